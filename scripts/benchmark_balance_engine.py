@@ -0,0 +1,503 @@
+"""
+Balance Engine Benchmark & Regression Harness (REPEATABLE PERFORMANCE CHECK).
+
+Times the calculation engine on synthetic data and checks its numbers:
+- ExcelManager.load_meter_readings()          cold (workbook parse) / disk (parsed
+                                              disk cache) / warm (in-memory)
+- BalanceService.calculate()                  cold / warm (inputs cached,
+                                              force_recalculate) / cached (result cache)
+- DaysOfOperationService.calculate_runway()   cold (new service) / warm
+
+Scenarios are a grid of synthetic Meter Readings workbooks (years of monthly
+rows) × storage facility counts (default 1/5/20 years × 10/100/1000
+facilities). Each scenario builds its own workbook and SQLite database in a
+temporary folder and calculates the last month (October 2025).
+
+Numeric results are written in the same shape as the analysis snapshots
+(system_balance_tab, recycled_tab, data_quality_tab, days_of_operation_tab),
+so they can be checked:
+- --baseline: against a previous run's JSON (same scenarios, release to release)
+- --live: the configured database (a copy) and Meter Readings workbook against
+  analysis/*_snapshot*.json for the snapshot period
+
+Synthetic scenarios use default CalculationConstants so results do not depend
+on the local database's system_constants.
+
+Usage:
+    python scripts/benchmark_balance_engine.py --output bench.json
+    python scripts/benchmark_balance_engine.py --years 1 --facilities 10 --repeat 3
+    python scripts/benchmark_balance_engine.py --baseline previous.json --output bench.json
+    python scripts/benchmark_balance_engine.py --live
+
+Exit status: 0 = OK, 1 = numeric mismatch against baseline or snapshots.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Ensure project src is on sys.path so imports like `services.*` resolve
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from openpyxl import Workbook
+
+from database.db_manager import DatabaseManager
+from database.schema import DatabaseSchema
+from services.calculation.balance_service import BalanceService, EXCEL_COLUMNS
+from services.calculation.constants import CalculationConstants, ConstantsLoader
+from services.calculation.days_of_operation_service import DaysOfOperationService
+from services.calculation.models import CalculationPeriod
+from services.excel_manager import ExcelManager, get_excel_manager
+
+# Last month of every synthetic workbook (matches the analysis snapshots)
+TARGET_YEAR, TARGET_MONTH = 2025, 10
+
+# Synthetic workbooks carry this many extra (unused) meter columns, like the real sheet
+FILLER_COLUMNS = 40
+
+# Relative/absolute tolerance when comparing numbers with a baseline or snapshot
+REL_TOL = 1e-6
+ABS_TOL = 0.01
+
+DAYS_TAB_FIELDS = (
+    'combined_days_remaining', 'system_days_remaining', 'limiting_facility',
+    'usable_storage_m3', 'minimum_reserve_m3', 'total_capacity_m3',
+    'total_current_volume_m3', 'total_outflows_m3', 'recycled_water_m3',
+    'net_fresh_demand_m3', 'net_fresh_daily_demand_m3', 'gross_outflow_daily_m3',
+    'gross_floor_daily_m3', 'runway_daily_demand_m3', 'runway_demand_method',
+    'evaporation_loss_m3', 'seepage_loss_m3', 'consumption_source',
+)
+
+
+class _PathConfig:
+    """Minimal config for ExcelManager pointing at one Meter Readings workbook."""
+
+    def __init__(self, meter_path: Path, disk_cache: bool = True) -> None:
+        self._values = {
+            'data_sources.legacy_excel_path': str(meter_path),
+            'data_sources.meter_cache_dir': str(meter_path.parent / 'meter_cache'),
+            'features.meter_readings_disk_cache': disk_cache,
+        }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._values[key] = value
+
+
+# =============================================================================
+# SYNTHETIC DATA
+# =============================================================================
+
+def _months(years: int) -> List[date]:
+    """First-of-month dates for `years` years ending at the target month."""
+    count = years * 12
+    out = []
+    year, month = TARGET_YEAR, TARGET_MONTH
+    for _ in range(count):
+        out.append(date(year, month, 1))
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return list(reversed(out))
+
+
+def _meter_columns() -> Dict[str, Callable[[random.Random], float]]:
+    """Meter Readings columns used by the engine with plausible value generators."""
+    columns: Dict[str, Callable[[random.Random], float]] = {
+        EXCEL_COLUMNS['tonnes_milled']: lambda r: r.uniform(280_000, 320_000),
+        EXCEL_COLUMNS['total_consumption']: lambda r: r.uniform(420_000, 480_000),
+        EXCEL_COLUMNS['total_recycled']: lambda r: r.uniform(220_000, 260_000),
+        EXCEL_COLUMNS['recycled_pct']: lambda r: r.uniform(45, 60),
+        EXCEL_COLUMNS['rwd_1']: lambda r: r.uniform(180_000, 220_000),
+        EXCEL_COLUMNS['rwd_intensity']: lambda r: r.uniform(0.55, 0.75),
+        EXCEL_COLUMNS['tailings_density']: lambda r: r.uniform(1.35, 1.5),
+        EXCEL_COLUMNS['pgm_wet_tonnes']: lambda r: r.uniform(7_000, 9_000),
+        EXCEL_COLUMNS['pgm_moisture_pct']: lambda r: r.uniform(12, 16),
+        EXCEL_COLUMNS['chromite_wet_tonnes']: lambda r: r.uniform(9_000, 11_000),
+        EXCEL_COLUMNS['chromite_moisture_pct']: lambda r: r.uniform(4, 7),
+    }
+    for name in EXCEL_COLUMNS['surface_water_sources']:
+        columns[name] = lambda r: r.uniform(15_000, 25_000)
+    for name in EXCEL_COLUMNS['groundwater_sources']:
+        columns[name] = lambda r: r.uniform(1_000, 3_000)
+    for name in EXCEL_COLUMNS['dewatering_sources']:
+        columns[name] = lambda r: r.uniform(8_000, 12_000)
+    for i in range(1, FILLER_COLUMNS + 1):
+        columns[f'Meter {i:02d}'] = lambda r: r.uniform(0, 10_000)
+    return columns
+
+
+def write_meter_workbook(path: Path, years: int, seed: int = 1) -> Path:
+    """Write a synthetic Meter Readings workbook (title, header row 3, units row 4).
+
+    Args:
+        path: Destination .xlsx path
+        years: Years of monthly rows ending at the target month
+        seed: Random seed (same seed → identical workbook values)
+    """
+    rng = random.Random(seed)
+    columns = _meter_columns()
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Meter Readings")
+    ws.append(["Meter Readings (synthetic benchmark data)"])
+    ws.append([])
+    ws.append(["Month", *columns])
+    ws.append(["", *["m³" for _ in columns]])
+    # Loader skips the first dated row (first_data_row offset), keep a filler row
+    months = _months(years)
+    filler = months[0].replace(year=months[0].year - 1)
+    ws.append([filler, *[0.0 for _ in columns]])
+    for month_start in months:
+        ws.append([month_start, *[round(gen(rng), 3) for gen in columns.values()]])
+    wb.save(path)
+    return path
+
+
+def build_database(path: Path, facilities: int, years: int, seed: int = 1) -> DatabaseManager:
+    """Create a schema-complete database with synthetic facilities and history.
+
+    Every facility gets storage_history for all months before the target, so
+    the target month chains its openings from history.
+    """
+    rng = random.Random(seed)
+    DatabaseSchema(path).create_database()
+    db = DatabaseManager(path)
+
+    types = ('Dam', 'TSF', 'Pond', 'Tank')
+    rows = []
+    for i in range(facilities):
+        capacity = rng.uniform(5_000, 500_000)
+        rows.append((
+            f"F{i:04d}", f"Facility {i:04d}", types[i % len(types)], capacity,
+            rng.uniform(500, 50_000), capacity * rng.uniform(0.3, 0.9), i % 2, 'active',
+        ))
+
+    months = _months(years)
+    env_rows = [(m.year, m.month, rng.uniform(0, 120), rng.uniform(70, 180)) for m in months]
+
+    history = []
+    for code, _, _, capacity, _, current, _, _ in rows:
+        volume = current
+        for m in months[:-1]:
+            closing = max(0.0, min(capacity, volume * rng.uniform(0.97, 1.03)))
+            history.append((code, m.year, m.month, volume, closing, 'measured'))
+            volume = closing
+
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3, "
+            "surface_area_m2, current_volume_m3, is_lined, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.executemany(
+            "INSERT INTO environmental_data (year, month, rainfall_mm, evaporation_mm) "
+            "VALUES (?, ?, ?, ?)",
+            env_rows,
+        )
+        conn.executemany(
+            "INSERT INTO storage_history (facility_code, year, month, opening_volume_m3, "
+            "closing_volume_m3, data_source) VALUES (?, ?, ?, ?, ?, ?)",
+            history,
+        )
+    return db
+
+
+def _pin_default_constants() -> None:
+    """Use default CalculationConstants (independent of the local database)."""
+    loader = ConstantsLoader()
+    loader._constants = CalculationConstants()
+
+
+# =============================================================================
+# TIMING & RESULTS
+# =============================================================================
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time fn() `repeat` times.
+
+    Returns:
+        Dict with runs_ms and min/median/max in milliseconds
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return {
+        'runs_ms': [round(r, 3) for r in runs],
+        'min_ms': round(min(runs), 3),
+        'median_ms': round(statistics.median(runs), 3),
+        'max_ms': round(max(runs), 3),
+    }
+
+
+def snapshot_from_results(result, runway) -> Dict[str, Any]:
+    """Build analysis-snapshot-shaped numbers from a BalanceResult and SystemRunway."""
+    kpis = result.kpis
+    flags = result.quality_flags
+    days_tab = {}
+    if runway is not None:
+        for field in DAYS_TAB_FIELDS:
+            days_tab[field] = getattr(runway, field)
+    return {
+        'period': {
+            'year': result.period.year,
+            'month': result.period.month,
+            'label': result.period.period_label,
+        },
+        'system_balance_tab': {
+            'fresh_inflows_m3': result.inflows.total_m3,
+            'total_outflows_m3': result.outflows.total_m3,
+            'opening_storage_m3': result.storage.opening_m3,
+            'closing_storage_m3': result.storage.closing_m3,
+            'storage_change_m3': result.storage.delta_m3,
+            'balance_error_m3': result.balance_error_m3,
+            'error_pct': result.error_pct,
+            'status': result.status,
+        },
+        'recycled_tab': {
+            'recycled_total_m3': result.recycled.total_m3 if result.recycled else 0.0,
+            'recycled_pct': kpis.recycled_pct if kpis else 0.0,
+            'fresh_pct': kpis.fresh_pct if kpis else 0.0,
+            'water_intensity_m3_per_tonne': kpis.water_intensity_m3_per_tonne if kpis else 0.0,
+        },
+        'data_quality_tab': {
+            'issue_count': flags.issue_count,
+            'missing': list(flags.missing_values),
+            'estimated': list(flags.estimated_values),
+            'warnings': list(flags.warnings),
+        },
+        'days_of_operation_tab': days_tab,
+    }
+
+
+def compare_snapshots(expected: Any, actual: Any, path: str = '') -> List[str]:
+    """Compare snapshot-shaped dicts; return human-readable mismatches.
+
+    Only keys present in both are compared (snapshots may carry extra detail
+    such as notes). Numbers use REL_TOL/ABS_TOL; everything else must be equal.
+    """
+    mismatches: List[str] = []
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in expected:
+            if key in actual:
+                mismatches.extend(compare_snapshots(expected[key], actual[key], f"{path}.{key}".lstrip('.')))
+        return mismatches
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        same = expected == actual
+    elif isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        same = math.isclose(expected, actual, rel_tol=REL_TOL, abs_tol=ABS_TOL)
+    else:
+        same = expected == actual
+    if not same:
+        mismatches.append(f"{path}: expected {expected!r}, got {actual!r}")
+    return mismatches
+
+
+def run_scenario(workdir: Path, years: int, facilities: int, repeat: int) -> Dict[str, Any]:
+    """Build one synthetic scenario, time the engine and capture its results."""
+    name = f"{years}y_{facilities}f"
+    scenario_dir = workdir / name
+    scenario_dir.mkdir(parents=True, exist_ok=True)
+    meter_path = write_meter_workbook(scenario_dir / 'meter_readings.xlsx', years)
+    db_path = scenario_dir / 'balance.db'
+    db = build_database(db_path, facilities, years)
+    period = CalculationPeriod(month=TARGET_MONTH, year=TARGET_YEAR)
+    config = _PathConfig(meter_path)
+    parse_config = _PathConfig(meter_path, disk_cache=False)
+
+    timings: Dict[str, Dict[str, Any]] = {}
+
+    # ExcelManager.load_meter_readings: workbook parse / disk cache / in-memory
+    excel = ExcelManager(config)
+    excel.load_meter_readings()  # writes the disk cache entry
+    timings['load_meter_readings'] = {
+        'cold': measure(lambda: ExcelManager(parse_config).load_meter_readings(), repeat),
+        'disk': measure(lambda: ExcelManager(config).load_meter_readings(), repeat),
+        'warm': measure(excel.load_meter_readings, repeat),
+    }
+
+    # BalanceService.calculate: fresh managers / cached inputs / cached result
+    def calculate_cold():
+        BalanceService(db, ExcelManager(parse_config)).calculate(period, force_recalculate=True)
+
+    service = BalanceService(db, excel)
+    service.calculate(period, force_recalculate=True)
+    timings['calculate'] = {
+        'cold': measure(calculate_cold, repeat),
+        'warm': measure(lambda: service.calculate(period, force_recalculate=True), repeat),
+        'cached': measure(lambda: service.calculate(period), repeat),
+    }
+    result = service.calculate(period)
+
+    # DaysOfOperationService.calculate_runway: fresh service vs reused service
+    runway_service = DaysOfOperationService(db)
+    runway_args = dict(month=period.month, year=period.year, balance_result=result)
+    timings['calculate_runway'] = {
+        'cold': measure(lambda: DaysOfOperationService(db).calculate_runway(**runway_args), repeat),
+        'warm': measure(lambda: runway_service.calculate_runway(**runway_args), repeat),
+    }
+    runway = runway_service.calculate_runway(**runway_args)
+
+    DatabaseManager.close_pool(db_path)
+    return {
+        'name': name,
+        'years': years,
+        'facilities': facilities,
+        'period': f"{period.year}-{period.month:02d}",
+        'timings': timings,
+        'results': snapshot_from_results(result, runway),
+    }
+
+
+def run_live(snapshot_paths: List[Path]) -> Dict[str, Any]:
+    """Calculate snapshot periods on the configured data and compare to the snapshots."""
+    excel = get_excel_manager()
+    if not excel.meter_readings_exists():
+        return {'skipped': 'Meter Readings Excel (data_sources.legacy_excel_path) not found'}
+
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_copy = DatabaseManager().create_backup(Path(tmp) / 'live.db')
+        db = DatabaseManager(db_copy)
+        service = BalanceService(db, excel)
+        runway_service = DaysOfOperationService(db)
+        for snapshot_path in snapshot_paths:
+            expected = json.loads(snapshot_path.read_text(encoding='utf-8'))
+            period = CalculationPeriod(month=expected['period']['month'], year=expected['period']['year'])
+            start = time.perf_counter()
+            result = service.calculate(period, force_recalculate=True)
+            runway = runway_service.calculate_runway(period.month, period.year, balance_result=result)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            mismatches = compare_snapshots(expected, snapshot_from_results(result, runway))
+            checks.append({
+                'snapshot': snapshot_path.name,
+                'period': f"{period.year}-{period.month:02d}",
+                'elapsed_ms': round(elapsed_ms, 3),
+                'matches': not mismatches,
+                'mismatches': mismatches,
+            })
+        DatabaseManager.close_pool(db_copy)
+
+    # Snapshots of the same period capture different database states; one
+    # matching snapshot per period is enough.
+    by_period: Dict[str, bool] = {}
+    for check in checks:
+        by_period[check['period']] = by_period.get(check['period'], False) or check['matches']
+    return {'checks': checks, 'ok': all(by_period.values())}
+
+
+def compare_with_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    slowdown_threshold: float,
+) -> Dict[str, List[str]]:
+    """Diff scenarios against a previous report (numbers and median timings)."""
+    numeric: List[str] = []
+    slowdowns: List[str] = []
+    previous = {s['name']: s for s in baseline.get('scenarios', [])}
+    for scenario in report['scenarios']:
+        old = previous.get(scenario['name'])
+        if old is None:
+            continue
+        for mismatch in compare_snapshots(old['results'], scenario['results']):
+            numeric.append(f"{scenario['name']}: {mismatch}")
+        for op, variants in scenario['timings'].items():
+            for variant, stats in variants.items():
+                old_stats = old.get('timings', {}).get(op, {}).get(variant)
+                if not old_stats or old_stats['median_ms'] <= 0:
+                    continue
+                ratio = stats['median_ms'] / old_stats['median_ms']
+                if ratio > 1 + slowdown_threshold:
+                    slowdowns.append(
+                        f"{scenario['name']} {op}/{variant}: {old_stats['median_ms']:.1f} ms → "
+                        f"{stats['median_ms']:.1f} ms ({ratio:.2f}x)"
+                    )
+    return {'numeric': numeric, 'slowdowns': slowdowns}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Balance engine benchmark and regression harness")
+    parser.add_argument('--years', type=int, nargs='+', default=[1, 5, 20],
+                        help='Synthetic workbook lengths in years (default: 1 5 20)')
+    parser.add_argument('--facilities', type=int, nargs='+', default=[10, 100, 1000],
+                        help='Synthetic facility counts (default: 10 100 1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per measurement (default 3)')
+    parser.add_argument('--output', type=Path, help='Write the JSON report to this file')
+    parser.add_argument('--baseline', type=Path, help='Previous JSON report to diff against')
+    parser.add_argument('--slowdown-threshold', type=float, default=0.25,
+                        help='Flag median slowdowns above this fraction (default 0.25)')
+    parser.add_argument('--live', action='store_true',
+                        help='Also check the configured data against analysis snapshots')
+    parser.add_argument('--snapshot', type=Path, nargs='+',
+                        default=sorted((ROOT / 'analysis').glob('*_snapshot*.json')),
+                        help='Snapshot files for --live (default: analysis/*_snapshot*.json)')
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'scenarios': [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _pin_default_constants()
+        for years, facilities in itertools.product(args.years, args.facilities):
+            print(f"Scenario {years}y × {facilities} facilities...", flush=True)
+            scenario = run_scenario(Path(tmp), years, facilities, args.repeat)
+            report['scenarios'].append(scenario)
+            for op, variants in scenario['timings'].items():
+                summary = ", ".join(f"{v} {s['median_ms']:.1f} ms" for v, s in variants.items())
+                print(f"  {op:<20} {summary}")
+        ConstantsLoader().refresh()
+
+    failed = False
+    if args.live:
+        report['live'] = run_live(args.snapshot)
+        live = report['live']
+        if 'skipped' in live:
+            print(f"Live snapshot check skipped: {live['skipped']}")
+        else:
+            for check in live['checks']:
+                state = 'match' if check['matches'] else f"{len(check['mismatches'])} mismatches"
+                print(f"Live {check['snapshot']} ({check['period']}): {state}")
+            failed |= not live['ok']
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        report['regressions'] = compare_with_baseline(report, baseline, args.slowdown_threshold)
+        for line in report['regressions']['numeric']:
+            print(f"NUMERIC  {line}")
+        for line in report['regressions']['slowdowns']:
+            print(f"SLOWER   {line}")
+        failed |= bool(report['regressions']['numeric'])
+
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        args.output.write_text(text, encoding='utf-8')
+        print(f"Report written to {args.output}")
+    else:
+        print(text)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
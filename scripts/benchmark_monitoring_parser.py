@@ -0,0 +1,300 @@
+"""
+Stacked-Block Monitoring Parser Benchmark (REPEATABLE PERFORMANCE CHECK).
+
+Times parse_borehole_stacked_blocks() on borehole/PCD lab workbooks:
+- read   pd.read_excel(header=None) alone (workbook I/O, same for any parser)
+- parse  the full parser call (read + block parsing)
+- blocks the parser call with the raw sheet served from memory, i.e. the
+         part the parser itself controls
+
+Scenarios are synthetic workbooks in the lab layout (metadata rows, parameter
+header with "Static Level", units row, section header, then one block per
+borehole: ID row followed by dated sample rows). Default sizes are 12/40/120
+boreholes × 24/60/120 samples with 24 parameters, which brackets the site's
+quarterly and monthly lab exports. Synthetic rows include the quirks seen in
+real files: (S)/(D) aquifer suffixes, text and Excel dates in several formats,
+"NO ACCESS", "<0.01" detection-limit values and blank rows. Real workbooks can
+be added with --file.
+
+Every parse is fingerprinted (rows, columns, dtypes and a hash of the values),
+so --baseline also proves a parser rewrite returns identical frames.
+
+Usage:
+    python scripts/benchmark_monitoring_parser.py --output parser.json
+    python scripts/benchmark_monitoring_parser.py --file "data/monitoring/borehole_monitoring/Lab 2025.xls"
+    python scripts/benchmark_monitoring_parser.py --baseline previous.json --output parser.json
+
+Exit status: 0 = OK, 1 = parsed output differs from baseline.
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+# Ensure project src is on sys.path so imports like `services.*` resolve
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+import pandas as pd
+from openpyxl import Workbook
+
+from services.monitoring_excel_parser_v2 import parse_borehole_stacked_blocks
+
+# Default (boreholes, samples per borehole) grid
+DEFAULT_SIZES = [(12, 24), (40, 60), (120, 120)]
+
+PARAMETERS = [
+    'Calcium^', 'Chloride^', 'Magnesium^', 'Nitrate (NO3)^', 'Potassium^', 'Sodium^',
+    'Sulphate^', 'Total Dissolved Solids', 'Electrical Conductivity', 'pH', 'Fluoride^',
+    'Iron^', 'Manganese^', 'Aluminium^', 'Ammonia^', 'Total Alkalinity', 'Total Hardness',
+    'Turbidity', 'Chromium^', 'Copper^', 'Nickel^', 'Zinc^', 'Temperature', 'Static Level',
+]
+
+# Relative tolerance when comparing median timings with a baseline
+DEFAULT_SLOWDOWN = 0.25
+
+
+# =============================================================================
+# SYNTHETIC DATA
+# =============================================================================
+
+def _date_cell(rng: random.Random, when: datetime) -> Any:
+    """A sample date the way lab exports write it (mostly Excel dates, some text)."""
+    style = rng.random()
+    if style < 0.55:
+        return when
+    if style < 0.7:
+        return when.strftime('%Y/%m/%d %I:%M:%S %p')
+    if style < 0.8:
+        return when.strftime('%d/%m/%Y %H:%M:%S')
+    if style < 0.9:
+        return when.strftime('%Y-%m-%d') + rng.choice([' (S)', ' (D)', '(Shallow)', ''])
+    return when.strftime('%m/%d/%Y')
+
+
+def _value_cell(rng: random.Random) -> Any:
+    """A parameter value (numbers with occasional text, limits and gaps)."""
+    roll = rng.random()
+    if roll < 0.04:
+        return None
+    if roll < 0.05:
+        return 'NO ACCESS'
+    if roll < 0.07:
+        return '<0.01'
+    if roll < 0.08:
+        return f"{rng.uniform(0, 50):.2f}"  # Number stored as text
+    return round(rng.uniform(0, 500), 2)
+
+
+def write_stacked_workbook(path: Path, boreholes: int, samples: int, seed: int = 1) -> Path:
+    """Write a lab workbook in the stacked-blocks layout.
+
+    Args:
+        path: Destination .xlsx path.
+        boreholes: Number of borehole blocks.
+        samples: Dated rows per borehole.
+        seed: Random seed (same inputs → same workbook).
+
+    Returns:
+        path
+    """
+    rng = random.Random(seed)
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Groundwater'
+    for line in ('TWO RIVERS PLATINUM', 'Groundwater Quality Report', 'Laboratory: SGS', '', ''):
+        ws.append([line])
+    ws.append(['Monitoring Point'] + PARAMETERS)
+    ws.append([''] + ['mg/l'] * (len(PARAMETERS) - 1) + ['mbgl'])
+    ws.append(['TWO RIVERS GROUNDWATER MONITORING'])
+
+    start = datetime(2015, 1, 15, 9, 30)
+    for b in range(1, boreholes + 1):
+        ws.append([f"TRPGWM {b:02d}{rng.choice(['', '', 'A'])}"])
+        for s in range(samples):
+            if rng.random() < 0.02:
+                ws.append([])
+                continue
+            when = start + timedelta(days=30 * s + rng.randint(0, 5))
+            ws.append([_date_cell(rng, when)] + [_value_cell(rng) for _ in PARAMETERS])
+    wb.save(path)
+    wb.close()
+    return path
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time fn() `repeat` times.
+
+    Returns:
+        Dict with runs_ms and min/median/max in milliseconds
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return {
+        'runs_ms': [round(r, 3) for r in runs],
+        'min_ms': round(min(runs), 3),
+        'median_ms': round(statistics.median(runs), 3),
+        'max_ms': round(max(runs), 3),
+    }
+
+
+def fingerprint(df: pd.DataFrame) -> Dict[str, Any]:
+    """Shape, schema and value hash of a parsed frame."""
+    digest = hashlib.sha256(df.to_csv(index=False).encode('utf-8')).hexdigest()
+    return {
+        'rows': len(df),
+        'columns': [str(c) for c in df.columns],
+        'dtypes': {str(c): str(t) for c, t in df.dtypes.items()},
+        'sha256': digest,
+    }
+
+
+def read_raw(path: Path) -> pd.DataFrame:
+    """Read a workbook the way the parser does (xlrd first, then the default engine)."""
+    try:
+        return pd.read_excel(path, header=None, engine='xlrd')
+    except Exception:
+        return pd.read_excel(path, header=None)
+
+
+@contextmanager
+def raw_sheet_in_memory(df_raw: pd.DataFrame) -> Iterator[None]:
+    """Serve pd.read_excel from an already-read sheet (isolates parsing time)."""
+    original = pd.read_excel
+    pd.read_excel = lambda *args, **kwargs: df_raw.copy()
+    try:
+        yield
+    finally:
+        pd.read_excel = original
+
+
+def run_file(name: str, path: Path, repeat: int) -> Dict[str, Any]:
+    """Benchmark one workbook."""
+    df_raw = read_raw(path)
+    timings = {
+        'read': measure(lambda: read_raw(path), repeat),
+        'parse': measure(lambda: parse_borehole_stacked_blocks(str(path)), repeat),
+    }
+    with raw_sheet_in_memory(df_raw):
+        timings['blocks'] = measure(lambda: parse_borehole_stacked_blocks(str(path)), repeat)
+    return {
+        'name': name,
+        'file': path.name,
+        'size_kb': round(path.stat().st_size / 1024, 1),
+        'raw_shape': list(df_raw.shape),
+        'timings': timings,
+        'output': fingerprint(parse_borehole_stacked_blocks(str(path))),
+    }
+
+
+def compare_with_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    slowdown_threshold: float,
+) -> Dict[str, List[str]]:
+    """Diff scenarios against a previous report (parsed output and median timings)."""
+    output: List[str] = []
+    slowdowns: List[str] = []
+    speedups: List[str] = []
+    previous = {s['name']: s for s in baseline.get('scenarios', [])}
+    for scenario in report['scenarios']:
+        old = previous.get(scenario['name'])
+        if old is None:
+            continue
+        for key in ('rows', 'columns', 'dtypes', 'sha256'):
+            if old['output'].get(key) != scenario['output'].get(key):
+                output.append(f"{scenario['name']}: {key} differs")
+        old_ms = old['timings']['blocks']['median_ms']
+        new_ms = scenario['timings']['blocks']['median_ms']
+        if old_ms <= 0:
+            continue
+        ratio = new_ms / old_ms
+        line = f"{scenario['name']} blocks: {old_ms:.1f} ms → {new_ms:.1f} ms ({ratio:.2f}x)"
+        if ratio > 1 + slowdown_threshold:
+            slowdowns.append(line)
+        else:
+            speedups.append(line)
+    return {'output': output, 'slowdowns': slowdowns, 'changes': speedups}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stacked-block monitoring parser benchmark")
+    parser.add_argument('--size', nargs=2, type=int, action='append', metavar=('BOREHOLES', 'SAMPLES'),
+                        help='Synthetic workbook size (repeatable; default 12 24, 40 60, 120 120)')
+    parser.add_argument('--file', type=Path, nargs='+', default=[],
+                        help='Real lab workbooks to benchmark as well')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per measurement (default 3)')
+    parser.add_argument('--output', type=Path, help='Write the JSON report to this file')
+    parser.add_argument('--baseline', type=Path, help='Previous JSON report to diff against')
+    parser.add_argument('--slowdown-threshold', type=float, default=DEFAULT_SLOWDOWN,
+                        help='Flag median slowdowns above this fraction (default 0.25)')
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'scenarios': [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for boreholes, samples in args.size or DEFAULT_SIZES:
+            name = f"synthetic_{boreholes}x{samples}"
+            files.append((name, write_stacked_workbook(Path(tmp) / f"{name}.xlsx", boreholes, samples)))
+        files += [(f"file:{path.name}", path) for path in args.file]
+
+        for name, path in files:
+            print(f"Scenario {name}...", flush=True)
+            scenario = run_file(name, path, args.repeat)
+            report['scenarios'].append(scenario)
+            t = scenario['timings']
+            print(f"  {scenario['output']['rows']} rows, read {t['read']['median_ms']:.1f} ms, "
+                  f"parse {t['parse']['median_ms']:.1f} ms, blocks {t['blocks']['median_ms']:.1f} ms")
+
+    failed = False
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        report['regressions'] = compare_with_baseline(report, baseline, args.slowdown_threshold)
+        for line in report['regressions']['output']:
+            print(f"OUTPUT   {line}")
+        for line in report['regressions']['slowdowns']:
+            print(f"SLOWER   {line}")
+        for line in report['regressions']['changes']:
+            print(f"TIMING   {line}")
+        failed |= bool(report['regressions']['output'])
+
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        args.output.write_text(text, encoding='utf-8')
+        print(f"Report written to {args.output}")
+    else:
+        print(text)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Benchmark sequential vs parallel balance evaluation (OCTOBER 2025 SNAPSHOT).
+
+Runs BalanceService.calculate(force_recalculate=True) for October 2025 in
+sequential mode and in parallel mode (independent sub-services on a thread
+pool with a shared input snapshot), then:
+- reports min/median/max wall time per mode
+- checks both modes produce identical results and data quality flags
+- compares headline figures against analysis/oct_2025_calculation_snapshot.json
+
+Uses the configured Meter Readings Excel and a COPY of the configured
+database (storage history writes never touch the live DB).
+
+Usage:
+    python scripts/benchmark_parallel_balance.py [--repeat 5] [--snapshot PATH]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project src is on sys.path so imports like `services.*` resolve
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from database.db_manager import DatabaseManager
+from services.calculation.balance_service import BalanceService
+from services.calculation.models import CalculationPeriod
+from services.excel_manager import get_excel_manager
+
+DEFAULT_SNAPSHOT = ROOT / 'analysis' / 'oct_2025_calculation_snapshot.json'
+
+# (snapshot key in system_balance_tab, BalanceResult accessor)
+SNAPSHOT_FIELDS = {
+    'fresh_inflows_m3': lambda r: r.inflows.total_m3,
+    'total_outflows_m3': lambda r: r.outflows.total_m3,
+    'storage_change_m3': lambda r: r.storage.delta_m3,
+    'balance_error_m3': lambda r: r.balance_error_m3,
+    'error_pct': lambda r: r.error_pct,
+}
+
+
+def time_mode(service: BalanceService, period: CalculationPeriod, repeat: int):
+    """Run calculate() repeat times; return (timings in seconds, last result)."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = service.calculate(period, force_recalculate=True)
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def comparable(result) -> dict:
+    """Result fields that must match between modes (timestamp excluded)."""
+    data = result.model_dump()
+    data.pop('calculated_at', None)
+    return data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per mode (default 5)')
+    parser.add_argument('--snapshot', type=Path, default=DEFAULT_SNAPSHOT,
+                        help='Expected-results snapshot JSON')
+    args = parser.parse_args()
+
+    snapshot = json.loads(args.snapshot.read_text(encoding='utf-8'))
+    period = CalculationPeriod(month=snapshot['period']['month'], year=snapshot['period']['year'])
+
+    excel = get_excel_manager()
+    if not excel.meter_readings_exists():
+        print("Meter Readings Excel not found (data_sources.legacy_excel_path); cannot benchmark.")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_db = DatabaseManager()
+        db_copy = source_db.create_backup(Path(tmp) / 'benchmark.db')
+        db = DatabaseManager(db_copy)
+
+        # Warm the Excel caches once so both modes measure evaluation, not file I/O
+        excel.load_meter_readings()
+
+        modes = {
+            'sequential': BalanceService(db, excel, parallel=False),
+            'parallel': BalanceService(db, excel, parallel=True),
+        }
+        timings, results = {}, {}
+        for name, service in modes.items():
+            timings[name], results[name] = time_mode(service, period, args.repeat)
+
+        DatabaseManager.close_pool(db_copy)
+
+    print(f"Balance evaluation for {period.period_label} ({args.repeat} runs per mode)")
+    for name, values in timings.items():
+        print(f"  {name:<10} min {min(values) * 1000:8.1f} ms   "
+              f"median {statistics.median(values) * 1000:8.1f} ms   "
+              f"max {max(values) * 1000:8.1f} ms")
+    speedup = statistics.median(timings['sequential']) / statistics.median(timings['parallel'])
+    print(f"  speedup (median): {speedup:.2f}x")
+
+    identical = comparable(results['sequential']) == comparable(results['parallel'])
+    print(f"\nParallel result identical to sequential: {'yes' if identical else 'NO'}")
+
+    expected = snapshot['system_balance_tab']
+    print(f"\nComparison with {args.snapshot.name}:")
+    for key, accessor in SNAPSHOT_FIELDS.items():
+        actual = accessor(results['parallel'])
+        print(f"  {key:<20} snapshot {expected[key]:>16,.2f}   now {actual:>16,.2f}")
+    expected_flags = sorted(snapshot['data_quality_tab']['estimated'])
+    actual_flags = sorted(results['parallel'].quality_flags.estimated_values)
+    print(f"  estimated flags      {'match' if expected_flags == actual_flags else 'differ'}")
+
+    return 0 if identical else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
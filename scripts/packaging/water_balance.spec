@@ -27,6 +27,14 @@ hiddenimports.extend(
         "openpyxl",
     ]
 )
+# pandas imports pyarrow lazily for to_feather/read_feather (disk caches of
+# parsed Meter Readings and monitoring workbooks).
+hiddenimports.extend(
+    [
+        "pyarrow",
+        "pyarrow.feather",
+    ]
+)
 binaries = collect_dynamic_libs("nacl")
 nacl_path = Path(nacl.__file__).parent
 sodium_pyd = nacl_path / "_sodium.pyd"
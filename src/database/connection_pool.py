@@ -0,0 +1,282 @@
+"""
+SQLite Connection Pool (REUSABLE RUNTIME CONNECTIONS).
+
+Keeps a small set of open sqlite3 connections per database file so services
+that open/close connections many times per calculation reuse them instead of
+paying connect + pragma setup every time.
+
+Key behaviour:
+- Pragmas (foreign keys, WAL, cache size, temp store) applied once per connection
+- Checkout is exclusive: a connection is never shared by two callers at once
+- conn.close() returns the connection to the pool (uncommitted work is rolled
+  back, exactly like closing a plain connection)
+- Checkout/wait statistics for diagnostics
+- Connections that are never closed are reclaimed when garbage collected, so
+  a leaked connection cannot permanently use up a pool slot
+
+Used by: DatabaseManager.get_connection() / DatabaseManager.connection()
+"""
+
+import gc
+import sqlite3
+import threading
+import time
+import weakref
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() hands it back to its pool.
+
+    Created via sqlite3.connect(factory=PooledConnection). Behaves like a
+    normal connection for callers; close_physical() really closes it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool: Optional["ConnectionPool"] = None
+        self._generation = 0
+        self._checked_out = False
+
+    def close(self) -> None:
+        """Return the connection to its pool (or close it if unpooled)."""
+        if self._pool is None:
+            self.close_physical()
+            return
+        self._pool.release(self)
+
+    def close_physical(self) -> None:
+        """Close the underlying SQLite connection."""
+        sqlite3.Connection.close(self)
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections for one database file (POOL).
+
+    Sizing follows the usual pool/overflow split: up to pool_size idle
+    connections are kept open; up to max_overflow extra connections may be
+    opened under load and are closed when returned. When every connection is
+    checked out, acquire() waits for a release (up to timeout seconds).
+
+    Args:
+        db_path: SQLite database file
+        timeout: Seconds to wait for a lock (sqlite) and for a free connection
+        row_factory: Row factory set on every checkout
+        pragmas: PRAGMA statements applied once when a connection is opened
+        pool_size: Idle connections kept open
+        max_overflow: Extra connections allowed beyond pool_size
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        timeout: float = 10.0,
+        row_factory: Optional[Callable] = None,
+        pragmas: Iterable[str] = (),
+        pool_size: int = 5,
+        max_overflow: int = 10,
+    ):
+        self.db_path = Path(db_path)
+        self.timeout = timeout
+        self.row_factory = row_factory
+        self.pragmas = tuple(pragmas)
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+
+        # RLock: leak finalizers may run (via GC) while this thread holds the lock
+        self._cond = threading.Condition(threading.RLock())
+        self._idle: List[PooledConnection] = []
+        self._checked_out_ids: Set[int] = set()
+        self._open = 0
+        self._in_use = 0
+        self._generation = 0
+
+        # Statistics
+        self._checkouts = 0
+        self._created = 0
+        self._waits = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+        self._peak_in_use = 0
+        self._leaked = 0
+
+    def acquire(self) -> PooledConnection:
+        """Check out a connection (blocks while the pool is exhausted).
+
+        Returns:
+            Exclusive PooledConnection; call close() to return it
+
+        Raises:
+            sqlite3.OperationalError: If no connection frees up within timeout
+        """
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        waited = False
+        collected = False
+        create = False
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._open < self.pool_size + self.max_overflow:
+                    # Reserve the slot; connect outside the lock
+                    self._open += 1
+                    create = True
+                    conn = None
+                    break
+                if not collected:
+                    # Leaked connections sit in reference cycles (sqlite statement
+                    # cache); collect once so their finalizers free the slots
+                    collected = True
+                    gc.collect()
+                    continue
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise sqlite3.OperationalError(
+                        f"Connection pool exhausted for {self.db_path.name} "
+                        f"({self._in_use} connections in use)"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            self._in_use += 1
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            if waited:
+                wait_s = time.perf_counter() - start
+                self._waits += 1
+                self._total_wait_s += wait_s
+                self._max_wait_s = max(self._max_wait_s, wait_s)
+            generation = self._generation
+
+        if create:
+            try:
+                conn = self._connect(generation)
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._in_use -= 1
+                    self._cond.notify()
+                raise
+
+        with self._cond:
+            self._checked_out_ids.add(id(conn))
+        conn._checked_out = True
+        return conn
+
+    def release(self, conn: PooledConnection) -> None:
+        """Return a checked-out connection to the pool.
+
+        Uncommitted changes are rolled back (same as closing a connection).
+        Calling close() twice is harmless.
+        """
+        if not conn._checked_out:
+            return
+        conn._checked_out = False
+
+        reusable = True
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = self.row_factory
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding pooled connection after reset failure: {e}")
+            reusable = False
+
+        with self._cond:
+            self._checked_out_ids.discard(id(conn))
+            self._in_use -= 1
+            keep = (
+                reusable
+                and conn._generation == self._generation
+                and len(self._idle) < self.pool_size
+            )
+            if keep:
+                self._idle.append(conn)
+            else:
+                self._open -= 1
+            self._cond.notify()
+
+        if not keep:
+            conn.close_physical()
+
+    def close_all(self) -> None:
+        """Close idle connections and retire checked-out ones on release.
+
+        Used before the database file is copied, replaced or deleted so no
+        open handle (or un-checkpointed WAL) is left behind.
+        """
+        with self._cond:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn in idle:
+            try:
+                conn.close_physical()
+            except sqlite3.Error:
+                pass
+        if idle:
+            logger.debug(f"Closed {len(idle)} pooled connections for {self.db_path.name}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return checkout/wait statistics (DIAGNOSTICS).
+
+        Returns:
+            Dict with checkouts, connections_created, reuse_ratio, waits,
+            total/avg/max wait (ms), in_use, idle, peak_in_use
+        """
+        with self._cond:
+            checkouts = self._checkouts
+            return {
+                "db_path": str(self.db_path),
+                "checkouts": checkouts,
+                "connections_created": self._created,
+                "reuse_ratio": (1 - self._created / checkouts) if checkouts else 0.0,
+                "waits": self._waits,
+                "total_wait_ms": self._total_wait_s * 1000,
+                "avg_wait_ms": (self._total_wait_s / self._waits * 1000) if self._waits else 0.0,
+                "max_wait_ms": self._max_wait_s * 1000,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "peak_in_use": self._peak_in_use,
+                "leaked": self._leaked,
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+            }
+
+    def _connect(self, generation: int) -> PooledConnection:
+        """Open a new connection and apply pragmas once (INTERNAL)."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.timeout,
+            check_same_thread=False,
+            factory=PooledConnection,
+        )
+        for pragma in self.pragmas:
+            conn.execute(f"PRAGMA {pragma}")
+        conn.row_factory = self.row_factory
+        conn._pool = self
+        conn._generation = generation
+        weakref.finalize(conn, self._reclaim_leaked, id(conn))
+        with self._cond:
+            self._created += 1
+        logger.debug(f"Opened pooled SQLite connection #{self._created} for {self.db_path.name}")
+        return conn
+
+    def _reclaim_leaked(self, conn_id: int) -> None:
+        """Free the slot of a checked-out connection that was garbage collected."""
+        with self._cond:
+            if conn_id not in self._checked_out_ids:
+                return
+            self._checked_out_ids.discard(conn_id)
+            self._in_use -= 1
+            self._open -= 1
+            self._leaked += 1
+            self._cond.notify()
@@ -2,7 +2,8 @@
 SQLite Database Manager (CONNECTION POOLING & CRUD OPERATIONS).
 
 Handles all SQLite database interactions with:
-- Connection pooling (reuse connections, reduce overhead)
+- Connection pooling (one shared ConnectionPool per database file; pragmas
+  applied once per connection, conn.close() returns it to the pool)
 - Row factory (dict-like column access instead of tuples)
 - Atomic writes (transactional integrity)
 - Backup before updates (data protection)
@@ -14,12 +15,16 @@ Thread-safe: Yes (SQLite with WAL mode)
 """
 
 import sqlite3
+import atexit
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 from datetime import datetime
 import logging
 
+from database.connection_pool import ConnectionPool
+
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +47,14 @@ class DatabaseManager:
     """
     
     _instance: Optional["DatabaseManager"] = None
+    
+    # One pool per database file, shared by every DatabaseManager instance
+    _pools: Dict[str, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+    
+    # Pool sizing (idle connections kept open / extra connections under load)
+    POOL_SIZE = 5
+    POOL_MAX_OVERFLOW = 10
 
     @classmethod
     def get_instance(cls) -> "DatabaseManager":
@@ -72,6 +85,8 @@ class DatabaseManager:
         
         # Ensure database exists and is initialized
         if not self.db_path.exists():
+            # Drop handles to a previous file at this path (deleted/replaced)
+            self.close_pool(self.db_path)
             logger.info(f"Database not found at {self.db_path}, creating fresh schema...")
             schema = DatabaseSchema(self.db_path)
             schema.create_database()
@@ -79,10 +94,15 @@ class DatabaseManager:
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection with row factory (CONNECTION GETTER).
         
-        Configuration:
+        Connections come from a pool shared by all DatabaseManager instances
+        for the same file. Calling conn.close() returns the connection to the
+        pool; uncommitted changes are rolled back as with a plain close.
+        
+        Configuration (applied once when the pooled connection is opened):
         - Row factory: dict_factory (access columns by name, not index)
-        - Timeout: 10 seconds (wait for lock)
+        - Timeout: 10 seconds (wait for lock / free pooled connection)
         - Check same thread: False (allows use across threads with WAL mode)
+        - Pragmas: DatabaseSchema.PRAGMAS (foreign keys, WAL, cache, temp store)
         
         Why row factory: Allows conn.execute(...).fetchall() to return
         list of dicts instead of tuples, making code more readable:
@@ -94,33 +114,106 @@ class DatabaseManager:
             SQLite connection object with dict factory
         
         Raises:
-            sqlite3.OperationalError: If database locked or connection fails
+            sqlite3.OperationalError: If database locked, connection fails or
+                the pool stays exhausted for longer than the timeout
         
         Example:
             conn = db.get_connection()
             cursor = conn.execute("SELECT * FROM storage_facilities WHERE code=?", ("NDCD1",))
             row = cursor.fetchone()  # Returns dict: {'id': 1, 'code': 'NDCD1', ...}
+            conn.close()  # Back to the pool
         """
-        conn = sqlite3.connect(
-            str(self.db_path),
-            timeout=self.connection_timeout,
-            check_same_thread=False
-        )
+        return self._get_pool().acquire()
+    
+    @contextmanager
+    def connection(self):
+        """Context manager for a pooled connection (CONNECTION CHECKOUT).
         
-        # Set row factory to return dicts (column name access)
-        conn.row_factory = self._dict_factory
+        Returns the connection to the pool on exit. Does not commit; use
+        transaction() for writes.
         
-        # Enable foreign key constraints
-        conn.execute("PRAGMA foreign_keys = ON")
+        Usage:
+            with db.connection() as conn:
+                rows = conn.execute("SELECT * FROM storage_facilities").fetchall()
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _get_pool(self) -> ConnectionPool:
+        """Get (or create) the shared pool for this database file (INTERNAL)."""
+        from database.schema import DatabaseSchema
         
-        return conn
+        key = self._pool_key(self.db_path)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(
+                    self.db_path,
+                    timeout=self.connection_timeout,
+                    row_factory=self._dict_factory,
+                    pragmas=DatabaseSchema.PRAGMAS,
+                    pool_size=self.POOL_SIZE,
+                    max_overflow=self.POOL_MAX_OVERFLOW,
+                )
+                self._pools[key] = pool
+            return pool
     
     @staticmethod
-    def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    def _pool_key(db_path: Path) -> str:
+        return str(Path(db_path).resolve())
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics (DIAGNOSTICS).
+        
+        Returns:
+            Dict with checkouts, connections_created, reuse_ratio, waits,
+            avg/max wait (ms), in_use, idle and peak_in_use
+        
+        Example:
+            stats = db.get_pool_stats()
+            logger.info(f"DB pool: {stats['checkouts']} checkouts, "
+                        f"{stats['connections_created']} connections opened")
+        """
+        return self._get_pool().stats()
+    
+    @classmethod
+    def close_pool(cls, db_path: Path) -> None:
+        """Close pooled connections for a database file (FILE MAINTENANCE).
+        
+        Call before copying, replacing or deleting the database file so the
+        WAL is checkpointed and no handle to the old file stays open.
+        """
+        with cls._pools_lock:
+            pool = cls._pools.pop(cls._pool_key(db_path), None)
+        if pool is not None:
+            pool.close_all()
+    
+    @classmethod
+    def close_all_pools(cls) -> None:
+        """Close every pooled connection (application shutdown)."""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.close_all()
+    
+    # (description, keys) of the last result set seen by _dict_factory.
+    # Replaced as a single tuple so concurrent threads never see a mismatch.
+    _row_keys_cache: tuple = (None, ())
+    
+    @classmethod
+    def _dict_factory(cls, cursor: sqlite3.Cursor, row: tuple) -> dict:
         """Convert SQL row tuple to dict (INTERNAL - ROW FACTORY).
         
         Allows accessing row['column_name'] instead of row[0].
         
+        Column names are resolved once per result set: sqlite returns the
+        same cursor.description object for every row of a statement, so the
+        key tuple is cached against it and each row is a single dict(zip(...)).
+        
         Args:
             cursor: SQLite cursor (contains column descriptions)
             row: Tuple of values from SQL query
@@ -131,10 +224,12 @@ class DatabaseManager:
         Example:
             row = {'id': 1, 'code': 'NDCD1', 'name': 'North Decline Decant 1'}
         """
-        d = {}
-        for idx, col in enumerate(cursor.description):
-            d[col[0]] = row[idx]
-        return d
+        description = cursor.description
+        cached_description, keys = cls._row_keys_cache
+        if cached_description is not description:
+            keys = tuple(col[0] for col in description)
+            cls._row_keys_cache = (description, keys)
+        return dict(zip(keys, row))
     
     @contextmanager
     def transaction(self):
@@ -202,6 +297,13 @@ class DatabaseManager:
             backup_path = self.db_path.parent / f"{self.db_path.stem}.backup-{timestamp}"
         
         try:
+            # Fold committed WAL pages into the main file before copying it
+            try:
+                with self.connection() as conn:
+                    conn.execute("PRAGMA wal_checkpoint(FULL)")
+            except sqlite3.Error as e:
+                logger.warning(f"WAL checkpoint before backup failed: {e}")
+            
             # Read original database
             with open(self.db_path, 'rb') as original:
                 data = original.read()
@@ -273,6 +375,72 @@ class DatabaseManager:
         finally:
             conn.close()
     
+    def execute_query_columnar(
+        self,
+        query: str,
+        params: tuple = (),
+        as_dataframe: bool = False
+    ) -> Any:
+        """Execute SELECT query and return column arrays (BULK READ).
+        
+        Skips per-row dict creation: rows are fetched as plain tuples and
+        transposed into one NumPy array per column. Use for bulk reads
+        (storage history, audit tables) that are aggregated or charted rather
+        than accessed row by row.
+        
+        Args:
+            query: SQL SELECT statement
+            params: Tuple of parameters for ? placeholders
+            as_dataframe: If True, return a pandas DataFrame instead of arrays
+        
+        Returns:
+            Dict {column_name: numpy.ndarray} (numeric columns get numeric
+            dtypes with NULL as NaN, text columns are object arrays), or a
+            DataFrame when as_dataframe=True. Columns are present even with
+            no rows.
+        
+        Raises:
+            sqlite3.Error: Database error
+        
+        Example:
+            cols = db.execute_query_columnar(
+                "SELECT year, month, closing_volume_m3 FROM storage_history WHERE facility_code=?",
+                ("NDCD1",)
+            )
+            total = cols['closing_volume_m3'].sum()
+        """
+        import numpy as np
+        
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples (no per-row dict)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            columns = [col[0] for col in cursor.description or ()]
+        finally:
+            conn.close()
+        
+        if as_dataframe:
+            import pandas as pd
+            return pd.DataFrame.from_records(rows, columns=columns)
+        
+        if not rows:
+            return {name: np.array([], dtype=object) for name in columns}
+        
+        result = {}
+        for name, values in zip(columns, zip(*rows)):
+            if any(isinstance(v, (str, bytes)) for v in values):
+                result[name] = np.array(values, dtype=object)
+            elif any(v is None for v in values):
+                # Numeric column with NULLs → float with NaN
+                result[name] = np.array(
+                    [np.nan if v is None else v for v in values], dtype=float
+                )
+            else:
+                result[name] = np.array(values)
+        return result
+    
     def execute_mutation(
         self,
         query: str,
@@ -429,3 +597,7 @@ class DatabaseManager:
             fetch_one=True
         )
         return result.get('count', 0) if result else 0
+
+
+# Close pooled connections cleanly on interpreter exit (checkpoints the WAL)
+atexit.register(DatabaseManager.close_all_pools)
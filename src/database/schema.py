@@ -35,6 +35,15 @@ class DatabaseSchema:
     allows easy schema updates without touching core DB manager.
     """
     
+    # Performance/integrity pragmas (also applied to pooled runtime connections)
+    PRAGMAS = (
+        "foreign_keys = ON",
+        "journal_mode = WAL",
+        "synchronous = NORMAL",
+        "cache_size = -64000",
+        "temp_store = MEMORY",
+    )
+    
     # Database location (prefer user data dir if configured)
     _user_dir = os.environ.get("WATERBALANCE_USER_DIR")
     if _user_dir:
@@ -43,7 +52,7 @@ class DatabaseSchema:
         DB_PATH = Path(__file__).parent.parent.parent / "data" / "water_balance.db"
     
     # Schema version (bump on any table/column changes)
-    SCHEMA_VERSION = 7  # Added license_cache and notifications_cache tables
+    SCHEMA_VERSION = 8  # Added balance_result_cache table
     
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize schema manager (CONSTRUCTOR).
@@ -91,6 +100,7 @@ class DatabaseSchema:
             self._create_facility_transfers_table(conn)
             self._create_license_cache_table(conn)
             self._create_notifications_cache_table(conn)
+            self._create_balance_result_cache_table(conn)
             # Future: _create_measurements_table, etc.
             conn.commit()
         except sqlite3.Error as e:
@@ -118,11 +128,8 @@ class DatabaseSchema:
         Args:
             conn: SQLite connection object
         """
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA synchronous = NORMAL")
-        conn.execute("PRAGMA cache_size = -64000")
-        conn.execute("PRAGMA temp_store = MEMORY")
+        for pragma in DatabaseSchema.PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
     
     def _create_storage_facilities_table(self, conn: sqlite3.Connection) -> None:
         """Create storage_facilities table (CORE TABLE - STORAGE FACILITY RECORDS).
@@ -539,6 +546,44 @@ class DatabaseSchema:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_notif_read ON notifications_cache(is_read)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_notif_published ON notifications_cache(published_at)")
 
+    def _create_balance_result_cache_table(self, conn: sqlite3.Connection) -> None:
+        """Create balance_result_cache table (PERSISTENT CALCULATION CACHE).
+        
+        Table purpose:
+        - Keeps BalanceResult JSON across app restarts
+        - Records the input fingerprint each result was computed from, so only
+          periods whose inputs changed are recalculated
+        
+        Table structure:
+        - year, month, mode: PRIMARY KEY (one result per period and mode)
+        - result_json: BalanceResult serialized with pydantic
+        - meter_mtime: Meter Readings file mtime at calculation time
+        - meter_month_hash: Hash of that month's Meter Readings values
+        - environmental_version: Hash of the month's environmental_data row
+        - facility_set_hash: Hash of storage_facilities rows
+        - storage_history_version: Hash of previous month's closing volumes
+        - constants_version: Hash of calculation constants
+        - volume_version: Hash of the facility volumes the period read
+        - created_at: Timestamp
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS balance_result_cache (
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL CHECK(month BETWEEN 1 AND 12),
+                mode TEXT NOT NULL,
+                result_json TEXT NOT NULL,
+                meter_mtime REAL,
+                meter_month_hash TEXT NOT NULL,
+                environmental_version TEXT NOT NULL,
+                facility_set_hash TEXT NOT NULL,
+                storage_history_version TEXT NOT NULL,
+                constants_version TEXT NOT NULL,
+                volume_version TEXT NOT NULL DEFAULT '',
+                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (year, month, mode)
+            )
+        """)
+    
     def ensure_monthly_parameters_table(self) -> None:
         """Ensure monthly parameters table exists (SAFE SCHEMA UPDATE).
         
@@ -674,6 +719,39 @@ class DatabaseSchema:
         finally:
             conn.close()
 
+    def ensure_balance_result_cache_table(self) -> None:
+        """Ensure balance_result_cache table exists (SAFE SCHEMA UPDATE).
+        
+        Safe to call on existing databases:
+        - Creates balance_result_cache table if missing
+        - Adds the volume_version column to older tables (existing
+          rows then fail validation once and are recalculated)
+        
+        Why needed:
+        - Existing DBs created before v8 don't have this table
+        
+        Used by: BalanceResultCache on first access
+        """
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            self._set_pragmas(conn)
+            self._create_balance_result_cache_table(conn)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(balance_result_cache)")]
+            if 'volume_version' not in columns:
+                conn.execute("""
+                    ALTER TABLE balance_result_cache
+                    ADD COLUMN volume_version TEXT NOT NULL DEFAULT ''
+                """)
+                logger.info("Added volume_version column to balance_result_cache (schema upgrade)")
+            conn.commit()
+            logger.info("Ensured balance_result_cache table exists")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to create balance_result_cache table: {e}")
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    
     def ensure_is_lined_column(self) -> None:
         """Ensure is_lined column exists in storage_facilities table (SAFE SCHEMA UPGRADE).
         
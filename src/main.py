@@ -353,4 +353,7 @@ def main():
     sys.exit(exit_code)
 
 if __name__ == "__main__":
+    # Frozen builds: let ProcessPoolExecutor children start without re-running the app
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
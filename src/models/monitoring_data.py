@@ -12,15 +12,19 @@ Models:
 - BoreholeStaticRecord: Static borehole measurement
 - BoreholeMonitoringRecord: Aquifer monitoring record
 - PCDMonitoringRecord: Pollution control dam record
+- RecordBatch: Parsed records as typed columns (models built on demand)
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Type
+from dataclasses import dataclass
 from datetime import datetime, date
 from enum import Enum
 from pathlib import Path
 import logging
 
+import pandas as pd
+
 
 logger = logging.getLogger(__name__)
 
@@ -232,6 +236,55 @@ class PCDMonitoringRecord(MonitoringRecord):
     tss_mg_l: Optional[float] = None  # Total suspended solids
 
 
+# ============================================================================
+# RECORD BATCHES (COLUMNAR PARSE OUTPUT)
+# ============================================================================
+
+@dataclass
+class RecordBatch:
+    """
+    Parsed records of one file as a typed DataFrame.
+
+    One row per record; columns are the record model's parsed fields
+    (measurement_date as datetime64, floats as float64 with NaN for missing).
+    Metadata fields (record_id, created_at, is_valid, error_message) keep
+    their model defaults. Pydantic models are only built by iter_records(),
+    so DataFrame consumers never pay per-row model construction.
+    """
+
+    record_type: Type[MonitoringRecord]
+    frame: pd.DataFrame
+    created_at: datetime
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def iter_records(self) -> Iterator[MonitoringRecord]:
+        """Yield one validated record model per row (lazily)."""
+        frame = self.frame.astype(object).where(self.frame.notna(), None)
+        if 'measurement_date' in frame.columns:
+            frame['measurement_date'] = self.frame['measurement_date'].dt.date
+        columns = list(frame.columns)
+        for values in frame.itertuples(index=False, name=None):
+            yield self.record_type(created_at=self.created_at, **dict(zip(columns, values)))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Rows shaped like model_dump() of each record (field order, defaults)."""
+        data: Dict[str, Any] = {}
+        for name, field in self.record_type.model_fields.items():
+            if name == 'created_at':
+                data[name] = pd.Series([self.created_at] * len(self.frame), index=self.frame.index)
+            elif name == 'measurement_date':
+                data[name] = self.frame[name].dt.date
+            elif name in self.frame.columns:
+                column = self.frame[name]
+                # An optional field missing on every row dumps as None, not NaN
+                data[name] = column.astype(object).where(column.notna(), None) if column.isna().all() else column
+            else:
+                data[name] = pd.Series([field.default] * len(self.frame), index=self.frame.index)
+        return pd.DataFrame(data).reset_index(drop=True)
+
+
 # ============================================================================
 # PARSER OUTPUT
 # ============================================================================
@@ -243,8 +296,9 @@ class ParseResult(BaseModel):
     file_path: str
     timestamp: datetime = Field(default_factory=datetime.now)
     
-    # Results
+    # Results (record models, and/or a columnar batch from the parsers)
     records: List[MonitoringRecord] = Field(default_factory=list)
+    batch: Optional[Any] = Field(default=None, exclude=True, description="RecordBatch")
     
     # Statistics
     total_rows: int = 0
@@ -255,10 +309,32 @@ class ParseResult(BaseModel):
     # Performance
     parse_time_ms: float = 0.0
     
+    @property
+    def record_count(self) -> int:
+        """Number of records (models plus batch rows)"""
+        return len(self.records) + (len(self.batch) if self.batch is not None else 0)
+    
+    def iter_records(self) -> Iterator[MonitoringRecord]:
+        """Yield all records, building batch models on demand"""
+        yield from self.records
+        if self.batch is not None:
+            yield from self.batch.iter_records()
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """All records as a DataFrame (one row per record, model_dump columns)"""
+        frames = []
+        if self.records:
+            frames.append(pd.DataFrame([r.model_dump() for r in self.records]))
+        if self.batch is not None and len(self.batch):
+            frames.append(self.batch.to_dataframe())
+        if not frames:
+            return pd.DataFrame()
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    
     @property
     def success(self) -> bool:
         """Was parsing successful (at least some valid records)?"""
-        return len(self.records) > 0 and len(self.errors) == 0
+        return self.record_count > 0 and len(self.errors) == 0
     
     @property
     def error_rate(self) -> float:
@@ -270,7 +346,7 @@ class ParseResult(BaseModel):
     def __str__(self):
         return (
             f"ParseResult(file={Path(self.file_path).name}, "
-            f"records={len(self.records)}, "
+            f"records={self.record_count}, "
             f"errors={len(self.errors)}, "
             f"time={self.parse_time_ms:.0f}ms)"
         )
@@ -12,6 +12,8 @@ Structure:
 - interfaces.py: Abstract service interfaces
 - constants.py: Calculation constants loader
 - balance_service.py: Main balance orchestrator
+- balance_inputs.py: Preloaded input snapshot for multi-period runs
+- result_cache.py: Persistent, dependency-tracked BalanceResult cache
 - inflows/: Inflow calculation modules
 - outflows/: Outflow calculation modules  
 - storage/: Storage and dam calculations
@@ -0,0 +1,380 @@
+"""
+Balance Input Snapshot (BATCH PRELOAD FOR MULTI-PERIOD RUNS).
+
+Holds every input the balance sub-services read, loaded once per run:
+- environmental_data rows (rainfall/evaporation by year/month)
+- storage_facilities rows (areas, volumes, lining, status)
+- storage_history closing volumes by facility/year/month
+- Meter Readings monthly matrix (ExcelManager.get_meter_readings_monthly)
+
+Used by BalanceService.calculate_range() so a 24-36 month recalculation reads
+SQLite once instead of per month.
+
+Storage chaining happens in memory: each month's recorded closing volumes are
+written into the snapshot and become the next month's opening volumes. The
+queued history rows are persisted once at the end of the run.
+
+Facility volumes (closing, evaporation cap, seepage, opening fallback)
+follow one rule in both the snapshot and the SQLite path, see
+facility_volumes_for(): the latest recorded month reads the live
+current_volume_m3, earlier months read their own recorded closings, so
+recalculating history never depends on volumes written by later months.
+
+Usage:
+    snapshot = BalanceInputSnapshot.load(db, excel, start, end)
+    rain = snapshot.environmental_value(period, 'rainfall_mm')
+    tonnes = snapshot.meter_value(period, 'Tonnes Milled')
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from services.calculation.models import CalculationPeriod, StorageChange
+
+logger = logging.getLogger(__name__)
+
+
+def iter_periods(start: CalculationPeriod, end: CalculationPeriod) -> Iterator[CalculationPeriod]:
+    """Yield every monthly period from start to end (inclusive).
+
+    Args:
+        start: First period in the range
+        end: Last period in the range
+
+    Raises:
+        ValueError: If start is after end
+    """
+    if (start.year, start.month) > (end.year, end.month):
+        raise ValueError(f"Range start {start.period_short} is after end {end.period_short}")
+
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield CalculationPeriod(month=month, year=year)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def previous_period_key(period: CalculationPeriod) -> Tuple[int, int]:
+    """Return (year, month) of the month before the period."""
+    if period.month == 1:
+        return period.year - 1, 12
+    return period.year, period.month - 1
+
+
+@dataclass
+class FacilityVolumes:
+    """Facility volumes a period's calculation reads (VOLUME BASIS).
+
+    Attributes:
+        volumes: {facility_code: volume} used as closing volume, evaporation
+            cap and seepage base
+        recorded_openings: {facility_code: opening_volume_m3} already recorded
+            for the period
+    """
+
+    volumes: Dict[str, float]
+    recorded_openings: Dict[str, float] = field(default_factory=dict)
+
+    def opening_fallback(self, facility_code: str) -> float:
+        """Opening for a facility without previous-month history.
+
+        The period's recorded opening when there is one (recording keeps it,
+        so recalculation is repeatable), else the facility's volume.
+        """
+        if facility_code in self.recorded_openings:
+            return self.recorded_openings[facility_code]
+        return self.volumes.get(facility_code, 0.0)
+
+    def fallback_openings(self, previous_closings: Dict[str, Any]) -> Dict[str, float]:
+        """Return opening fallbacks of facilities without a previous closing."""
+        return {
+            code: self.opening_fallback(code)
+            for code in self.volumes
+            if code not in previous_closings
+        }
+
+
+def facility_volumes_for(
+    period: CalculationPeriod,
+    live_volumes: Dict[str, float],
+    latest_history_period: Optional[Tuple[int, int]],
+    period_closings: Dict[str, float],
+    period_openings: Dict[str, float],
+) -> FacilityVolumes:
+    """Return the facility volumes a period reads (shared snapshot/SQLite rule).
+
+    Args:
+        period: Period being calculated
+        live_volumes: {facility_code: current_volume_m3}
+        latest_history_period: Latest (year, month) in storage_history
+        period_closings: {facility_code: closing_volume_m3} recorded for period
+        period_openings: {facility_code: opening_volume_m3} recorded for period
+
+    Returns:
+        FacilityVolumes with live volumes when period is the latest recorded
+        month (or newer); otherwise the period's recorded closings, falling
+        back to the live volume for facilities without a row for the period.
+    """
+    if latest_history_period is None or (period.year, period.month) >= latest_history_period:
+        volumes = dict(live_volumes)
+    else:
+        volumes = {code: period_closings.get(code, volume) for code, volume in live_volumes.items()}
+    return FacilityVolumes(volumes=volumes, recorded_openings=dict(period_openings))
+
+
+def load_facility_volumes(db_manager, period: CalculationPeriod) -> FacilityVolumes:
+    """Read a period's facility volumes from SQLite (see facility_volumes_for)."""
+    conn = db_manager.get_connection()
+    try:
+        live = {
+            row['code']: float(row['current_volume_m3'] or 0)
+            for row in conn.execute("SELECT code, current_volume_m3 FROM storage_facilities")
+        }
+        row = conn.execute("""
+            SELECT year, month
+            FROM storage_history
+            ORDER BY year DESC, month DESC
+            LIMIT 1
+        """).fetchone()
+        rows = conn.execute("""
+            SELECT facility_code, opening_volume_m3, closing_volume_m3
+            FROM storage_history
+            WHERE year = ? AND month = ?
+        """, (period.year, period.month)).fetchall()
+    finally:
+        conn.close()
+    latest = (int(row['year']), int(row['month'])) if row else None
+    return facility_volumes_for(
+        period,
+        live,
+        latest,
+        {r['facility_code']: float(r['closing_volume_m3']) for r in rows},
+        {r['facility_code']: float(r['opening_volume_m3']) for r in rows},
+    )
+
+
+def next_period(period: CalculationPeriod) -> CalculationPeriod:
+    """Return the month after the period."""
+    if period.month == 12:
+        return CalculationPeriod(month=1, year=period.year + 1)
+    return CalculationPeriod(month=period.month + 1, year=period.year)
+
+
+@dataclass
+class BalanceInputSnapshot:
+    """Preloaded balance inputs for a range of periods (READ SNAPSHOT).
+
+    Attributes:
+        environmental: {(year, month): {'rainfall_mm': x, 'evaporation_mm': y}}
+        facilities: storage_facilities rows (dicts), mutated in memory as
+            closing volumes are recorded
+        storage_history: {(facility_code, year, month): closing_volume_m3}
+        storage_openings: {(facility_code, year, month): opening_volume_m3}
+        latest_history_period: Latest (year, month) present in storage_history
+        meter_monthly: Meter Readings aggregated by (year, month)
+        meter_columns: Column names available in Meter Readings
+        pending_history: History rows queued for a single flush
+        dirty_facilities: Facility codes whose current_volume_m3 changed
+    """
+
+    environmental: Dict[Tuple[int, int], Dict[str, Optional[float]]] = field(default_factory=dict)
+    facilities: List[Dict[str, Any]] = field(default_factory=list)
+    storage_history: Dict[Tuple[str, int, int], float] = field(default_factory=dict)
+    storage_openings: Dict[Tuple[str, int, int], float] = field(default_factory=dict)
+    latest_history_period: Optional[Tuple[int, int]] = None
+    meter_monthly: pd.DataFrame = field(default_factory=pd.DataFrame)
+    meter_columns: Set[str] = field(default_factory=set)
+    pending_history: List[Tuple[str, int, int, float, float, str]] = field(default_factory=list)
+    dirty_facilities: Set[str] = field(default_factory=set)
+    _facility_index: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(
+        cls,
+        db_manager,
+        excel_manager,
+        start: CalculationPeriod,
+        end: CalculationPeriod,
+    ) -> "BalanceInputSnapshot":
+        """Load all inputs for start..end with one connection (BATCH LOAD).
+
+        Args:
+            db_manager: DatabaseManager used for the SQLite reads
+            excel_manager: ExcelManager providing Meter Readings
+            start: First period of the run
+            end: Last period of the run
+
+        Returns:
+            Populated BalanceInputSnapshot
+        """
+        snapshot = cls()
+        prev_year, prev_month = previous_period_key(start)
+
+        conn = db_manager.get_connection()
+        try:
+            for row in conn.execute("""
+                SELECT year, month, rainfall_mm, evaporation_mm
+                FROM environmental_data
+                WHERE (year * 100 + month) BETWEEN ? AND ?
+            """, (start.year * 100 + start.month, end.year * 100 + end.month)).fetchall():
+                snapshot.environmental[(int(row['year']), int(row['month']))] = {
+                    'rainfall_mm': row['rainfall_mm'],
+                    'evaporation_mm': row['evaporation_mm'],
+                }
+
+            snapshot.facilities = [
+                dict(row) for row in conn.execute(
+                    "SELECT * FROM storage_facilities ORDER BY id"
+                ).fetchall()
+            ]
+
+            for row in conn.execute("""
+                SELECT facility_code, year, month, opening_volume_m3, closing_volume_m3
+                FROM storage_history
+                WHERE (year * 100 + month) BETWEEN ? AND ?
+            """, (prev_year * 100 + prev_month, end.year * 100 + end.month)).fetchall():
+                key = (row['facility_code'], int(row['year']), int(row['month']))
+                snapshot.storage_history[key] = float(row['closing_volume_m3'])
+                snapshot.storage_openings[key] = float(row['opening_volume_m3'])
+
+            row = conn.execute("""
+                SELECT year, month
+                FROM storage_history
+                ORDER BY year DESC, month DESC
+                LIMIT 1
+            """).fetchone()
+            if row:
+                snapshot.latest_history_period = (int(row['year']), int(row['month']))
+        finally:
+            conn.close()
+
+        try:
+            df = excel_manager.load_meter_readings()
+        except Exception as e:
+            logger.warning(f"Meter Readings unavailable for batch snapshot: {e}")
+            df = None
+        if df is not None and not df.empty:
+            snapshot.meter_columns = {str(c).strip() for c in df.columns}
+            snapshot.meter_monthly = excel_manager.get_meter_readings_monthly()
+
+        logger.debug(
+            f"Balance snapshot loaded for {start.period_short}..{end.period_short}: "
+            f"{len(snapshot.environmental)} env rows, {len(snapshot.facilities)} facilities, "
+            f"{len(snapshot.storage_history)} history rows, {len(snapshot.meter_monthly)} meter months"
+        )
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def environmental_value(self, period: CalculationPeriod, column: str) -> Optional[float]:
+        """Return rainfall_mm/evaporation_mm for a period, or None if missing."""
+        row = self.environmental.get((period.year, period.month))
+        if not row or row.get(column) is None:
+            return None
+        return float(row[column])
+
+    def meter_value(self, period: CalculationPeriod, column: str) -> Optional[float]:
+        """Return the month's Meter Readings value for a column, or None."""
+        if self.meter_monthly.empty or column not in self.meter_monthly.columns:
+            return None
+        try:
+            value = self.meter_monthly.at[(period.year, period.month), column]
+        except KeyError:
+            return None
+        return None if pd.isna(value) else float(value)
+
+    def active_facilities(self, case_insensitive: bool = False) -> List[Dict[str, Any]]:
+        """Return facilities with status 'active'.
+
+        Args:
+            case_insensitive: Match LOWER(status) = 'active' instead of the exact
+                value (the sub-services use both forms).
+        """
+        if case_insensitive:
+            return [f for f in self.facilities if str(f.get('status') or '').lower() == 'active']
+        return [f for f in self.facilities if f.get('status') == 'active']
+
+    def facility_by_code(self) -> Dict[str, Dict[str, Any]]:
+        """Return facilities keyed by code (rows are shared, not copied)."""
+        if len(self._facility_index) != len(self.facilities):
+            self._facility_index = {f.get('code'): f for f in self.facilities}
+        return self._facility_index
+
+    def period_closings(self, period: CalculationPeriod) -> Dict[str, float]:
+        """Return {facility_code: closing_volume_m3} recorded for the period."""
+        return {
+            code: closing
+            for (code, year, month), closing in self.storage_history.items()
+            if (year, month) == (period.year, period.month)
+        }
+
+    def facility_volumes(self, period: CalculationPeriod) -> FacilityVolumes:
+        """Return the facility volumes the period reads (see facility_volumes_for)."""
+        live = {f['code']: float(f.get('current_volume_m3') or 0) for f in self.facilities}
+        openings = {
+            code: opening
+            for (code, year, month), opening in self.storage_openings.items()
+            if (year, month) == (period.year, period.month)
+        }
+        return facility_volumes_for(
+            period, live, self.latest_history_period, self.period_closings(period), openings
+        )
+
+    def previous_closing(self, facility_code: str, period: CalculationPeriod) -> Optional[float]:
+        """Return the facility's closing volume for the month before period."""
+        prev_year, prev_month = previous_period_key(period)
+        return self.storage_history.get((facility_code, prev_year, prev_month))
+
+    # ------------------------------------------------------------------
+    # In-memory history chaining
+    # ------------------------------------------------------------------
+    def record_history(
+        self,
+        period: CalculationPeriod,
+        storage: StorageChange,
+        data_source: str,
+    ) -> bool:
+        """Record a facility's month in memory and queue it for persistence.
+
+        Mirrors StorageService.record_storage_history(): the closing volume
+        becomes next month's opening, and current_volume_m3 is only advanced
+        when the period is the latest recorded one.
+        """
+        if not storage.facility_code:
+            return False
+
+        key = (period.year, period.month)
+        self.storage_history[(storage.facility_code, period.year, period.month)] = storage.closing_m3
+        self.storage_openings[(storage.facility_code, period.year, period.month)] = storage.opening_m3
+        self.pending_history.append((
+            storage.facility_code,
+            period.year,
+            period.month,
+            storage.opening_m3,
+            storage.closing_m3,
+            data_source,
+        ))
+
+        if self.latest_history_period is None or key >= self.latest_history_period:
+            self.latest_history_period = key
+            fac = self.facility_by_code().get(storage.facility_code)
+            if fac is not None:
+                fac['current_volume_m3'] = storage.closing_m3
+                self.dirty_facilities.add(storage.facility_code)
+        return True
+
+    def current_volume_updates(self) -> List[Tuple[float, str]]:
+        """Return (current_volume_m3, code) pairs for facilities changed in memory."""
+        return [
+            (float(fac.get('current_volume_m3') or 0), fac['code'])
+            for fac in self.facilities
+            if fac.get('code') in self.dirty_facilities
+        ]
@@ -28,9 +28,11 @@ Usage:
         logger.info("Balance issues: %s", result.quality_flags.warnings)
 """
 
+import atexit
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from services.calculation.interfaces import (
     IBalanceEngine,
@@ -40,6 +42,7 @@ from services.calculation.interfaces import (
     IRecycledService,
     IKPIService,
     IFacilityBalanceService,
+    CalculationCancelled,
     CalculationError,
 )
 from services.calculation.models import (
@@ -57,10 +60,21 @@ from services.calculation.models import (
     OutflowComponent,
 )
 from services.calculation.constants import get_constants, ConstantsLoader
+from services.calculation.balance_inputs import (
+    BalanceInputSnapshot, FacilityVolumes, iter_periods, load_facility_volumes, next_period,
+    previous_period_key
+)
+from services.calculation.result_cache import (
+    BalanceDependencies, BalanceDependencyTracker, BalanceResultCache
+)
 from services.excel_manager import get_excel_manager, ExcelManager
 
 logger = logging.getLogger(__name__)
 
+# Progress callback: (stage message, percent complete 0-100). May raise
+# CalculationCancelled to stop a running calculation between stages.
+ProgressCallback = Callable[[str, int], None]
+
 # Excel column names for Meter Readings data
 # These map to columns in the legacy Excel "Meter Readings" sheet
 EXCEL_COLUMNS = {
@@ -114,7 +128,44 @@ EXCEL_COLUMNS = {
 }
 
 
-class InflowsService(IInflowsService):
+class _SnapshotAwareService:
+    """Shared data access for balance sub-services (SNAPSHOT SUPPORT).
+
+    When BalanceService.calculate_range() attaches a BalanceInputSnapshot,
+    reads are served from the preloaded snapshot instead of SQLite and the
+    Meter Readings DataFrame. With no snapshot attached, behaviour is the
+    original per-call lookup.
+    """
+
+    _snapshot: Optional[BalanceInputSnapshot] = None
+
+    def attach_snapshot(self, snapshot: Optional[BalanceInputSnapshot]) -> None:
+        """Attach a preloaded input snapshot (pass None to detach)."""
+        self._snapshot = snapshot
+
+    def _meter_value(self, period: CalculationPeriod, column: str) -> Optional[float]:
+        """Get the Meter Readings value for a column within the period.
+
+        Returns:
+            First numeric value dated inside the month, or None if the column
+            is missing or has no reading for the month.
+        """
+        if self._snapshot is not None:
+            return self._snapshot.meter_value(period, column)
+        return self._excel.get_meter_values(period, [column])[column]
+
+    def _facility_volumes(self, period: CalculationPeriod) -> FacilityVolumes:
+        """Get the facility volumes the period reads.
+
+        Live current_volume_m3 for the latest recorded month, the month's own
+        storage_history closings before that (see facility_volumes_for).
+        """
+        if self._snapshot is not None:
+            return self._snapshot.facility_volumes(period)
+        return load_facility_volumes(self.db, period)
+
+
+class InflowsService(_SnapshotAwareService, IInflowsService):
     """Inflows calculation service implementation.
     
     Calculates all fresh water inflows from:
@@ -148,6 +199,8 @@ class InflowsService(IInflowsService):
 
         Used to distinguish "column missing" from "column exists but month has no values".
         """
+        if self._snapshot is not None:
+            return self._snapshot.meter_columns
         try:
             df = self._excel.load_meter_readings()
             if df is None or df.empty:
@@ -331,14 +384,8 @@ class InflowsService(IInflowsService):
             # Sum all abstraction sources from Excel (full month range)
             for source_col in EXCEL_COLUMNS['abstraction_sources']:
                 try:
-                    series = self._excel.get_meter_readings_series(
-                        source_col,
-                        start_date=period.start_date,
-                        end_date=period.end_date
-                    )
-                    if series:
-                        # series is List[(date, value)], get first match within month
-                        value = series[0][1] if series else 0.0
+                    value = self._meter_value(period, source_col)
+                    if value is not None:
                         total += value
                 except Exception:
                     # Column may not exist in all Excel versions
@@ -382,13 +429,9 @@ class InflowsService(IInflowsService):
                             f"Excel Meter Readings column missing: {source_col}"
                         )
                         continue
-                    series = self._excel.get_meter_readings_series(
-                        source_col,
-                        start_date=period.start_date,
-                        end_date=period.end_date
-                    )
-                    if series and series[0][1] > 0:
-                        total += float(series[0][1])
+                    value = self._meter_value(period, source_col)
+                    if value is not None and value > 0:
+                        total += value
                 except Exception:
                     pass
             
@@ -428,13 +471,9 @@ class InflowsService(IInflowsService):
                             f"Excel Meter Readings column missing: {source_col}"
                         )
                         continue
-                    series = self._excel.get_meter_readings_series(
-                        source_col,
-                        start_date=period.start_date,
-                        end_date=period.end_date
-                    )
-                    if series and series[0][1] > 0:
-                        total += float(series[0][1])
+                    value = self._meter_value(period, source_col)
+                    if value is not None and value > 0:
+                        total += value
                 except Exception:
                     pass
             
@@ -477,13 +516,9 @@ class InflowsService(IInflowsService):
                             f"Excel Meter Readings column missing: {source_col}"
                         )
                         continue
-                    series = self._excel.get_meter_readings_series(
-                        source_col,
-                        start_date=period.start_date,
-                        end_date=period.end_date
-                    )
-                    if series and series[0][1] > 0:
-                        total += float(series[0][1])
+                    value = self._meter_value(period, source_col)
+                    if value is not None and value > 0:
+                        total += value
                 except Exception:
                     pass
             
@@ -532,20 +567,7 @@ class InflowsService(IInflowsService):
             
             # Get total catchment area from storage facilities
             # Look for facilities with catchment_area_m2 column
-            try:
-                conn = self.db.get_connection()
-                cursor = conn.execute("""
-                    SELECT SUM(COALESCE(catchment_area_m2, 0)) as total_catchment
-                    FROM storage_facilities
-                    WHERE status = 'active'
-                """)
-                row = cursor.fetchone()
-                conn.close()
-                
-                catchment_area = float(row['total_catchment']) if row and row['total_catchment'] else 0.0
-            except Exception:
-                # Column may not exist - runoff not configured
-                catchment_area = 0.0
+            catchment_area = self._get_total_catchment_area()
             
             if catchment_area <= 0:
                 # Runoff not configured for this site
@@ -566,6 +588,28 @@ class InflowsService(IInflowsService):
             logger.debug(f"Runoff calculation error: {e}")
             return 0.0
 
+    def _get_total_catchment_area(self) -> float:
+        """Get total catchment area of active facilities (0 if not configured)."""
+        if self._snapshot is not None:
+            active = self._snapshot.active_facilities()
+            if not active or 'catchment_area_m2' not in active[0]:
+                return 0.0
+            return sum(float(f.get('catchment_area_m2') or 0) for f in active)
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.execute("""
+                SELECT SUM(COALESCE(catchment_area_m2, 0)) as total_catchment
+                FROM storage_facilities
+                WHERE status = 'active'
+            """)
+            row = cursor.fetchone()
+            conn.close()
+            
+            return float(row['total_catchment']) if row and row['total_catchment'] else 0.0
+        except Exception:
+            # Column may not exist - runoff not configured
+            return 0.0
+
     def _get_ore_moisture(
         self, 
         period: CalculationPeriod,
@@ -604,13 +648,9 @@ class InflowsService(IInflowsService):
                 return 0.0
 
             # Get tonnes milled from Excel (full month range)
-            series = self._excel.get_meter_readings_series(
-                tonnes_col,
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, tonnes_col)
             
-            tonnes_milled = series[0][1] if series else 0.0
+            tonnes_milled = value if value is not None else 0.0
             
             if tonnes_milled <= 0:
                 flags.add_missing('ore_moisture', f'No ore production data for {period.period_short}')
@@ -640,6 +680,12 @@ class InflowsService(IInflowsService):
         
         Table schema: environmental_data(id, year, month, rainfall_mm, evaporation_mm, ...)
         """
+        if self._snapshot is not None:
+            rainfall_mm = self._snapshot.environmental_value(period, 'rainfall_mm')
+            if rainfall_mm is None:
+                flags.add_missing('rainfall', f'No rainfall data for {period.period_short}')
+                return 0.0
+            return rainfall_mm
         try:
             conn = self.db.get_connection()
             cursor = conn.execute("""
@@ -666,6 +712,12 @@ class InflowsService(IInflowsService):
         Table schema: storage_facilities(id, code, name, ..., surface_area_m2, status, ...)
         Uses status='Active' to filter active facilities (no evap_active column).
         """
+        if self._snapshot is not None:
+            return sum(
+                float(f.get('surface_area_m2') or 0)
+                for f in self._snapshot.active_facilities(case_insensitive=True)
+                if (f.get('surface_area_m2') or 0) > 0
+            )
         try:
             conn = self.db.get_connection()
             cursor = conn.execute("""
@@ -684,7 +736,7 @@ class InflowsService(IInflowsService):
             return 0.0
 
 
-class OutflowsService(IOutflowsService):
+class OutflowsService(_SnapshotAwareService, IOutflowsService):
     """Outflows calculation service implementation.
     
     Calculates all water leaving the system:
@@ -858,26 +910,33 @@ class OutflowsService(IOutflowsService):
             
             # Calculate per facility and sum
             # Filter by status='active' (case-insensitive) and surface area > 0
-            conn = self.db.get_connection()
-            cursor = conn.execute("""
-                SELECT code, surface_area_m2, current_volume_m3
-                FROM storage_facilities
-                WHERE LOWER(status) = 'active'
-                AND surface_area_m2 > 0
-            """)
-            facilities = cursor.fetchall()
-            conn.close()
+            if self._snapshot is not None:
+                facilities = [
+                    f for f in self._snapshot.active_facilities(case_insensitive=True)
+                    if (f.get('surface_area_m2') or 0) > 0
+                ]
+            else:
+                conn = self.db.get_connection()
+                cursor = conn.execute("""
+                    SELECT code, surface_area_m2
+                    FROM storage_facilities
+                    WHERE LOWER(status) = 'active'
+                    AND surface_area_m2 > 0
+                """)
+                facilities = cursor.fetchall()
+                conn.close()
+            volumes = self._facility_volumes(period).volumes
             
             total_evap = 0.0
             for fac in facilities:
                 surface_area = float(fac['surface_area_m2'] or 0)
-                current_vol = float(fac['current_volume_m3'] or 0)
+                volume = volumes.get(fac['code'], 0.0)
                 
                 # Calculate evaporation for this facility
                 evap_m3 = (evap_mm * pan_coeff * surface_area) / 1000
                 
-                # Cap at current volume (can't evaporate more than exists)
-                evap_m3 = min(evap_m3, current_vol)
+                # Cap at the period's volume (can't evaporate more than exists)
+                evap_m3 = min(evap_m3, volume)
                 
                 total_evap += evap_m3
             
@@ -902,19 +961,24 @@ class OutflowsService(IOutflowsService):
             lined_rate = self._constants.seepage_rate_lined_pct / 100
             unlined_rate = self._constants.seepage_rate_unlined_pct / 100
             
-            conn = self.db.get_connection()
-            cursor = conn.execute("""
-                SELECT code, is_lined, current_volume_m3
-                FROM storage_facilities
-                WHERE status = 'active'
-                AND current_volume_m3 > 0
-            """)
-            facilities = cursor.fetchall()
-            conn.close()
+            if self._snapshot is not None:
+                facilities = self._snapshot.active_facilities()
+            else:
+                conn = self.db.get_connection()
+                cursor = conn.execute("""
+                    SELECT code, is_lined
+                    FROM storage_facilities
+                    WHERE status = 'active'
+                """)
+                facilities = cursor.fetchall()
+                conn.close()
+            volumes = self._facility_volumes(period).volumes
             
             total_seepage = 0.0
             for fac in facilities:
-                volume = float(fac['current_volume_m3'] or 0)
+                volume = volumes.get(fac['code'], 0.0)
+                if volume <= 0:
+                    continue
                 is_lined = bool(fac['is_lined'])
                 
                 rate = lined_rate if is_lined else unlined_rate
@@ -934,6 +998,12 @@ class OutflowsService(IOutflowsService):
         
         Table schema: environmental_data(id, year, month, rainfall_mm, evaporation_mm, ...)
         """
+        if self._snapshot is not None:
+            evaporation_mm = self._snapshot.environmental_value(period, 'evaporation_mm')
+            if evaporation_mm is None:
+                flags.add_missing('evaporation', f'No evaporation data for {period.period_short}')
+                return 0.0
+            return evaporation_mm
         try:
             conn = self.db.get_connection()
             cursor = conn.execute("""
@@ -979,14 +1049,10 @@ class OutflowsService(IOutflowsService):
         """
         try:
             # Read tonnes milled from Excel (full month range)
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tonnes_milled'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['tonnes_milled'])
             
-            if series and series[0][1] > 0:
-                tonnes_milled = float(series[0][1])
+            if value is not None and value > 0:
+                tonnes_milled = value
                 
                 # Dust suppression rate: L water per tonne of ore handled
                 # Use configured value or default to 1.0 L/t
@@ -1039,15 +1105,11 @@ class OutflowsService(IOutflowsService):
         try:
             # Read tonnes milled from Excel (tailings ≈ tonnes milled)
             # Recovery rate is typically 1-2%, so 98%+ becomes tailings
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tonnes_milled'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['tonnes_milled'])
             
             tailings_tonnes = 0.0
-            if series and series[0][1] > 0:
-                tailings_tonnes = float(series[0][1])
+            if value is not None and value > 0:
+                tailings_tonnes = value
             
             if tailings_tonnes <= 0:
                 flags.add_estimated('tailings_lockup', 'No tonnage data')
@@ -1098,16 +1160,12 @@ class OutflowsService(IOutflowsService):
         """
         try:
             # Get tailings density from Excel (t/m³)
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tailings_density'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['tailings_density'])
             
-            if not series or series[0][1] <= 0:
+            if value is None or value <= 0:
                 return None
             
-            rho_slurry = float(series[0][1])  # Measured slurry density (t/m³)
+            rho_slurry = value  # Measured slurry density (t/m³)
             
             # Physical constants
             rho_solids = getattr(self._constants, 'tailings_solids_density', 2.7)  # t/m³
@@ -1161,14 +1219,10 @@ class OutflowsService(IOutflowsService):
         """
         try:
             # Read tonnes milled (proxy for tonnes mined)
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tonnes_milled'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['tonnes_milled'])
             
-            if series and series[0][1] > 0:
-                tonnes_mined = float(series[0][1])
+            if value is not None and value > 0:
+                tonnes_mined = value
                 
                 # Mining water rate: m³ per tonne of ore mined
                 rate = getattr(self._constants, 'mining_water_rate_m3_per_t', 0.05)
@@ -1291,48 +1345,32 @@ class OutflowsService(IOutflowsService):
         """
         try:
             # Get PGM concentrate data
-            pgm_tonnes_series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['pgm_wet_tonnes'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
-            pgm_moisture_series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['pgm_moisture_pct'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            pgm_tonnes_value = self._meter_value(period, EXCEL_COLUMNS['pgm_wet_tonnes'])
+            pgm_moisture_value = self._meter_value(period, EXCEL_COLUMNS['pgm_moisture_pct'])
             
             # Get Chromite concentrate data
-            chromite_tonnes_series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['chromite_wet_tonnes'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
-            chromite_moisture_series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['chromite_moisture_pct'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            chromite_tonnes_value = self._meter_value(period, EXCEL_COLUMNS['chromite_wet_tonnes'])
+            chromite_moisture_value = self._meter_value(period, EXCEL_COLUMNS['chromite_moisture_pct'])
             
             # Check if we have at least PGM data (primary product)
-            if not pgm_tonnes_series or pgm_tonnes_series[0][1] <= 0:
+            if pgm_tonnes_value is None or pgm_tonnes_value <= 0:
                 return None  # Fall back to constants
             
             # Calculate PGM water
-            pgm_wet_tonnes = float(pgm_tonnes_series[0][1])
+            pgm_wet_tonnes = pgm_tonnes_value
             pgm_moisture_pct = 14.0  # Default for PGM
-            if pgm_moisture_series and pgm_moisture_series[0][1] > 0:
-                pgm_moisture_pct = float(pgm_moisture_series[0][1])
+            if pgm_moisture_value is not None and pgm_moisture_value > 0:
+                pgm_moisture_pct = pgm_moisture_value
             pgm_water_m3 = pgm_wet_tonnes * (pgm_moisture_pct / 100.0)
             
             # Calculate Chromite water (if available)
             chromite_water_m3 = 0.0
             chromite_wet_tonnes = 0.0
             chromite_moisture_pct = 5.0  # Default for Chromite
-            if chromite_tonnes_series and chromite_tonnes_series[0][1] > 0:
-                chromite_wet_tonnes = float(chromite_tonnes_series[0][1])
-                if chromite_moisture_series and chromite_moisture_series[0][1] > 0:
-                    chromite_moisture_pct = float(chromite_moisture_series[0][1])
+            if chromite_tonnes_value is not None and chromite_tonnes_value > 0:
+                chromite_wet_tonnes = chromite_tonnes_value
+                if chromite_moisture_value is not None and chromite_moisture_value > 0:
+                    chromite_moisture_pct = chromite_moisture_value
                 chromite_water_m3 = chromite_wet_tonnes * (chromite_moisture_pct / 100.0)
             
             total_water = pgm_water_m3 + chromite_water_m3
@@ -1370,14 +1408,10 @@ class OutflowsService(IOutflowsService):
         - product_moisture_pct: Default 8% (filter cake)
         """
         try:
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tonnes_milled'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['tonnes_milled'])
             
-            if series and series[0][1] > 0:
-                tonnes_milled = float(series[0][1])
+            if value is not None and value > 0:
+                tonnes_milled = value
                 
                 recovery_pct = getattr(self._constants, 'recovery_rate_pct', 2.0)
                 product_tonnes = tonnes_milled * (recovery_pct / 100.0)
@@ -1401,7 +1435,7 @@ class OutflowsService(IOutflowsService):
             return 0.0
 
 
-class StorageService(IStorageService):
+class StorageService(_SnapshotAwareService, IStorageService):
     """Storage calculation service implementation (STORAGE TRACKING).
     
     Tracks storage volumes across all facilities for water balance calculation.
@@ -1424,6 +1458,29 @@ class StorageService(IStorageService):
     - facility_transfers table: inter-dam water movements (optional)
     """
     
+    # Upsert one monthly history row (shared by single, batch and snapshot writes)
+    _HISTORY_UPSERT_SQL = """
+        INSERT INTO storage_history (
+            facility_code, year, month, 
+            opening_volume_m3, closing_volume_m3, 
+            data_source, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(facility_code, year, month) DO UPDATE SET
+            opening_volume_m3 = excluded.opening_volume_m3,
+            closing_volume_m3 = excluded.closing_volume_m3,
+            data_source = excluded.data_source,
+            updated_at = CURRENT_TIMESTAMP
+    """
+    
+    # Advance the live volume shown on the Storage Facilities page
+    _CURRENT_VOLUME_UPDATE_SQL = """
+        UPDATE storage_facilities
+        SET current_volume_m3 = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE code = ?
+    """
+    
     def __init__(self, db_manager=None):
         """Initialize storage service (CONSTRUCTOR).
         
@@ -1449,7 +1506,7 @@ class StorageService(IStorageService):
         """
         try:
             from database.schema import DatabaseSchema
-            schema = DatabaseSchema()
+            schema = DatabaseSchema(getattr(self.db, 'db_path', None))
             schema.ensure_storage_history_tables()
         except Exception as e:
             logger.warning(f"Could not ensure storage tables: {e}")
@@ -1554,11 +1611,12 @@ class StorageService(IStorageService):
     ) -> StorageChange:
         """Get storage for a specific facility."""
         try:
+            basis = self._facility_volumes(period)
             conn = self.db.get_connection()
             
             # Get facility info
             cursor = conn.execute("""
-                SELECT code, name, capacity_m3, current_volume_m3
+                SELECT code, name, capacity_m3
                 FROM storage_facilities
                 WHERE code = ?
             """, (facility_code,))
@@ -1573,13 +1631,12 @@ class StorageService(IStorageService):
                     closing_m3=0
                 )
             
-            # Get opening volume from previous month end
-            # For now, use current volume as closing
-            closing_m3 = float(fac['current_volume_m3'] or 0)
+            # Closing is the period's facility volume (live for the latest month)
+            closing_m3 = basis.volumes.get(facility_code, 0.0)
             
             # Try to get previous month's closing as opening
             opening_m3 = self._get_previous_month_volume(
-                facility_code, period, conn, flags
+                facility_code, period, conn, flags, basis.opening_fallback(facility_code)
             )
             
             conn.close()
@@ -1608,19 +1665,40 @@ class StorageService(IStorageService):
         flags: DataQualityFlags
     ) -> List[StorageChange]:
         """Get storage for all active facilities."""
+        basis = self._facility_volumes(period)
+        if self._snapshot is not None:
+            return [
+                self._build_facility_storage(
+                    fac, self._snapshot.previous_closing(fac['code'], period), basis, period, flags
+                )
+                for fac in self._snapshot.active_facilities()
+            ]
+        
+        prev_year, prev_month = previous_period_key(period)
         results = []
         
         try:
+            # Single joined query: facility rows + previous month's closing
             conn = self.db.get_connection()
             cursor = conn.execute("""
-                SELECT code FROM storage_facilities WHERE status = 'active'
-            """)
+                SELECT f.code, f.name, f.capacity_m3,
+                       h.closing_volume_m3 AS prev_closing_m3
+                FROM storage_facilities f
+                LEFT JOIN storage_history h
+                    ON h.facility_code = f.code
+                    AND h.year = ? AND h.month = ?
+                WHERE f.status = 'active'
+                ORDER BY f.id
+            """, (prev_year, prev_month))
             facilities = cursor.fetchall()
             conn.close()
             
             for fac in facilities:
-                storage = self.get_facility_storage(fac['code'], period, flags)
-                results.append(storage)
+                prev_closing = fac['prev_closing_m3']
+                if prev_closing is not None:
+                    logger.debug(f"{fac['code']}: Opening from history = {prev_closing:,.0f} m³")
+                    prev_closing = float(prev_closing)
+                results.append(self._build_facility_storage(fac, prev_closing, basis, period, flags))
                 
         except Exception as e:
             logger.warning(f"All facilities storage query error: {e}")
@@ -1628,14 +1706,58 @@ class StorageService(IStorageService):
         
         return results
     
+    def _build_facility_storage(
+        self,
+        fac: Dict,
+        prev_closing_m3: Optional[float],
+        basis: FacilityVolumes,
+        period: CalculationPeriod,
+        flags: DataQualityFlags
+    ) -> StorageChange:
+        """Build a facility StorageChange from a facility row (SHARED RULES).
+
+        Same rules as get_facility_storage()/_get_previous_month_volume():
+        opening = previous month's closing, falling back to the period's
+        recorded opening or volume (flagged as estimated); closing = the
+        period's volume.
+
+        Args:
+            fac: storage_facilities row (code, name, capacity_m3)
+            prev_closing_m3: Previous month's closing volume, or None if no history
+            basis: Facility volumes for the period (see _facility_volumes)
+            period: Year/month being calculated
+            flags: Data quality tracker
+        """
+        facility_code = fac['code']
+        opening_m3 = prev_closing_m3
+        if opening_m3 is None:
+            opening_m3 = basis.opening_fallback(facility_code)
+            prev_year, prev_month = previous_period_key(period)
+            flags.add_estimated(f'{facility_code}_opening', 
+                               f'No history for {prev_month}/{prev_year}, using {opening_m3:,.0f} m³')
+            logger.info(f"{facility_code}: No storage history, opening fallback: {opening_m3:,.0f} m³")
+        
+        return StorageChange(
+            facility_code=facility_code,
+            facility_name=fac.get('name'),
+            opening_m3=opening_m3,
+            closing_m3=basis.volumes.get(facility_code, 0.0),
+            capacity_m3=float(fac.get('capacity_m3') or 0),
+            source=DataQualityLevel.MEASURED
+        )
+    
     def _get_previous_month_volume(
         self,
         facility_code: str,
         period: CalculationPeriod,
         conn,
-        flags: DataQualityFlags
+        flags: DataQualityFlags,
+        fallback_m3: float
     ) -> float:
-        """Get previous month's closing volume as this month's opening."""
+        """Get previous month's closing volume as this month's opening.
+        
+        Falls back to fallback_m3 (FacilityVolumes.opening_fallback).
+        """
         try:
             # Calculate previous month
             if period.month == 1:
@@ -1657,45 +1779,20 @@ class StorageService(IStorageService):
                 logger.debug(f"{facility_code}: Opening from history = {row['closing_volume_m3']:,.0f} m³")
                 return float(row['closing_volume_m3'])
             
-            # No history found - fallback to current volume
-            # This assumes current volume is a reasonable proxy for opening
-            # (will be inaccurate but better than 0)
-            cursor = conn.execute("""
-                SELECT current_volume_m3
-                FROM storage_facilities
-                WHERE code = ?
-            """, (facility_code,))
-            row = cursor.fetchone()
-            
-            if row:
-                current = float(row['current_volume_m3'] or 0)
-                flags.add_estimated(f'{facility_code}_opening', 
-                                   f'No history for {prev_month}/{prev_year}, using current ({current:,.0f} m³)')
-                logger.info(f"{facility_code}: No storage history, using current volume as opening: {current:,.0f} m³")
-                return current
-            
-            flags.add_warning(f"{facility_code}: no current volume data found for opening fallback.")
-            return 0.0
+            # No history found - fall back to the period's recorded opening
+            # or volume (will be inaccurate but better than 0)
+            flags.add_estimated(f'{facility_code}_opening', 
+                               f'No history for {prev_month}/{prev_year}, using {fallback_m3:,.0f} m³')
+            logger.info(f"{facility_code}: No storage history, opening fallback: {fallback_m3:,.0f} m³")
+            return fallback_m3
             
         except Exception as e:
-            # Log error but don't fail completely - try current volume fallback
+            # Log error but don't fail completely - use the fallback opening
             logger.warning(f"Previous month volume query error for {facility_code}: {e}")
-            
-            # Fallback: try to get current volume
-            try:
-                cursor = conn.execute("""
-                    SELECT current_volume_m3
-                    FROM storage_facilities
-                    WHERE code = ?
-                """, (facility_code,))
-                row = cursor.fetchone()
-                if row and row['current_volume_m3']:
-                    flags.add_estimated(f'{facility_code}_opening', 
-                                       'History query failed, using current volume')
-                    return float(row['current_volume_m3'])
-            except Exception:
-                pass
-            
+            if fallback_m3:
+                flags.add_estimated(f'{facility_code}_opening', 
+                                   'History query failed, using fallback opening')
+                return fallback_m3
             return 0.0
 
     def record_storage_history(
@@ -1728,23 +1825,15 @@ class StorageService(IStorageService):
             logger.debug("Cannot record history for system total (no facility_code)")
             return False
         
+        if self._snapshot is not None:
+            # Batch mode: chain in memory, persisted by flush_snapshot_history()
+            return self._snapshot.record_history(period, storage, data_source)
+        
         try:
             conn = self.db.get_connection()
             
             # 1. Upsert history record (monthly snapshot)
-            conn.execute("""
-                INSERT INTO storage_history (
-                    facility_code, year, month, 
-                    opening_volume_m3, closing_volume_m3, 
-                    data_source, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(facility_code, year, month) DO UPDATE SET
-                    opening_volume_m3 = excluded.opening_volume_m3,
-                    closing_volume_m3 = excluded.closing_volume_m3,
-                    data_source = excluded.data_source,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (
+            conn.execute(self._HISTORY_UPSERT_SQL, (
                 storage.facility_code,
                 period.year,
                 period.month,
@@ -1757,12 +1846,10 @@ class StorageService(IStorageService):
             # is latest/newer. Prevent historical recalculations from overwriting
             # the live snapshot on Storage Facilities page.
             if self._should_update_current_volume(conn, period):
-                conn.execute("""
-                    UPDATE storage_facilities
-                    SET current_volume_m3 = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE code = ?
-                """, (storage.closing_m3, storage.facility_code))
+                conn.execute(
+                    self._CURRENT_VOLUME_UPDATE_SQL,
+                    (storage.closing_m3, storage.facility_code)
+                )
             else:
                 logger.info(
                     f"Skipped current_volume update for historical period "
@@ -1828,7 +1915,7 @@ class StorageService(IStorageService):
             Number of records successfully saved
         """
         facilities = self.get_all_facilities_storage(period, flags)
-        saved = 0
+        to_record: List[StorageChange] = []
         
         # If we have calculated storage from balance equation, distribute
         # the closing volume proportionally across facilities
@@ -1843,31 +1930,115 @@ class StorageService(IStorageService):
                     proportion = storage.opening_m3 / total_opening if total_opening > 0 else 1.0 / len(facilities)
                     facility_delta = delta * proportion
                     # Create updated storage with calculated closing
-                    updated_storage = StorageChange(
+                    to_record.append(StorageChange(
                         facility_code=storage.facility_code,
                         facility_name=storage.facility_name,
                         opening_m3=storage.opening_m3,
                         closing_m3=storage.opening_m3 + facility_delta,
                         capacity_m3=storage.capacity_m3,
                         source=DataQualityLevel.CALCULATED
-                    )
-                    if self.record_storage_history(period, updated_storage, data_source):
-                        saved += 1
+                    ))
                 else:
                     # No opening volumes - just save as-is
-                    if self.record_storage_history(period, storage, data_source):
-                        saved += 1
+                    to_record.append(storage)
         else:
             # Legacy mode - save facilities as-is
-            for storage in facilities:
-                if self.record_storage_history(period, storage, data_source):
-                    saved += 1
+            to_record = list(facilities)
+        
+        saved = self.record_storage_history_batch(period, to_record, data_source)
         
         logger.info(f"Recorded storage history for {saved}/{len(facilities)} facilities")
         return saved
 
+    def record_storage_history_batch(
+        self,
+        period: CalculationPeriod,
+        storages: List[StorageChange],
+        data_source: str = 'calculated'
+    ) -> int:
+        """Record history for many facilities in one transaction (BATCH WRITE).
+        
+        Set-based equivalent of calling record_storage_history() per facility:
+        one executemany upsert into storage_history and, when the period is the
+        latest/newer one, one executemany current_volume_m3 update. All rows
+        commit together or roll back together.
+        
+        Args:
+            period: Year/month for the records
+            storages: Per-facility StorageChange objects (system totals skipped)
+            data_source: 'measured', 'calculated', 'estimated', 'imported'
+        
+        Returns:
+            Number of history rows written (0 if the transaction failed)
+        """
+        storages = [s for s in storages if s.facility_code]
+        if not storages:
+            return 0
+        
+        if self._snapshot is not None:
+            # Batch mode: chain in memory, persisted by flush_snapshot_history()
+            return sum(
+                1 for storage in storages
+                if self._snapshot.record_history(period, storage, data_source)
+            )
+        
+        history_rows = [
+            (s.facility_code, period.year, period.month, s.opening_m3, s.closing_m3, data_source)
+            for s in storages
+        ]
+        
+        try:
+            with self.db.transaction() as conn:
+                # Evaluated before the upsert; equivalent to the per-row check
+                # since the new rows are all for this period.
+                update_current = self._should_update_current_volume(conn, period)
+                conn.executemany(self._HISTORY_UPSERT_SQL, history_rows)
+                if update_current:
+                    conn.executemany(
+                        self._CURRENT_VOLUME_UPDATE_SQL,
+                        [(s.closing_m3, s.facility_code) for s in storages]
+                    )
+                else:
+                    logger.info(
+                        f"Skipped current_volume update for historical period "
+                        f"{period.month:02d}/{period.year} ({len(storages)} facilities)"
+                    )
+        except Exception as e:
+            logger.error(f"Failed to record storage history batch: {e}")
+            return 0
+        
+        logger.debug(f"Recorded storage history batch for {period.month}/{period.year}: "
+                     f"{len(history_rows)} facilities")
+        return len(history_rows)
+
+    def flush_snapshot_history(self, snapshot: BalanceInputSnapshot) -> int:
+        """Persist history rows queued in a snapshot (SINGLE TRANSACTION).
+
+        Writes every storage_history row recorded during a calculate_range()
+        run and the final current_volume_m3 of facilities whose snapshot was
+        advanced, then commits once.
+
+        Args:
+            snapshot: Snapshot whose pending_history should be written
 
-class KPIService(IKPIService):
+        Returns:
+            Number of history rows written
+        """
+        if not snapshot.pending_history:
+            return 0
+        
+        with self.db.transaction() as conn:
+            conn.executemany(self._HISTORY_UPSERT_SQL, snapshot.pending_history)
+            conn.executemany(self._CURRENT_VOLUME_UPDATE_SQL, snapshot.current_volume_updates())
+        
+        written = len(snapshot.pending_history)
+        snapshot.pending_history.clear()
+        snapshot.dirty_facilities.clear()
+        logger.info(f"Flushed {written} storage history rows from batch calculation")
+        return written
+
+
+class KPIService(_SnapshotAwareService, IKPIService):
     """KPI calculation service implementation (KEY PERFORMANCE INDICATORS).
     
     Calculates key performance indicators from balance results.
@@ -1987,21 +2158,13 @@ class KPIService(IKPIService):
         """
         try:
             # Get measured RWD intensity from Excel (RWD.1 column)
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['rwd_intensity'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
-            rwd_measured = float(series[0][1]) if series and series[0][1] > 0 else None
+            value = self._meter_value(period, EXCEL_COLUMNS['rwd_intensity'])
+            rwd_measured = value if value is not None and value > 0 else None
             
             # Get RWD volume directly from Excel to calculate intensity
             # (We read from Excel since recycled.components may have pre-calculated total)
-            rwd_volume_series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['rwd_1'],  # RWD column (m³)
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
-            rwd_volume = float(rwd_volume_series[0][1]) if rwd_volume_series and rwd_volume_series[0][1] > 0 else 0.0
+            rwd_volume = self._meter_value(period, EXCEL_COLUMNS['rwd_1'])  # RWD column (m³)
+            rwd_volume = rwd_volume if rwd_volume is not None and rwd_volume > 0 else 0.0
             
             # Calculate RWD intensity from RWD volume and tonnes
             rwd_calculated = None
@@ -2038,16 +2201,12 @@ class KPIService(IKPIService):
         """
         try:
             # Get tailings density from Excel
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tailings_density'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['tailings_density'])
             
-            if not series or series[0][1] <= 0:
+            if value is None or value <= 0:
                 return None, None
             
-            rho_slurry = float(series[0][1])  # Measured slurry density (t/m³)
+            rho_slurry = value  # Measured slurry density (t/m³)
             
             # Physical constants
             rho_solids = getattr(self._constants, 'tailings_solids_density', 2.7)  # t/m³
@@ -2081,12 +2240,8 @@ class KPIService(IKPIService):
     def _get_tonnes_milled(self, period: CalculationPeriod) -> float:
         """Get tonnes milled for the period from Excel Meter Readings."""
         try:
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['tonnes_milled'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
-            return series[0][1] if series else 0.0
+            value = self._meter_value(period, EXCEL_COLUMNS['tonnes_milled'])
+            return value if value is not None else 0.0
             
         except Exception as e:
             logger.debug(f"Tonnes milled query error: {e}")
@@ -2112,7 +2267,7 @@ class KPIService(IKPIService):
         return storage.closing_m3 / daily_usage
 
 
-class RecycledService(IRecycledService):
+class RecycledService(_SnapshotAwareService, IRecycledService):
     """Recycled water calculation service.
     
     Uses Excel Meter Readings for RWD and Total Recycled Water data.
@@ -2145,13 +2300,9 @@ class RecycledService(IRecycledService):
         
         # Try to get pre-calculated total from Excel first
         try:
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['total_recycled'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
-            if series and series[0][1] > 0:
-                total_recycled = series[0][1]
+            value = self._meter_value(period, EXCEL_COLUMNS['total_recycled'])
+            if value is not None and value > 0:
+                total_recycled = value
                 logger.debug(f"Recycled water from Excel for {period.period_short}: {total_recycled:,.0f} m³")
                 return RecycledWaterResult(
                     total_m3=total_recycled,
@@ -2196,14 +2347,10 @@ class RecycledService(IRecycledService):
         """
         try:
             # Read total consumption from Excel
-            series = self._excel.get_meter_readings_series(
-                EXCEL_COLUMNS['total_consumption'],
-                start_date=period.start_date,
-                end_date=period.end_date
-            )
+            value = self._meter_value(period, EXCEL_COLUMNS['total_consumption'])
             
-            if series and series[0][1] > 0:
-                plant_consumption = float(series[0][1])
+            if value is not None and value > 0:
+                plant_consumption = value
                 tsf_return_pct = self._constants.tsf_return_water_pct
                 flags.add_estimated('tsf_return', 
                                    f'Estimated at {tsf_return_pct}% of plant consumption')
@@ -2231,13 +2378,9 @@ class RecycledService(IRecycledService):
                 if not col_name:
                     continue
                     
-                series = self._excel.get_meter_readings_series(
-                    col_name,
-                    start_date=period.start_date,
-                    end_date=period.end_date
-                )
-                if series and series[0][1] > 0:
-                    total += float(series[0][1])
+                value = self._meter_value(period, col_name)
+                if value is not None and value > 0:
+                    total += value
             except Exception as e:
                 logger.debug(f"RWD column {col_key} read failed: {e}")
         
@@ -2255,12 +2398,38 @@ class BalanceService(IBalanceEngine):
         error = fresh_inflows - outflows - delta_storage
     """
     
-    def __init__(self, db_manager=None, excel_manager: Optional[ExcelManager] = None):
+    # Closing-volume difference (m³) below which a cascade is considered converged
+    CASCADE_TOLERANCE_M3 = 1.0
+    
+    # Progress reported by _evaluate_period before each stage: (message, percent)
+    PROGRESS_STAGES = {
+        'inflows': ("Calculating inflows", 0),
+        'outflows': ("Calculating outflows", 20),
+        'storage': ("Calculating storage change", 40),
+        'recycled': ("Calculating recycled water", 55),
+        'kpis': ("Calculating KPIs", 70),
+        'history': ("Recording storage history", 85),
+        # Parallel mode runs inflows, outflows, storage and recycled together
+        'independent': ("Calculating inflows, outflows, storage and recycled water", 0),
+    }
+    
+    # Worker threads for parallel mode (one per independent stage)
+    PARALLEL_WORKERS = 4
+    
+    def __init__(
+        self,
+        db_manager=None,
+        excel_manager: Optional[ExcelManager] = None,
+        parallel: Optional[bool] = None,
+    ):
         """Initialize balance service with all sub-services.
         
         Args:
             db_manager: Shared database manager (creates one if None)
             excel_manager: Shared Excel manager for reading Meter Readings
+            parallel: Run the independent stages (inflows, outflows, storage,
+                      recycled) concurrently on a shared input snapshot.
+                      None = use features.parallel_balance_stages from config.
         """
         if db_manager is None:
             from database.db_manager import DatabaseManager
@@ -2269,6 +2438,15 @@ class BalanceService(IBalanceEngine):
         self.db = db_manager
         self._excel = excel_manager or get_excel_manager()
         
+        if parallel is None:
+            try:
+                from core.config_manager import config
+                parallel = bool(config.get('features.parallel_balance_stages', False))
+            except Exception:
+                parallel = False
+        self.parallel = parallel
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # Initialize sub-services with shared DB and Excel managers
         self.inflows_service = InflowsService(db_manager, self._excel)
         self.outflows_service = OutflowsService(db_manager, self._excel)
@@ -2276,8 +2454,14 @@ class BalanceService(IBalanceEngine):
         self.recycled_service = RecycledService(db_manager, self._excel)
         self.kpi_service = KPIService(db_manager, self._excel)
         
-        # Cache for repeated calculations
-        self._cache: Dict[str, BalanceResult] = {}
+        # Persistent result cache, validated against each result's inputs
+        self._result_cache = BalanceResultCache(
+            db_manager,
+            BalanceDependencyTracker(
+                db_manager, self._excel,
+                constants_provider=lambda: self.inflows_service._constants
+            )
+        )
         
         logger.info("BalanceService initialized")
     
@@ -2286,11 +2470,13 @@ class BalanceService(IBalanceEngine):
         period: CalculationPeriod,
         mode: str = "REGULATOR",
         force_recalculate: bool = False,
+        progress: Optional[ProgressCallback] = None,
     ) -> BalanceResult:
         """Run complete water balance calculation.
         
         Workflow:
-        1. Check cache for existing result (skip if force_recalculate=True)
+        1. Check cache for existing result (skip if force_recalculate=True);
+           a cached result is stale once any recorded input changed
         2. Calculate inflows
         3. Calculate outflows
         4. Calculate storage change
@@ -2304,101 +2490,550 @@ class BalanceService(IBalanceEngine):
             mode: Calculation mode (REGULATOR, INTERNAL, AUDIT)
             force_recalculate: If True, skip cache and recalculate from fresh data.
                               Use when data has changed (e.g., Excel updated, DB modified).
+            progress: Optional callback receiving (stage, percent) before each
+                      stage; raising CalculationCancelled from it stops the run
         
         Returns:
             BalanceResult with all calculation outputs
+        
+        Raises:
+            CalculationCancelled: If progress cancelled the run (nothing saved)
         """
-        # Check cache (skip if force_recalculate is True)
-        cache_key = f"{period.year}_{period.month}_{mode}"
-        if not force_recalculate and cache_key in self._cache:
-            logger.debug(f"Returning cached result for {period.period_short}")
-            return self._cache[cache_key]
+        # Check cache (skip if force_recalculate is True). Cached results are
+        # reused only while their recorded inputs are unchanged.
+        if not force_recalculate:
+            cached = self._result_cache.get(period, mode)
+            if cached is not None:
+                return cached
         
         if force_recalculate:
             logger.info(f"Force recalculating balance for {period.period_label} (cache bypassed)")
         else:
             logger.info(f"Calculating balance for {period.period_label} (mode={mode})")
         
+        # Fingerprint the inputs before evaluating: evaluation writes
+        # storage_history and the live facility volumes
+        dependencies = self._result_cache.fingerprint(period)
+        
+        try:
+            if self.parallel:
+                result = self._evaluate_with_snapshot(period, mode, progress)
+            else:
+                result = self._evaluate_period(period, mode, progress)
+            
+            # 10. Cache result with the fingerprint of its inputs
+            self._result_cache.put(period, mode, result, dependencies)
+            if progress:
+                progress("Done", 100)
+            
+            return result
+            
+        except CalculationCancelled:
+            logger.info(f"Balance calculation for {period.period_label} cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Balance calculation failed: {e}")
+            raise CalculationError(
+                message=str(e),
+                component="BalanceService",
+                details={'period': period.period_label, 'mode': mode}
+            )
+    
+    def calculate_range(
+        self,
+        start: CalculationPeriod,
+        end: CalculationPeriod,
+        mode: str = "REGULATOR",
+    ) -> List[BalanceResult]:
+        """Recalculate every month from start to end in one pass (BATCH ENGINE).
+        
+        Used after an Excel correction when 24-36 months must be recomputed.
+        Compared with calling calculate() per month:
+        - environmental_data, storage_facilities and storage_history are read
+          once into a BalanceInputSnapshot
+        - Meter Readings are pre-aggregated by month (one slice per run)
+        - Each month's recorded closing volumes feed the next month's opening
+          in memory; storage_history is written once in a single transaction
+        
+        Results match sequential calculate(..., force_recalculate=True) calls
+        and replace any cached results (memory and persisted) for the same
+        periods. If any month fails, nothing is written to storage_history.
+        
+        Args:
+            start: First period (inclusive)
+            end: Last period (inclusive)
+            mode: Calculation mode (REGULATOR, INTERNAL, AUDIT)
+        
+        Returns:
+            List of BalanceResult in chronological order
+        
+        Raises:
+            ValueError: If start is after end
+            CalculationError: If any period fails to calculate
+        
+        Example:
+            results = service.calculate_range(
+                CalculationPeriod(month=1, year=2024),
+                CalculationPeriod(month=12, year=2025),
+            )
+        """
+        periods = list(iter_periods(start, end))
+        logger.info(
+            f"Calculating balance range {start.period_short}..{end.period_short} "
+            f"({len(periods)} months, mode={mode})"
+        )
+        return self._run_chain(periods, mode)
+    
+    def recalculate_from(
+        self,
+        start: CalculationPeriod,
+        mode: str = "REGULATOR",
+        end: Optional[CalculationPeriod] = None,
+        tolerance_m3: float = CASCADE_TOLERANCE_M3,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[BalanceResult]:
+        """Recompute a changed month and its downstream chain (CASCADE).
+        
+        Each month's closing volumes become the next month's opening, so a
+        correction in one month can shift every later month. Months are
+        recomputed in order (batch snapshot, like calculate_range) and the
+        cascade stops as soon as a month's closing volumes match the values
+        previously stored in storage_history (within tolerance_m3 for every
+        facility): later months would then see identical openings.
+        
+        Args:
+            start: First month whose inputs changed
+            mode: Calculation mode (REGULATOR, INTERNAL, AUDIT)
+            end: Last month to consider (default: latest month in storage_history,
+                 or start if nothing later has been recorded)
+            tolerance_m3: Closing-volume difference treated as converged
+            progress: Optional (stage, percent) callback, called per month
+        
+        Returns:
+            Recomputed results in chronological order (may stop before end)
+        """
+        if end is None:
+            end = self._latest_history_period() or start
+            if (end.year, end.month) < (start.year, start.month):
+                end = start
+        
+        periods = list(iter_periods(start, end))
+        logger.info(
+            f"Cascading balance recalculation from {start.period_short} "
+            f"(up to {len(periods)} months, mode={mode})"
+        )
+        results = self._run_chain(
+            periods, mode, converge_tolerance_m3=tolerance_m3, progress=progress
+        )
+        if len(results) < len(periods):
+            logger.info(
+                f"Cascade converged at {results[-1].period.period_short}; "
+                f"{len(periods) - len(results)} later months unchanged"
+            )
+        return results
+    
+    def find_stale_periods(self, mode: str = "REGULATOR") -> List[CalculationPeriod]:
+        """Return persisted periods whose recorded inputs changed (chronological).
+        
+        Only periods with a persisted result are checked; periods never
+        calculated are computed on first request anyway.
+        """
+        stale = self._result_cache.stale_periods(mode)
+        for period, changed in stale:
+            logger.debug(f"Stale balance {period.period_short} ({mode}): {', '.join(changed)}")
+        return [period for period, _ in stale]
+    
+    def refresh_stale_periods(
+        self,
+        mode: str = "REGULATOR",
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[BalanceResult]:
+        """Recompute every stale period and its downstream chain.
+        
+        Stale periods already covered by an earlier cascade are skipped.
+        
+        Args:
+            mode: Calculation mode (REGULATOR, INTERNAL, AUDIT)
+            progress: Optional (stage, percent) callback, called per month
+        
+        Returns:
+            All recomputed results in chronological order
+        """
+        refreshed: Dict[Tuple[int, int], BalanceResult] = {}
+        for period in self.find_stale_periods(mode):
+            if (period.year, period.month) in refreshed:
+                continue
+            for result in self.recalculate_from(period, mode, progress=progress):
+                refreshed[(result.period.year, result.period.month)] = result
+        return [refreshed[key] for key in sorted(refreshed)]
+    
+    def calculate_with_cascade(
+        self,
+        period: CalculationPeriod,
+        mode: str = "REGULATOR",
+        progress: Optional[ProgressCallback] = None,
+        refresh_stale: bool = False,
+    ) -> Tuple[BalanceResult, List[BalanceResult]]:
+        """Calculate one month and cascade any change into the months after it.
+        
+        Workflow:
+        1. Optionally refresh stale persisted periods (refresh_stale=True)
+        2. Calculate the requested period (cached when still valid)
+        3. If its closing volumes moved, cascade into the following months
+           (recalculate_from, stopping once closings converge)
+        
+        Earlier months are not touched unless refresh_stale is set; each one
+        is revalidated against its recorded inputs when it is next requested.
+        
+        Args:
+            period: Month requested by the user
+            mode: Calculation mode (REGULATOR, INTERNAL, AUDIT)
+            progress: Optional (stage, percent) callback covering all steps;
+                      raising CalculationCancelled from it stops the run
+            refresh_stale: Also sweep every persisted period for changed
+                           inputs first (see refresh_stale_periods)
+        
+        Returns:
+            (result for period, other months recomputed as a consequence)
+        
+        Raises:
+            CalculationCancelled: If progress cancelled the run. Months already
+                refreshed by an earlier step stay saved.
+        """
+        refreshed: Dict[Tuple[int, int], BalanceResult] = {}
+        calc_start = 0
+        if refresh_stale:
+            calc_start = 10
+            refreshed = {
+                (r.period.year, r.period.month): r
+                for r in self.refresh_stale_periods(mode, self._scaled_progress(progress, 0, 10))
+            }
+        
+        before = self._stored_closings(period)
+        result = self.calculate(
+            period, mode, progress=self._scaled_progress(progress, calc_start, 90)
+        )
+        after = self._stored_closings(period)
+        
+        if not self._closings_converged(before, after, self.CASCADE_TOLERANCE_M3):
+            following = next_period(period)
+            latest = self._latest_history_period()
+            if latest is not None and (following.year, following.month) <= (latest.year, latest.month):
+                chain = self.recalculate_from(
+                    following, mode, end=latest,
+                    progress=self._scaled_progress(progress, 90, 100)
+                )
+                for downstream in chain:
+                    refreshed[(downstream.period.year, downstream.period.month)] = downstream
+        
+        refreshed.pop((period.year, period.month), None)
+        if progress:
+            progress("Done", 100)
+        return result, [refreshed[key] for key in sorted(refreshed)]
+    
+    def _run_chain(
+        self,
+        periods: List[CalculationPeriod],
+        mode: str,
+        converge_tolerance_m3: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[BalanceResult]:
+        """Evaluate consecutive periods on one snapshot, then flush and cache.
+        
+        Args:
+            periods: Consecutive periods in chronological order
+            mode: Calculation mode
+            converge_tolerance_m3: If set, stop after the first period whose
+                closing volumes match the previously stored ones
+            progress: Optional (stage, percent) callback, called per period;
+                cancelling discards the whole chain
+        
+        Returns:
+            Evaluated results (all periods unless the chain converged early)
+        """
+        start, end = periods[0], periods[-1]
+        snapshot = BalanceInputSnapshot.load(self.db, self._excel, start, end)
+        results: List[BalanceResult] = []
+        dependencies: List[BalanceDependencies] = []
+        current: Optional[CalculationPeriod] = None
+        
+        tracker = self._result_cache.tracker
+        facility_hash = tracker.facility_set_hash()
+        constants_version = tracker.constants_version()
+        
+        self._attach_snapshot(snapshot)
+        try:
+            for index, current in enumerate(periods):
+                if progress:
+                    progress(f"Recalculating {current.period_short}", index * 100 // len(periods))
+                before = snapshot.period_closings(current)
+                # Fingerprint from the snapshot as this month sees it: openings
+                # are the in-memory closings chained from the previous month
+                dependencies.append(self._snapshot_dependencies(
+                    snapshot, current, facility_hash, constants_version
+                ))
+                results.append(self._evaluate_period(current, mode))
+                if converge_tolerance_m3 is not None and self._closings_converged(
+                    before, snapshot.period_closings(current), converge_tolerance_m3
+                ):
+                    break
+        except CalculationCancelled:
+            logger.info(f"Balance range {start.period_short}..{end.period_short} cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Balance range calculation failed at {current.period_short}: {e}")
+            raise CalculationError(
+                message=str(e),
+                component="BalanceService",
+                details={'period': current.period_label, 'mode': mode,
+                         'range': f"{start.period_short}..{end.period_short}"}
+            )
+        finally:
+            self._attach_snapshot(None)
+        
+        try:
+            self.storage_service.flush_snapshot_history(snapshot)
+        except Exception as hist_err:
+            logger.warning(f"Could not record storage history: {hist_err}")
+        
+        for result, deps in zip(results, dependencies):
+            self._result_cache.put(result.period, mode, result, deps)
+        
+        return results
+    
+    def _snapshot_dependencies(
+        self,
+        snapshot: BalanceInputSnapshot,
+        period: CalculationPeriod,
+        facility_hash: str,
+        constants_version: str,
+    ) -> BalanceDependencies:
+        """Fingerprint a chained period's inputs before it is evaluated."""
+        tracker = self._result_cache.tracker
+        prev_year, prev_month = previous_period_key(period)
+        openings = snapshot.period_closings(CalculationPeriod(month=prev_month, year=prev_year))
+        return tracker.current(
+            period,
+            facility_set_hash=facility_hash,
+            constants_version=constants_version,
+            storage_history_version=tracker.closings_version(openings),
+            volume_version=tracker.volumes_version(snapshot.facility_volumes(period), openings),
+        )
+    
+    @staticmethod
+    def _scaled_progress(
+        progress: Optional[ProgressCallback],
+        start: int,
+        end: int,
+    ) -> Optional[ProgressCallback]:
+        """Map a step's 0-100 progress onto the start..end slice of the caller's."""
+        if progress is None:
+            return None
+        return lambda stage, percent: progress(stage, start + (end - start) * percent // 100)
+    
+    @staticmethod
+    def _closings_converged(
+        before: Dict[str, float],
+        after: Dict[str, float],
+        tolerance_m3: float,
+    ) -> bool:
+        """True when every facility's closing volume is unchanged (within tolerance).
+        
+        A month with no previously stored closings has not converged.
+        """
+        if not before or before.keys() != after.keys():
+            return False
+        return all(abs(after[code] - before[code]) <= tolerance_m3 for code in before)
+    
+    def _stored_closings(self, period: CalculationPeriod) -> Dict[str, float]:
+        """Read {facility_code: closing_volume_m3} from storage_history."""
+        rows = self.db.execute_query(
+            "SELECT facility_code, closing_volume_m3 FROM storage_history "
+            "WHERE year = ? AND month = ?",
+            (period.year, period.month),
+        )
+        return {row['facility_code']: float(row['closing_volume_m3']) for row in rows}
+    
+    def _latest_history_period(self) -> Optional[CalculationPeriod]:
+        """Latest month recorded in storage_history (None if empty)."""
+        row = self.db.execute_query(
+            "SELECT year, month FROM storage_history ORDER BY year DESC, month DESC LIMIT 1",
+            fetch_one=True,
+        )
+        if not row:
+            return None
+        return CalculationPeriod(month=int(row['month']), year=int(row['year']))
+    
+    def _attach_snapshot(self, snapshot: Optional[BalanceInputSnapshot]) -> None:
+        """Attach (or detach) a preloaded snapshot on every sub-service."""
+        for service in (
+            self.inflows_service,
+            self.outflows_service,
+            self.storage_service,
+            self.recycled_service,
+            self.kpi_service,
+        ):
+            service.attach_snapshot(snapshot)
+    
+    def _evaluate_with_snapshot(
+        self,
+        period: CalculationPeriod,
+        mode: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BalanceResult:
+        """Evaluate one period on a preloaded snapshot (PARALLEL MODE).
+        
+        The snapshot gives the concurrent stages one shared, read-only copy
+        of environmental data, facilities, storage history and the Meter
+        Readings month matrix, so they do not contend for SQLite or Excel.
+        Storage history is written after the period completes.
+        """
+        snapshot = BalanceInputSnapshot.load(self.db, self._excel, period, period)
+        self._attach_snapshot(snapshot)
+        try:
+            result = self._evaluate_period(period, mode, progress)
+        finally:
+            self._attach_snapshot(None)
+        
+        try:
+            self.storage_service.flush_snapshot_history(snapshot)
+        except Exception as hist_err:
+            logger.warning(f"Could not record storage history: {hist_err}")
+        return result
+    
+    def _run_independent_stages(
+        self,
+        period: CalculationPeriod,
+        flags: DataQualityFlags,
+    ) -> Tuple[InflowResult, OutflowResult, StorageChange, RecycledWaterResult]:
+        """Run inflows, outflows, storage and recycled concurrently (PARALLEL MODE).
+        
+        Each stage records into its own DataQualityFlags; they are merged
+        into flags in workflow order afterwards, so the flags (and their
+        ordering) match the sequential path regardless of which stage
+        finishes first.
+        """
+        stages = (
+            lambda f: self.inflows_service.calculate_inflows(period, f),
+            lambda f: self.outflows_service.calculate_outflows(period, f),
+            lambda f: self.storage_service.calculate_storage(
+                period, f, inflows_m3=None, outflows_m3=None
+            ),
+            lambda f: self.recycled_service.calculate_recycled(period, f),
+        )
+        executor = self._executor
+        if executor is None:
+            executor = self._executor = ThreadPoolExecutor(
+                max_workers=self.PARALLEL_WORKERS, thread_name_prefix="balance-stage"
+            )
+        
+        stage_flags = [DataQualityFlags() for _ in stages]
+        futures = [
+            executor.submit(stage, stage_flag)
+            for stage, stage_flag in zip(stages, stage_flags)
+        ]
+        results = [future.result() for future in futures]
+        
+        for stage_flag in stage_flags:
+            flags.merge(stage_flag)
+        return tuple(results)
+    
+    def _evaluate_period(
+        self,
+        period: CalculationPeriod,
+        mode: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BalanceResult:
+        """Run steps 1-9 of the balance workflow for one period (NO CACHING).
+        
+        Shared by calculate() and calculate_range(). Reads come from the
+        attached snapshot when one is present. progress is called before
+        each stage (see PROGRESS_STAGES); storage history is written last,
+        so a run cancelled from progress leaves no trace.
+        """
+        def report(stage: str) -> None:
+            if progress:
+                progress(*self.PROGRESS_STAGES[stage])
+        
         # Initialize quality flags
         flags = DataQualityFlags()
         
-        try:
+        if self.parallel:
+            # 1-4. Independent stages run concurrently (same results and flags)
+            report('independent')
+            inflows, outflows, storage, recycled = self._run_independent_stages(period, flags)
+        else:
             # 1. Calculate inflows
+            report('inflows')
             inflows = self.inflows_service.calculate_inflows(period, flags)
-            
+
             # 2. Calculate outflows
+            report('outflows')
             outflows = self.outflows_service.calculate_outflows(period, flags)
-            
+
             # 3. Calculate storage change from MEASURED volumes
             # DO NOT pass inflows/outflows - we need real ΔStorage to calculate error
             # Error % reveals data quality issues (missing flows, measurement gaps)
+            report('storage')
             storage = self.storage_service.calculate_storage(
                 period, flags,
                 inflows_m3=None,  # Don't back-calculate storage
                 outflows_m3=None  # Use actual measured volumes
             )
-            
+
             # 4. Calculate recycled water (for KPIs only)
+            report('recycled')
             recycled = self.recycled_service.calculate_recycled(period, flags)
-            
-            # 5. Compute balance closure
-            # Master equation: error = IN - OUT - ΔS
-            balance_error = inflows.total_m3 - outflows.total_m3 - storage.delta_m3
-            error_pct = 0.0
-            if inflows.total_m3 > 0:
-                error_pct = (balance_error / inflows.total_m3) * 100
-            
-            # 6. Calculate KPIs
-            kpis = self.kpi_service.calculate_kpis(
-                inflows, outflows, recycled, storage, period
-            )
-            
-            # 7. Build result
-            result = BalanceResult(
-                period=period,
-                inflows=inflows,
-                outflows=outflows,
-                storage=storage,
-                recycled=recycled,
-                balance_error_m3=balance_error,
-                error_pct=error_pct,
-                kpis=kpis,
-                quality_flags=flags,
-                calculated_at=datetime.now(),
-                calculation_mode=mode
-            )
-            
-            # 8. Log summary
-            status = "✓ BALANCED" if result.is_balanced else "✗ UNBALANCED"
-            logger.info(f"Balance {period.period_short}: {status} "
-                       f"(error={error_pct:.1f}%, IN={inflows.total_m3:,.0f}, "
-                       f"OUT={outflows.total_m3:,.0f}, ΔS={storage.delta_m3:,.0f})")
-            
-            # 9. Record storage history for future reference
-            # This allows future calculations to get accurate opening volumes
-            # by looking up the previous month's closing volume from history
-            # Pass calculated storage so facilities get proportional closing volumes
-            try:
-                self.storage_service.record_all_facilities_history(
-                    period, flags, data_source='calculated',
-                    calculated_storage=storage
-                )
-            except Exception as hist_err:
-                logger.warning(f"Could not record storage history: {hist_err}")
-                # Don't fail calculation if history recording fails
-            
-            # 10. Cache result
-            self._cache[cache_key] = result
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Balance calculation failed: {e}")
-            raise CalculationError(
-                message=str(e),
-                component="BalanceService",
-                details={'period': period.period_label, 'mode': mode}
+
+        # 5. Compute balance closure
+        # Master equation: error = IN - OUT - ΔS
+        balance_error = inflows.total_m3 - outflows.total_m3 - storage.delta_m3
+        error_pct = 0.0
+        if inflows.total_m3 > 0:
+            error_pct = (balance_error / inflows.total_m3) * 100
+
+        # 6. Calculate KPIs
+        report('kpis')
+        kpis = self.kpi_service.calculate_kpis(
+            inflows, outflows, recycled, storage, period
+        )
+
+        # 7. Build result
+        result = BalanceResult(
+            period=period,
+            inflows=inflows,
+            outflows=outflows,
+            storage=storage,
+            recycled=recycled,
+            balance_error_m3=balance_error,
+            error_pct=error_pct,
+            kpis=kpis,
+            quality_flags=flags,
+            calculated_at=datetime.now(),
+            calculation_mode=mode
+        )
+
+        # 8. Log summary
+        status = "✓ BALANCED" if result.is_balanced else "✗ UNBALANCED"
+        logger.info(f"Balance {period.period_short}: {status} "
+                   f"(error={error_pct:.1f}%, IN={inflows.total_m3:,.0f}, "
+                   f"OUT={outflows.total_m3:,.0f}, ΔS={storage.delta_m3:,.0f})")
+
+        # 9. Record storage history for future reference
+        # This allows future calculations to get accurate opening volumes
+        # by looking up the previous month's closing volume from history
+        # Pass calculated storage so facilities get proportional closing volumes
+        report('history')
+        try:
+            self.storage_service.record_all_facilities_history(
+                period, flags, data_source='calculated',
+                calculated_storage=storage
             )
+        except Exception as hist_err:
+            logger.warning(f"Could not record storage history: {hist_err}")
+            # Don't fail calculation if history recording fails
+        
+        return result
     
     def calculate_for_date(
         self,
@@ -2433,16 +3068,58 @@ class BalanceService(IBalanceEngine):
         return self.calculate(period, mode, force_recalculate)
     
     def clear_cache(self) -> None:
-        """Clear all calculation caches.
+        """Clear in-memory calculation caches.
         
         Call when:
         - Excel file is updated
         - Database is modified
         - Configuration changes
+        
+        Persisted results are kept; each is revalidated against its recorded
+        inputs on next use, so only periods whose inputs changed recalculate.
+        Use invalidate_cache() to drop persisted results explicitly.
         """
-        self._cache.clear()
+        self._result_cache.clear_memory()
         ConstantsLoader().refresh()
         logger.debug("Balance calculation cache cleared")
+    
+    def get_latest_cached_result(self) -> Optional[BalanceResult]:
+        """Return the most recently calculated or served result without recalculating.
+        
+        Used by read-only views (e.g. Help page worked examples) that must not
+        trigger a calculation. Returns None until a result has been cached.
+        """
+        return self._result_cache.latest_result()
+    
+    def shutdown(self) -> None:
+        """Stop the parallel-stage worker threads (SHUTDOWN SAFETY).
+        
+        Called by the calculation dashboard teardown, reset_balance_service()
+        and at interpreter exit. Safe to call more than once; a later parallel
+        calculation starts a new pool.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.debug("Balance stage worker threads stopped")
+    
+    def invalidate_cache(
+        self,
+        period: Optional[CalculationPeriod] = None,
+        mode: Optional[str] = None,
+    ) -> int:
+        """Drop persisted results (all, one period, and/or one mode).
+        
+        Args:
+            period: Period to drop (None = all periods)
+            mode: Calculation mode to drop (None = all modes)
+        
+        Returns:
+            Number of persisted results removed
+        """
+        removed = self._result_cache.invalidate(period, mode)
+        logger.info(f"Invalidated {removed} persisted balance results")
+        return removed
 
 
 # Singleton instance
@@ -2472,5 +3149,16 @@ def reset_balance_service() -> None:
     global _balance_service
     if _balance_service is not None:
         _balance_service.clear_cache()
+        _balance_service.shutdown()
     _balance_service = None
     logger.debug("Balance service singleton reset")
+
+
+def _shutdown_balance_service() -> None:
+    """Stop the singleton's worker threads (registered with atexit)."""
+    if _balance_service is not None:
+        _balance_service.shutdown()
+
+
+# Do not leave parallel-stage worker threads running on interpreter exit
+atexit.register(_shutdown_balance_service)
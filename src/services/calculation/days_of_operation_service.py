@@ -42,6 +42,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 from calendar import monthrange
+import numpy as np
 from pydantic import BaseModel, Field
 
 from database.db_manager import DatabaseManager
@@ -496,12 +497,10 @@ class DaysOfOperationService:
         rates = {}
         
         try:
-            conn = self.db.get_connection()
-            
             # Try to get actual consumption from storage history
             # Consumption = opening - closing + inflows
             # Simplified: use delta as proxy
-            cursor = conn.execute("""
+            cols = self.db.execute_query_columnar("""
                 SELECT facility_code, 
                        opening_volume_m3,
                        closing_volume_m3,
@@ -510,15 +509,13 @@ class DaysOfOperationService:
                 WHERE year = ? AND month = ?
             """, (year, month))
             
-            for row in cursor:
-                code = row['facility_code']
-                # If closing > opening, water was added, so consumption = 0 (or negative)
-                # Use absolute value as rough consumption estimate
-                consumption = abs(float(row['consumption_proxy'] or 0))
-                rates[code] = consumption
-                logger.debug(f"{code}: estimated consumption = {consumption:,.0f} m³/month")
-            
-            conn.close()
+            # If closing > opening, water was added, so consumption = 0 (or negative)
+            # Use absolute value as rough consumption estimate
+            proxy = np.asarray(cols['consumption_proxy'], dtype=float)
+            consumption = np.abs(np.nan_to_num(proxy, nan=0.0))
+            rates = dict(zip(cols['facility_code'].tolist(), consumption.tolist()))
+            logger.debug(f"Estimated consumption for {len(rates)} facilities "
+                        f"({month:02d}/{year}): {consumption.sum():,.0f} m³/month total")
             
         except Exception as e:
             logger.warning(f"Could not get consumption rates: {e}")
@@ -434,3 +434,11 @@ class CalculationError(Exception):
         super().__init__(message)
         self.component = component
         self.details = details or {}
+
+
+class CalculationCancelled(CalculationError):
+    """Exception raised when a running calculation is cancelled.
+    
+    Raised from a progress callback between stages; nothing is written
+    to storage_history or the result cache for the cancelled run.
+    """
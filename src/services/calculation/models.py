@@ -122,6 +122,28 @@ class DataQualityFlags(BaseModel):
         if message not in self.warnings:
             self.warnings.append(message)
     
+    def merge(self, other: "DataQualityFlags") -> None:
+        """Append flags recorded by another run (e.g. a parallel stage).
+        
+        Merging stage flags in workflow order gives the same lists, notes
+        and ordering as recording them all into one instance sequentially.
+        
+        Args:
+            other: Flags to append after this instance's own
+        """
+        for field in other.missing_values:
+            if field not in self.missing_values:
+                self.missing_values.append(field)
+        for field in other.estimated_values:
+            if field not in self.estimated_values:
+                self.estimated_values.append(field)
+        for field in other.simulated_values:
+            if field not in self.simulated_values:
+                self.simulated_values.append(field)
+        for message in other.warnings:
+            self.add_warning(message)
+        self.notes.update(other.notes)
+    
     @property
     def has_issues(self) -> bool:
         """Check if any data quality issues exist."""
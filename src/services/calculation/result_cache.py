@@ -0,0 +1,487 @@
+"""
+Balance Result Cache (PERSISTENT, DEPENDENCY-TRACKED).
+
+Stores BalanceResult objects in SQLite (balance_result_cache table) together
+with a fingerprint of the inputs each result was computed from:
+- Meter Readings file mtime + hash of that month's Meter Readings values
+- environmental_data row for the month (rainfall/evaporation)
+- storage_facilities set (codes, capacity, surface area, lining, status)
+- previous month's storage_history closing volumes (opening volumes)
+- calculation constants
+- facility volumes of the month (live current_volume_m3 for the latest
+  recorded month, the month's own storage_history closings before that)
+
+A cached result is reused only while its fingerprint still matches, so a
+March rainfall correction recalculates March only, and results survive app
+restarts. The Meter Readings month hash is only recomputed when the file
+mtime differs from the recorded one.
+
+A cached result is only returned while it equals what
+calculate(force_recalculate=True) would produce. Facility volumes feed the
+closing volume, evaporation cap and seepage; the engine reads live volumes for
+the latest month only, so calculating a new month does not invalidate earlier
+ones. A month whose own calculation rewrote its volumes (proportional closing
+split) is recomputed once on next use; its recorded closings are then stable.
+
+Usage:
+    tracker = BalanceDependencyTracker(db, excel, lambda: constants)
+    cache = BalanceResultCache(db, tracker)
+    result = cache.get(period, "REGULATOR")
+    if result is None:
+        dependencies = cache.fingerprint(period)  # before computing
+        result = compute(period)
+        cache.put(period, "REGULATOR", result, dependencies)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from services.calculation.balance_inputs import (
+    FacilityVolumes, load_facility_volumes, previous_period_key
+)
+from services.calculation.models import BalanceResult, CalculationPeriod
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_payload(payload: Any) -> str:
+    """Stable short hash of a JSON-serializable payload."""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+@dataclass(frozen=True)
+class BalanceDependencies:
+    """Input fingerprint of one BalanceResult (CACHE VALIDATION KEY).
+
+    Attributes:
+        meter_mtime: Meter Readings file mtime when the result was stored
+        meter_month_hash: Hash of the month's Meter Readings values
+        environmental_version: Hash of the month's environmental_data row
+        facility_set_hash: Hash of the calculation-relevant facility columns
+        storage_history_version: Hash of previous month's closing volumes
+        constants_version: Hash of calculation constants
+        volume_version: Hash of the facility volumes the period reads
+    """
+
+    meter_mtime: Optional[float]
+    meter_month_hash: str
+    environmental_version: str
+    facility_set_hash: str
+    storage_history_version: str
+    constants_version: str
+    volume_version: str = ""
+
+    # Fields compared for validity (meter_mtime is only a shortcut)
+    TRACKED = (
+        "meter_month_hash",
+        "environmental_version",
+        "facility_set_hash",
+        "storage_history_version",
+        "constants_version",
+        "volume_version",
+    )
+
+    def changed_inputs(self, other: "BalanceDependencies") -> List[str]:
+        """Return names of tracked inputs that differ from other."""
+        return [name for name in self.TRACKED if getattr(self, name) != getattr(other, name)]
+
+
+class BalanceDependencyTracker:
+    """Computes input fingerprints for balance periods (DEPENDENCY TRACKING).
+
+    Args:
+        db_manager: DatabaseManager for environmental/facility/history reads
+        excel_manager: ExcelManager providing Meter Readings
+        constants_provider: Callable returning the CalculationConstants in use
+    """
+
+    # storage_facilities columns that affect every period's calculation
+    # (current_volume_m3 is tracked per period, see volume_version)
+    _FACILITY_TRACKED_COLUMNS = (
+        "code", "facility_type", "capacity_m3", "surface_area_m2", "catchment_area_m2",
+        "is_lined", "status",
+    )
+
+    def __init__(self, db_manager, excel_manager, constants_provider: Callable[[], Any]):
+        self.db = db_manager
+        self._excel = excel_manager
+        self._constants_provider = constants_provider
+
+    def meter_mtime(self) -> Optional[float]:
+        """Return the Meter Readings file mtime, or None if unavailable."""
+        try:
+            return self._excel.meter_readings_mtime()
+        except Exception:
+            return None
+
+    def meter_month_hash(self, period: CalculationPeriod) -> str:
+        """Hash the month's row of the Meter Readings monthly matrix."""
+        try:
+            matrix = self._excel.get_meter_readings_monthly()
+        except Exception as e:
+            logger.debug(f"Meter Readings unavailable for cache fingerprint: {e}")
+            return "unavailable"
+        key = (period.year, period.month)
+        if matrix.empty or key not in matrix.index:
+            return "missing"
+        row = matrix.loc[key]
+        return _hash_payload({str(col): float(v) for col, v in row.items() if pd.notna(v)})
+
+    def environmental_version(self, period: CalculationPeriod) -> str:
+        """Hash the month's environmental_data values (rainfall/evaporation)."""
+        row = self.db.execute_query(
+            "SELECT rainfall_mm, evaporation_mm FROM environmental_data WHERE year = ? AND month = ?",
+            (period.year, period.month),
+            fetch_one=True,
+        )
+        return _hash_payload(row or None)
+
+    def facility_set_hash(self) -> str:
+        """Hash the tracked storage_facilities columns (live volumes excluded)."""
+        rows = self.db.execute_query("SELECT * FROM storage_facilities ORDER BY code")
+        return _hash_payload([
+            {k: row.get(k) for k in self._FACILITY_TRACKED_COLUMNS}
+            for row in rows
+        ])
+
+    def storage_history_version(self, period: CalculationPeriod) -> str:
+        """Hash previous month's closing volumes (this month's openings)."""
+        prev_year, prev_month = previous_period_key(period)
+        return self.closings_version(self._history_closings(prev_year, prev_month))
+
+    def volume_version(self, period: CalculationPeriod) -> str:
+        """Hash the facility volumes the period reads (load_facility_volumes)."""
+        prev_year, prev_month = previous_period_key(period)
+        return self.volumes_version(
+            load_facility_volumes(self.db, period), self._history_closings(prev_year, prev_month)
+        )
+
+    @staticmethod
+    def volumes_version(basis: FacilityVolumes, previous_closings: Dict[str, Any]) -> str:
+        """Hash facility volumes plus the opening fallbacks they imply (volume_version format)."""
+        return _hash_payload({
+            "volumes": basis.volumes,
+            "openings": basis.fallback_openings(previous_closings),
+        })
+
+    @staticmethod
+    def closings_version(closings: Dict[str, Any]) -> str:
+        """Hash {facility_code: closing_volume_m3} (storage_history_version format)."""
+        return _hash_payload([[code, closings[code]] for code in sorted(closings)])
+
+    def _history_closings(self, year: int, month: int) -> Dict[str, Any]:
+        rows = self.db.execute_query(
+            "SELECT facility_code, closing_volume_m3 FROM storage_history "
+            "WHERE year = ? AND month = ?",
+            (year, month),
+        )
+        return {r["facility_code"]: r["closing_volume_m3"] for r in rows}
+
+    def constants_version(self) -> str:
+        """Hash the calculation constants in use."""
+        constants = self._constants_provider()
+        try:
+            payload = asdict(constants)
+        except TypeError:
+            payload = vars(constants)
+        return _hash_payload(payload)
+
+    def current(
+        self,
+        period: CalculationPeriod,
+        facility_set_hash: Optional[str] = None,
+        constants_version: Optional[str] = None,
+        storage_history_version: Optional[str] = None,
+        volume_version: Optional[str] = None,
+    ) -> BalanceDependencies:
+        """Compute the full fingerprint for a period.
+
+        Take it before the period is evaluated: evaluation writes
+        storage_history and the live volumes.
+
+        Args:
+            period: Period to fingerprint
+            facility_set_hash: Precomputed facility hash (batch callers)
+            constants_version: Precomputed constants hash (batch callers)
+            storage_history_version: Opening-volume hash from in-memory
+                closings (batch callers chaining months before the flush)
+            volume_version: Facility-volume hash from a snapshot (batch callers)
+        """
+        if storage_history_version is None:
+            storage_history_version = self.storage_history_version(period)
+        if volume_version is None:
+            volume_version = self.volume_version(period)
+        return BalanceDependencies(
+            meter_mtime=self.meter_mtime(),
+            meter_month_hash=self.meter_month_hash(period),
+            environmental_version=self.environmental_version(period),
+            facility_set_hash=facility_set_hash or self.facility_set_hash(),
+            storage_history_version=storage_history_version,
+            constants_version=constants_version or self.constants_version(),
+            volume_version=volume_version,
+        )
+
+    def validate(
+        self,
+        period: CalculationPeriod,
+        stored: BalanceDependencies,
+    ) -> Tuple[List[str], BalanceDependencies]:
+        """Compare a stored fingerprint against current inputs.
+
+        The Meter Readings month hash is only recomputed when the file mtime
+        changed; if the month's values are unchanged the returned fingerprint
+        carries the new mtime so the next check is cheap again.
+
+        Facility volumes the period's own calculation wrote back are not
+        exempt: the result was computed from the volumes before that write.
+
+        Returns:
+            (changed input names, refreshed fingerprint)
+        """
+        mtime = self.meter_mtime()
+        meter_hash = stored.meter_month_hash
+        if mtime != stored.meter_mtime:
+            meter_hash = self.meter_month_hash(period)
+
+        current = replace(
+            stored,
+            meter_mtime=mtime,
+            meter_month_hash=meter_hash,
+            environmental_version=self.environmental_version(period),
+            facility_set_hash=self.facility_set_hash(),
+            storage_history_version=self.storage_history_version(period),
+            constants_version=self.constants_version(),
+            volume_version=self.volume_version(period),
+        )
+        return current.changed_inputs(stored), current
+
+
+class BalanceResultCache:
+    """Two-tier (memory + SQLite) BalanceResult cache (PERSISTENT CACHE).
+
+    Every hit is validated against current inputs; stale entries are
+    dropped and reported with the inputs that changed.
+
+    Args:
+        db_manager: DatabaseManager owning the balance_result_cache table
+        tracker: BalanceDependencyTracker used to fingerprint inputs
+    """
+
+    def __init__(self, db_manager, tracker: BalanceDependencyTracker):
+        self.db = db_manager
+        self.tracker = tracker
+        self._memory: Dict[Tuple[int, int, str], Tuple[BalanceResult, BalanceDependencies]] = {}
+        self._table_ready = False
+
+    def get(self, period: CalculationPeriod, mode: str) -> Optional[BalanceResult]:
+        """Return a cached result if all of its inputs are unchanged."""
+        key = (period.year, period.month, mode)
+        entry = self._memory.get(key) or self._load(key)
+        if entry is None:
+            return None
+
+        result, stored = entry
+        try:
+            changed, current = self.tracker.validate(period, stored)
+        except Exception as e:
+            logger.warning(f"Could not validate cached balance for {period.period_short}: {e}")
+            return None
+
+        if changed:
+            logger.info(
+                f"Cached balance for {period.period_short} ({mode}) is stale "
+                f"(changed: {', '.join(changed)})"
+            )
+            self._memory.pop(key, None)
+            self._delete(key)
+            return None
+
+        if current != stored:
+            # Same inputs, newer Meter Readings mtime: record it
+            try:
+                self._store(key, result, current)
+            except Exception as e:
+                logger.debug(f"Could not refresh cached fingerprint for {period.period_short}: {e}")
+        else:
+            self._remember(key, result, stored)
+        logger.debug(f"Returning cached result for {period.period_short}")
+        return result
+
+    def fingerprint(self, period: CalculationPeriod) -> Optional[BalanceDependencies]:
+        """Capture a period's input fingerprint (call before evaluating it).
+
+        Returns:
+            BalanceDependencies, or None if the inputs could not be read
+        """
+        try:
+            return self.tracker.current(period)
+        except Exception as e:
+            logger.warning(f"Could not fingerprint balance inputs for {period.period_short}: {e}")
+            return None
+
+    def put(
+        self,
+        period: CalculationPeriod,
+        mode: str,
+        result: BalanceResult,
+        dependencies: Optional[BalanceDependencies],
+    ) -> None:
+        """Store a result with the fingerprint of the inputs it was computed from.
+
+        Args:
+            dependencies: Fingerprint captured before evaluation (see
+                fingerprint()); None skips caching
+        """
+        if dependencies is None:
+            return
+        try:
+            self._store((period.year, period.month, mode), result, dependencies)
+        except Exception as e:
+            logger.warning(f"Could not cache balance result for {period.period_short}: {e}")
+
+    def invalidate(self, period: Optional[CalculationPeriod] = None, mode: Optional[str] = None) -> int:
+        """Drop cached results (all, one period, and/or one mode).
+
+        Returns:
+            Number of persisted entries removed
+        """
+        self._memory = {
+            k: v for k, v in self._memory.items()
+            if not (
+                (period is None or (k[0], k[1]) == (period.year, period.month))
+                and (mode is None or k[2] == mode)
+            )
+        }
+        clauses, params = [], []
+        if period is not None:
+            clauses.append("year = ? AND month = ?")
+            params.extend([period.year, period.month])
+        if mode is not None:
+            clauses.append("mode = ?")
+            params.append(mode)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        try:
+            self._ensure_table()
+            with self.db.transaction() as conn:
+                return conn.execute(f"DELETE FROM balance_result_cache{where}", tuple(params)).rowcount
+        except Exception as e:
+            logger.warning(f"Could not invalidate persisted balance cache: {e}")
+            return 0
+
+    def stale_periods(self, mode: str) -> List[Tuple[CalculationPeriod, List[str]]]:
+        """List persisted results for a mode whose inputs changed (read-only).
+
+        Returns:
+            Chronological (period, changed input names) pairs
+        """
+        try:
+            self._ensure_table()
+            rows = self.db.execute_query(
+                "SELECT * FROM balance_result_cache WHERE mode = ? ORDER BY year, month",
+                (mode,),
+            )
+        except Exception as e:
+            logger.warning(f"Could not scan persisted balance cache: {e}")
+            return []
+
+        stale = []
+        for row in rows:
+            period = CalculationPeriod(month=row["month"], year=row["year"])
+            stored = BalanceDependencies(**{f.name: row[f.name] for f in fields(BalanceDependencies)})
+            try:
+                changed, _ = self.tracker.validate(period, stored)
+            except Exception as e:
+                logger.warning(f"Could not validate cached balance for {period.period_short}: {e}")
+                changed = ["unknown"]
+            if changed:
+                stale.append((period, changed))
+        return stale
+
+    def latest_result(self) -> Optional[BalanceResult]:
+        """Return the most recently stored or served in-memory result, if any.
+
+        Read-only: the entry is not revalidated, so callers that must show
+        current figures should use get() with an explicit period.
+        """
+        if not self._memory:
+            return None
+        result, _ = next(reversed(self._memory.values()))
+        return result
+
+    def clear_memory(self) -> None:
+        """Drop the in-memory tier (persisted entries are revalidated on use)."""
+        self._memory.clear()
+
+    # ------------------------------------------------------------------
+    # SQLite persistence
+    # ------------------------------------------------------------------
+    def _ensure_table(self) -> None:
+        if self._table_ready:
+            return
+        from database.schema import DatabaseSchema
+        DatabaseSchema(getattr(self.db, 'db_path', None)).ensure_balance_result_cache_table()
+        self._table_ready = True
+
+    def _load(self, key: Tuple[int, int, str]) -> Optional[Tuple[BalanceResult, BalanceDependencies]]:
+        try:
+            self._ensure_table()
+            row = self.db.execute_query(
+                "SELECT * FROM balance_result_cache WHERE year = ? AND month = ? AND mode = ?",
+                key,
+                fetch_one=True,
+            )
+            if not row:
+                return None
+            result = BalanceResult.model_validate_json(row["result_json"])
+            deps = BalanceDependencies(**{f.name: row[f.name] for f in fields(BalanceDependencies)})
+        except Exception as e:
+            logger.warning(f"Could not load persisted balance result {key}: {e}")
+            return None
+        return result, deps
+
+    def _remember(self, key: Tuple[int, int, str], result: BalanceResult, deps: BalanceDependencies) -> None:
+        # Re-insert so the dict stays ordered by last use (see latest_result)
+        self._memory.pop(key, None)
+        self._memory[key] = (result, deps)
+
+    def _store(self, key: Tuple[int, int, str], result: BalanceResult, deps: BalanceDependencies) -> None:
+        self._remember(key, result, deps)
+        self._ensure_table()
+        with self.db.transaction() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO balance_result_cache (
+                    year, month, mode, result_json,
+                    meter_mtime, meter_month_hash, environmental_version,
+                    facility_set_hash, storage_history_version, constants_version,
+                    volume_version
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                *key,
+                result.model_dump_json(),
+                deps.meter_mtime,
+                deps.meter_month_hash,
+                deps.environmental_version,
+                deps.facility_set_hash,
+                deps.storage_history_version,
+                deps.constants_version,
+                deps.volume_version,
+            ))
+
+    def _delete(self, key: Tuple[int, int, str]) -> None:
+        try:
+            with self.db.transaction() as conn:
+                conn.execute(
+                    "DELETE FROM balance_result_cache WHERE year = ? AND month = ? AND mode = ?",
+                    key,
+                )
+        except Exception as e:
+            logger.warning(f"Could not delete stale balance result {key}: {e}")
@@ -22,17 +22,223 @@ Data Flow:
    - Collect errors (if file fails).
 4. Worker emits "complete" signal with combined DataFrame and error summary.
 5. Main thread receives signal, updates UI (table, status label, error dialog).
+
+Parallel mode (set_parallel_workers(n) with n > 1):
+- Cache hits are resolved first; uncached files are parsed by a
+  ProcessPoolExecutor (openpyxl/xlrd parsing is CPU-bound, so threads
+  would serialize on the GIL).
+- Results are consumed in file order, so progress → file_loaded/error
+  signals arrive in exactly the same order as in sequential mode.
+- cancel() stops waiting and cancels every task that has not started.
+
+Incremental rescan (load_directory(folder, snapshot) with a FolderSnapshot
+kept by the caller):
+- The folder manifest (file name → size, mtime) is compared with the
+  snapshot's; only added or changed files go through cache/parse.
+- Rows of removed and changed files are dropped from the previous combined
+  DataFrame and the new files' rows appended (no concat of every file), so
+  a periodic refresh of a folder that gained one monthly workbook parses
+  just that workbook.
 """
 from __future__ import annotations
 
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
+import os
+import numpy as np
 from PySide6.QtCore import QThread, Signal, QObject
 from shiboken6 import isValid
 import pandas as pd
 
 from core.app_logger import logger as app_logger
 
+# Dashboards whose files use the stacked-blocks monitoring layout
+STACKED_BLOCK_DASHBOARDS = {
+    "borehole_monitoring": "Failed to parse monitoring file (no data found)",
+    "pcd_monitoring": "Failed to parse PCD file (no data found)",
+}
+
+# Below this many files to parse, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+
+def parse_monitoring_file(dashboard_name: str, file_path: str) -> pd.DataFrame:
+    """Parse one monitoring workbook for a dashboard (PROCESS-POOL TASK).
+
+    Module-level so it can be pickled to ProcessPoolExecutor workers.
+
+    Args:
+        dashboard_name: Worker dashboard name (selects the parser).
+        file_path: Excel file path.
+
+    Returns:
+        Parsed DataFrame (may be empty for stacked-block files with no data).
+    """
+    if dashboard_name in STACKED_BLOCK_DASHBOARDS:
+        # Use Tkinter's proven stacked blocks parser
+        from services.monitoring_excel_parser_v2 import parse_borehole_stacked_blocks
+        return parse_borehole_stacked_blocks(file_path)
+
+    # Static levels: use simple parsing (DON'T TOUCH - IT'S WORKING)
+    df = pd.read_excel(file_path)
+    df["source_file"] = Path(file_path).name
+    return df
+
+
+def monitoring_parser_version(dashboard_name: str) -> str:
+    """Parser version string of a dashboard's files (key for the shared parse cache).
+
+    Args:
+        dashboard_name: Worker dashboard name (selects the parser).
+
+    Returns:
+        Version string that changes whenever parse_monitoring_file output would.
+    """
+    if dashboard_name in STACKED_BLOCK_DASHBOARDS:
+        from services.monitoring_excel_parser_v2 import PARSER_VERSION
+        return f"stacked_blocks:{PARSER_VERSION}"
+    return "read_excel:1"
+
+
+def default_parallel_workers() -> int:
+    """Worker count used when parallel loading is enabled without a count."""
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+# Patterns DirectoryLoadWorker loads (same matching rules as Path.glob)
+EXCEL_PATTERNS = ("*.xlsx", "*.xls")
+
+
+def scan_excel_files(folder: Path) -> Dict[str, Tuple[int, int]]:
+    """Folder manifest: Excel file name → (size, mtime_ns) (one stat per file).
+
+    Args:
+        folder: Directory to scan (not recursive).
+
+    Returns:
+        Manifest of the folder's Excel files.
+    """
+    manifest: Dict[str, Tuple[int, int]] = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # Path.glob("*...") skips hidden files too
+            if entry.name.startswith(".") or not any(fnmatch(entry.name, p) for p in EXCEL_PATTERNS):
+                continue
+            try:
+                if entry.is_file():
+                    stat = entry.stat()
+                    manifest[entry.name] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                continue  # Deleted/unreadable while scanning: treat as absent
+    return manifest
+
+
+@dataclass
+class FolderSnapshot:
+    """Result of the last load of a folder, patched by incremental rescans (FOLDER MANIFEST).
+
+    Owned by the caller and passed to each DirectoryLoaderThread it creates
+    (QThreads cannot be restarted), so a reload of the same folder parses
+    only added/changed files and drops rows of removed ones.
+
+    Attributes:
+        folder: Folder the snapshot describes (None until the first load).
+        manifest: File name → (size, mtime_ns) at the last load.
+        combined: Combined DataFrame of all loaded files (rows tagged by
+            the parsers' source_file column).
+        errors: File name → error reason for files that failed to load.
+    """
+    folder: Optional[Path] = None
+    manifest: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    combined: pd.DataFrame = field(default_factory=pd.DataFrame)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def reset(self) -> None:
+        """Forget the last load (next load is a full one)."""
+        self.folder = None
+        self.manifest = {}
+        self.combined = pd.DataFrame()
+        self.errors = {}
+
+    def diff(self, manifest: Dict[str, Tuple[int, int]]) -> Tuple[List[str], List[str], List[str]]:
+        """Compare a fresh manifest with the snapshot.
+
+        Returns:
+            (added, changed, removed) file names, each sorted.
+        """
+        added = sorted(name for name in manifest if name not in self.manifest)
+        changed = sorted(
+            name for name, state in manifest.items()
+            if name in self.manifest and self.manifest[name] != state
+        )
+        removed = sorted(name for name in self.manifest if name not in manifest)
+        return added, changed, removed
+
+    def has_changes(self, folder: Optional[Path] = None) -> bool:
+        """True if the folder's Excel files differ from the snapshot (cheap: stats only)."""
+        folder = Path(folder) if folder else self.folder
+        if folder is None:
+            return False
+        if folder != self.folder:
+            return True
+        try:
+            return any(self.diff(scan_excel_files(folder)))
+        except OSError:
+            return True
+
+    def apply(
+        self,
+        folder: Path,
+        manifest: Dict[str, Tuple[int, int]],
+        frames: Dict[str, pd.DataFrame],
+        errors: Dict[str, str],
+    ) -> pd.DataFrame:
+        """Patch the combined DataFrame with a load of some of the folder's files.
+
+        Rows of removed files and of the reloaded ones (frames/errors keys)
+        are dropped, the new frames appended, and rows put back in file name
+        order, so the result matches a full load of the folder.
+
+        Args:
+            folder: Folder that was scanned.
+            manifest: Its current manifest.
+            frames: Newly loaded files → parsed DataFrame.
+            errors: Newly failed files → error reason.
+
+        Returns:
+            The updated combined DataFrame.
+        """
+        stale = (set(self.manifest) - set(manifest)) | set(frames) | set(errors)
+        kept = self.combined
+        if stale and not kept.empty:
+            kept = kept[~kept["source_file"].isin(stale)]
+
+        new_frames = [frames[name] for name in sorted(frames)]
+        if new_frames:
+            parts = ([kept] if not kept.empty else []) + new_frames
+            combined = pd.concat(parts, ignore_index=True)
+            if not kept.empty:
+                # Kept rows come first after concat; restore folder (file name) order
+                rank = {name: i for i, name in enumerate(sorted(manifest))}
+                order = np.argsort(combined["source_file"].map(rank).to_numpy(), kind="stable")
+                combined = combined.iloc[order].reset_index(drop=True)
+        else:
+            combined = kept.reset_index(drop=True)
+
+        self.errors = {
+            name: reason for name, reason in self.errors.items()
+            if name in manifest and name not in stale
+        }
+        self.errors.update(errors)
+        self.folder = folder
+        self.manifest = dict(manifest)
+        self.combined = combined
+        return combined
+
 
 class DirectoryLoadWorker(QObject):
     """Background worker for loading and combining Excel files from a directory (DIRECTORY SCANNER).
@@ -78,8 +284,13 @@ class DirectoryLoadWorker(QObject):
         super().__init__()
         self._cancel_requested = False
         self._folder_path: Optional[Path] = None
+        self._snapshot: Optional[FolderSnapshot] = None
         self.dashboard_name = dashboard_name
         
+        # Process-pool size for parsing (0/1 = parse on this thread)
+        self._max_workers = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
         # Cache functions (set from dashboard)
         self._cache_loader = None
         self._cache_saver = None
@@ -100,13 +311,26 @@ class DirectoryLoadWorker(QObject):
         self._cache_saver = saver
         self.logger.info("Cache functions configured")
     
-    def load_directory(self, folder_path: str) -> None:
+    def set_parallel_workers(self, max_workers: int) -> None:
+        """Parse files in a process pool of this size (0 or 1 = sequential).
+
+        Args:
+            max_workers: Number of worker processes.
+        """
+        self._max_workers = max(0, int(max_workers))
+        self.logger.info(f"Parallel parsing workers: {self._max_workers or 'off'}")
+
+    def load_directory(self, folder_path: str, snapshot: Optional[FolderSnapshot] = None) -> None:
         """Set the directory to scan. Call this before start().
         
         Args:
             folder_path: Path to directory containing Excel files.
+            snapshot: Result of the previous load, kept by the caller. If it
+                describes the same folder only added/changed files are parsed
+                (incremental rescan); either way it is updated with this load.
         """
         self._folder_path = Path(folder_path)
+        self._snapshot = snapshot
         self._cancel_requested = False
         self._cache_stats = {'files_cached': 0, 'files_parsed': 0, 'total_files': 0}
         self.logger.info(f"Set load directory: {folder_path}")
@@ -114,6 +338,10 @@ class DirectoryLoadWorker(QObject):
     def cancel(self) -> None:
         """Request cancellation of current load operation (thread-safe)."""
         self._cancel_requested = True
+        executor = self._executor
+        if executor is not None:
+            # Drop queued parses now; running ones finish in their processes
+            executor.shutdown(wait=False, cancel_futures=True)
         self.logger.info("Cancel requested by user")
 
     def _emit_safe(self, signal, *args) -> bool:
@@ -155,113 +383,133 @@ class DirectoryLoadWorker(QObject):
             return
 
         try:
-            # Scan for all Excel files in directory
-            excel_files = sorted(
-                list(self._folder_path.glob("*.xlsx")) + list(self._folder_path.glob("*.xls"))
-            )
+            # Scan for all Excel files in directory (name → size, mtime)
+            manifest = scan_excel_files(self._folder_path)
             
-            if not excel_files:
+            if not manifest:
                 msg = f"No Excel files found in {self._folder_path}"
                 self.logger.warning(msg)
+                if self._snapshot is not None:
+                    self._snapshot.reset()
                 self._emit_safe(self.complete, pd.DataFrame(), {"warning": msg})
                 return
 
-            self.logger.info(f"Found {len(excel_files)} Excel files in {self._folder_path}")
-            self._cache_stats['total_files'] = len(excel_files)
+            self.logger.info(f"Found {len(manifest)} Excel files in {self._folder_path}")
+            self._cache_stats['total_files'] = len(manifest)
+
+            # Incremental rescan: only files added or changed since the snapshot
+            snapshot = self._snapshot if self._snapshot is not None else FolderSnapshot()
+            incremental = snapshot.folder == self._folder_path
+            if incremental:
+                added, changed, removed = snapshot.diff(manifest)
+                names = sorted(added + changed)
+                self._cache_stats['files_unchanged'] = len(manifest) - len(names)
+                self.logger.info(
+                    f"Incremental rescan: {len(added)} added, {len(changed)} changed, "
+                    f"{len(removed)} removed, {self._cache_stats['files_unchanged']} unchanged"
+                )
+            else:
+                names = sorted(manifest)
+            excel_files = [self._folder_path / name for name in names]
 
             # Load each file
-            frames: List[pd.DataFrame] = []
+            frames: Dict[str, pd.DataFrame] = {}
             errors: Dict[str, str] = {}  # {filename: error_reason}
-            
-            for idx, excel_file in enumerate(excel_files):
-                # Check for cancellation
-                if self._cancel_requested:
-                    self.logger.info("Loading cancelled by user")
-                    self._emit_safe(self.cancelled)
-                    return
-
-                # Emit progress signal (update progress bar/label)
-                self._emit_safe(self.progress, idx + 1, len(excel_files), excel_file.name)
-
-                # Try cache first if loader provided
-                df = None
-                cache_hit = False
+
+            # Parallel mode: resolve cache hits first, fan the rest out to processes
+            cached: Dict[int, pd.DataFrame] = {}
+            futures: Dict[int, Future] = {}
+            prescanned = self._max_workers > 1
+            if prescanned:
                 if self._cache_loader:
-                    df = self._cache_loader(str(excel_file))
+                    for idx, excel_file in enumerate(excel_files):
+                        df = self._cache_loader(str(excel_file))
+                        if df is not None:
+                            cached[idx] = df
+                futures = self._submit_parses(
+                    [(idx, f) for idx, f in enumerate(excel_files) if idx not in cached]
+                )
+
+            try:
+                for idx, excel_file in enumerate(excel_files):
+                    # Check for cancellation
+                    if self._cancel_requested:
+                        self.logger.info("Loading cancelled by user")
+                        self._emit_safe(self.cancelled)
+                        return
+
+                    # Emit progress signal (update progress bar/label)
+                    self._emit_safe(self.progress, idx + 1, len(excel_files), excel_file.name)
+
+                    # Try cache first if loader provided
+                    df = cached.pop(idx, None)
+                    if df is None and self._cache_loader and not prescanned:
+                        df = self._cache_loader(str(excel_file))
                     if df is not None:
-                        cache_hit = True
                         self._cache_stats['files_cached'] += 1
                         self.logger.debug(f"Cache HIT: {excel_file.name}")
-                        frames.append(df)
+                        frames[excel_file.name] = df
                         self._emit_safe(self.file_loaded, excel_file.name, len(df))
                         continue  # Skip parsing, use cached data
 
-                # Parse file if not cached
-                try:
-                    # Use STACKED BLOCKS parser for monitoring tabs (Tkinter's proven approach)
-                    if self.dashboard_name == "borehole_monitoring":
-                        # Use Tkinter's proven stacked blocks parser
-                        from services.monitoring_excel_parser_v2 import parse_borehole_stacked_blocks
-                        df = parse_borehole_stacked_blocks(str(excel_file))
-                        if df.empty:
-                            error_msg = "Failed to parse monitoring file (no data found)"
+                    # Parse file if not cached
+                    try:
+                        df = self._parse_result(excel_file, futures.pop(idx, None))
+                        if df is None:
+                            continue  # Cancelled while waiting; handled at loop top
+                        if df.empty and self.dashboard_name in STACKED_BLOCK_DASHBOARDS:
+                            error_msg = STACKED_BLOCK_DASHBOARDS[self.dashboard_name]
                             self.logger.warning(f"{excel_file.name}: {error_msg}")
                             errors[excel_file.name] = error_msg
                             self._emit_safe(self.error, excel_file.name, error_msg)
                             continue
-                    elif self.dashboard_name == "pcd_monitoring":
-                        # Use same stacked blocks parser
-                        from services.monitoring_excel_parser_v2 import parse_borehole_stacked_blocks
-                        df = parse_borehole_stacked_blocks(str(excel_file))
-                        if df.empty:
-                            error_msg = "Failed to parse PCD file (no data found)"
-                            self.logger.warning(f"{excel_file.name}: {error_msg}")
-                            errors[excel_file.name] = error_msg
-                            self._emit_safe(self.error, excel_file.name, error_msg)
-                            continue
-                    else:
-                        # Static levels: use simple parsing (DON'T TOUCH - IT'S WORKING)
-                        df = pd.read_excel(excel_file)
-                        df["source_file"] = excel_file.name
-                    
-                    # Save to cache if saver provided
-                    if self._cache_saver and not cache_hit:
-                        self._cache_saver(str(excel_file), df)
-                        self._cache_stats['files_parsed'] += 1
-                    
-                    frames.append(df)
-                    self._emit_safe(self.file_loaded, excel_file.name, len(df))
-
-                except PermissionError as e:
-                    error_msg = f"File is locked (open in another program): {str(e)}"
-                    self.logger.error(f"{excel_file.name}: {error_msg}")
-                    errors[excel_file.name] = error_msg
-                    self._emit_safe(self.error, excel_file.name, error_msg)
-
-                except Exception as e:
-                    error_msg = f"Failed to read file: {str(e)}"
-                    self.logger.error(f"{excel_file.name}: {error_msg}")
-                    errors[excel_file.name] = error_msg
-                    self._emit_safe(self.error, excel_file.name, error_msg)
-
-            # Combine all loaded DataFrames
-            if frames:
-                combined_df = pd.concat(frames, ignore_index=True)
+
+                        # Save to cache if saver provided
+                        if self._cache_saver:
+                            self._cache_saver(str(excel_file), df)
+                            self._cache_stats['files_parsed'] += 1
+
+                        frames[excel_file.name] = df
+                        self._emit_safe(self.file_loaded, excel_file.name, len(df))
+
+                    except PermissionError as e:
+                        error_msg = f"File is locked (open in another program): {str(e)}"
+                        self.logger.error(f"{excel_file.name}: {error_msg}")
+                        errors[excel_file.name] = error_msg
+                        self._emit_safe(self.error, excel_file.name, error_msg)
+
+                    except Exception as e:
+                        error_msg = f"Failed to read file: {str(e)}"
+                        self.logger.error(f"{excel_file.name}: {error_msg}")
+                        errors[excel_file.name] = error_msg
+                        self._emit_safe(self.error, excel_file.name, error_msg)
+            finally:
+                self._shutdown_executor()
+
+            # Combine: patch the previous result (or build it, for a full load)
+            combined_df = snapshot.apply(self._folder_path, manifest, frames, errors)
+            if combined_df.empty:
+                self.logger.warning("No files loaded successfully; returning empty DataFrame")
+            else:
                 self.logger.info(
-                    f"Combined {len(frames)} files into DataFrame: "
+                    f"Combined {len(manifest) - len(snapshot.errors)} files into DataFrame: "
                     f"{len(combined_df)} total rows, {len(combined_df.columns)} columns"
                 )
-            else:
-                combined_df = pd.DataFrame()
-                self.logger.warning("No files loaded successfully; returning empty DataFrame")
+            if self._snapshot is not None:
+                # Receivers may modify the frame; keep the snapshot's copy intact
+                combined_df = combined_df.copy(deep=False)
 
-            # Build error summary
+            # Build error summary (all current failures, not just this run's)
             error_summary = {
-                "total_files": len(excel_files),
-                "loaded_files": len(frames),
-                "failed_files": len(errors),
-                "errors": errors if errors else None,
+                "total_files": len(manifest),
+                "loaded_files": len(manifest) - len(snapshot.errors),
+                "failed_files": len(snapshot.errors),
+                "errors": dict(snapshot.errors) if snapshot.errors else None,
             }
+            if incremental:
+                error_summary["incremental"] = {
+                    "added": len(added), "changed": len(changed), "removed": len(removed),
+                }
 
             # Emit cache statistics
             if self._cache_loader:
@@ -282,6 +530,52 @@ class DirectoryLoadWorker(QObject):
             self._emit_safe(self.complete, pd.DataFrame(), {"exception": error_msg})
 
 
+    def _submit_parses(self, files: List[Tuple[int, Path]]) -> Dict[int, Future]:
+        """Queue file parses on a process pool (empty dict → parse sequentially)."""
+        if len(files) < PARALLEL_MIN_FILES:
+            return {}
+        workers = min(self._max_workers, len(files))
+        try:
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            futures = {
+                idx: self._executor.submit(parse_monitoring_file, self.dashboard_name, str(path))
+                for idx, path in files
+            }
+        except (OSError, RuntimeError) as e:
+            self.logger.warning(f"Process pool unavailable, parsing sequentially: {e}")
+            self._shutdown_executor()
+            return {}
+        self.logger.info(f"Parsing {len(files)} files with {workers} processes")
+        return futures
+
+    def _parse_result(self, excel_file: Path, future: Optional[Future]) -> Optional[pd.DataFrame]:
+        """Return a file's parsed DataFrame, waiting on its pool task if it has one.
+
+        Returns:
+            DataFrame, or None if cancelled while waiting.
+
+        Raises:
+            Exception: Whatever the parser raised (re-raised from the worker process).
+        """
+        if future is None:
+            return parse_monitoring_file(self.dashboard_name, str(excel_file))
+        while True:
+            if self._cancel_requested:
+                return None
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeoutError:
+                continue
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory): finish this file here
+                self.logger.warning(f"Process pool broke, parsing {excel_file.name} in-thread")
+                return parse_monitoring_file(self.dashboard_name, str(excel_file))
+
+    def _shutdown_executor(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
 class DirectoryLoaderThread(QThread):
     """QThread wrapper for DirectoryLoadWorker (CONVENIENCE CLASS).
     
@@ -318,9 +612,13 @@ class DirectoryLoaderThread(QThread):
         """Pass cache functions to worker."""
         self.worker.set_cache_functions(loader, saver)
 
-    def load_directory(self, folder_path: str) -> None:
-        """Set directory to load."""
-        self.worker.load_directory(folder_path)
+    def set_parallel_workers(self, max_workers: int) -> None:
+        """Pass process-pool size to worker (0 or 1 = sequential)."""
+        self.worker.set_parallel_workers(max_workers)
+
+    def load_directory(self, folder_path: str, snapshot: Optional[FolderSnapshot] = None) -> None:
+        """Set directory to load (snapshot: previous load, for incremental rescans)."""
+        self.worker.load_directory(folder_path, snapshot)
 
     def run(self) -> None:
         """Run worker in this thread."""
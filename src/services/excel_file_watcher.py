@@ -0,0 +1,223 @@
+"""
+Excel File Watcher (CHANGE-DRIVEN CACHE INVALIDATION).
+
+Watches the Meter Readings and Flow Diagram workbooks with QFileSystemWatcher
+so ExcelManager can serve cached data without a stat() per call.
+
+Flow:
+1. File (or its folder) changes → debounce timer restarts for that source
+2. Timer fires → if size/mtime still moving (Excel mid-save), wait again
+3. Settled with new content → invalidate caches together:
+   - ExcelManager (Meter Readings or Flow Diagram cache)
+   - RecirculationVolumeLoader (volumes read from flow sheets)
+   - BalanceService (in-memory results; persisted results revalidate)
+4. Emit excel_changed(source) plus the source-specific signal
+
+While a change is pending (or the file is missing) the source is marked as
+unwatched in ExcelManager, so loads fall back to the mtime check.
+
+(IMPORTS)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from services.excel_manager import ExcelManager, get_excel_manager
+
+logger = logging.getLogger(__name__)
+
+# (size, mtime_ns) of a watched file, None when missing
+StatSignature = Optional[Tuple[int, int]]
+
+
+def _stat_signature(path: Path) -> StatSignature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ExcelFileWatcher(QObject):
+    """
+    Watches configured Excel sources and invalidates dependent caches.
+
+    Signals:
+        excel_changed(str): Source changed (ExcelManager.METER_READINGS or
+            ExcelManager.FLOW_DIAGRAM), after caches were invalidated.
+        meter_readings_changed(): Meter Readings workbook changed.
+        flow_diagram_changed(): Flow Diagram workbook changed.
+    """
+
+    excel_changed = Signal(str)
+    meter_readings_changed = Signal()
+    flow_diagram_changed = Signal()
+
+    # Quiet period before a change is acted on (Excel writes in several steps)
+    DEBOUNCE_MS = 1000
+    # Debounce rounds to wait for a missing/still-changing file before giving up
+    MAX_SETTLE_ROUNDS = 10
+
+    def __init__(
+        self,
+        excel_manager: Optional[ExcelManager] = None,
+        debounce_ms: Optional[int] = None,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self._excel = excel_manager or get_excel_manager()
+        self._debounce_ms = self.DEBOUNCE_MS if debounce_ms is None else debounce_ms
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._paths: Dict[str, Path] = {}
+        self._signatures: Dict[str, StatSignature] = {}  # Last content acted on
+        self._pending: Dict[str, StatSignature] = {}     # Signature when timer (re)started
+        self._settle_rounds: Dict[str, int] = {}
+        self._timers: Dict[str, QTimer] = {}
+        for source in (ExcelManager.METER_READINGS, ExcelManager.FLOW_DIAGRAM):
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda s=source: self._on_settle_timeout(s))
+            self._timers[source] = timer
+
+        self._excel.add_path_change_listener(self.refresh_paths)
+        self.refresh_paths()
+
+    # ------------------------------------------------------------------
+    # Watch management
+    # ------------------------------------------------------------------
+    def refresh_paths(self) -> None:
+        """(Re)read configured Excel paths and watch them."""
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._paths.clear()
+
+        if self._excel._has_meter_readings_path():
+            self._paths[ExcelManager.METER_READINGS] = self._excel.get_meter_readings_path()
+        self._paths[ExcelManager.FLOW_DIAGRAM] = self._excel.get_flow_diagram_path()
+
+        for source in (ExcelManager.METER_READINGS, ExcelManager.FLOW_DIAGRAM):
+            if source in self._paths:
+                self._signatures[source] = _stat_signature(self._paths[source])
+                self._watch(source)
+            else:
+                self._excel.set_file_watch(source, False)
+
+    def stop(self) -> None:
+        """Stop watching (ExcelManager goes back to per-call mtime checks)."""
+        for timer in self._timers.values():
+            timer.stop()
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        for source in self._timers:
+            self._excel.set_file_watch(source, False)
+
+    def _watch(self, source: str) -> None:
+        """Watch a source file and its folder (Excel saves by replacing the file)."""
+        path = self._paths[source]
+        if path.parent.exists() and str(path.parent) not in self._watcher.directories():
+            self._watcher.addPath(str(path.parent))
+        if path.exists() and str(path) not in self._watcher.files():
+            self._watcher.addPath(str(path))
+        self._excel.set_file_watch(source, str(path) in self._watcher.files())
+
+    # ------------------------------------------------------------------
+    # Change handling
+    # ------------------------------------------------------------------
+    def _on_file_changed(self, path_str: str) -> None:
+        for source, path in self._paths.items():
+            if str(path) == path_str:
+                self._schedule(source)
+
+    def _on_directory_changed(self, dir_str: str) -> None:
+        # Folder events include Excel lock/temp files: act only if our file moved
+        for source, path in self._paths.items():
+            if str(path.parent) != dir_str:
+                continue
+            if self._timers[source].isActive() or _stat_signature(path) != self._signatures.get(source):
+                self._schedule(source)
+
+    def _schedule(self, source: str) -> None:
+        """Start (or restart) the debounce timer for a source."""
+        # Until the change settles, cached loads must re-check mtime
+        self._excel.set_file_watch(source, False)
+        if not self._timers[source].isActive():
+            self._settle_rounds[source] = 0
+        self._pending[source] = _stat_signature(self._paths[source])
+        self._timers[source].start(self._debounce_ms)
+
+    def _on_settle_timeout(self, source: str) -> None:
+        path = self._paths.get(source)
+        if path is None:
+            return
+        signature = _stat_signature(path)
+        rounds = self._settle_rounds.get(source, 0) + 1
+        self._settle_rounds[source] = rounds
+
+        still_saving = signature is None or signature != self._pending.get(source)
+        if still_saving and rounds < self.MAX_SETTLE_ROUNDS:
+            logger.debug(f"Excel file still changing, waiting: {path.name}")
+            self._pending[source] = signature
+            self._timers[source].start(self._debounce_ms)
+            return
+
+        self._watch(source)
+        if signature == self._signatures.get(source):
+            return  # Touched/reopened without new content
+        self._signatures[source] = signature
+        self.invalidate(source)
+
+    def invalidate(self, source: str) -> None:
+        """Invalidate every cache fed by a source and notify subscribers.
+
+        Args:
+            source: ExcelManager.METER_READINGS or ExcelManager.FLOW_DIAGRAM.
+        """
+        logger.info(f"Excel source changed on disk ({source}), invalidating caches")
+        if source == ExcelManager.METER_READINGS:
+            self._excel.clear_meter_cache()
+        else:
+            self._excel.clear_flow_cache()
+
+        try:
+            from services.recirculation_loader import get_recirculation_loader
+            get_recirculation_loader().clear_cache()
+        except Exception as exc:
+            logger.warning(f"Could not clear recirculation cache: {exc}")
+        try:
+            from services.calculation.balance_service import get_balance_service
+            get_balance_service().clear_cache()
+        except Exception as exc:
+            logger.warning(f"Could not clear balance cache: {exc}")
+
+        self.excel_changed.emit(source)
+        if source == ExcelManager.METER_READINGS:
+            self.meter_readings_changed.emit()
+        else:
+            self.flow_diagram_changed.emit()
+
+
+_watcher_instance: Optional[ExcelFileWatcher] = None
+
+
+def get_excel_file_watcher() -> ExcelFileWatcher:
+    """
+    Get the singleton ExcelFileWatcher (requires a running QApplication).
+
+    Returns:
+        ExcelFileWatcher instance.
+    """
+    global _watcher_instance
+    if _watcher_instance is None:
+        _watcher_instance = ExcelFileWatcher()
+    return _watcher_instance
@@ -14,13 +14,15 @@ Design goals:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import threading
 import warnings
 import re
 
+import numpy as np
 import pandas as pd
 
 # Suppress openpyxl warning about invalid print areas in Excel files
@@ -28,6 +30,7 @@ warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 
 from core.app_logger import logger
 from core.config_manager import ConfigManager, get_resource_path
+from services.meter_readings_cache import MeterReadingsDiskCache
 
 
 @dataclass(frozen=True)
@@ -60,6 +63,117 @@ class FlowDiagramConfig:
     default_sheet_prefix: str = "Flows_"
 
 
+@dataclass
+class MeterSourceInfo:
+    """Metadata for one Meter Readings column (computed once per load).
+
+    Attributes:
+        name: Column name.
+        unit: Unit from the units row ('' when blank).
+        is_numeric: True if the column holds at least one numeric reading.
+        non_null_count: Number of numeric readings.
+        first_date: Date of the earliest numeric reading (None if none).
+        last_date: Date of the latest numeric reading (None if none).
+    """
+
+    name: str
+    unit: str = ""
+    is_numeric: bool = False
+    non_null_count: int = 0
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+
+
+@dataclass
+class FlowSheetIndex:
+    """(Year, Month) → row lookup for one cached Flow Diagram sheet.
+
+    Attributes:
+        frame: Sheet DataFrame the index was built from.
+        first_period: Year * 12 + (Month - 1) of the earliest dated row.
+        period_rows: Dense array of row positions per month from first_period
+            (-1 where the sheet has no row for that month).
+        latest_row: Row position of the most recent (Year, Month), or None.
+        numeric: Lazily converted float columns (non-numeric cells → NaN).
+    """
+
+    frame: pd.DataFrame
+    first_period: int = 0
+    period_rows: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    latest_row: Optional[int] = None
+    numeric: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "FlowSheetIndex":
+        """Index rows by (Year, Month); the first row of a month wins."""
+        index = cls(frame=df)
+        if df.empty or "Year" not in df.columns or "Month" not in df.columns:
+            return index
+
+        years = pd.to_numeric(df["Year"], errors="coerce").to_numpy(dtype=float)
+        months = pd.to_numeric(df["Month"], errors="coerce").to_numpy(dtype=float)
+        valid = ~np.isnan(years) & ~np.isnan(months) & (years % 1 == 0) & (months % 1 == 0)
+        if not valid.any():
+            index.latest_row = 0
+            return index
+
+        positions = np.flatnonzero(valid)
+        keys = years[valid].astype(np.int64) * 12 + (months[valid].astype(np.int64) - 1)
+        unique_keys, first = np.unique(keys, return_index=True)
+        index.first_period = int(unique_keys[0])
+        index.period_rows = np.full(int(unique_keys[-1] - unique_keys[0]) + 1, -1, dtype=np.int64)
+        index.period_rows[unique_keys - index.first_period] = positions[first]
+        index.latest_row = int(positions[first[-1]])
+        return index
+
+    def row_for(self, year: int, month: int) -> Optional[int]:
+        """Row position for a month, or None if the sheet has no such row."""
+        offset = int(year) * 12 + (int(month) - 1) - self.first_period
+        if 0 <= offset < len(self.period_rows) and self.period_rows[offset] >= 0:
+            return int(self.period_rows[offset])
+        return None
+
+    def column(self, column_name: str) -> np.ndarray:
+        """Float view of a column (converted once per sheet load)."""
+        values = self.numeric.get(column_name)
+        if values is None:
+            values = pd.to_numeric(self.frame[column_name], errors="coerce").to_numpy(dtype=float)
+            self.numeric[column_name] = values
+        return values
+
+
+@dataclass
+class FlowColumnEdit:
+    """One queued Flow Diagram column operation.
+
+    Attributes:
+        action: "create", "rename" or "delete".
+        sheet_name: Resolved sheet name.
+        column_name: Column to create/delete, or the current name when renaming.
+        new_column_name: Target name for "rename".
+    """
+
+    action: str
+    sheet_name: str
+    column_name: str
+    new_column_name: Optional[str] = None
+
+
+@dataclass
+class DiagramVolumeResult:
+    """Edge volumes resolved for one flow diagram and month.
+
+    Attributes:
+        volumes: Edge index (position in diagram_data['edges']) → volume in m³.
+        warnings: Human-readable issues (missing month/column, empty cells).
+        mapped_count: Edges with an Excel sheet + column mapping.
+    """
+
+    volumes: Dict[int, float] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+    mapped_count: int = 0
+
+
 class ExcelManager:
     """Excel Manager (SINGLE ENTRY POINT FOR EXCEL DATA).
 
@@ -70,6 +184,13 @@ class ExcelManager:
     - Invalidate cache when Excel files change on disk
     """
 
+    # Source names used by file watching
+    METER_READINGS = "meter_readings"
+    FLOW_DIAGRAM = "flow_diagram"
+
+    # Column names containing these are date/time fields, not sources
+    _METER_DATE_PATTERNS = ("date", "time", "datetime", "timestamp", "month", "year", "day", "period")
+
     # Optional convenience mapping for flow diagram sheets
     AREA_CODE_TO_SHEET = {
         "UG2N": "Flows_UG2 North",
@@ -94,10 +215,26 @@ class ExcelManager:
         self._meter_df: Optional[pd.DataFrame] = None
         self._meter_mtime: Optional[float] = None
         self._meter_units: Dict[str, str] = {}  # Map column name → unit from row 4
+        # Numeric (year, month) × column matrix derived from _meter_df
+        self._meter_monthly: Optional[pd.DataFrame] = None
+        # Source column metadata derived from _meter_df (see get_source_catalog)
+        self._meter_catalog: Optional[Dict[str, MeterSourceInfo]] = None
+        # Parsed Meter Readings persisted across app starts (created lazily)
+        self._meter_disk_cache: Optional[MeterReadingsDiskCache] = None
 
         # Cached Flow Diagram DataFrames by sheet name
         self._flow_df_cache: Dict[str, pd.DataFrame] = {}
         self._flow_mtime: Optional[float] = None
+        # (Year, Month) row indexes for cached flow sheets (built on first lookup)
+        self._flow_index: Dict[str, FlowSheetIndex] = {}
+        # Serializes whole-workbook flow loads (UI thread vs background prefetch)
+        self._flow_lock = threading.RLock()
+        self._flow_prefetch: Optional[threading.Thread] = None
+        self._flow_loaded_all = False
+
+        # Sources whose changes are reported by a file watcher (skip per-call stat)
+        self._watched_sources: set = set()
+        self._path_listeners: List[Callable[[], None]] = []
 
     # ---------------------------------------------------------------------
     # User-Configured Paths (Persistence)
@@ -117,7 +254,9 @@ class ExcelManager:
         # Persist path selection for future sessions (user-defined location)
         self._config.set("data_sources.legacy_excel_path", new_path)
         # Invalidate cache so next access reloads from new file
+        self._watched_sources.discard(self.METER_READINGS)
         self.clear_meter_cache()
+        self._notify_path_listeners()
 
     def set_flow_diagram_path(self, new_path: str) -> None:
         """Persist user-selected Flow Diagram Excel path.
@@ -131,7 +270,48 @@ class ExcelManager:
         # Persist path selection for future sessions (user-defined location)
         self._config.set("data_sources.timeseries_excel_path", new_path)
         # Invalidate cache so next access reloads from new file
+        self._watched_sources.discard(self.FLOW_DIAGRAM)
         self.clear_flow_cache()
+        self._notify_path_listeners()
+
+    # ---------------------------------------------------------------------
+    # File Watching (change notification instead of per-call stat)
+    # ---------------------------------------------------------------------
+    def set_file_watch(self, source: str, active: bool) -> None:
+        """Mark a source as watched (cached loads then skip the mtime check).
+
+        A watcher calling this must invalidate the source's cache on change.
+
+        Args:
+            source: ExcelManager.METER_READINGS or ExcelManager.FLOW_DIAGRAM.
+            active: True while the file is being watched.
+        """
+        if active:
+            self._watched_sources.add(source)
+        else:
+            self._watched_sources.discard(source)
+
+    def add_path_change_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback run after an Excel path changes or this manager saves a workbook."""
+        self._path_listeners.append(callback)
+
+    def _notify_path_listeners(self) -> None:
+        for callback in list(self._path_listeners):
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning(f"Excel path change listener failed: {exc}")
+
+    def meter_readings_mtime(self) -> Optional[float]:
+        """Return the Meter Readings file mtime (cached while watched), or None."""
+        if self.METER_READINGS in self._watched_sources and self._meter_mtime is not None:
+            return self._meter_mtime
+        try:
+            if not self.meter_readings_exists():
+                return None
+            return self.get_meter_readings_path().stat().st_mtime
+        except OSError:
+            return None
 
     def meter_readings_status(self) -> Tuple[bool, Path]:
         """Return whether Meter Readings Excel is configured and exists.
@@ -216,12 +396,33 @@ class ExcelManager:
         self._meter_df = None
         self._meter_mtime = None
         self._meter_units = {}  # Clear units cache too
+        self._meter_monthly = None
+        self._meter_catalog = None
         logger.info("Meter Readings Excel cache cleared")
 
+    def _get_meter_disk_cache(self) -> Optional[MeterReadingsDiskCache]:
+        """Return the Meter Readings disk cache (None when disabled in config).
+
+        Config keys:
+            features.meter_readings_disk_cache: Enable the cache (default True).
+            data_sources.meter_cache_dir: Override the cache directory.
+        """
+        if not self._config.get("features.meter_readings_disk_cache", True):
+            return None
+        if self._meter_disk_cache is None:
+            cache_dir = self._config.get("data_sources.meter_cache_dir")
+            self._meter_disk_cache = MeterReadingsDiskCache(
+                self._resolve_path(cache_dir) if cache_dir else None
+            )
+        return self._meter_disk_cache
+
     def clear_flow_cache(self) -> None:
         """Clear Flow Diagram cache (force reload on next access)."""
-        self._flow_df_cache.clear()
-        self._flow_mtime = None
+        with self._flow_lock:
+            self._flow_df_cache.clear()
+            self._flow_index.clear()
+            self._flow_mtime = None
+            self._flow_loaded_all = False
         logger.info("Flow Diagram Excel cache cleared")
 
     def clear_all_caches(self) -> None:
@@ -236,8 +437,12 @@ class ExcelManager:
         """Load Meter Readings Excel into a cached DataFrame.
 
         Returns:
-            DataFrame with normalized columns and Date column.
+            DataFrame with normalized columns, indexed by Date.
         """
+        if self._meter_df is not None and self.METER_READINGS in self._watched_sources:
+            # Watcher invalidates on change: no stat needed
+            return self._meter_df
+
         if not self._has_meter_readings_path():
             logger.warning("Meter Readings Excel path not configured")
             return pd.DataFrame()
@@ -264,62 +469,239 @@ class ExcelManager:
             logger.debug(f"EXCEL OPERATIONS - Using cached Meter Readings ({len(self._meter_df)} rows)")
             return self._meter_df
 
-        # Read Excel: header is row 3 (1-based → header=2)
-        # Row 4 contains units (we'll read it separately)
-        df = pd.read_excel(
-            file_path,
-            sheet_name=cfg.sheet_name,
-            header=cfg.header_row - 1,
-            engine="openpyxl",
-        )
-        
-        # Read units row (row 4 is index 3 in 0-based)
-        units_df = pd.read_excel(
-            file_path,
-            sheet_name=cfg.sheet_name,
-            header=None,
-            skiprows=cfg.header_row,  # Skip to units row
-            nrows=1,  # Read only units row
-            engine="openpyxl",
-        )
-        # Store units mapping: {column_name: unit}
-        column_names = [str(col).strip() for col in df.columns]
-        self._meter_units = {}
-        for i, col_name in enumerate(column_names):
-            if i < len(units_df.columns):
-                unit = str(units_df.iloc[0, i]).strip() if pd.notna(units_df.iloc[0, i]) else ""
-                self._meter_units[col_name] = unit
-
-        # Normalize column names (trim whitespace)
-        df.columns = [str(col).strip() for col in df.columns]
-
-        # First column should be date; enforce consistent name
-        date_col = df.columns[0]
-        df["Date"] = pd.to_datetime(df[date_col], errors="coerce")
+        # Warm start: parsed frame + units from the disk cache (skips openpyxl)
+        disk_cache = self._get_meter_disk_cache()
+        float32 = bool(self._config.get("features.meter_readings_float32", False))
+        cache_settings = {
+            "sheet_name": cfg.sheet_name,
+            "header_row": cfg.header_row,
+            "first_data_row": cfg.first_data_row,
+            "float32": float32,
+        }
+        if disk_cache is not None:
+            cached = disk_cache.load(file_path, cache_settings)
+            if cached is not None:
+                self._meter_df, self._meter_units = cached
+                logger.info(
+                    f"Loaded Meter Readings from disk cache: {len(self._meter_df)} rows, "
+                    f"{len(self._meter_df.columns)} columns"
+                )
+                return self._meter_df
 
-        # Drop rows without valid date
-        df = df.dropna(subset=["Date"]).reset_index(drop=True)
-
-        # Skip rows before first_data_row
-        extra_skip = max(0, cfg.first_data_row - cfg.header_row - 1)
-        if extra_skip > 0:
-            df = df.iloc[extra_skip:].reset_index(drop=True)
+        # Single openpyxl pass: header row 3, units row 4 and typed data columns
+        df, self._meter_units = self._read_meter_sheet(cfg)
+        df = self._compact_meter_frame(df, float32=float32)
+        self._meter_units = {k: v for k, v in self._meter_units.items() if k in df.columns}
 
         self._meter_df = df
         logger.info(
             f"Loaded Meter Readings: {len(df)} rows, {len(df.columns)} columns"
         )
+        if disk_cache is not None:
+            disk_cache.store(file_path, cache_settings, df, self._meter_units)
         
         # EXCEL OPERATIONS LOGGING: Track what was loaded with details
         logger.debug(f"Columns loaded: {', '.join(df.columns[:10])}{'...' if len(df.columns) > 10 else ''}")
-        if not df.empty and 'Date' in df.columns:
-            min_date = df['Date'].min()
-            max_date = df['Date'].max()
-            logger.debug(f"Date range: {min_date} to {max_date}")
+        if not df.empty and isinstance(df.index, pd.DatetimeIndex):
+            logger.debug(f"Date range: {df.index.min()} to {df.index.max()}")
         logger.debug(f"Units mapping: {len(self._meter_units)} columns have units defined")
         
         return df
 
+    @staticmethod
+    def _read_meter_sheet(cfg: MeterReadingsConfig) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """Read header, units and data rows of the Meter Readings sheet in one pass.
+
+        Streams the sheet with openpyxl ``read_only`` mode and builds one NumPy
+        array per column from the dated rows only, so the units row and blank
+        rows never force numeric meters into object dtype. Column naming, NA
+        strings and row filtering follow the previous ``pd.read_excel`` load.
+
+        Args:
+            cfg: Meter Readings sheet layout.
+
+        Returns:
+            Tuple of (normalized DataFrame with a Date column, column → unit map).
+        """
+        from openpyxl import load_workbook
+
+        wb = load_workbook(cfg.file_path, read_only=True, data_only=True)
+        try:
+            ws = wb[cfg.sheet_name]
+            rows = ws.iter_rows(min_row=cfg.header_row, values_only=True)
+            header = _trim_row(next(rows, ()))
+            body = [_trim_row(row) for row in rows]
+        finally:
+            wb.close()
+
+        units_row = body[0] if body else ()
+        width = max([len(header), *(len(row) for row in body)] or [0])
+        columns = _excel_column_names(header, width)
+
+        units: Dict[str, str] = {}
+        units_width = max(len(header), len(units_row))
+        for i, col_name in enumerate(columns):
+            if i < units_width:
+                unit = _excel_value(units_row[i]) if i < len(units_row) else None
+                units[col_name] = str(unit).strip() if unit is not None else ""
+
+        # First column should be date; keep dated rows after first_data_row
+        first_values = np.array([_excel_value(row[0]) if row else None for row in body], dtype=object)
+        dates = pd.to_datetime(pd.Series(first_values, dtype=object), errors="coerce")
+        keep = np.flatnonzero(dates.notna().to_numpy())
+        extra_skip = max(0, cfg.first_data_row - cfg.header_row - 1)
+        keep = keep[extra_skip:]
+
+        df = _excel_frame(header, [body[i] for i in keep], [header, *body])
+        df["Date"] = dates.iloc[keep].reset_index(drop=True)
+        return df, units
+
+    def get_source_catalog(self) -> Dict[str, MeterSourceInfo]:
+        """Return metadata for every Meter Readings source column (CACHED CATALOG).
+
+        Computed in one vectorized pass per loaded workbook and reused until
+        the Meter Readings cache is cleared. Excludes date/time columns and
+        unnamed (empty) Excel columns; non-numeric columns are included with
+        is_numeric=False so callers can filter and sort without rescanning.
+
+        Returns:
+            Dict of column name → MeterSourceInfo in sheet column order
+            (empty dict if Meter Readings are unavailable).
+        """
+        df = self.load_meter_readings()
+        if df.empty:
+            return {}
+        if self._meter_catalog is None:
+            self._meter_catalog = self._build_source_catalog(df)
+            logger.debug(f"Built Meter Readings source catalog: {len(self._meter_catalog)} columns")
+        return self._meter_catalog
+
+    def _build_source_catalog(self, df: pd.DataFrame) -> Dict[str, MeterSourceInfo]:
+        """Compute numeric-ness, counts, date span and unit for each source column."""
+        columns = [
+            col for col in df.columns
+            if not col.lower().startswith("unnamed")
+            and not any(pattern in col.lower() for pattern in self._METER_DATE_PATTERNS)
+        ]
+        if not columns:
+            return {}
+
+        # One numeric conversion per column, then column-wise reductions on the mask
+        numeric = np.column_stack([
+            pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            for col in columns
+        ])
+        valid = ~np.isnan(numeric)
+        counts = valid.sum(axis=0)
+
+        first_dates: List[Optional[date]] = [None] * len(columns)
+        last_dates: List[Optional[date]] = [None] * len(columns)
+        dates = self.get_meter_dates(df)
+        if dates is not None:
+            stamps = dates.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+            has_date = dates.notna().to_numpy()
+            dated = valid & has_date[:, None]
+            lo = np.where(dated, stamps[:, None], np.iinfo(np.int64).max).min(axis=0)
+            hi = np.where(dated, stamps[:, None], np.iinfo(np.int64).min).max(axis=0)
+            for i in np.flatnonzero(dated.any(axis=0)):
+                first_dates[i] = pd.Timestamp(lo[i]).date()
+                last_dates[i] = pd.Timestamp(hi[i]).date()
+
+        return {
+            col: MeterSourceInfo(
+                name=col,
+                unit=self._meter_units.get(col, ""),
+                is_numeric=bool(counts[i]),
+                non_null_count=int(counts[i]),
+                first_date=first_dates[i],
+                last_date=last_dates[i],
+            )
+            for i, col in enumerate(columns)
+        }
+
+    @staticmethod
+    def _compact_meter_frame(df: pd.DataFrame, float32: bool = False) -> pd.DataFrame:
+        """Shrink the parsed Meter Readings frame kept in memory (MEMORY COMPACTION).
+
+        Steps:
+        1. Drop "Unnamed:" columns (no header, never offered as sources); named
+           columns are kept even when empty so column checks still see them
+        2. Drop the sheet's first column when it only duplicates Date
+        3. Date becomes the frame's DatetimeIndex (no date column is kept)
+        4. Non-integer float columns → float32 when lossless (or always with
+           float32=True); integer-valued and int64 columns keep 64 bits so
+           meter totals cannot overflow or round in later sums/differences
+        5. Repetitive text-only columns → categorical
+
+        Numeric columns with text cells (e.g. "n/a") stay object so lookups
+        still coerce them to NaN.
+
+        Args:
+            df: Frame from _read_meter_sheet (Date column last).
+            float32: Opt in to float32 for all non-integer float columns (config
+                features.meter_readings_float32), accepting ~7 significant digits.
+
+        Returns:
+            Compacted DataFrame indexed by Date.
+        """
+        if df.empty:
+            return df
+        before = int(df.memory_usage(deep=True).sum())
+
+        drop = [c for c in df.columns if c.lower().startswith("unnamed:")]
+        first = df.columns[0]
+        if first != "Date" and "Date" in df.columns and first not in drop:
+            as_dates = pd.to_datetime(df[first], errors="coerce")
+            if as_dates.equals(df["Date"]):
+                drop.append(first)
+        compact = df.drop(columns=drop).set_index("Date")
+
+        converted: Dict[str, Any] = {}
+        for col in compact.columns:
+            series = compact[col]
+            if series.dtype == np.float64:
+                values = series.to_numpy()
+                present = values[~np.isnan(values)]
+                if np.array_equal(present, np.trunc(present)):
+                    continue  # Integer-valued meter totals stay float64
+                small = values.astype(np.float32)
+                if float32 or np.array_equal(small.astype(np.float64), values, equal_nan=True):
+                    converted[col] = small
+            elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+                present = series.dropna()
+                # Only repetitive text (status/comment codes) is cheaper as categories
+                if (
+                    len(present)
+                    and present.nunique() * 2 <= len(series)
+                    and all(isinstance(v, str) for v in present.tolist())
+                ):
+                    converted[col] = series.astype("category")
+        if converted:
+            compact = compact.assign(**converted)
+
+        after = int(compact.memory_usage(deep=True).sum())
+        logger.info(
+            f"Meter Readings compacted: {before / 1024:.1f} KiB → {after / 1024:.1f} KiB "
+            f"({len(drop)} columns dropped, {len(converted)} retyped)"
+        )
+        return compact
+
+    @staticmethod
+    def get_meter_dates(df: pd.DataFrame) -> Optional[pd.Series]:
+        """Return the row dates of a Meter Readings frame, or None if it has none.
+
+        Loaded frames are indexed by Date (see _compact_meter_frame); frames
+        that still carry a Date column are accepted too. The returned Series
+        has a RangeIndex, so it lines up with the frame's rows by position.
+        """
+        if "Date" in df.columns:
+            dates = df["Date"]
+        elif isinstance(df.index, pd.DatetimeIndex):
+            dates = df.index
+        else:
+            return None
+        return pd.Series(pd.to_datetime(dates, errors="coerce")).reset_index(drop=True)
+
     def list_meter_readings_sources(self) -> List[str]:
         """List numeric source columns available for charting.
 
@@ -331,33 +713,7 @@ class ExcelManager:
         Returns:
             List of numeric column names suitable for charting.
         """
-        df = self.load_meter_readings()
-        if df.empty:
-            return []
-
-        # Common date/time column patterns to exclude
-        date_patterns = [
-            "date", "time", "datetime", "timestamp",
-            "month", "year", "day", "period"
-        ]
-
-        sources: List[str] = []
-        for col in df.columns:
-            col_lower = col.lower()
-            
-            # Skip unnamed columns (empty Excel columns)
-            if col_lower.startswith("unnamed"):
-                continue
-            
-            # Skip if column name matches date patterns
-            if any(pattern in col_lower for pattern in date_patterns):
-                continue
-            
-            # Check if column has numeric data
-            series = pd.to_numeric(df[col], errors="coerce")
-            if series.notna().any():
-                sources.append(col)
-        return sources
+        return [name for name, info in self.get_source_catalog().items() if info.is_numeric]
 
     def get_meter_readings_date_range(self) -> Tuple[Optional[date], Optional[date]]:
         """Return min/max dates in Meter Readings data.
@@ -366,9 +722,10 @@ class ExcelManager:
             (min_date, max_date) tuple or (None, None) if data missing.
         """
         df = self.load_meter_readings()
-        if df.empty or "Date" not in df.columns:
+        dates = None if df.empty else self.get_meter_dates(df)
+        if dates is None or dates.isna().all():
             return None, None
-        return df["Date"].min().date(), df["Date"].max().date()
+        return dates.min().date(), dates.max().date()
 
     def get_meter_readings_series(
         self,
@@ -390,8 +747,12 @@ class ExcelManager:
         if df.empty or source_name not in df.columns:
             return []
 
+        dates = self.get_meter_dates(df)
+        if dates is None:
+            return []
+
         # Filter by date range if provided
-        data = df[["Date", source_name]].copy()
+        data = pd.DataFrame({"Date": dates, source_name: df[source_name].to_numpy()})
         if start_date:
             data = data[data["Date"] >= pd.to_datetime(start_date)]
         if end_date:
@@ -403,6 +764,84 @@ class ExcelManager:
 
         return [(d.date(), float(v)) for d, v in zip(data["Date"], data[source_name])]
 
+    def get_meter_readings_monthly(self) -> pd.DataFrame:
+        """Get Meter Readings as a numeric (year, month) × column matrix.
+
+        Built once per loaded file (rebuilt when the file mtime changes) so
+        per-month lookups are index hits instead of DataFrame slices. The value
+        for a month is the first numeric reading dated inside that month, which
+        matches ``get_meter_readings_series(...)[0][1]`` for the month range.
+
+        Returns:
+            DataFrame indexed by (year, month) with one float column per source,
+            or an empty DataFrame if Meter Readings are unavailable.
+        """
+        df = self.load_meter_readings()
+        if df.empty or self.get_meter_dates(df) is None:
+            return pd.DataFrame()
+
+        if self._meter_monthly is None:
+            self._meter_monthly = self._aggregate_meter_readings_by_month(df)
+            logger.debug(
+                f"Built Meter Readings monthly matrix: {len(self._meter_monthly)} months × "
+                f"{len(self._meter_monthly.columns)} columns"
+            )
+        return self._meter_monthly
+
+    def get_meter_values(self, period: Any, columns: Iterable[str]) -> Dict[str, Optional[float]]:
+        """Get several Meter Readings values for one month in a single lookup.
+
+        Args:
+            period: Any object with ``year`` and ``month`` attributes
+                (CalculationPeriod, date, datetime).
+            columns: Column names to read (e.g., ['Tonnes Milled', 'Tailings RD']).
+
+        Returns:
+            Dict mapping each requested column to its value for the month, or
+            None when the column is missing or has no numeric reading.
+
+        Example:
+            values = excel.get_meter_values(period, ["Tonnes Milled", "Tailings RD"])
+            tonnes = values["Tonnes Milled"] or 0.0
+        """
+        columns = list(columns)
+        matrix = self.get_meter_readings_monthly()
+        key = (int(period.year), int(period.month))
+        if matrix.empty or key not in matrix.index:
+            return {col: None for col in columns}
+
+        row = matrix.loc[key].reindex(columns)
+        return {col: (None if pd.isna(value) else float(value)) for col, value in zip(columns, row)}
+
+    @staticmethod
+    def _aggregate_meter_readings_by_month(df: pd.DataFrame) -> pd.DataFrame:
+        """Collapse Meter Readings rows into one numeric row per (year, month).
+
+        Args:
+            df: Meter Readings DataFrame (Date index or 'Date' column).
+
+        Returns:
+            DataFrame indexed by (year, month); non-numeric cells become NaN and
+            each cell holds the first non-null reading of that month.
+        """
+        dates = ExcelManager.get_meter_dates(df)
+        valid = dates.notna().to_numpy()
+        values = (
+            df.drop(columns=["Date"], errors="ignore")
+            .iloc[valid]
+            .reset_index(drop=True)
+            .apply(pd.to_numeric, errors="coerce")
+        )
+        dates = dates[valid].reset_index(drop=True)
+        if values.empty:
+            return pd.DataFrame()
+
+        monthly = values.groupby(
+            [dates.dt.year.rename("year"), dates.dt.month.rename("month")],
+            sort=True,
+        ).first()
+        return monthly.astype(float)
+
     def get_source_unit(self, source_name: str) -> str:
         """Get the unit of measurement for a source column from Excel row 4.
         
@@ -452,9 +891,14 @@ class ExcelManager:
         Returns:
             DataFrame with normalized time columns if detected.
         """
-        file_path = self.get_flow_diagram_path()
         sheet_name = self._resolve_flow_sheet(area_code_or_sheet)
+        if self.FLOW_DIAGRAM in self._watched_sources:
+            cached = self._flow_df_cache.get(sheet_name)
+            if cached is not None:
+                # Watcher invalidates on change: no stat needed
+                return cached
 
+        file_path = self.get_flow_diagram_path()
         if not file_path.exists():
             # Silent return - don't log warnings (called too many times during startup)
             logger.debug(f"Flow Diagram Excel not found: {file_path}")
@@ -470,69 +914,119 @@ class ExcelManager:
             self.clear_flow_cache()
         self._flow_mtime = current_mtime
 
-        if sheet_name in self._flow_df_cache:
-            logger.debug(f"EXCEL OPERATIONS - Using cached Flow Diagram sheet '{sheet_name}' ({len(self._flow_df_cache[sheet_name])} rows)")
-            return self._flow_df_cache[sheet_name]
+        with self._flow_lock:
+            if sheet_name not in self._flow_df_cache and not self._flow_loaded_all:
+                # One workbook open fills every Flows_* sheet (also waits for a prefetch)
+                self.load_all_flow_sheets()
 
-        try:
-            # Header layout varies across deployments/templates.
-            # Try the legacy default first (row 3), then detected header row, then row 1.
-            header_candidates = [2]
+        df = self._flow_df_cache.get(sheet_name)
+        if df is None:
+            logger.error(f"Failed to load flow sheet '{sheet_name}': sheet not found in {file_path.name}")
+            return pd.DataFrame()
+        logger.debug(f"EXCEL OPERATIONS - Using cached Flow Diagram sheet '{sheet_name}' ({len(df)} rows)")
+        return df
+
+    def load_all_flow_sheets(self) -> Dict[str, pd.DataFrame]:
+        """Parse every Flows_* sheet in one workbook open and cache them all.
+
+        Each sheet is streamed once (openpyxl read-only) and its header row is
+        chosen from the in-memory rows with the same candidates as before:
+        legacy row 3 first, then the detected header row, then row 1.
+
+        Returns:
+            Dict of sheet name → DataFrame (empty dict if the file is missing).
+        """
+        file_path = self.get_flow_diagram_path()
+        if not file_path.exists():
+            logger.debug(f"Flow Diagram Excel not found: {file_path}")
+            return {}
+
+        with self._flow_lock:
+            current_mtime = file_path.stat().st_mtime
+            if self._flow_mtime and self._flow_mtime != current_mtime:
+                logger.debug(f"EXCEL FILE CHANGED - Flow Diagram modified (mtime changed), clearing cache")
+                self.clear_flow_cache()
+            self._flow_mtime = current_mtime
+
+            prefix = FlowDiagramConfig(file_path=file_path).default_sheet_prefix
             try:
                 from openpyxl import load_workbook
 
                 wb = load_workbook(file_path, read_only=True, data_only=True)
-                if sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    detected_header_row = max(1, self._detect_flow_header_row(ws))
-                    header_candidates.append(detected_header_row - 1)
-                wb.close()
-            except Exception as detect_exc:
-                logger.debug(
-                    f"Could not auto-detect flow header row for '{sheet_name}': {detect_exc}"
-                )
+            except Exception as exc:
+                logger.error(f"Failed to open Flow Diagram Excel '{file_path.name}': {exc}")
+                return {}
 
-            header_candidates.append(0)
-            # Preserve order while removing duplicates
-            unique_candidates = list(dict.fromkeys(header_candidates))
-
-            df = pd.DataFrame()
-            last_exc: Optional[Exception] = None
-            for header_idx in unique_candidates:
-                try:
-                    candidate_df = pd.read_excel(
-                        file_path,
-                        sheet_name=sheet_name,
-                        header=header_idx,
-                        engine="openpyxl",
+            try:
+                for sheet_name in wb.sheetnames:
+                    if not sheet_name.startswith(prefix) or sheet_name in self._flow_df_cache:
+                        continue
+                    try:
+                        rows = [_trim_row(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+                        df = self._flow_frame_from_rows(rows)
+                    except Exception as exc:
+                        logger.error(f"Failed to load flow sheet '{sheet_name}': {exc}")
+                        continue
+                    self._flow_df_cache[sheet_name] = df
+                    logger.debug(
+                        f"Loaded Flow Diagram sheet '{sheet_name}': "
+                        f"{len(df)} rows, {len(df.columns)} columns"
                     )
-                    candidate_df.columns = [str(col).strip() for col in candidate_df.columns]
-                    # Accept first candidate with at least one real header.
-                    if any(not c.lower().startswith("unnamed:") for c in candidate_df.columns):
-                        df = candidate_df
-                        break
-                except Exception as read_exc:
-                    last_exc = read_exc
-                    continue
+            finally:
+                wb.close()
 
-            if df.empty and last_exc is not None:
-                raise last_exc
+            self._flow_loaded_all = True
+            logger.info(f"Loaded {len(self._flow_df_cache)} Flow Diagram sheets from {file_path.name}")
+            return dict(self._flow_df_cache)
 
-            df.columns = [str(col).strip() for col in df.columns]
-            df = self._normalize_time_columns(df)
-            self._flow_df_cache[sheet_name] = df
-            logger.info(
-                f"Loaded Flow Diagram sheet '{sheet_name}': "
-                f"{len(df)} rows, {len(df.columns)} columns"
-            )
-            # EXCEL OPERATIONS LOGGING: Track detailed sheet info
-            # Sanitize column names for Windows cp1252 console (replace → with ->)
-            safe_cols = [c.replace('→', '->') for c in df.columns if c not in ['Date', 'Year', 'Month']][:10]
-            logger.debug(f"Flow columns: {', '.join(safe_cols)}...")
-            return df
-        except Exception as exc:
-            logger.error(f"Failed to load flow sheet '{sheet_name}': {exc}")
-            return pd.DataFrame()
+    def prefetch_flow_sheets(self) -> Optional[threading.Thread]:
+        """Parse all Flow Diagram sheets on a background thread (OPTIONAL WARM-UP).
+
+        Later load_flow_sheet() calls wait for the prefetch instead of reparsing.
+
+        Returns:
+            The started daemon thread, or None if the file is missing or a
+            prefetch is already running.
+        """
+        if not self.flow_diagram_exists():
+            return None
+        if self._flow_prefetch is not None and self._flow_prefetch.is_alive():
+            return None
+
+        def _run() -> None:
+            try:
+                self.load_all_flow_sheets()
+            except Exception as exc:
+                logger.warning(f"Flow Diagram prefetch failed: {exc}")
+
+        self._flow_prefetch = threading.Thread(target=_run, name="FlowSheetPrefetch", daemon=True)
+        self._flow_prefetch.start()
+        return self._flow_prefetch
+
+    @classmethod
+    def _flow_frame_from_rows(cls, rows: List[Tuple[Any, ...]]) -> pd.DataFrame:
+        """Build a Flow Diagram DataFrame from a sheet's rows.
+
+        Header candidates (0-based): legacy row 3, the detected header row,
+        then row 1; the first with at least one named column wins.
+
+        Args:
+            rows: Sheet rows with trailing empty cells trimmed.
+
+        Returns:
+            DataFrame with stripped column names and normalized Year/Month.
+        """
+        header_candidates = [2, max(1, cls._detect_flow_header_index(rows)) - 1, 0]
+        df = pd.DataFrame()
+        for header_idx in dict.fromkeys(header_candidates):
+            if header_idx >= len(rows):
+                continue
+            candidate_df = _excel_frame(rows[header_idx], rows[header_idx + 1:], rows)
+            # Accept first candidate with at least one real header.
+            if any(not c.lower().startswith("unnamed:") for c in candidate_df.columns):
+                df = candidate_df
+                break
+        return cls._normalize_time_columns(df)
 
     def list_flow_columns(self, area_code_or_sheet: str) -> List[str]:
         """List usable flow columns for a given sheet.
@@ -596,37 +1090,132 @@ class ExcelManager:
         Returns:
             Float volume in m³ if found, otherwise None.
         """
-        df = self.load_flow_sheet(area_code_or_sheet)
-        if df.empty or column_name not in df.columns:
-            return None
+        return self.get_flow_volumes(area_code_or_sheet, [column_name], year, month)[column_name]
 
-        if "Year" not in df.columns or "Month" not in df.columns:
-            return None
+    def get_flow_volumes(
+        self,
+        area_code_or_sheet: str,
+        columns: Iterable[str],
+        year: int,
+        month: int,
+        fallback_to_latest: bool = True,
+    ) -> Dict[str, Optional[float]]:
+        """Return flow volumes for several columns of one sheet in a single lookup.
 
-        # First try exact year/month match
-        matching = df[(df["Year"] == year) & (df["Month"] == month)]
-        
-        # If not found, use most recent date in sheet
-        if matching.empty:
+        Same rules as get_flow_volume(): the first row of the requested month,
+        else (optionally) the most recent month in the sheet.
+
+        Args:
+            area_code_or_sheet: Area code (e.g., 'UG2N') or explicit sheet name.
+            columns: Flow column names (e.g., all mapped edges of the sheet).
+            year: Year to look up.
+            month: Month to look up (1-12).
+            fallback_to_latest: Use the most recent month when the requested
+                month has no row (default True).
+
+        Returns:
+            Dict of column → float volume in m³, or None when the column is
+            missing or the cell is empty/non-numeric.
+
+        Example:
+            volumes = excel.get_flow_volumes("UG2N", ["bh_to_sump", "sump_to_plant"], 2025, 10)
+        """
+        columns = list(columns)
+        result: Dict[str, Optional[float]] = {col: None for col in columns}
+        index = self._get_flow_index(area_code_or_sheet)
+        if index is None:
+            return result
+
+        row = index.row_for(year, month)
+        if row is None:
+            if not fallback_to_latest:
+                return result
             logger.debug(f"No data for {year}/{month}, using most recent date from sheet")
-            # Sort by Year DESC, then Month DESC to get most recent
+            row = index.latest_row
+        if row is None:
+            return result
+
+        for col in columns:
+            if col in index.frame.columns:
+                value = index.column(col)[row]
+                result[col] = None if np.isnan(value) else float(value)
+        return result
+
+    def resolve_diagram_volumes(
+        self, diagram_data: Dict[str, Any], year: int, month: int
+    ) -> DiagramVolumeResult:
+        """Resolve volumes for every Excel-mapped edge of a flow diagram.
+
+        Edges are grouped by their mapped sheet and each sheet is resolved
+        with one (Year, Month) lookup. Only the requested month is used (no
+        fallback to the latest month), matching the Load Excel action.
+
+        Args:
+            diagram_data: Diagram JSON dict with an 'edges' list; each mapped
+                edge has excel_mapping {'sheet': ..., 'column': ...}.
+            year: Year to load.
+            month: Month to load (1-12).
+
+        Returns:
+            DiagramVolumeResult with volumes keyed by edge index and warnings.
+        """
+        result = DiagramVolumeResult()
+        edges_by_sheet: Dict[str, List[Tuple[int, str]]] = {}
+        for edge_idx, edge in enumerate(diagram_data.get('edges', [])):
+            excel_mapping = edge.get('excel_mapping') or {}
+            if not excel_mapping.get('sheet') or not excel_mapping.get('column'):
+                continue  # Skip unmapped flows
+            edges_by_sheet.setdefault(excel_mapping['sheet'], []).append((edge_idx, excel_mapping['column']))
+            result.mapped_count += 1
+
+        for sheet_name, sheet_edges in edges_by_sheet.items():
+            column_names = [column_name for _, column_name in sheet_edges]
             try:
-                df_sorted = df.sort_values(by=["Year", "Month"], ascending=[False, False])
-                matching = df_sorted.head(1)
-            except Exception:
-                return None
-        
-        if matching.empty:
-            return None
+                df = self.load_flow_sheet(sheet_name)
+                if df.empty:
+                    continue
+                has_period = self.has_flow_period(sheet_name, year, month)
+                volumes = self.get_flow_volumes(
+                    sheet_name, column_names, year, month, fallback_to_latest=False
+                )
+            except Exception as exc:
+                result.warnings.extend(f"Error loading '{column_name}': {exc}" for column_name in column_names)
+                continue
 
-        value = matching.iloc[0][column_name]
-        if pd.isna(value):
-            return None
-        try:
-            return float(value)
-        except (TypeError, ValueError):
+            for edge_idx, column_name in sheet_edges:
+                if not has_period:
+                    result.warnings.append(f"No data for {year}/{month} in sheet '{sheet_name}'")
+                elif column_name not in df.columns:
+                    result.warnings.append(f"Column '{column_name}' not found in sheet '{sheet_name}'")
+                elif volumes.get(column_name) is None:
+                    result.warnings.append(f"Empty value for '{column_name}' in {year}/{month}")
+                else:
+                    result.volumes[edge_idx] = volumes[column_name]
+
+        logger.debug(
+            f"Resolved {len(result.volumes)}/{result.mapped_count} diagram edge volumes "
+            f"for {year}/{month} from {len(edges_by_sheet)} sheets"
+        )
+        return result
+
+    def has_flow_period(self, area_code_or_sheet: str, year: int, month: int) -> bool:
+        """Check whether a flow sheet has a row for the given year/month."""
+        index = self._get_flow_index(area_code_or_sheet)
+        return index is not None and index.row_for(year, month) is not None
+
+    def _get_flow_index(self, area_code_or_sheet: str) -> Optional[FlowSheetIndex]:
+        """Return the (Year, Month) index for a flow sheet (None if unusable)."""
+        df = self.load_flow_sheet(area_code_or_sheet)
+        if df.empty or "Year" not in df.columns or "Month" not in df.columns:
             return None
 
+        sheet_name = self._resolve_flow_sheet(area_code_or_sheet)
+        index = self._flow_index.get(sheet_name)
+        if index is None or index.frame is not df:
+            index = FlowSheetIndex.build(df)
+            self._flow_index[sheet_name] = index
+        return index
+
     def auto_map_flow_column(
         self,
         from_id: str,
@@ -681,7 +1270,8 @@ class ExcelManager:
         """Create a new flow column in the Flow Diagram Excel workbook.
 
         This writes a new column header into the Flow Diagram Excel file and
-        ensures the column exists for future volume entry.
+        ensures the column exists for future volume entry. For several edits
+        in a row use begin_flow_column_edits() (one load/save for all).
 
         Args:
             area_code_or_sheet: Area code (e.g., 'UG2N') or explicit sheet name.
@@ -690,10 +1280,7 @@ class ExcelManager:
         Returns:
             True if the column was created successfully, otherwise False.
         """
-        file_path = self.get_flow_diagram_path()
-        sheet_name = self._resolve_flow_sheet(area_code_or_sheet)
-
-        if not file_path.exists():
+        if not self.get_flow_diagram_path().exists():
             # Show user-friendly error instead of just logging
             from PySide6.QtWidgets import QMessageBox, QApplication
             app = QApplication.instance()
@@ -705,40 +1292,10 @@ class ExcelManager:
                 )
             logger.error("Flow Diagram Excel file not found. Cannot create column.")
             return False
-        try:
-            from openpyxl import load_workbook
-
-            wb = load_workbook(file_path)
-            if sheet_name not in wb.sheetnames:
-                logger.error(f"Sheet '{sheet_name}' not found in Excel")
-                return False
-
-            ws = wb[sheet_name]
-            header_row = self._detect_flow_header_row(ws)
-
-            existing_headers = [
-                str(cell.value).strip() for cell in ws[header_row] if cell.value is not None
-            ]
-            if column_name in existing_headers:
-                logger.info(f"Column already exists: {sheet_name}:{column_name}")
-                return True
 
-            next_col = ws.max_column + 1
-            ws.cell(row=header_row, column=next_col, value=column_name)
-
-            # Preserve existing row structure by writing empty cells in data rows.
-            for row_idx in range(header_row + 1, max(ws.max_row, header_row + 1) + 1):
-                ws.cell(row=row_idx, column=next_col, value=None)
-
-            wb.save(file_path)
-            wb.close()
-
-            self.clear_flow_cache()
-            logger.info(f"Created flow column '{column_name}' in '{sheet_name}'")
-            return True
-        except (OSError, ValueError, KeyError) as exc:
-            logger.error(f"Failed to create flow column '{column_name}': {exc}")
-            return False
+        edits = self.begin_flow_column_edits()
+        edits.create_column(area_code_or_sheet, column_name)
+        return edits.commit()
 
     def rename_flow_column(
         self, area_code_or_sheet: str, old_column_name: str, new_column_name: str
@@ -753,136 +1310,212 @@ class ExcelManager:
             new_column_name: New column header name.
 
         Returns:
-            True if the column was renamed successfully, otherwise False.
-
-        Raises:
-            ValueError: If old column name does not exist or new name already exists.
+            True if the column was renamed successfully, otherwise False
+            (old column missing or new name already taken).
         """
-        file_path = self.get_flow_diagram_path()
-        sheet_name = self._resolve_flow_sheet(area_code_or_sheet)
+        edits = self.begin_flow_column_edits()
+        edits.rename_column(area_code_or_sheet, old_column_name, new_column_name)
+        return edits.commit()
 
-        if not file_path.exists():
-            logger.error(
-                f"Flow Diagram Excel file not found: {file_path}. Cannot rename column."
-            )
-            return False
+    def delete_flow_column(self, area_code_or_sheet: str, column_name: str) -> bool:
+        """Delete a flow column from the Flow Diagram Excel workbook (COLUMN MANAGEMENT).
 
-        try:
-            from openpyxl import load_workbook
+        Removes the column and shifts remaining columns left. Cached sheet
+        data is patched to match, and mappings to the column are removed.
 
-            wb = load_workbook(file_path)
-            if sheet_name not in wb.sheetnames:
-                logger.error(f"Sheet '{sheet_name}' not found in Excel")
-                return False
-
-            ws = wb[sheet_name]
-            header_row = self._detect_flow_header_row(ws)
-
-            # Find the column with old_column_name
-            old_col_idx = None
-            for col_idx, cell in enumerate(ws[header_row], start=1):
-                if cell.value and str(cell.value).strip() == old_column_name:
-                    old_col_idx = col_idx
-                    break
-
-            if old_col_idx is None:
-                logger.error(f"Column '{old_column_name}' not found in sheet '{sheet_name}'")
-                return False
-
-            # Check that new_column_name doesn't already exist
-            existing_headers = [
-                str(cell.value).strip() for cell in ws[header_row] if cell.value is not None
-            ]
-            if new_column_name in existing_headers:
-                logger.error(
-                    f"Column '{new_column_name}' already exists in sheet '{sheet_name}'"
-                )
-                return False
+        Args:
+            area_code_or_sheet: Area code (e.g., 'UG2N') or explicit sheet name.
+            column_name: Column header to delete.
 
-            # Rename the column header
-            ws.cell(row=header_row, column=old_col_idx, value=new_column_name)
+        Returns:
+            True if the column was deleted successfully, otherwise False
+            (including when the column does not exist).
+        """
+        edits = self.begin_flow_column_edits()
+        edits.delete_column(area_code_or_sheet, column_name)
+        return edits.commit()
 
-            wb.save(file_path)
-            wb.close()
+    def begin_flow_column_edits(self) -> "FlowColumnEditSession":
+        """Start a batch of Flow Diagram column edits (TRANSACTIONAL EDITS).
 
-            # UPDATE MAPPINGS: Rename column in excel_flow_links.json
-            # All flow IDs that referenced old_column_name must now point to new_column_name
-            self._update_column_mappings(sheet_name, old_column_name, new_column_name)
+        Queued creates/renames/deletes (any sheets) are applied with a single
+        workbook load and save on commit; nothing is written if any edit fails.
 
-            self.clear_flow_cache()
-            logger.info(
-                f"Renamed column '{old_column_name}' → '{new_column_name}' in '{sheet_name}'"
-            )
-            return True
+        Example:
+            with manager.begin_flow_column_edits() as edits:
+                edits.create_column("UG2N", "BH_to_Sump")
+                edits.rename_column("UG2N", "Old", "New")
+            if not edits.committed:
+                print(edits.error)
 
-        except (OSError, ValueError, KeyError) as exc:
-            logger.error(f"Failed to rename flow column '{old_column_name}': {exc}")
-            return False
+        Returns:
+            New FlowColumnEditSession bound to this manager.
+        """
+        return FlowColumnEditSession(self)
 
-    def delete_flow_column(self, area_code_or_sheet: str, column_name: str) -> bool:
-        """Delete a flow column from the Flow Diagram Excel workbook (COLUMN MANAGEMENT).
+    def _apply_flow_column_edits(self, edits: List[FlowColumnEdit]) -> Optional[str]:
+        """Apply queued column edits in one load/save cycle.
 
-        Removes the column and shifts remaining columns left. Updates Excel file and
-        clears cache to force reload on next access.
+        Edits run in order against the open workbook, so later edits see
+        earlier ones (e.g. create then rename). Cached sheet DataFrames whose
+        header row is the edited one are patched positionally; other cached
+        sheets touched by the batch are dropped and reload lazily.
 
         Args:
-            area_code_or_sheet: Area code (e.g., 'UG2N') or explicit sheet name.
-            column_name: Column header to delete.
+            edits: Edits to apply.
 
         Returns:
-            True if the column was deleted successfully, otherwise False.
-
-        Raises:
-            ValueError: If column name does not exist.
+            None on success, otherwise an error message (workbook unchanged).
         """
-        file_path = self.get_flow_diagram_path()
-        sheet_name = self._resolve_flow_sheet(area_code_or_sheet)
+        if not edits:
+            return None
 
+        file_path = self.get_flow_diagram_path()
         if not file_path.exists():
-            logger.error(
-                f"Flow Diagram Excel file not found: {file_path}. Cannot delete column."
-            )
-            return False
+            error = f"Flow Diagram Excel file not found: {file_path}. Cannot edit columns."
+            logger.error(error)
+            return error
 
         try:
             from openpyxl import load_workbook
 
             wb = load_workbook(file_path)
-            if sheet_name not in wb.sheetnames:
-                logger.error(f"Sheet '{sheet_name}' not found in Excel")
-                return False
-
-            ws = wb[sheet_name]
-            header_row = self._detect_flow_header_row(ws)
-
-            # Find the column with column_name
-            col_idx = None
-            for col_idx_temp, cell in enumerate(ws[header_row], start=1):
-                if cell.value and str(cell.value).strip() == column_name:
-                    col_idx = col_idx_temp
-                    break
+            try:
+                header_rows: Dict[str, int] = {}
+                # Sheet → patched copy of its cached frame (None: drop from cache)
+                frames: Dict[str, Optional[pd.DataFrame]] = {}
+                changed = False
+
+                for edit in edits:
+                    if edit.sheet_name not in wb.sheetnames:
+                        error = f"Sheet '{edit.sheet_name}' not found in Excel"
+                        logger.error(error)
+                        return error
+
+                    ws = wb[edit.sheet_name]
+                    if edit.sheet_name not in header_rows:
+                        header_row = self._detect_flow_header_row(ws)
+                        header_rows[edit.sheet_name] = header_row
+                        frames[edit.sheet_name] = self._patchable_flow_frame(
+                            edit.sheet_name, ws, header_row
+                        )
+                    header_row = header_rows[edit.sheet_name]
+                    df = frames[edit.sheet_name]
+
+                    headers = [
+                        str(cell.value).strip() if cell.value is not None else None
+                        for cell in ws[header_row]
+                    ]
+
+                    if edit.action == "create":
+                        if edit.column_name in headers:
+                            logger.info(f"Column already exists: {edit.sheet_name}:{edit.column_name}")
+                            continue
+                        next_col = ws.max_column + 1
+                        ws.cell(row=header_row, column=next_col, value=edit.column_name)
+                        if df is not None:
+                            df = df.copy(deep=False)
+                            df[edit.column_name] = pd.Series(
+                                np.nan, index=df.index, dtype=float if len(df) else object
+                            )
+                    elif edit.action == "rename":
+                        if edit.column_name not in headers:
+                            error = f"Column '{edit.column_name}' not found in sheet '{edit.sheet_name}'"
+                            logger.error(error)
+                            return error
+                        if edit.new_column_name in headers:
+                            error = (
+                                f"Column '{edit.new_column_name}' already exists in sheet "
+                                f"'{edit.sheet_name}'"
+                            )
+                            logger.error(error)
+                            return error
+                        col_idx = headers.index(edit.column_name) + 1
+                        ws.cell(row=header_row, column=col_idx, value=edit.new_column_name)
+                        if df is not None:
+                            columns = list(df.columns)
+                            columns[col_idx - 1] = edit.new_column_name
+                            df = df.set_axis(columns, axis=1)
+                    elif edit.action == "delete":
+                        if edit.column_name not in headers:
+                            error = f"Column '{edit.column_name}' not found in sheet '{edit.sheet_name}'"
+                            logger.error(error)
+                            return error
+                        col_idx = headers.index(edit.column_name) + 1
+                        # openpyxl shifts remaining columns left
+                        ws.delete_cols(col_idx)
+                        if df is not None:
+                            keep = [i for i in range(len(df.columns)) if i != col_idx - 1]
+                            df = df.iloc[:, keep]
+                    else:
+                        raise ValueError(f"Unknown column edit action: {edit.action}")
+
+                    frames[edit.sheet_name] = df
+                    changed = True
+
+                if changed:
+                    wb.save(file_path)
+            finally:
+                wb.close()
+        except (OSError, ValueError, KeyError) as exc:
+            error = f"Failed to apply flow column edits: {exc}"
+            logger.error(error)
+            return error
 
-            if col_idx is None:
-                logger.error(f"Column '{column_name}' not found in sheet '{sheet_name}'")
-                return False
+        if not changed:
+            return None
 
-            # Delete the column (openpyxl shifts remaining columns left)
-            ws.delete_cols(col_idx)
+        # UPDATE MAPPINGS: keep excel_flow_links.json pointing at real columns
+        for edit in edits:
+            if edit.action == "rename":
+                self._update_column_mappings(edit.sheet_name, edit.column_name, edit.new_column_name)
+            elif edit.action == "delete":
+                self._remove_column_mappings(edit.sheet_name, edit.column_name)
 
-            wb.save(file_path)
-            wb.close()
+        with self._flow_lock:
+            for sheet_name, df in frames.items():
+                if sheet_name not in self._flow_df_cache:
+                    continue
+                if df is None:
+                    # Edited header is not the cached one: reparse this sheet on demand
+                    self._flow_df_cache.pop(sheet_name, None)
+                    self._flow_index.pop(sheet_name, None)
+                    self._flow_loaded_all = False
+                    continue
+                self._flow_df_cache[sheet_name] = df
+                index = self._flow_index.get(sheet_name)
+                if index is not None:
+                    # Rows are unchanged; only the column views need rebuilding
+                    index.frame = df
+                    index.numeric.clear()
+            if self._flow_mtime is not None:
+                # Our own save must not look like an external change
+                self._flow_mtime = file_path.stat().st_mtime
+        self._notify_path_listeners()
+
+        logger.info(f"Applied {len(edits)} flow column edit(s) to {file_path.name} in one save")
+        return None
 
-            # REMOVE MAPPINGS: Delete all flow IDs that referenced the deleted column
-            # This prevents dangling references to non-existent columns
-            self._remove_column_mappings(sheet_name, column_name)
+    def _patchable_flow_frame(self, sheet_name: str, ws, header_row: int) -> Optional[pd.DataFrame]:
+        """Return the cached frame if its columns map 1:1 onto the edited header row.
 
-            self.clear_flow_cache()
-            logger.info(f"Deleted column '{column_name}' from '{sheet_name}'")
-            return True
+        Args:
+            sheet_name: Sheet being edited.
+            ws: Open (writable) worksheet.
+            header_row: 1-based header row the edits write to.
 
-        except (OSError, ValueError, KeyError) as exc:
-            logger.error(f"Failed to delete flow column '{column_name}': {exc}")
-            return False
+        Returns:
+            Cached DataFrame, or None if not cached or laid out differently
+            (other header row, derived Year/Month columns, blank padding).
+        """
+        df = self._flow_df_cache.get(sheet_name)
+        if df is None or len(df.columns) != ws.max_column:
+            return None
+        header = _trim_row(cell.value for cell in ws[header_row])
+        expected = _excel_column_names(header, ws.max_column)
+        if [name.lower() for name in expected] != [str(c).lower() for c in df.columns]:
+            return None
+        return df
 
     def suggest_flow_column_name(self, from_id: str, to_id: str) -> str:
         """Suggest a standardized column name for a flowline.
@@ -919,21 +1552,23 @@ class ExcelManager:
         if df.empty or column_name not in df.columns:
             return []
 
-        data = df.copy()
+        values = pd.to_numeric(df[column_name], errors="coerce").to_numpy(dtype=float)
+        zeros = np.zeros(len(df))
+        years = pd.to_numeric(df["Year"], errors="coerce").to_numpy(dtype=float) if "Year" in df.columns else zeros
+        months = pd.to_numeric(df["Month"], errors="coerce").to_numpy(dtype=float) if "Month" in df.columns else zeros
+
+        mask = ~np.isnan(values)
         if year is not None:
-            data = data[data.get("Year") == year]
+            mask &= years == year
         if month is not None:
-            data = data[data.get("Month") == month]
+            mask &= months == month
 
-        data[column_name] = pd.to_numeric(data[column_name], errors="coerce")
-        data = data.dropna(subset=[column_name])
-
-        results: List[Tuple[Tuple[int, int], float]] = []
-        for _, row in data.iterrows():
-            y = int(row.get("Year")) if pd.notna(row.get("Year")) else 0
-            m = int(row.get("Month")) if pd.notna(row.get("Month")) else 0
-            results.append(((y, m), float(row[column_name])))
-        return results
+        years = np.nan_to_num(years[mask]).astype(int)
+        months = np.nan_to_num(months[mask]).astype(int)
+        return [
+            ((int(y), int(m)), float(v))
+            for y, m, v in zip(years, months, values[mask])
+        ]
 
     # ---------------------------------------------------------------------
     # Utilities
@@ -1023,12 +1658,26 @@ class ExcelManager:
         Args:
             ws: openpyxl worksheet object.
 
+        Returns:
+            1-based row index for header row.
+        """
+        return ExcelManager._detect_flow_header_index(ws.iter_rows(max_row=5, values_only=True))
+
+    @staticmethod
+    def _detect_flow_header_index(rows: Iterable[Iterable[Any]]) -> int:
+        """Detect the header row from row values (see _detect_flow_header_row).
+
+        Args:
+            rows: Sheet rows as value tuples (only the first 5 are inspected).
+
         Returns:
             1-based row index for header row.
         """
         best_row = 1
-        for row_idx in range(1, min(ws.max_row, 5) + 1):
-            values = [str(c.value).strip() for c in ws[row_idx] if c.value is not None]
+        for row_idx, row in enumerate(rows, start=1):
+            if row_idx > 5:
+                break
+            values = [str(v).strip() for v in row if v is not None]
             if not values:
                 continue
             lower = {v.lower() for v in values}
@@ -1151,10 +1800,176 @@ class ExcelManager:
 
 
 
+class FlowColumnEditSession:
+    """Queued Flow Diagram column edits applied in one workbook save.
+
+    Created by ExcelManager.begin_flow_column_edits(). Used as a context
+    manager, edits are committed on a clean exit and discarded if the block
+    raises.
+
+    Attributes:
+        committed: True once commit() succeeded.
+        error: Failure message from the last commit() (None on success).
+    """
+
+    def __init__(self, manager: ExcelManager) -> None:
+        self._manager = manager
+        self._edits: List[FlowColumnEdit] = []
+        self.committed = False
+        self.error: Optional[str] = None
+
+    def __enter__(self) -> "FlowColumnEditSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self._edits.clear()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._edits)
+
+    def create_column(self, area_code_or_sheet: str, column_name: str) -> None:
+        """Queue creating a column (no-op if it already exists)."""
+        self._queue("create", area_code_or_sheet, column_name)
+
+    def rename_column(self, area_code_or_sheet: str, old_column_name: str, new_column_name: str) -> None:
+        """Queue renaming a column (mappings follow the new name)."""
+        self._queue("rename", area_code_or_sheet, old_column_name, new_column_name)
+
+    def delete_column(self, area_code_or_sheet: str, column_name: str) -> None:
+        """Queue deleting a column (its mappings are removed)."""
+        self._queue("delete", area_code_or_sheet, column_name)
+
+    def _queue(self, action: str, area_code_or_sheet: str, column_name: str,
+               new_column_name: Optional[str] = None) -> None:
+        sheet_name = self._manager.resolve_flow_sheet_name(area_code_or_sheet)
+        self._edits.append(FlowColumnEdit(action, sheet_name, column_name, new_column_name))
+
+    def commit(self) -> bool:
+        """Apply all queued edits with one load/save (all or nothing).
+
+        Returns:
+            True if every edit was applied (or nothing was queued).
+        """
+        edits, self._edits = self._edits, []
+        self.error = self._manager._apply_flow_column_edits(edits)
+        self.committed = self.error is None
+        return self.committed
+
+
 # Singleton-style helper
 _excel_manager_instance: Optional[ExcelManager] = None
 
 
+# Strings pandas' Excel reader treats as missing (its default na_values)
+_EXCEL_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def _trim_row(row: Iterable[Any]) -> Tuple[Any, ...]:
+    """Drop trailing empty cells (openpyxl pads read-only rows to the sheet width)."""
+    values = tuple(row)
+    end = len(values)
+    while end and (values[end - 1] is None or values[end - 1] == ""):
+        end -= 1
+    return values[:end]
+
+
+def _excel_value(value: Any) -> Any:
+    """Map NA strings to None, leaving other cell values unchanged."""
+    if isinstance(value, str) and value in _EXCEL_NA_STRINGS:
+        return None
+    return value
+
+
+def _excel_column_names(header: Tuple[Any, ...], width: int) -> List[str]:
+    """Header cells → unique, stripped names ("Unnamed: i", "Name.1" like pandas)."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i in range(width):
+        value = header[i] if i < len(header) else None
+        name = f"Unnamed: {i}" if value is None or value == "" else str(value)
+        if name in seen:
+            base = name
+            while name in seen:
+                seen[base] += 1
+                name = f"{base}.{seen[base]}"
+        seen[name] = 0
+        names.append(name.strip())
+    return names
+
+
+def _excel_frame(
+    header: Tuple[Any, ...],
+    body: List[Tuple[Any, ...]],
+    all_rows: Optional[List[Tuple[Any, ...]]] = None,
+) -> pd.DataFrame:
+    """Build a typed DataFrame from a header row and trimmed data rows.
+
+    Mirrors ``pd.read_excel(header=...)``: trailing empty rows are dropped,
+    blank rows in between stay as NaN rows, and the width is the widest row.
+
+    Args:
+        header: Header row values.
+        body: Data rows below the header.
+        all_rows: Rows used to size the frame (defaults to header + body).
+    """
+    body = list(body)
+    while body and not body[-1]:
+        body.pop()
+    sizing = all_rows if all_rows is not None else [header, *body]
+    width = max([len(header), *(len(row) for row in sizing)])
+    columns = _excel_column_names(header, width)
+    arrays = [
+        _excel_column_array([_excel_value(row[j]) if j < len(row) else None for row in body])
+        for j in range(width)
+    ]
+    # Positional build: stripped names may repeat ("Flow " and "Flow")
+    df = pd.DataFrame(dict(enumerate(arrays)))
+    df.columns = columns
+    return df
+
+
+def _excel_column_array(values: List[Any]) -> np.ndarray:
+    """Build a typed NumPy column (int64/float64/datetime64, else object).
+
+    Args:
+        values: Cell values for one column (None for empty cells).
+    """
+    if not values:
+        return np.array([], dtype=object)
+    present = [v for v in values if v is not None]
+    if all(isinstance(v, datetime) for v in present) and present:
+        return pd.to_datetime(pd.Series(values, dtype=object)).to_numpy()
+    try:
+        # Numeric text (e.g. "12.5") converts like pandas' Excel reader
+        numbers = [None if v is None else _excel_number(v) for v in values]
+    except (TypeError, ValueError):
+        return np.array([np.nan if v is None else v for v in values], dtype=object)
+    if len(present) == len(values) and all(isinstance(v, int) for v in numbers):
+        return np.array(numbers, dtype=np.int64)
+    return np.array([np.nan if v is None else v for v in numbers], dtype=np.float64)
+
+
+def _excel_number(value: Any) -> Any:
+    """Return an int/float for a numeric cell or numeric text; raise otherwise."""
+    if isinstance(value, bool):
+        raise TypeError("boolean cell")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    raise TypeError(f"non-numeric cell: {type(value).__name__}")
+
+
 def get_excel_manager() -> ExcelManager:
     """Get shared ExcelManager instance (singleton style)."""
     global _excel_manager_instance
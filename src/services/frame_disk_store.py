@@ -0,0 +1,137 @@
+"""
+Frame Disk Store (SHARED DATAFRAME PERSISTENCE FOR DISK CACHES).
+
+File-level helpers used by the parsed-workbook disk caches
+(MeterReadingsDiskCache, MonitoringCache). Each cache owns its keys and
+validation rules; this module only writes and reads the files of an entry:
+- <key>.feather  Columnar frame (pyarrow, listed in requirements.txt)
+- <key>.pkl      Fallback for frames Feather cannot represent (mixed-type
+                 object columns) and for installs missing pyarrow
+- <key>.json     Cache metadata, written last so an interrupted store
+                 leaves no valid entry
+
+All writes go to a temporary file first and are moved into place with
+os.replace, so readers never see a partially written file.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+import json
+import os
+
+import pandas as pd
+
+from core.app_logger import logger
+from core.config_manager import get_resource_path
+
+try:
+    import pyarrow  # noqa: F401  (pd.to_feather / read_feather backend)
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
+# Data file suffixes (one per entry) and every suffix an entry may leave behind
+DATA_SUFFIXES = (".feather", ".pkl")
+ENTRY_SUFFIXES = (".json", ".feather", ".pkl", ".tmp")
+
+# Missing pyarrow is reported once per process, not per write
+_pickle_fallback_logged = False
+
+
+def default_cache_dir(name: str) -> Path:
+    """Return data/cache/<name> (user data dir, repo data/ in dev mode)."""
+    user_dir = os.environ.get('WATERBALANCE_USER_DIR')
+    if user_dir:
+        return Path(user_dir) / "data" / "cache" / name
+    return get_resource_path("data") / "cache" / name
+
+
+def write_frame(
+    cache_dir: Path, key: str, df: pd.DataFrame, drop_index: bool = False
+) -> Dict[str, Any]:
+    """Write an entry's frame as Feather when possible, otherwise pickle.
+
+    Feather only stores columns, so a non-default index is written as
+    leading columns and restored by read_frame(). Any data file of the other
+    format left by a previous entry is removed.
+
+    Args:
+        cache_dir: Existing cache directory.
+        key: Entry file stem.
+        df: Frame to persist.
+        drop_index: Discard the index instead of storing it.
+
+    Returns:
+        Metadata fields to store with the entry (data_file, data_format,
+        index_columns); pass the metadata back to read_frame().
+    """
+    global _pickle_fallback_logged
+    if not FEATHER_AVAILABLE and not _pickle_fallback_logged:
+        _pickle_fallback_logged = True
+        logger.info("pyarrow not installed: disk caches store parsed frames as pickle, not Feather")
+
+    fields: Dict[str, Any] = {}
+    if FEATHER_AVAILABLE:
+        path = cache_dir / f"{key}.feather"
+        tmp = path.with_suffix(".tmp")
+        try:
+            index_columns = []
+            if drop_index:
+                frame = df.reset_index(drop=True)
+            elif df.index.equals(pd.RangeIndex(len(df))) and df.index.name is None:
+                frame = df
+            else:
+                frame = df.reset_index()
+                index_columns = [str(c) for c in frame.columns[:df.index.nlevels]]
+            frame.to_feather(tmp)
+            os.replace(tmp, path)
+            fields = {"data_file": path.name, "data_format": "feather", "index_columns": index_columns}
+        except Exception as e:
+            # Mixed-type object columns (e.g. "n/a" or remarks among numbers)
+            tmp.unlink(missing_ok=True)
+            logger.debug(f"Feather unavailable for cache entry {key}, using pickle: {e}")
+
+    if not fields:
+        path = cache_dir / f"{key}.pkl"
+        tmp = path.with_suffix(".tmp")
+        (df.reset_index(drop=True) if drop_index else df).to_pickle(tmp)
+        os.replace(tmp, path)
+        fields = {"data_file": path.name, "data_format": "pickle", "index_columns": []}
+
+    for stale in cache_dir.glob(f"{key}.*"):
+        if stale != path and stale.suffix in DATA_SUFFIXES:
+            stale.unlink(missing_ok=True)
+    return fields
+
+
+def read_frame(cache_dir: Path, meta: Dict[str, Any]) -> pd.DataFrame:
+    """Read the frame described by an entry's metadata (see write_frame)."""
+    data_path = cache_dir / meta["data_file"]
+    if meta["data_format"] == "feather":
+        df = pd.read_feather(data_path)
+        index_columns = meta.get("index_columns") or []
+        return df.set_index(index_columns) if index_columns else df
+    return pd.read_pickle(data_path)
+
+
+def read_meta(path: Path) -> Dict[str, Any]:
+    """Read an entry's JSON metadata."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_meta(path: Path, meta: Dict[str, Any]) -> None:
+    """Write an entry's JSON metadata atomically."""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def clear_entries(cache_dir: Path) -> None:
+    """Delete every entry file in a cache directory."""
+    if not cache_dir.exists():
+        return
+    for path in cache_dir.iterdir():
+        if path.suffix in ENTRY_SUFFIXES:
+            path.unlink(missing_ok=True)
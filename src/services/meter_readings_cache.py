@@ -0,0 +1,154 @@
+"""
+Meter Readings Disk Cache (PARSED WORKBOOK PERSISTENCE).
+
+Persists the normalized Meter Readings DataFrame and its units map so app
+starts can skip openpyxl parsing when the workbook has not changed.
+
+Cache entries (one per workbook path) live in a cache directory:
+- <key>.feather (or <key>.pkl when Feather is unavailable for the frame)
+- <key>.json    metadata: source size, mtime, SHA-256, loader settings, units
+
+Validation:
+1. Size + mtime + loader settings match → hit (no hashing)
+2. Size matches but mtime differs (file copied/touched) → hash the file;
+   same content hash → hit (metadata refreshed)
+3. Anything else → miss (caller parses the workbook and stores a new entry)
+
+Entry files are written and read by services.frame_disk_store (Feather,
+pickle fallback for frames pyarrow cannot represent).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+
+import pandas as pd
+
+from core.app_logger import logger
+from services import frame_disk_store
+
+# Bump when the stored layout or the loader's normalization changes
+CACHE_FORMAT_VERSION = 4
+
+# Read size when hashing the source workbook
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MeterReadingsDiskCache:
+    """Columnar on-disk cache of parsed Meter Readings (CONTENT-KEYED).
+
+    Args:
+        cache_dir: Directory holding cache entries (created on first store).
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir else frame_disk_store.default_cache_dir("meter_readings")
+        )
+
+    def _entry_key(self, source: Path) -> str:
+        """Stable file stem for a workbook path."""
+        resolved = str(Path(source).resolve()).lower()
+        return hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:16]
+
+    def _meta_path(self, source: Path) -> Path:
+        return self.cache_dir / f"{self._entry_key(source)}.json"
+
+    def load(
+        self, source: Path, settings: Dict[str, Any]
+    ) -> Optional[Tuple[pd.DataFrame, Dict[str, str]]]:
+        """Return the cached (DataFrame, units) for a workbook, or None on a miss.
+
+        Args:
+            source: Meter Readings workbook path.
+            settings: Loader settings (sheet/header/data rows) the entry must match.
+
+        Returns:
+            Tuple of (normalized DataFrame, units map) or None.
+        """
+        meta_path = self._meta_path(source)
+        if not meta_path.exists():
+            return None
+
+        try:
+            meta = frame_disk_store.read_meta(meta_path)
+            stat = Path(source).stat()
+            if (
+                meta.get("format_version") != CACHE_FORMAT_VERSION
+                or meta.get("settings") != settings
+                or meta.get("size") != stat.st_size
+            ):
+                return None
+
+            if meta.get("mtime_ns") != stat.st_mtime_ns:
+                # Same size, new timestamp: only the content hash can tell
+                if meta.get("sha256") != file_sha256(source):
+                    return None
+                meta["mtime_ns"] = stat.st_mtime_ns
+                frame_disk_store.write_meta(meta_path, meta)
+
+            df = frame_disk_store.read_frame(self.cache_dir, meta)
+        except Exception as e:
+            logger.warning(f"Meter Readings disk cache unreadable, reparsing workbook: {e}")
+            return None
+
+        logger.debug(f"EXCEL OPERATIONS - Meter Readings loaded from disk cache ({meta['data_file']})")
+        return df, dict(meta.get("units", {}))
+
+    def store(
+        self,
+        source: Path,
+        settings: Dict[str, Any],
+        df: pd.DataFrame,
+        units: Dict[str, str],
+    ) -> bool:
+        """Persist a parsed workbook (best effort; failures are logged, not raised).
+
+        Args:
+            source: Meter Readings workbook path the frame was parsed from.
+            settings: Loader settings used for the parse.
+            df: Normalized DataFrame.
+            units: Column name → unit map.
+
+        Returns:
+            True if the entry was written.
+        """
+        key = self._entry_key(source)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            stat = Path(source).stat()
+            data_fields = frame_disk_store.write_frame(self.cache_dir, key, df)
+
+            meta = {
+                "format_version": CACHE_FORMAT_VERSION,
+                "source": str(source),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_sha256(source),
+                "settings": settings,
+                **data_fields,
+                "units": units,
+            }
+            # Metadata last: an interrupted store leaves no valid entry
+            frame_disk_store.write_meta(self.cache_dir / f"{key}.json", meta)
+        except Exception as e:
+            logger.warning(f"Could not write Meter Readings disk cache: {e}")
+            return False
+
+        logger.debug(f"Meter Readings disk cache written ({data_fields['data_format']}, {len(df)} rows)")
+        return True
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        frame_disk_store.clear_entries(self.cache_dir)
@@ -0,0 +1,330 @@
+"""
+Monitoring Parse Cache (SHARED MEMORY + DISK CACHE FOR PARSED WORKBOOKS).
+
+One cache for every monitoring loader: DirectoryLoadWorker (dashboard folder
+loads) and MonitoringDataLoader (source-definition loads) both store the
+DataFrame parsed from a workbook here.
+
+Entries are keyed by the workbook's absolute path plus a parser version
+string, and are only valid while the file's size and mtime match the values
+recorded when it was parsed. Two files with the same name in different
+folders never collide, and a parser change (new version string) never
+serves frames produced by the old code.
+
+Tiers:
+- Memory: LRU (most recently used kept), capped by total DataFrame bytes
+- Disk:   <key>.feather (or <key>.pkl for frames Feather cannot represent)
+          plus <key>.json metadata via services.frame_disk_store, written on
+          a background thread so parsing threads never block on disk I/O
+
+Usage:
+    cache = get_monitoring_cache()
+    df = cache.get(path, "stacked_blocks:2")
+    if df is None:
+        df = parse(path)
+        cache.put(path, "stacked_blocks:2", df)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import threading
+
+import pandas as pd
+
+from core.app_logger import logger
+from core.config_manager import ConfigManager
+from services import frame_disk_store
+
+# Bump when the stored layout changes (parser changes bump their own version)
+CACHE_FORMAT_VERSION = 1
+
+# Memory tier cap when config monitoring.cache_memory_mb is not set
+DEFAULT_MEMORY_MB = 256
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """Approximate in-memory size of a DataFrame (deep, includes strings)."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+@dataclass
+class _CacheEntry:
+    """A parsed frame and the source file state it was parsed from."""
+    size: int
+    mtime_ns: int
+    frame: pd.DataFrame
+    nbytes: int
+
+
+class MonitoringCache:
+    """Parsed monitoring workbooks, LRU in memory and persisted to disk (PARSE CACHE).
+
+    Thread-safe: loader threads call get()/put() concurrently; disk writes are
+    serialized on a single background writer thread.
+
+    Args:
+        cache_dir: Directory holding disk entries (created on first write).
+        max_memory_bytes: Memory tier cap; least recently used frames are
+            evicted beyond it (they stay on disk).
+        async_writes: Write disk entries on a background thread (False writes
+            inline, e.g. for scripts that exit straight after loading).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_memory_bytes: int = DEFAULT_MEMORY_MB * 1024 * 1024,
+        async_writes: bool = True,
+    ) -> None:
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir else frame_disk_store.default_cache_dir("monitoring")
+        )
+        self.max_memory_bytes = max_memory_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        # Entries queued for disk but not yet written (served until they land)
+        self._pending: Dict[str, _CacheEntry] = {}
+        self._futures: Dict[Future, str] = {}
+        self._writer = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="monitoring-cache")
+            if async_writes else None
+        )
+
+    # ==================== LOOKUP ====================
+
+    def get(self, source: str | Path, parser_version: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame for a workbook, or None on a miss/stale entry.
+
+        Args:
+            source: Workbook path.
+            parser_version: Version string of the parser that produced the frame.
+
+        Returns:
+            Cached DataFrame (shared; callers must not modify it in place) or None.
+        """
+        stat = self._stat(source)
+        if stat is None:
+            return None
+        key = self._entry_key(source, parser_version)
+
+        with self._lock:
+            entry = self._memory.get(key) or self._pending.get(key)
+            if entry is not None:
+                if (entry.size, entry.mtime_ns) == stat:
+                    if key in self._memory:
+                        self._memory.move_to_end(key)
+                    logger.debug(f"Monitoring cache memory HIT: {Path(source).name}")
+                    return entry.frame
+                logger.debug(f"Monitoring cache STALE: {Path(source).name} (file modified)")
+                return None
+
+        entry = self._read_disk(key, parser_version, stat)
+        if entry is None:
+            return None
+        with self._lock:
+            self._remember(key, entry)
+        logger.debug(f"Monitoring cache disk HIT: {Path(source).name}")
+        return entry.frame
+
+    def put(self, source: str | Path, parser_version: str, df: pd.DataFrame) -> None:
+        """Cache a parsed frame (memory now, disk in the background).
+
+        Args:
+            source: Workbook path the frame was parsed from.
+            parser_version: Version string of the parser that produced it.
+            df: Parsed DataFrame (not copied; do not modify it afterwards).
+        """
+        stat = self._stat(source)
+        if stat is None or df is None:
+            return
+        key = self._entry_key(source, parser_version)
+        entry = _CacheEntry(size=stat[0], mtime_ns=stat[1], frame=df, nbytes=frame_nbytes(df))
+        meta = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "parser_version": parser_version,
+            "source": str(Path(source).resolve()),
+            "size": entry.size,
+            "mtime_ns": entry.mtime_ns,
+        }
+
+        with self._lock:
+            self._remember(key, entry)
+            if self._writer is None:
+                pending = None
+            else:
+                self._pending[key] = entry
+                pending = self._writer.submit(self._write_entry, key, meta, entry)
+                self._futures[pending] = key
+        if pending is None:
+            self._write_entry(key, meta, entry)
+        else:
+            pending.add_done_callback(self._write_done)
+
+    # ==================== MAINTENANCE ====================
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until queued disk writes have finished."""
+        with self._lock:
+            futures = list(self._futures)
+        if futures:
+            wait(futures, timeout=timeout)
+
+    def discard(self, source: str | Path, parser_version: str) -> None:
+        """Drop one workbook's entry from both tiers."""
+        key = self._entry_key(source, parser_version)
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old.nbytes
+            queued = key in self._pending
+        if queued:
+            self.flush()
+        for path in self.cache_dir.glob(f"{key}.*"):
+            path.unlink(missing_ok=True)
+
+    def clear(self, memory: bool = True, disk: bool = True) -> int:
+        """Drop cached entries.
+
+        Args:
+            memory: Clear the memory tier.
+            disk: Delete disk entries (after queued writes finish).
+
+        Returns:
+            Number of memory entries dropped.
+        """
+        count = 0
+        if memory:
+            with self._lock:
+                count = len(self._memory)
+                self._memory.clear()
+                self._memory_bytes = 0
+        if disk:
+            self.flush()
+            frame_disk_store.clear_entries(self.cache_dir)
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory tier usage (entries, bytes, cap) and queued disk writes."""
+        with self._lock:
+            return {
+                "entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "pending_writes": len(self._pending),
+            }
+
+    # ==================== INTERNALS ====================
+
+    def _entry_key(self, source: str | Path, parser_version: str) -> str:
+        """Stable file stem for a (workbook path, parser version) pair."""
+        resolved = str(Path(source).resolve()).lower()
+        return hashlib.sha1(f"{resolved}|{parser_version}".encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _stat(source: str | Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = Path(source).stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _remember(self, key: str, entry: _CacheEntry) -> None:
+        """Insert into the memory tier and evict LRU entries over the cap (lock held)."""
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old.nbytes
+        if entry.nbytes > self.max_memory_bytes:
+            return  # Larger than the whole tier: disk only
+        self._memory[key] = entry
+        self._memory_bytes += entry.nbytes
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def _read_disk(
+        self, key: str, parser_version: str, stat: Tuple[int, int]
+    ) -> Optional[_CacheEntry]:
+        meta_path = self.cache_dir / f"{key}.json"
+        if not meta_path.exists():
+            return None
+        try:
+            meta = frame_disk_store.read_meta(meta_path)
+            if (
+                meta.get("format_version") != CACHE_FORMAT_VERSION
+                or meta.get("parser_version") != parser_version
+                or (meta.get("size"), meta.get("mtime_ns")) != stat
+            ):
+                return None
+            df = frame_disk_store.read_frame(self.cache_dir, meta)
+        except Exception as e:
+            logger.warning(f"Monitoring disk cache entry {key} unreadable, reparsing: {e}")
+            return None
+        return _CacheEntry(size=stat[0], mtime_ns=stat[1], frame=df, nbytes=frame_nbytes(df))
+
+    def _write_entry(self, key: str, meta: Dict[str, Any], entry: _CacheEntry) -> None:
+        """Persist one entry (best effort; failures are logged, not raised)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Parsers may return a filtered index; cached frames get a default one
+            data_fields = frame_disk_store.write_frame(
+                self.cache_dir, key, entry.frame, drop_index=True
+            )
+
+            # Metadata last: an interrupted write leaves no valid entry
+            frame_disk_store.write_meta(self.cache_dir / f"{key}.json", {**meta, **data_fields})
+            logger.debug(
+                f"Monitoring disk cache written ({data_fields['data_format']}, {len(entry.frame)} rows)"
+            )
+        except Exception as e:
+            logger.warning(f"Could not write monitoring disk cache entry {key}: {e}")
+        finally:
+            with self._lock:
+                if self._pending.get(key) is entry:
+                    del self._pending[key]
+
+    def _write_done(self, future: Future) -> None:
+        with self._lock:
+            self._futures.pop(future, None)
+
+
+_cache_instance: Optional[MonitoringCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_monitoring_cache() -> MonitoringCache:
+    """Get the shared monitoring parse cache (SINGLETON ACCESSOR).
+
+    Memory cap comes from config monitoring.cache_memory_mb (default 256).
+
+    Returns:
+        MonitoringCache instance (created on first call)
+    """
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            try:
+                memory_mb = float(ConfigManager().get('monitoring.cache_memory_mb', DEFAULT_MEMORY_MB))
+            except (TypeError, ValueError):
+                memory_mb = DEFAULT_MEMORY_MB
+            _cache_instance = MonitoringCache(max_memory_bytes=int(memory_mb * 1024 * 1024))
+        return _cache_instance
+
+
+def reset_monitoring_cache() -> None:
+    """Reset singleton instance (FOR TESTING).
+
+    Queued disk writes are finished first; the next get_monitoring_cache()
+    call creates a fresh cache (re-reading the cache directory and config).
+    """
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is not None:
+            _cache_instance.flush()
+        _cache_instance = None
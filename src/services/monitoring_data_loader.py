@@ -7,17 +7,18 @@ Key Features:
 - Directory scanning (finds Excel files)
 - File validation (checks they're readable)
 - Incremental loading (tracks mtimes, skips unchanged files)
-- Caching (in-memory + disk cache)
+- Caching (shared monitoring parse cache: LRU memory + disk)
 - Background threading (REUSE AsyncDatabaseLoader pattern)
 - Error handling (collects errors, continues processing)
 
 Architecture:
 1. Scan directory for Excel files
-2. Check cache (mtime-based) - skip if unchanged
+2. Check cache (path + parser version, size/mtime checked) - skip if unchanged
 3. Select parser based on source definition
 4. Parse file in background thread
 5. Collect results + cache
-6. Return combined DataFrame to UI
+6. Return combined DataFrame to UI (built from the parsers' typed record
+   batches; Pydantic models are only created if a caller iterates records)
 
 REUSE: Async pattern from existing app architecture
 """
@@ -32,9 +33,10 @@ from pathlib import Path
 import pandas as pd
 
 from models.monitoring_data import (
-    DataSourceDefinition, MonitoringRecord, ParseResult, LoadResult, CacheEntry
+    DataSourceDefinition, MonitoringRecord, ParseResult, LoadResult, CacheEntry, RecordBatch
 )
-from services.monitoring_parsers import ParserFactory
+from services.monitoring_cache import MonitoringCache, get_monitoring_cache
+from services.monitoring_parsers import MonitoringExcelParser, ParserFactory
 
 logger = logging.getLogger(__name__)
 
@@ -43,78 +45,53 @@ logger = logging.getLogger(__name__)
 # CACHE MANAGER (incremental file-level caching)
 # ============================================================================
 
+# Frame column carrying RecordBatch.created_at through the shared cache
+_CREATED_AT_COLUMN = "__batch_created_at"
+
+
 class CacheManager:
     """
-    Manages cached parsing results with mtime tracking.
+    Stores parsed record batches in the shared monitoring parse cache.
     
     Strategy:
-    - Cache by file path
-    - Store file modification time
-    - Skip unchanged files (instant load)
-    - Reparse if file modified
+    - Cache by absolute file path + parser version (parser code, class and
+      source definition), so same-named files in other folders never collide
+    - Serve only while the file's size and mtime are unchanged
+    - Memory tier (LRU) + disk tier shared with the dashboard folder loaders
     """
     
-    def __init__(self, cache_dir: str):
+    def __init__(self, parser: MonitoringExcelParser, cache: Optional[MonitoringCache] = None):
         """
         Initialize cache manager.
         
         Args:
-            cache_dir: Directory to store cache files
+            parser: Parser whose batches are cached (provides version + record type)
+            cache: Parse cache to use (default: shared get_monitoring_cache())
         """
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.memory_cache: Dict[str, List[MonitoringRecord]] = {}
-        self.mtime_cache: Dict[str, float] = {}
-    
-    def get_cache_key(self, file_path: str) -> str:
-        """Generate cache key from file path"""
-        return Path(file_path).stem  # filename without extension
-    
-    def is_cached(self, file_path: str) -> bool:
-        """Check if file is in cache AND file hasn't been modified"""
-        
-        key = self.get_cache_key(file_path)
-        
-        # Not in memory cache
-        if key not in self.memory_cache:
-            return False
-        
-        # Check if file was modified
-        try:
-            current_mtime = os.path.getmtime(file_path)
-            cached_mtime = self.mtime_cache.get(key)
-            
-            if cached_mtime is None:
-                return False  # No mtime recorded
-            
-            return current_mtime == cached_mtime  # Same modification time = not changed
-        
-        except (OSError, FileNotFoundError):
-            return False
+        self.parser = parser
+        self.cache = cache or get_monitoring_cache()
     
-    def get(self, file_path: str) -> Optional[List[MonitoringRecord]]:
-        """Get cached records (if not stale)"""
-        if self.is_cached(file_path):
-            key = self.get_cache_key(file_path)
-            return self.memory_cache.get(key)
-        return None
+    def get(self, file_path: str) -> Optional[RecordBatch]:
+        """Get cached record batch (if not stale)"""
+        spec = self.parser.record_spec()
+        if spec is None:
+            return None
+        
+        frame = self.cache.get(file_path, self.parser.cache_version)
+        if frame is None or _CREATED_AT_COLUMN not in frame.columns:
+            return None
+        
+        created_at = pd.Timestamp(frame[_CREATED_AT_COLUMN].iloc[0]).to_pydatetime()
+        return RecordBatch(spec.record_type, frame.drop(columns=_CREATED_AT_COLUMN), created_at)
     
-    def set(self, file_path: str, records: List[MonitoringRecord]):
-        """Cache parsed records with current mtime"""
-        key = self.get_cache_key(file_path)
-        
-        try:
-            mtime = os.path.getmtime(file_path)
-            self.memory_cache[key] = records
-            self.mtime_cache[key] = mtime
-        except OSError:
-            pass
+    def set(self, file_path: str, batch: RecordBatch):
+        """Cache parsed record batch (keyed to the file's current size + mtime)"""
+        frame = batch.frame.assign(**{_CREATED_AT_COLUMN: batch.created_at})
+        self.cache.put(file_path, self.parser.cache_version, frame)
     
-    def clear(self):
-        """Clear all caches"""
-        self.memory_cache.clear()
-        self.mtime_cache.clear()
+    def discard(self, file_path: str):
+        """Drop the cached batch of one file"""
+        self.cache.discard(file_path, self.parser.cache_version)
 
 
 # ============================================================================
@@ -133,7 +110,13 @@ class MonitoringDataLoader:
         loader.load_async(on_complete=callback)
     """
     
-    def __init__(self, source_def: DataSourceDefinition, directory: Optional[Path] = None, enable_cache: bool = True):
+    def __init__(
+        self,
+        source_def: DataSourceDefinition,
+        directory: Optional[Path] = None,
+        enable_cache: bool = True,
+        cache: Optional[MonitoringCache] = None,
+    ):
         """
         Initialize loader for specific data source.
         
@@ -141,6 +124,7 @@ class MonitoringDataLoader:
             source_def: Defines how to load this source (from YAML config)
             directory: Where to scan for Excel files (overrides config)
             enable_cache: Whether to use caching
+            cache: Parse cache (default: shared get_monitoring_cache())
         """
         self.source_def = source_def
         self.directory = directory or Path(source_def.directory_pattern)
@@ -150,19 +134,12 @@ class MonitoringDataLoader:
             base_dir = Path(os.getenv('WATERBALANCE_USER_DIR', '.'))
             self.directory = base_dir / self.directory
         
-        # Initialize cache
-        if enable_cache:
-            cache_dir = Path('data/monitoring/cache')
-            if not cache_dir.is_absolute():
-                base_dir = Path(os.getenv('WATERBALANCE_USER_DIR', '.'))
-                cache_dir = base_dir / cache_dir
-            self.cache = CacheManager(str(cache_dir))
-        else:
-            self.cache = None
-        
         # Parser
         self.parser = ParserFactory.create_parser(source_def)
         
+        # Initialize cache (shared with the dashboard folder loaders)
+        self.cache = CacheManager(self.parser, cache) if enable_cache else None
+        
         # Results
         self.result: Optional[LoadResult] = None
         self.loading = False
@@ -213,15 +190,15 @@ class MonitoringDataLoader:
             for file_path in files[:max_files]:
                 # Check cache first
                 if self.cache:
-                    cached_records = self.cache.get(str(file_path))
-                    if cached_records:
+                    cached_batch = self.cache.get(str(file_path))
+                    if cached_batch is not None:
                         # Use cache
                         parse_result = ParseResult(
                             source_id=self.source_def.id,
                             file_path=str(file_path),
-                            records=cached_records,
-                            total_rows=len(cached_records),
-                            valid_rows=len(cached_records),
+                            batch=cached_batch,
+                            total_rows=len(cached_batch),
+                            valid_rows=len(cached_batch),
                             parse_time_ms=0.5  # Cached - instant
                         )
                         self.result.files_cached += 1
@@ -230,8 +207,8 @@ class MonitoringDataLoader:
                         parse_result = self.parser.parse(str(file_path))
                         
                         # Cache result
-                        if parse_result.records:
-                            self.cache.set(str(file_path), parse_result.records)
+                        if parse_result.batch is not None and len(parse_result.batch):
+                            self.cache.set(str(file_path), parse_result.batch)
                         
                         self.result.files_parsed += 1
                 else:
@@ -241,7 +218,7 @@ class MonitoringDataLoader:
                 
                 # Collect results
                 self.result.file_results.append(parse_result)
-                self.result.total_records += len(parse_result.records)
+                self.result.total_records += parse_result.record_count
                 self.result.total_errors += len(parse_result.errors)
         
         except Exception as e:
@@ -284,6 +261,9 @@ class MonitoringDataLoader:
         """
         Convert loaded records to pandas DataFrame for display/analysis.
         
+        Built from each file's record batch directly (no per-row models);
+        columns match model_dump() of the records.
+        
         Returns:
             DataFrame with all records (empty if no data)
         """
@@ -291,21 +271,14 @@ class MonitoringDataLoader:
             return pd.DataFrame()
         
         # Collect all records from all files
-        all_records = []
-        for file_result in self.result.file_results:
-            all_records.extend(file_result.records)
-        
-        if not all_records:
+        frames = [fr.to_dataframe() for fr in self.result.file_results if fr.record_count]
+        if not frames:
             return pd.DataFrame()
         
-        # Convert to DataFrame (use model_dump for Pydantic v2)
-        try:
-            data = [r.model_dump() for r in all_records]
-        except AttributeError:
-            # Pydantic v1 fallback
-            data = [r.dict() for r in all_records]
-        
-        df = pd.DataFrame(data)
+        df = frames[0]
+        if len(frames) > 1:
+            # Re-infer types so None-only optional columns combine with numbers
+            df = pd.concat(frames, ignore_index=True).infer_objects()
         
         # Sort by measurement date
         if 'measurement_date' in df.columns:
@@ -330,9 +303,10 @@ class MonitoringDataLoader:
         }
     
     def clear_cache(self):
-        """Clear all cached data (call after Excel files are updated)"""
+        """Drop this source's cached files (changed files are reparsed anyway)"""
         if self.cache:
-            self.cache.clear()
+            for file_path in self.scan_files():
+                self.cache.discard(str(file_path))
 
 
 def create_loader(source_def: DataSourceDefinition, directory: Optional[Path] = None) -> MonitoringDataLoader:
@@ -13,7 +13,16 @@ STRUCTURE:
     Row 9+: Data rows → timestamp + values
     Row X: Next borehole ID → "TRPGWM 02"
     Row X+1+: Data rows for next borehole
-    
+
+PARSING (VECTORIZED):
+    Rows are processed as whole columns instead of cell by cell: block starts
+    come from one regex over column A, borehole IDs are forward-filled onto
+    their data rows, dates are parsed per format for all rows at once, and
+    parameter columns are converted with pd.to_numeric. Only cells no bulk
+    step understands (odd date text, numbers pandas will not parse) fall back
+    to the original per-value rules, so output matches the Tkinter parser.
+    Benchmark: scripts/benchmark_monitoring_parser.py
+
 ONLY USED FOR: Borehole Monitoring tab
 DOES NOT AFFECT: PCD or Static Levels tabs (separate parsers)
 """
@@ -23,25 +32,135 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
+import numpy as np
 import re
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, List, Tuple
 from core.app_logger import logger
 
+# Matches "TRPGWM 01", "BH 12", etc.
+BOREHOLE_ID_PATTERN = r'^[A-Z]{3,}\s*\d+[A-Z]*'
+
+# Tried in order (explicit formats avoid day/month confusion), then inference
+DATE_FORMATS = ["%Y/%m/%d %I:%M:%S %p", "%d/%m/%Y %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y"]
+
+# Non-parameter columns of the parsed frame
+BASE_COLUMNS = ['borehole', 'borehole_norm', 'date', 'aquifer', 'source_file']
+
+# Bump when the parsed frame changes (invalidates cached parses)
+PARSER_VERSION = 2
+
+
+def _find_header_row(df_raw: pd.DataFrame) -> int:
+    """Row with a "Static Level" header in the first 20 rows (row 5 fallback)."""
+    head = df_raw.head(20).astype(str)
+    hits = head.apply(lambda col: col.str.lower().str.contains('static level', regex=False)).any(axis=1)
+    if hits.any():
+        return int(np.flatnonzero(hits.to_numpy())[0])
+    return 5 if len(df_raw) > 5 else 0  # Default to row 5 as fallback
+
+
+def _extract_parameters(header: pd.Series) -> List[Tuple[int, str]]:
+    """(column index, cleaned name) for each parameter header cell."""
+    params = []
+    for col_idx, val in enumerate(header):
+        if pd.notna(val):
+            name = str(val).replace('\xa0', ' ').strip()
+            if name:
+                # Clean up: remove control chars, superscripts
+                name = re.sub(r"[\r\n]+", " ", name).replace('^', '').strip()
+                if name and name.lower() != 'monitoring point':
+                    params.append((col_idx, name))
+    return params
+
+
+def _parse_sample_dates(cells: pd.Series, text: pd.Series) -> pd.Series:
+    """Parse sample dates column-wise (NaT where a row has no usable date).
+
+    Args:
+        cells: Raw column A values of the data rows.
+        text: Same rows as cleaned text with any "(S)"/"(D)" suffix removed.
+
+    Returns:
+        datetime64 Series aligned with cells.
+    """
+    dates = pd.Series(pd.NaT, index=cells.index, dtype='datetime64[us]')
+
+    # Excel date cells need no text parsing (str() of them always infers back)
+    is_datetime = cells.map(lambda v: isinstance(v, datetime)).astype(bool)
+    if is_datetime.any():
+        dates[is_datetime] = pd.to_datetime(cells[is_datetime].tolist()).as_unit('us')
+
+    for fmt in DATE_FORMATS:
+        pending = dates.isna() & ~is_datetime
+        if not pending.any():
+            return dates
+        parsed = pd.to_datetime(text[pending], format=fmt, errors='coerce')
+        dates = dates.fillna(parsed)
+
+    # Remaining text: per distinct value with format inference (rare in practice)
+    pending = dates.isna() & ~is_datetime
+    inferred: Dict[str, pd.Timestamp] = {}
+    for value in text[pending].unique():
+        try:
+            ts = pd.to_datetime(value, errors='coerce')
+        except Exception:
+            continue
+        if pd.notna(ts):
+            inferred[value] = ts.tz_localize(None) if ts.tzinfo is not None else ts
+    if inferred:
+        dates = dates.fillna(pd.to_datetime(text[pending].map(inferred)))
+    return dates
+
+
+def _parameter_values(cells: pd.Series) -> pd.Series:
+    """Convert one parameter column (NaN where a cell is skipped).
+
+    Blank, "NO ACCESS" and "<" (below detection limit) cells are skipped.
+    Numbers become float; text that is not a number is kept as text.
+    """
+    if cells.dtype.kind in 'iuf':
+        return cells.astype('float64')
+
+    # Numbers (and numeric text) in one pass; only the rest needs string checks
+    if cells.dtype == object or pd.api.types.is_string_dtype(cells.dtype):
+        numbers = pd.to_numeric(cells, errors='coerce').astype('float64')
+    else:  # Whole-column dates/durations are never numeric here
+        numbers = pd.Series(np.nan, index=cells.index)
+    rest = cells.notna() & numbers.isna()
+    if not rest.any():
+        return numbers
+
+    text = cells[rest].astype(str).str.strip()
+    keep = ~((text == '') | (text.str.upper() == 'NO ACCESS') | text.str.contains('<', regex=False))
+    leftovers = text.index[keep]
+    if len(leftovers) == 0:
+        return numbers
+
+    values = numbers.astype(object)
+    for idx in leftovers:
+        try:
+            values[idx] = float(cells[idx])
+        except Exception:
+            values[idx] = text[idx]
+    # Same dtype inference as building the frame from per-row dicts
+    return pd.Series(values.tolist(), index=cells.index)
+
 
 def parse_borehole_stacked_blocks(file_path: str) -> pd.DataFrame:
     """
     Parse BOREHOLE MONITORING Excel (stacked blocks structure).
-    
-    Algorithm (copied from Tkinter):
+
+    Algorithm (copied from Tkinter, column-wise):
         1. Find header row by searching for "Static Level" keyword (rows 0-20)
         2. Extract parameter names from header row
         3. Find borehole name rows using regex (col A after header)
-        4. Parse data between borehole blocks
-    
+        4. Forward-fill borehole names onto the data rows of each block
+        5. Parse dates/aquifer suffixes and parameter values per column
+
     Args:
         file_path: Excel file path
-    
+
     Returns:
         DataFrame with columns: borehole, aquifer, date, calcium, chloride, etc.
     """
@@ -50,139 +169,87 @@ def parse_borehole_stacked_blocks(file_path: str) -> pd.DataFrame:
         df_raw = pd.read_excel(file_path, header=None, engine='xlrd')
     except Exception:
         df_raw = pd.read_excel(file_path, header=None)
-    
+
     if df_raw.empty:
         logger.warning(f"Empty Excel: {Path(file_path).name}")
         return pd.DataFrame()
-    
+    df_raw = df_raw.reset_index(drop=True)
+
     # 2. Locate header row by searching for "Static Level" keyword
-    header_row = None
-    for i in range(min(len(df_raw), 20)):
-        row_str = df_raw.iloc[i].astype(str).str.lower()
-        if row_str.str.contains('static level').any():
-            header_row = i
-            break
-    
-    if header_row is None:
-        header_row = 5 if len(df_raw) > 5 else 0  # Default to row 5 as fallback
-    
+    header_row = _find_header_row(df_raw)
     logger.info(f"Detected header row: {header_row}")
-    
+
     # 3. Extract parameter names from header row
-    params = []
-    for col_idx, val in enumerate(df_raw.iloc[header_row]):
-        if pd.notna(val):
-            name = str(val).replace('\xa0', ' ').strip()
-            if name:
-                # Clean up: remove control chars, superscripts
-                name = re.sub(r"[\r\n]+", " ", name).replace('^', '').strip()
-                if name and name.lower() != 'monitoring point':
-                    params.append((col_idx, name))
-    
+    params = _extract_parameters(df_raw.iloc[header_row])
     logger.info(f"Found {len(params)} parameters: {[p[1] for p in params]}")
-    
+
     # 4. Identify borehole name rows (col A, after header row)
-    borehole_pattern = re.compile(r'^[A-Z]{3,}\s*\d+[A-Z]*')  # Matches "TRPGWM 01", "BH 12", etc.
-    borehole_rows = []
-    for i in range(header_row + 1, len(df_raw)):
-        val = df_raw.iat[i, 0]
-        if pd.isna(val):
-            continue
-        s = str(val).replace('\xa0', '').strip()
-        if borehole_pattern.match(s):
-            borehole_rows.append(i)
-    
-    if not borehole_rows:
+    first_col = df_raw.iloc[header_row + 1:, 0]
+    cells = first_col[first_col.notna()]
+    text = cells.astype(str).str.replace('\xa0', '', regex=False).str.strip()
+    is_block_start = text.str.match(BOREHOLE_ID_PATTERN).fillna(False).astype(bool)
+
+    if not is_block_start.any():
         logger.warning(f"No borehole IDs found in {Path(file_path).name}")
         return pd.DataFrame()
-    
-    borehole_rows.append(len(df_raw))  # Sentinel to mark end of file
-    logger.info(f"Found {len(borehole_rows) - 1} boreholes")
-    
-    # 5. Parse data rows between borehole blocks
-    records = []
-    for idx in range(len(borehole_rows) - 1):
-        start_row = borehole_rows[idx]
-        end_row = borehole_rows[idx + 1]
-        borehole_name = str(df_raw.iat[start_row, 0]).replace('\xa0', '').strip()
-        
-        if not borehole_name:
+
+    logger.info(f"Found {int(is_block_start.sum())} boreholes")
+
+    # 5. Data rows follow their borehole name row until the next one
+    borehole = text.where(is_block_start).ffill()
+    is_data = ~is_block_start & borehole.notna()
+    cells, text, borehole = cells[is_data], text[is_data], borehole[is_data]
+
+    # Detect aquifer from suffix: (S) = Shallow, (D) = Deep
+    upper = text.str.upper()
+    aquifer = np.select(
+        [upper.str.contains('(S', regex=False), upper.str.contains('(D', regex=False)],
+        ['Shallow Aquifer', 'Deep Aquifer'],
+        default='',
+    )
+
+    # Remove suffix for date parsing
+    date_text = text.str.split('(', n=1).str[0].str.strip()
+    dates = _parse_sample_dates(cells, date_text)
+    has_date = dates.notna()
+
+    if not has_date.any():
+        logger.info(f"OK Parsed {Path(file_path).name}: 0 rows, 0 parameters")
+        return pd.DataFrame()
+
+    rows = has_date.index[has_date]
+    df_result = pd.DataFrame({
+        'borehole': borehole[rows],
+        'borehole_norm': borehole[rows].str.upper(),
+        'date': dates[rows],
+        'aquifer': pd.Series(aquifer, index=has_date.index, dtype=borehole.dtype)[rows],
+    })
+
+    # 6. Extract parameter values (later duplicate headers win, like dict updates)
+    columns: Dict[str, pd.Series] = {}
+    first_seen: Dict[str, Tuple[int, int]] = {}
+    for order, (col_idx, param_name) in enumerate(params):
+        values = _parameter_values(df_raw.iloc[rows, col_idx])
+        present = values.notna().to_numpy()
+        if not present.any():
             continue
-        
-        # Data rows start immediately after borehole name row
-        for data_row_idx in range(start_row + 1, end_row):
-            date_cell = df_raw.iat[data_row_idx, 0]
-            if pd.isna(date_cell):
-                continue
-            
-            date_str = str(date_cell).replace('\xa0', '').strip()
-            
-            # Detect aquifer from suffix: (S) = Shallow, (D) = Deep
-            aquifer = ''
-            if '(S' in date_str.upper():
-                aquifer = 'Shallow Aquifer'
-            elif '(D' in date_str.upper():
-                aquifer = 'Deep Aquifer'
-            
-            # Remove suffix for date parsing
-            if '(' in date_str:
-                date_str = date_str.split('(')[0].strip()
-            
-            # Parse date
-            try:
-                # Try multiple formats to avoid day/month confusion
-                parsed_date = None
-                for fmt in ["%Y/%m/%d %I:%M:%S %p", "%d/%m/%Y %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y"]:
-                    try:
-                        parsed_date = pd.to_datetime(date_str, format=fmt)
-                        break
-                    except:
-                        continue
-                
-                if parsed_date is None:
-                    parsed_date = pd.to_datetime(date_str, errors='coerce')
-                
-                if pd.isna(parsed_date):
-                    continue
-                
-            except Exception:
-                continue
-            
-            # Build record
-            record = {
-                'borehole': borehole_name,
-                'borehole_norm': borehole_name.upper(),
-                'date': parsed_date.to_pydatetime() if hasattr(parsed_date, 'to_pydatetime') else parsed_date,
-                'aquifer': aquifer
-            }
-            
-            # Extract parameter values
-            for col_idx, param_name in params:
-                if col_idx >= df_raw.shape[1]:
-                    continue
-                
-                val = df_raw.iat[data_row_idx, col_idx]
-                if pd.isna(val):
-                    continue
-                
-                val_str = str(val).strip()
-                if not val_str or val_str.upper() == 'NO ACCESS' or '<' in val_str:
-                    continue
-                
-                try:
-                    record[param_name] = float(val)
-                except Exception:
-                    record[param_name] = val_str
-            
-            records.append(record)
-    
-    df_result = pd.DataFrame(records)
-    if not df_result.empty:
-        df_result['source_file'] = Path(file_path).name
-        df_result = df_result.sort_values(['borehole', 'date']).reset_index(drop=True)
-    
+        if param_name in columns:
+            merged = values.combine_first(columns[param_name])
+            columns[param_name] = pd.Series(merged.tolist(), index=merged.index)
+        else:
+            columns[param_name] = values
+        position = (int(np.argmax(present)), order)
+        first_seen[param_name] = min(first_seen.get(param_name, position), position)
+
+    # Column order of the row-dict frame: first row with a value, then header order
+    for param_name in sorted(columns, key=first_seen.__getitem__):
+        df_result[param_name] = columns[param_name]
+
+    df_result['source_file'] = Path(file_path).name
+    df_result = df_result.sort_values(['borehole', 'date']).reset_index(drop=True)
+
     row_count = len(df_result)
-    param_count = len([col for col in df_result.columns if col not in ['borehole', 'borehole_norm', 'date', 'aquifer', 'source_file']])
+    param_count = len([col for col in df_result.columns if col not in BASE_COLUMNS])
     logger.info(f"OK Parsed {Path(file_path).name}: {row_count} rows, {param_count} parameters")
-    
+
     return df_result
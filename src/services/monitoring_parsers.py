@@ -9,7 +9,8 @@ Generic parsers for different Excel structures:
 
 Key Features:
 - Fuzzy column name matching (handles Excel renames)
-- Type-safe validation (Pydantic models)
+- Type-safe validation (Pydantic models, built on demand from a RecordBatch)
+- Columnar parsing (type conversion and validation rules as column operations)
 - Error collection (skip invalid rows, continue processing)
 - Performance profiling (track parse time)
 - Threading-ready (stateless parsers)
@@ -18,10 +19,13 @@ REUSE PATTERN: Inherits async + caching from existing app architecture
 """
 
 import pandas as pd
+import numpy as np
 import logging
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Type
 import time
+import hashlib
 from difflib import SequenceMatcher
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -29,11 +33,14 @@ from pathlib import Path
 from models.monitoring_data import (
     DataSourceDefinition, MonitoringRecord, BoreholeStaticRecord,
     BoreholeMonitoringRecord, PCDMonitoringRecord, ParseResult,
-    DataType, StructureType
+    RecordBatch, DataType, StructureType
 )
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsed record batches change (invalidates cached parses)
+PARSER_VERSION = 1
+
 
 # ============================================================================
 # FUZZY COLUMN MATCHING
@@ -76,6 +83,31 @@ def fuzzy_match_column(target: str, candidates: List[str], threshold: float = 0.
     return best_match if best_score >= threshold else None
 
 
+# ============================================================================
+# RECORD SPECS (which mapped columns make up each record type)
+# ============================================================================
+
+@dataclass(frozen=True)
+class RecordSpec:
+    """Columns that make up one record type (COLUMNAR PARSE)."""
+    record_type: Type[MonitoringRecord]
+    id_field: str                          # Required string identifier
+    value_field: str                       # Required float measurement
+    optional_fields: Tuple[str, ...] = ()  # Optional floats
+    name_field: Optional[str] = None       # Optional string, defaults to the identifier
+
+
+BOREHOLE_STATIC_SPEC = RecordSpec(
+    BoreholeStaticRecord, "borehole_id", "static_level_m", ("depth_m",), name_field="borehole_name"
+)
+BOREHOLE_MONITORING_SPEC = RecordSpec(
+    BoreholeMonitoringRecord, "borehole_id", "aquifer_depth_m", ("temperature_c", "conductivity_us_cm", "ph")
+)
+PCD_MONITORING_SPEC = RecordSpec(
+    PCDMonitoringRecord, "pcd_id", "water_level_m", ("ph", "conductivity_us_cm", "tss_mg_l")
+)
+
+
 # ============================================================================
 # BASE PARSER
 # ============================================================================
@@ -83,6 +115,9 @@ def fuzzy_match_column(target: str, candidates: List[str], threshold: float = 0.
 class MonitoringExcelParser(ABC):
     """Base class for monitoring Excel parsers"""
     
+    # (source ID prefix, record spec) pairs this parser produces records for
+    RECORD_SPECS: Tuple[Tuple[str, RecordSpec], ...] = ()
+    
     def __init__(self, source_def: DataSourceDefinition, threshold: float = 0.85):
         """
         Initialize parser.
@@ -108,6 +143,24 @@ class MonitoringExcelParser(ABC):
         """
         pass
     
+    def record_spec(self) -> Optional[RecordSpec]:
+        """Record spec for this source (None: the parser yields no records for it)"""
+        for prefix, spec in self.RECORD_SPECS:
+            if self.source_def.id.startswith(prefix):
+                return spec
+        return None
+    
+    @property
+    def cache_version(self) -> str:
+        """
+        Parser version string for the parse cache.
+        
+        Changes when the parser code (PARSER_VERSION), parser class or the
+        source definition (column mappings, validation rules) changes.
+        """
+        definition = hashlib.sha1(self.source_def.model_dump_json().encode("utf-8")).hexdigest()[:12]
+        return f"{self.__class__.__name__}:{PARSER_VERSION}:{definition}:{self.threshold}"
+    
     def _find_columns(self, df: pd.DataFrame) -> Dict[str, Optional[str]]:
         """
         Map logical column IDs to Excel column names using fuzzy matching.
@@ -225,6 +278,135 @@ class MonitoringExcelParser(ABC):
         
         return True
 
+    # ------------------------------------------------------------------
+    # Columnar conversion (same rules as _convert_type / _validate_record)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _present(values: pd.Series) -> pd.Series:
+        """Cells that are neither NaN nor empty text"""
+        return values.notna() & (values != "")
+    
+    def _string_column(self, values: pd.Series) -> pd.Series:
+        """str(value) per cell, NaN where missing"""
+        present = self._present(values)
+        text = values[present]
+        if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+            text = text.astype(str)
+        else:
+            text = text.map(str)
+        return text.reindex(values.index)
+    
+    def _float_column(self, values: pd.Series) -> pd.Series:
+        """float(value) per cell, NaN where missing or not a number"""
+        if values.dtype.kind in 'iufb':
+            return values.astype('float64')
+        if not (values.dtype == object or pd.api.types.is_string_dtype(values.dtype)):
+            return pd.Series(np.nan, index=values.index)  # Dates are never floats
+        
+        numbers = pd.to_numeric(values, errors='coerce').astype('float64')
+        # Text float() accepts but pandas does not (e.g. "1_000") - usually none
+        rest = self._present(values) & numbers.isna()
+        for idx in rest.index[rest]:
+            value, _ = self._convert_type(values[idx], DataType.FLOAT)
+            numbers[idx] = np.nan if value is None else value
+        return numbers
+    
+    def _date_column(self, values: pd.Series, date_formats: List[str] = None) -> pd.Series:
+        """Dates per cell (datetime64 at midnight), NaT where missing or unparseable"""
+        if date_formats is None:
+            date_formats = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"]
+        
+        if values.dtype.kind == 'M':
+            return values.dt.normalize()
+        
+        dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[us]')
+        # Excel date cells are already dates; only text goes through the formats
+        is_date = values.map(lambda v: isinstance(v, date)).astype(bool)
+        if is_date.any():
+            dates[is_date] = pd.to_datetime(values[is_date].tolist()).normalize()
+        
+        text = values[self._present(values) & ~is_date].astype(str)
+        for fmt in date_formats:
+            if text.empty:
+                break
+            parsed = pd.to_datetime(text, format=fmt, errors='coerce')
+            dates = dates.fillna(parsed)
+            text = text[parsed.isna()]
+        return dates
+    
+    def _validation_errors(self, frame: pd.DataFrame) -> pd.Series:
+        """
+        Apply column min/max rules to a record frame.
+        
+        Returns:
+            Series aligned with frame: first failed rule message per row, None if valid
+        """
+        errors = pd.Series(None, index=frame.index, dtype=object)
+        if not self.source_def.validation_enabled:
+            return errors
+        
+        for col_def in self.source_def.columns:
+            rules = col_def.validation
+            if not rules or col_def.id not in frame.columns or frame[col_def.id].dtype.kind != 'f':
+                continue
+            
+            values = frame[col_def.id]
+            if rules.min is not None:
+                failed = errors.isna() & (values < rules.min)
+                errors[failed] = [f"{col_def.id} below minimum: {v} < {rules.min}" for v in values[failed]]
+            if rules.max is not None:
+                failed = errors.isna() & (values > rules.max)
+                errors[failed] = [f"{col_def.id} above maximum: {v} > {rules.max}" for v in values[failed]]
+        
+        return errors
+    
+    def _parse_records(self, df: pd.DataFrame, col_mapping: Dict[str, str], spec: RecordSpec,
+                       file_path: str, result: ParseResult) -> None:
+        """
+        Convert mapped columns into result.batch (COLUMNAR PARSE PATH).
+        
+        Rows missing the identifier, date or required value are not records;
+        rows failing validation rules are counted as skipped with an error.
+        
+        Args:
+            df: DataFrame from Excel
+            col_mapping: Logical column ID → Excel column name
+            spec: Record type and its columns
+            file_path: Path to Excel file
+            result: ParseResult to fill (batch, valid/skipped rows, errors)
+        """
+        id_col = col_mapping.get(spec.id_field)
+        date_col = col_mapping.get("measurement_date")
+        value_col = col_mapping.get(spec.value_field)
+        if not all([id_col, date_col, value_col]):
+            return
+        
+        frame = pd.DataFrame(index=df.index)
+        frame["source_id"] = self.source_def.id
+        frame["source_file"] = Path(file_path).name
+        frame["measurement_date"] = self._date_column(df[date_col])
+        frame[spec.id_field] = self._string_column(df[id_col])
+        if spec.name_field:
+            name_col = col_mapping.get(spec.name_field)
+            names = self._string_column(df[name_col]) if name_col else pd.Series(np.nan, index=df.index)
+            frame[spec.name_field] = names.fillna(frame[spec.id_field])
+        frame[spec.value_field] = self._float_column(df[value_col])
+        for field_id in spec.optional_fields:
+            col = col_mapping.get(field_id)
+            frame[field_id] = self._float_column(df[col]) if col else np.nan
+        
+        required = frame[[spec.id_field, "measurement_date", spec.value_field]].notna().all(axis=1)
+        frame = frame[required]
+        
+        errors = self._validation_errors(frame)
+        invalid = errors.notna()
+        result.errors.extend(f"Row {idx}: {message}" for idx, message in errors[invalid].items())
+        result.skipped_rows += int(invalid.sum())
+        
+        frame = frame[~invalid].reset_index(drop=True)
+        result.valid_rows += len(frame)
+        result.batch = RecordBatch(spec.record_type, frame, created_at=result.timestamp)
+
 
 # ============================================================================
 # STACKED BLOCKS PARSER (Multiple items stacked vertically)
@@ -246,8 +428,10 @@ class StackedBlocksParser(MonitoringExcelParser):
     Each block = one borehole, multiple measurements
     """
     
+    RECORD_SPECS = (("borehole_static", BOREHOLE_STATIC_SPEC),)
+    
     def parse(self, file_path: str) -> ParseResult:
-        """Parse stacked blocks Excel file"""
+        """Parse stacked blocks Excel file (records returned as result.batch)"""
         
         result = ParseResult(
             source_id=self.source_def.id,
@@ -267,27 +451,10 @@ class StackedBlocksParser(MonitoringExcelParser):
                 result.errors.append("No required columns found")
                 return result
             
-            # Parse rows
-            for idx, row in df.iterrows():
-                try:
-                    # Create record based on source type
-                    if self.source_def.id.startswith("borehole_static"):
-                        record = self._parse_borehole_static_row(row, col_mapping, file_path)
-                    else:
-                        # Default: use generic parsing
-                        continue
-                    
-                    if record:
-                        if self._validate_record(record):
-                            result.records.append(record)
-                            result.valid_rows += 1
-                        else:
-                            result.skipped_rows += 1
-                            result.errors.append(f"Row {idx}: {record.error_message}")
-                
-                except Exception as e:
-                    result.skipped_rows += 1
-                    result.errors.append(f"Row {idx}: {str(e)}")
+            # Convert columns (other sources: no records)
+            spec = self.record_spec()
+            if spec is not None:
+                self._parse_records(df, col_mapping, spec, file_path, result)
         
         except Exception as e:
             result.errors.append(f"File parsing error: {str(e)}")
@@ -295,41 +462,6 @@ class StackedBlocksParser(MonitoringExcelParser):
         result.parse_time_ms = (time.perf_counter() - start_time) * 1000
         
         return result
-    
-    def _parse_borehole_static_row(self, row, col_mapping, file_path) -> Optional[BoreholeStaticRecord]:
-        """Parse a single row into BoreholeStaticRecord"""
-        
-        # Extract values
-        borehole_id_col = col_mapping.get("borehole_id")
-        date_col = col_mapping.get("measurement_date")
-        level_col = col_mapping.get("static_level_m")
-        
-        if not all([borehole_id_col, date_col, level_col]):
-            return None
-        
-        # Convert types
-        borehole_id, err = self._convert_type(row.get(borehole_id_col), DataType.STRING)
-        if err or not borehole_id:
-            return None
-        
-        measurement_date, err = self._convert_type(row.get(date_col), DataType.DATE)
-        if err or not measurement_date:
-            return None
-        
-        static_level, err = self._convert_type(row.get(level_col), DataType.FLOAT)
-        if err or static_level is None:
-            return None
-        
-        # Create record
-        return BoreholeStaticRecord(
-            source_id=self.source_def.id,
-            source_file=Path(file_path).name,
-            measurement_date=measurement_date,
-            borehole_id=borehole_id,
-            borehole_name=row.get(col_mapping.get("borehole_name", "")) or borehole_id,
-            static_level_m=static_level,
-            depth_m=row.get(col_mapping.get("depth_m")) if "depth_m" in col_mapping else None
-        )
 
 
 # ============================================================================
@@ -349,8 +481,13 @@ class TimeseriesParser(MonitoringExcelParser):
     Each row = one measurement with multiple parameters
     """
     
+    RECORD_SPECS = (
+        ("borehole_monitoring", BOREHOLE_MONITORING_SPEC),
+        ("pcd_monitoring", PCD_MONITORING_SPEC),
+    )
+    
     def parse(self, file_path: str) -> ParseResult:
-        """Parse timeseries Excel file"""
+        """Parse timeseries Excel file (records returned as result.batch)"""
         
         result = ParseResult(
             source_id=self.source_def.id,
@@ -369,27 +506,10 @@ class TimeseriesParser(MonitoringExcelParser):
                 result.errors.append("No required columns found")
                 return result
             
-            # Parse rows
-            for idx, row in df.iterrows():
-                try:
-                    if self.source_def.id.startswith("borehole_monitoring"):
-                        record = self._parse_borehole_monitoring_row(row, col_mapping, file_path)
-                    elif self.source_def.id.startswith("pcd_monitoring"):
-                        record = self._parse_pcd_row(row, col_mapping, file_path)
-                    else:
-                        continue
-                    
-                    if record:
-                        if self._validate_record(record):
-                            result.records.append(record)
-                            result.valid_rows += 1
-                        else:
-                            result.skipped_rows += 1
-                            result.errors.append(f"Row {idx}: {record.error_message}")
-                
-                except Exception as e:
-                    result.skipped_rows += 1
-                    result.errors.append(f"Row {idx}: {str(e)}")
+            # Convert columns (other sources: no records)
+            spec = self.record_spec()
+            if spec is not None:
+                self._parse_records(df, col_mapping, spec, file_path, result)
         
         except Exception as e:
             result.errors.append(f"File parsing error: {str(e)}")
@@ -397,70 +517,6 @@ class TimeseriesParser(MonitoringExcelParser):
         result.parse_time_ms = (time.perf_counter() - start_time) * 1000
         
         return result
-    
-    def _parse_borehole_monitoring_row(self, row, col_mapping, file_path) -> Optional[BoreholeMonitoringRecord]:
-        """Parse aquifer monitoring row"""
-        
-        borehole_id_col = col_mapping.get("borehole_id")
-        date_col = col_mapping.get("measurement_date")
-        depth_col = col_mapping.get("aquifer_depth_m")
-        
-        if not all([borehole_id_col, date_col, depth_col]):
-            return None
-        
-        borehole_id, _ = self._convert_type(row.get(borehole_id_col), DataType.STRING)
-        measurement_date, _ = self._convert_type(row.get(date_col), DataType.DATE)
-        aquifer_depth, _ = self._convert_type(row.get(depth_col), DataType.FLOAT)
-        
-        if not all([borehole_id, measurement_date, aquifer_depth is not None]):
-            return None
-        
-        return BoreholeMonitoringRecord(
-            source_id=self.source_def.id,
-            source_file=Path(file_path).name,
-            measurement_date=measurement_date,
-            borehole_id=borehole_id,
-            aquifer_depth_m=aquifer_depth,
-            temperature_c=self._get_optional_float(row, col_mapping, "temperature_c"),
-            conductivity_us_cm=self._get_optional_float(row, col_mapping, "conductivity_us_cm"),
-            ph=self._get_optional_float(row, col_mapping, "ph")
-        )
-    
-    def _parse_pcd_row(self, row, col_mapping, file_path) -> Optional[PCDMonitoringRecord]:
-        """Parse PCD monitoring row"""
-        
-        pcd_id_col = col_mapping.get("pcd_id")
-        date_col = col_mapping.get("measurement_date")
-        level_col = col_mapping.get("water_level_m")
-        
-        if not all([pcd_id_col, date_col, level_col]):
-            return None
-        
-        pcd_id, _ = self._convert_type(row.get(pcd_id_col), DataType.STRING)
-        measurement_date, _ = self._convert_type(row.get(date_col), DataType.DATE)
-        water_level, _ = self._convert_type(row.get(level_col), DataType.FLOAT)
-        
-        if not all([pcd_id, measurement_date, water_level is not None]):
-            return None
-        
-        return PCDMonitoringRecord(
-            source_id=self.source_def.id,
-            source_file=Path(file_path).name,
-            measurement_date=measurement_date,
-            pcd_id=pcd_id,
-            water_level_m=water_level,
-            ph=self._get_optional_float(row, col_mapping, "ph"),
-            conductivity_us_cm=self._get_optional_float(row, col_mapping, "conductivity_us_cm"),
-            tss_mg_l=self._get_optional_float(row, col_mapping, "tss_mg_l")
-        )
-    
-    def _get_optional_float(self, row, col_mapping, field_id) -> Optional[float]:
-        """Helper to extract optional float field"""
-        col = col_mapping.get(field_id)
-        if not col:
-            return None
-        value, _ = self._convert_type(row.get(col), DataType.FLOAT)
-        return value
 
 
 # ============================================================================
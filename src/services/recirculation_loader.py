@@ -160,9 +160,8 @@ class RecirculationVolumeLoader:
             logger.debug(f"[RECIRCULATION] _read_from_excel: Loading recirculation for {area_code}, {month}/{year}")
             logger.debug(f"[RECIRCULATION] Found {len(self._recirculation_config)} recirculation configs")
             
-            # Iterate through configured recirculation components
-            
-            # Iterate through configured recirculation components
+            # Group enabled components by sheet: one indexed lookup per sheet
+            columns_by_sheet: Dict[str, Dict[str, str]] = {}
             for config in self._recirculation_config:
                 component_id = config.get('component_id')
                 sheet_name = config.get('excel_sheet')
@@ -174,34 +173,36 @@ class RecirculationVolumeLoader:
                 if not enabled or not sheet_name or not column_name:
                     logger.debug(f"[RECIRCULATION] Skipped: enabled={enabled}")
                     continue
-                
-                # Load sheet and verify column exists
+                columns_by_sheet.setdefault(sheet_name, {})[component_id] = column_name
+            
+            for sheet_name, components in columns_by_sheet.items():
+                # Load sheet and verify columns exist
                 try:
                     df = self.excel_manager.load_flow_sheet(sheet_name)
-                    if column_name not in df.columns:
-                        logger.warning(f"[RECIRCULATION] Column not found in {sheet_name}: {column_name}")
-                        continue
                 except Exception as e:
                     logger.error(f"[RECIRCULATION] Error loading sheet {sheet_name}: {e}")
                     continue
+                for component_id, column_name in list(components.items()):
+                    if column_name not in df.columns:
+                        logger.warning(f"[RECIRCULATION] Column not found in {sheet_name}: {column_name}")
+                        del components[component_id]
                 
-                # Try to load volume from Excel
+                # Try to load volumes from Excel
                 try:
-                    volume = self.excel_manager.get_flow_volume(
-                        area_code_or_sheet=sheet_name,
-                        column_name=column_name,
-                        year=year,
-                        month=month
+                    sheet_volumes = self.excel_manager.get_flow_volumes(
+                        sheet_name, components.values(), year=year, month=month
                     )
-                    
+                except Exception as e:
+                    logger.error(f"[RECIRCULATION] Error loading volumes from {sheet_name}: {e}")
+                    continue
+                
+                for component_id, column_name in components.items():
+                    volume = sheet_volumes.get(column_name)
                     if volume is not None:
                         volumes[component_id] = volume
                         logger.debug(f"[RECIRCULATION] Loaded: {component_id} = {volume} m³")
                     else:
                         logger.warning(f"[RECIRCULATION] No volume found for {component_id}")
-                        
-                except Exception as e:
-                    logger.error(f"[RECIRCULATION] Error loading {component_id}: {e}")
             
             logger.debug(f"[RECIRCULATION] Loaded {len(volumes)} recirculation volumes for {area_code}")
             return volumes
@@ -424,7 +424,10 @@ class UpdateService(QObject):
             backup_name = f"water_balance.backup-{timestamp}"
             backup_path = self.backup_dir / backup_name
             
-            # Copy database
+            # Copy database (close pooled connections first so the WAL is
+            # checkpointed into the main file)
+            from database.db_manager import DatabaseManager
+            DatabaseManager.close_pool(self.db_path)
             shutil.copy2(self.db_path, backup_path)
             logger.info(f"Database backed up to {backup_path}")
             
@@ -468,6 +471,10 @@ class UpdateService(QObject):
                 logger.error(f"Backup not found: {backup_path}")
                 return False
             
+            # Release pooled connections to the file being replaced
+            from database.db_manager import DatabaseManager
+            DatabaseManager.close_pool(self.db_path)
+            
             # Remove current database
             if self.db_path.exists():
                 self.db_path.unlink()
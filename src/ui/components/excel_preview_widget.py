@@ -11,12 +11,17 @@ Users can:
 IMPORTANT:
 - This widget operates on the Flow Diagram Excel (timeseries_excel_path)
 - It does NOT touch the Meter Readings Excel file
+
+Large sheets: the table is a QTableView over a VirtualTableModel whose
+provider formats rows from ExcelManager's cached DataFrame on demand, so
+only the rows scrolled into view are ever turned into display text.
+Edits and added rows are kept as an overlay and only those cells are
+written back on save.
 """
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 from PySide6.QtWidgets import (
@@ -25,21 +30,184 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QMessageBox,
     QComboBox,
     QAbstractItemView,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QModelIndex
 from PySide6.QtGui import QColor, QBrush
 
 from services.excel_manager import get_excel_manager
+from ui.components.virtual_table_model import DataProvider, VirtualTableColumn, VirtualTableModel
+
+
+_TEXT_ROLES = frozenset({Qt.DisplayRole.value, Qt.EditRole.value})
+_BACKGROUND_ROLE = Qt.BackgroundRole.value
+_PREVIEW_ROLES = _TEXT_ROLES | {_BACKGROUND_ROLE, Qt.ForegroundRole.value}
+_MARKED_BACKGROUND = QBrush(QColor("#fff6a4"))
+_READONLY_BACKGROUND = QBrush(QColor("#eef2f7"))
+_MARKED_FOREGROUND = QBrush(QColor("#0f2747"))
+_READONLY_FOREGROUND = QBrush(QColor("#667085"))
+
+
+class FlowSheetDataProvider(DataProvider):
+    """Windowed rows from a cached Flow Diagram DataFrame (DISPLAY TEXT ON DEMAND).
+
+    Args:
+        df: Sheet DataFrame (ExcelManager cache; never modified).
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._columns = [str(col) for col in df.columns]
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    def get_total_rows(self) -> int:
+        return len(self._df)
+
+    def get_rows(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """Format rows [start, end) as display strings ("" for missing)."""
+        window = self._df.iloc[start:end]
+        columns = {
+            name: ["" if pd.isna(value) else str(value) for value in window.iloc[:, i].tolist()]
+            for i, name in enumerate(self._columns)
+        }
+        return [{name: columns[name][r] for name in self._columns} for r in range(len(window))]
+
+    def search(self, query: str, columns: List[str]) -> List[int]:
+        mask = pd.Series(False, index=range(len(self._df)))
+        for i, name in enumerate(self._columns):
+            if name in columns:
+                text = self._df.iloc[:, i].astype(str).reset_index(drop=True)
+                mask |= text.str.contains(query, case=False, regex=False)
+        return mask[mask].index.tolist()
+
+    def sort(self, column: str, ascending: bool) -> None:
+        # Rows map 1:1 to Excel rows for saving: the preview keeps sheet order
+        return None
+
+
+class FlowSheetTableModel(VirtualTableModel):
+    """Editable preview model: lazy sheet rows plus an edit/added-row overlay.
+
+    Args:
+        df: Sheet DataFrame from ExcelManager.
+        batch_size: Rows formatted per provider call.
+    """
+
+    def __init__(self, df: pd.DataFrame, batch_size: int = 100) -> None:
+        provider = FlowSheetDataProvider(df)
+        columns = [VirtualTableColumn(name=name, key=name) for name in provider.columns]
+        super().__init__(provider, columns, batch_size=batch_size)
+        self._edits: Dict[Tuple[int, int], str] = {}
+        self._added_rows: List[List[str]] = []
+        self._highlight_index: Optional[int] = None
+        self._editable_index: Optional[int] = None
+
+    # --- Qt model API -------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return self.total_rows + len(self._added_rows)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
+        # Called for every role of every visible cell: compare plain ints
+        role = int(role)
+        if role not in _PREVIEW_ROLES or not index.isValid():
+            return None
+        col = index.column()
+        if role in _TEXT_ROLES:
+            return self.cell_text(index.row(), col)
+        # Editable column (or, when nothing is editable, the mapped column) in yellow
+        marked = col == (self._editable_index if self._editable_index is not None else self._highlight_index)
+        if role == _BACKGROUND_ROLE:
+            return _MARKED_BACKGROUND if marked else _READONLY_BACKGROUND
+        return _MARKED_FOREGROUND if marked else _READONLY_FOREGROUND
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if index.isValid() and self._editable_index is not None and index.column() == self._editable_index:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self.set_cell_text(index.row(), index.column(), "" if value is None else str(value))
+        return True
+
+    # --- Preview API --------------------------------------------------
+    def headers(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def cell_text(self, row: int, col: int) -> str:
+        """Display text for a cell (edits and added rows take precedence)."""
+        if row >= self.total_rows:
+            return self._added_rows[row - self.total_rows][col]
+        edited = self._edits.get((row, col))
+        if edited is not None:
+            return edited
+        return self._get_row_data(row).get(self.columns[col].key, "")
+
+    def set_cell_text(self, row: int, col: int, text: str) -> None:
+        if row >= self.total_rows:
+            self._added_rows[row - self.total_rows][col] = text
+        else:
+            self._edits[(row, col)] = text
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+
+    def append_row(self) -> int:
+        """Append a blank row and return its index."""
+        row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._added_rows.append([""] * len(self.columns))
+        self.endInsertRows()
+        return row
+
+    def set_highlight_index(self, col: Optional[int]) -> None:
+        self._highlight_index = col
+        self._emit_all_changed()
+
+    def set_editable_index(self, col: Optional[int]) -> None:
+        self._editable_index = col
+        self._emit_all_changed()
+
+    def changed_cells(self) -> Iterator[Tuple[int, int, str]]:
+        """Yield (row, col, text) for edited cells and every cell of added rows."""
+        for (row, col), text in sorted(self._edits.items()):
+            yield row, col, text
+        for offset, values in enumerate(self._added_rows):
+            for col, text in enumerate(values):
+                yield self.total_rows + offset, col, text
+
+    def _emit_all_changed(self) -> None:
+        if self.rowCount() and self.columnCount():
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1)
+            )
+
+
+def _excel_cell_value(text: str) -> Any:
+    """Convert preview text to an Excel cell value (numbers stay numeric)."""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return int(number) if number.is_integer() and "." not in text else number
 
 
 class ExcelPreviewWidget(QWidget):
     """Spreadsheet-like preview and editor for Flow Diagram Excel data."""
 
+    # Rows sampled when auto-sizing columns
+    RESIZE_SAMPLE_ROWS = 50
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Initialize the preview widget and table controls.
 
@@ -66,9 +234,13 @@ class ExcelPreviewWidget(QWidget):
         self._label_title.setStyleSheet("font-weight: bold;")
         self._label_title.hide()  # Hidden by default until Excel data loads
 
-        self._table = QTableWidget()
-        self._table.setAlternatingRowColors(True)
-        self._table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.SelectedClicked)
+        self._model: Optional[FlowSheetTableModel] = None
+        self._table = QTableView()
+        self._table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked
+        )
+        # Size columns from the first window of rows, not the whole sheet
+        self._table.horizontalHeader().setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
 
         self._btn_add_row = QPushButton("Add Row")
         self._btn_save = QPushButton("Save Changes")
@@ -206,9 +378,8 @@ class ExcelPreviewWidget(QWidget):
 
     def _clear_table(self) -> None:
         """Clear the table contents."""
-        self._table.clear()
-        self._table.setRowCount(0)
-        self._table.setColumnCount(0)
+        self._model = None
+        self._table.setModel(None)
 
     def _get_header_index(self, header_name: str) -> Optional[int]:
         """Find the column index for a given header name.
@@ -219,118 +390,74 @@ class ExcelPreviewWidget(QWidget):
         Returns:
             Column index if found, otherwise None.
         """
-        for col in range(self._table.columnCount()):
-            item = self._table.horizontalHeaderItem(col)
-            if item and item.text().strip().lower() == header_name.lower():
+        if self._model is None:
+            return None
+        for col, header in enumerate(self._model.headers()):
+            if header.strip().lower() == header_name.lower():
                 return col
         return None
 
     def _populate_table(self, df: pd.DataFrame) -> None:
-        """Populate the table widget with DataFrame content.
+        """Show the DataFrame through a lazy table model.
 
         The table displays data starting from row index 0 (first data row),
-        with column headers shown separately in the table header.
+        with column headers shown separately in the table header. Cell text
+        is built only for rows the view requests.
 
         Args:
             df: DataFrame loaded from Flow Diagram Excel sheet.
         """
-        self._table.clear()
-        self._table.setColumnCount(len(df.columns))
-        self._table.setRowCount(len(df))
-        self._table.setHorizontalHeaderLabels([str(col) for col in df.columns])
-
-        # Populate table rows with actual data (not headers)
-        # df.iterrows() returns (index, row) - we use enumerate to get sequential row numbers
-        for display_row_idx, (df_index, row) in enumerate(df.iterrows()):
-            for col_idx, col_name in enumerate(df.columns):
-                value = row[col_name]
-                display = "" if pd.isna(value) else str(value)
-                item = QTableWidgetItem(display)
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
-                # Use display_row_idx (0, 1, 2...) instead of df_index
-                self._table.setItem(display_row_idx, col_idx, item)
-
+        self._model = FlowSheetTableModel(df)
+        self._table.setModel(self._model)
         self._table.resizeColumnsToContents()
         self._apply_edit_permissions()
 
     def _apply_highlight(self) -> None:
         """Apply column highlight styling if requested."""
-        if not self._highlight_column:
-            self._clear_column_highlight()
-            self._apply_edit_permissions()
+        if self._model is None:
             return
+        col_index = self._highlight_index()
+        self._model.set_highlight_index(col_index)
 
-        headers = [self._table.horizontalHeaderItem(i).text()
-                   for i in range(self._table.columnCount())]
-        if self._highlight_column not in headers:
-            self._clear_column_highlight()
-            self._apply_edit_permissions()
-            return
-
-        self._clear_column_highlight()
-        col_index = headers.index(self._highlight_column)
-        for row in range(self._table.rowCount()):
-            item = self._table.item(row, col_index)
-            if item:
-                item.setBackground(QBrush(QColor("#fff6a4")))
-
-        # Ensure the highlighted column is visible for the user.
-        # UX rule: keep mapping column in view so the yellow highlight is obvious.
-        first_item = self._table.item(0, col_index) if self._table.rowCount() else None
-        if first_item:
-            self._table.scrollToItem(first_item, QAbstractItemView.PositionAtCenter)
+        if col_index is not None and self._model.rowCount():
+            # Ensure the highlighted column is visible for the user.
+            # UX rule: keep mapping column in view so the yellow highlight is obvious.
+            self._table.scrollTo(self._model.index(0, col_index), QAbstractItemView.PositionAtCenter)
 
         self._apply_edit_permissions()
 
-    def _clear_column_highlight(self) -> None:
-        """Remove any existing column highlight styling."""
-        for row in range(self._table.rowCount()):
-            for col in range(self._table.columnCount()):
-                item = self._table.item(row, col)
-                if item:
-                    item.setBackground(QBrush(QColor("#ffffff")))
+    def _highlight_index(self) -> Optional[int]:
+        """Column index of the highlight column (exact header match)."""
+        if self._model is None or not self._highlight_column:
+            return None
+        headers = self._model.headers()
+        if self._highlight_column not in headers:
+            return None
+        return headers.index(self._highlight_column)
 
     def _apply_edit_permissions(self) -> None:
         """Apply editable/read-only flags with visual affordance by column."""
+        if self._model is None:
+            return
         editable_index: Optional[int] = None
         if self._editable_column:
             editable_index = self._get_header_index(self._editable_column)
-
-        for row in range(self._table.rowCount()):
-            for col in range(self._table.columnCount()):
-                item = self._table.item(row, col)
-                if not item:
-                    continue
-
-                is_editable_col = editable_index is not None and col == editable_index
-                base_flags = item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled
-                if is_editable_col:
-                    item.setFlags(base_flags | Qt.ItemIsEditable)
-                    item.setForeground(QBrush(QColor("#0f2747")))
-                    item.setBackground(QBrush(QColor("#fff6a4")))
-                else:
-                    item.setFlags(base_flags & ~Qt.ItemIsEditable)
-                    item.setForeground(QBrush(QColor("#667085")))
-                    item.setBackground(QBrush(QColor("#eef2f7")))
+        self._model.set_editable_index(editable_index)
 
     def _on_add_row(self) -> None:
         """Insert a blank row at the end of the table."""
-        if not self._add_row_enabled:
+        if not self._add_row_enabled or self._model is None:
             return
 
-        row_idx = self._table.rowCount()
-        self._table.insertRow(row_idx)
+        row_idx = self._model.append_row()
 
         year_col = self._get_header_index("Year")
         month_col = self._get_header_index("Month")
 
         if year_col is not None and month_col is not None and row_idx > 0:
-            prev_year_item = self._table.item(row_idx - 1, year_col)
-            prev_month_item = self._table.item(row_idx - 1, month_col)
-
             try:
-                prev_year = int(prev_year_item.text()) if prev_year_item else 0
-                prev_month = int(prev_month_item.text()) if prev_month_item else 0
+                prev_year = int(float(self._model.cell_text(row_idx - 1, year_col) or 0))
+                prev_month = int(float(self._model.cell_text(row_idx - 1, month_col) or 0))
             except ValueError:
                 prev_year = 0
                 prev_month = 0
@@ -342,10 +469,10 @@ class ExcelPreviewWidget(QWidget):
                     next_month = 1
                     next_year += 1
 
-                self._table.setItem(row_idx, year_col, QTableWidgetItem(str(next_year)))
-                self._table.setItem(row_idx, month_col, QTableWidgetItem(str(next_month)))
+                self._model.set_cell_text(row_idx, year_col, str(next_year))
+                self._model.set_cell_text(row_idx, month_col, str(next_month))
 
-        self._apply_edit_permissions()
+        self._table.scrollToBottom()
 
     def _on_save(self) -> None:
         """Save table contents back to the Flow Diagram Excel sheet."""
@@ -358,15 +485,12 @@ class ExcelPreviewWidget(QWidget):
             QMessageBox.warning(self, "Save", "Flow Diagram Excel file not found.")
             return
 
-        headers = [self._table.horizontalHeaderItem(i).text()
-                   for i in range(self._table.columnCount())]
-        data: List[List[object]] = []
-        for row in range(self._table.rowCount()):
-            row_values = []
-            for col in range(self._table.columnCount()):
-                item = self._table.item(row, col)
-                row_values.append(item.text() if item else "")
-            data.append(row_values)
+        if self._model is None:
+            QMessageBox.warning(self, "Save", "No sheet loaded for saving.")
+            return
+
+        headers = self._model.headers()
+        changes = list(self._model.changed_cells())
 
         try:
             from openpyxl import load_workbook
@@ -385,21 +509,15 @@ class ExcelPreviewWidget(QWidget):
 
             if editable_index is not None:
                 # Flowline-only safeguard: persist only the selected mapped column.
-                excel_col = editable_index + 1
-                for row_offset, row_values in enumerate(data, start=1):
-                    ws.cell(
-                        row=header_row + row_offset,
-                        column=excel_col,
-                        value=row_values[editable_index],
-                    )
+                changes = [change for change in changes if change[1] == editable_index]
             else:
                 # Default behavior for unrestricted modes.
                 for col_idx, header in enumerate(headers, start=1):
                     ws.cell(row=header_row, column=col_idx, value=header)
 
-                for row_offset, row_values in enumerate(data, start=1):
-                    for col_idx, value in enumerate(row_values, start=1):
-                        ws.cell(row=header_row + row_offset, column=col_idx, value=value)
+            # Only edited cells and added rows are written (untouched cells keep their types)
+            for row, col, text in changes:
+                ws.cell(row=header_row + row + 1, column=col + 1, value=_excel_cell_value(text))
 
             wb.save(file_path)
             wb.close()
@@ -736,10 +736,7 @@ class FlowEdgeItem(QGraphicsPathItem, QObject):
         self.volume_label.setDefaultTextColor(QColor("#0D47A1"))
         
         # Background for readability (semi-transparent white)
-        self.volume_label.setHtml(
-            f'<div style="background-color: rgba(255, 255, 255, 0.85); '
-            f'padding: 2px 4px; border-radius: 3px;">{volume_text}</div>'
-        )
+        self._set_volume_label_text(volume_text)
         
         # Z-value: Above everything (edges=0, nodes=1, anchors=5, labels=10)
         self.volume_label.setZValue(10)
@@ -1199,8 +1196,20 @@ class FlowEdgeItem(QGraphicsPathItem, QObject):
         """
         self.edge_data['volume'] = volume
         volume_text = f"{volume:.1f} m³"
-        self.volume_label.setPlainText(volume_text)
+        self._set_volume_label_text(volume_text)
+
+        # Re-centre the label (its width depends on the text)
+        path = self.path()
+        if path.elementCount() > 0:
+            self._update_label_position(path.pointAtPercent(0.0), path.pointAtPercent(1.0))
         logger.debug(f"Updated edge volume to {volume} m³")
+
+    def _set_volume_label_text(self, volume_text: str):
+        """Set label text with the readable background used on first render."""
+        self.volume_label.setHtml(
+            f'<div style="background-color: rgba(255, 255, 255, 0.85); '
+            f'padding: 2px 4px; border-radius: 3px;">{volume_text}</div>'
+        )
     
     def __repr__(self) -> str:
         return (f"FlowEdgeItem({self.edge_data['from_id']} → "
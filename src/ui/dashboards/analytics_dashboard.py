@@ -596,8 +596,16 @@ class AnalyticsPage(QWidget):
         list_widget = QListWidget(dialog)
         list_widget.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
 
+        catalog = self._excel_manager.get_source_catalog()
         for src in sources:
             item = QListWidgetItem(src)
+            info = catalog.get(src)
+            if info is not None:
+                unit = f" ({info.unit})" if info.unit else ""
+                item.setToolTip(
+                    f"{info.non_null_count} readings{unit}, "
+                    f"{info.first_date or '-'} to {info.last_date or '-'}"
+                )
             if src in self._selected_sources:
                 item.setSelected(True)
             list_widget.addItem(item)
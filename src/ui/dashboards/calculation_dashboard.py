@@ -10,8 +10,10 @@ Purpose:
 Data Flow:
 1. User selects month/year and clicks "Calculate Balance"
 2. calculate_btn.clicked → _on_calculate()
-3. _on_calculate() → calls BalanceService.calculate_for_date()
-4. Results returned as BalanceResult with all balance data
+3. _on_calculate() → CalculationWorker (QThread) runs pre-checks, then
+   BalanceService.calculate_with_cascade() with per-stage progress
+   (later months whose openings depend on this one are recomputed too)
+4. Results returned as BalanceResult via the worker's finished signal
 5. _populate_tabs() distributes data to each tab
 6. UI displays results with KPI cards and status indicators
 
@@ -40,17 +42,22 @@ from PySide6.QtWidgets import (
     QGraphicsDropShadowEffect, QFileDialog, QLineEdit, QPushButton,
     QComboBox, QToolTip, QScroller
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QObject, QThread, Signal
 from PySide6.QtGui import QColor, QFont, QPainter, QBrush, QPen, QCursor
 from PySide6.QtCharts import QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
 from ui.dashboards.generated_ui_calculation import Ui_Form
 import calendar
 from datetime import date, datetime
 import logging
+import threading
 from html import escape
+from typing import Any, Callable, Optional
 
 # Import calculation services
-from services.calculation.balance_service import get_balance_service, BalanceService, EXCEL_COLUMNS
+from services.calculation.balance_service import (
+    get_balance_service, BalanceService, EXCEL_COLUMNS, ProgressCallback
+)
+from services.calculation.interfaces import CalculationCancelled
 from services.calculation.days_of_operation_service import get_days_of_operation_service
 from services.calculation.models import BalanceResult, CalculationPeriod, DataQualityFlags
 
@@ -83,6 +90,62 @@ STATUS_THEMES = {
 }
 
 
+class CalculationWorker(QObject):
+    """Background worker for calculation page jobs (KEEPS UI RESPONSIVE).
+
+    Runs one task callable in a QThread. The task receives a progress
+    callback (stage, percent) that it passes to the balance service; once
+    cancel() has been requested the callback raises CalculationCancelled,
+    so the service stops at the next stage without saving the month.
+    UI updates happen on the main thread via signals.
+    """
+
+    progress = Signal(str, int)
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, task: Callable[[ProgressCallback], Any]) -> None:
+        """Initialize worker with the task to run.
+
+        Args:
+            task: Callable taking a progress callback; its return value is
+                emitted via finished.
+        """
+        super().__init__()
+        self._task = task
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation (thread-safe; honoured at the next stage)."""
+        self._cancel_event.set()
+
+    def _report(self, stage: str, percent: int) -> None:
+        """Progress callback handed to the task (WORKER THREAD)."""
+        if self._cancel_event.is_set():
+            raise CalculationCancelled("Calculation cancelled by user", component="CalculationWorker")
+        self.progress.emit(stage, percent)
+
+    def run(self) -> None:
+        """Run the task in the worker thread.
+
+        Emits:
+            finished: Task return value.
+            failed: Error string if the task raised.
+            cancelled: If cancel() stopped the task.
+        """
+        try:
+            result = self._task(self._report)
+        except CalculationCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as exc:
+            logger.error(f"Calculation job failed: {exc}", exc_info=True)
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit(result)
+
+
 class CalculationPage(QWidget):
     """Water Balance Calculations Dashboard (MAIN CALCULATION UI).
     
@@ -130,6 +193,11 @@ class CalculationPage(QWidget):
         # Track if tabs are set up
         self._tabs_initialized = False
         
+        # Background calculation job (pre-checks, then the balance calculation)
+        self._calc_thread: Optional[QThread] = None
+        self._calc_worker: Optional[CalculationWorker] = None
+        self._calc_on_finished = None
+        
         # Connect signals to slots
         self._connect_signals()
 
@@ -279,6 +347,21 @@ class CalculationPage(QWidget):
             else:
                 self.ui.horizontalLayout_2.addWidget(self.calc_latest_period_label)
 
+            # Progress for background calculations (hidden while idle)
+            self.calc_progress_bar = QProgressBar()
+            self.calc_progress_bar.setObjectName("calc_progress_bar")
+            self.calc_progress_bar.setRange(0, 100)
+            self.calc_progress_bar.setMinimumWidth(220)
+            self.calc_progress_bar.setMaximumHeight(22)
+            self.calc_progress_bar.setVisible(False)
+            if hasattr(self.ui, "pushButton"):
+                self.ui.horizontalLayout_2.insertWidget(
+                    self.ui.horizontalLayout_2.indexOf(self.ui.pushButton),
+                    self.calc_progress_bar
+                )
+            else:
+                self.ui.horizontalLayout_2.addWidget(self.calc_progress_bar)
+
         self._refresh_meter_excel_path_display()
 
     def _refresh_meter_excel_path_display(self) -> None:
@@ -404,11 +487,20 @@ class CalculationPage(QWidget):
         Workflow:
         1. Get selected month/year from comboboxes
         2. Validate input
-        3. CHECK DATA QUALITY & REQUIRED FILES (NEW)
-        4. Call BalanceService.calculate_for_date()
-        5. Populate tabs with BalanceResult
+        3. CHECK DATA QUALITY & REQUIRED FILES (background job)
+        4. Call BalanceService.calculate_with_cascade() (background job,
+           recomputes the later months whose openings the result moved)
+        5. Populate tabs with BalanceResult (via worker finished signal)
         6. Show success/error message
+        
+        While a job runs the button becomes "Cancel"; clicking it again
+        cancels the calculation at the next stage.
         """
+        # Second click while a job runs cancels it
+        if self._calc_worker is not None:
+            self._cancel_calculation()
+            return
+        
         # Get selected month and year
         try:
             year_str = self.ui.comboBox.currentText()  # e.g., "2025"
@@ -429,100 +521,234 @@ class CalculationPage(QWidget):
                 return
             
             year = int(year_str)
-
-            # HARD STOP: selected period must exist in Meter Readings data.
-            period_ok, period_msg = self._validate_period_against_meter_data(year, month)
-            if not period_ok:
-                QMessageBox.warning(self, "Calculation Blocked", period_msg)
-                logger.warning(f"Calculation blocked for {year}-{month:02d}: {period_msg}")
-                return
-            
-            # VALIDATE DATA QUALITY BEFORE CALCULATION (NEW)
-            data_check = self._validate_data_completeness()
-            if not data_check['is_complete']:
-                # Show warning with missing items
-                missing_list = "\n".join([f"  • {item}" for item in data_check['missing']])
-                response = QMessageBox.warning(
-                    self, 
-                    "⚠ Missing Data",
-                    f"The following required data is missing or incomplete:\n\n{missing_list}\n\n"
-                    f"This will result in INCORRECT calculation results.\n\n"
-                    f"Do you want to continue anyway?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if response != QMessageBox.Yes:
-                    logger.warning(f"User cancelled calculation due to missing data")
-                    return
             
             # Log the calculation request
             logger.info(f"User requested balance calculation for {month_str} {year}")
             
-            # Disable button during calculation
-            if hasattr(self.ui, 'pushButton'):
-                self.ui.pushButton.setEnabled(False)
-                self.ui.pushButton.setText("Calculating...")
-            
-            try:
-                # Call the balance service
-                result = self.balance_service.calculate_for_date(
-                    month=month,
-                    year=year,
-                    mode="REGULATOR"
-                )
-                
-                # Store result for other tabs
-                self.current_results = result
-                
-                # Populate tabs with real data
-                self._populate_tabs_from_result(result)
-                
-                # Show success message with summary (updated to include data quality warnings)
-                status_icon = "✓" if result.is_balanced else "⚠"
-                summary_msg = (
-                    f"{status_icon} Water Balance for {result.period.period_label}\n\n"
-                    f"Fresh Inflows:  {result.inflows.total_m3:,.0f} m³\n"
-                    f"Total Outflows: {result.outflows.total_m3:,.0f} m³\n"
-                    f"Storage Change: {result.storage.delta_m3:,.0f} m³\n"
-                    f"Balance Error:  {result.error_pct:.2f}%\n\n"
-                    f"Status: {result.status}"
-                )
-                
-                # Add quality warnings if present
-                if result.quality_flags and result.quality_flags.warnings:
-                    summary_msg += (
-                        f"\n\n⚠ Data Quality Warnings ({len(result.quality_flags.warnings)}):\n"
-                        + "\n".join([f"  • {w}" for w in list(result.quality_flags.warnings)[:5]])
-                    )
-                    if len(result.quality_flags.warnings) > 5:
-                        summary_msg += f"\n  ... and {len(result.quality_flags.warnings) - 5} more"
-                
-                QMessageBox.information(self, "Calculation Complete", summary_msg)
-
-                
-                logger.info(f"Balance calculation complete: {result.status} "
-                           f"(error={result.error_pct:.1f}%)")
-                
-            finally:
-                # Re-enable button
-                if hasattr(self.ui, 'pushButton'):
-                    self.ui.pushButton.setEnabled(True)
-                    self.ui.pushButton.setText("Calculate Balance")
+            # Pre-checks load the Meter Readings workbook, so run them off the UI thread
+            self._start_calc_job(
+                lambda report: self._run_prechecks(year, month, report),
+                lambda checks: self._on_prechecks_finished(year, month, checks),
+            )
             
         except Exception as e:
             logger.error(f"Balance calculation failed: {e}", exc_info=True)
             QMessageBox.critical(self, "Calculation Error", 
                 f"Balance calculation failed:\n\n{str(e)}\n\n"
                 f"Check the logs for details.")
-            
-            # Re-enable button on error
-            if hasattr(self.ui, 'pushButton'):
-                self.ui.pushButton.setEnabled(True)
-                self.ui.pushButton.setText("Calculate Balance")
-
+            self._set_calculating_state(False)
+    
+    def _run_prechecks(self, year: int, month: int, report) -> dict:
+        """Run period and data completeness checks (WORKER THREAD).
+        
+        Args:
+            year: Selected year
+            month: Selected month (1-12)
+            report: Worker progress callback (stage, percent)
+        
+        Returns:
+            Dict with 'period_ok', 'period_msg' and 'data_check'
+        """
+        report("Checking Meter Readings", 0)
+        period_ok, period_msg = self._validate_period_against_meter_data(year, month)
+        data_check = {'is_complete': True, 'missing': []}
+        if period_ok:
+            report("Checking required data", 50)
+            data_check = self._validate_data_completeness()
+        return {'period_ok': period_ok, 'period_msg': period_msg, 'data_check': data_check}
+    
+    def _on_prechecks_finished(self, year: int, month: int, checks: dict) -> None:
+        """Confirm pre-check results and start the calculation job (UI THREAD)."""
+        # HARD STOP: selected period must exist in Meter Readings data.
+        if not checks['period_ok']:
+            QMessageBox.warning(self, "Calculation Blocked", checks['period_msg'])
+            logger.warning(f"Calculation blocked for {year}-{month:02d}: {checks['period_msg']}")
+            return
+        
+        # VALIDATE DATA QUALITY BEFORE CALCULATION
+        data_check = checks['data_check']
+        if not data_check['is_complete']:
+            # Show warning with missing items
+            missing_list = "\n".join([f"  • {item}" for item in data_check['missing']])
+            response = QMessageBox.warning(
+                self, 
+                "⚠ Missing Data",
+                f"The following required data is missing or incomplete:\n\n{missing_list}\n\n"
+                f"This will result in INCORRECT calculation results.\n\n"
+                f"Do you want to continue anyway?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if response != QMessageBox.Yes:
+                logger.warning(f"User cancelled calculation due to missing data")
+                return
+        
+        # Resolve the service here so the singleton is created on the UI thread
+        service = self.balance_service
+        period = CalculationPeriod(month=month, year=year)
+        
+        # Call the balance service (also recomputes affected later months)
+        self._start_calc_job(
+            lambda report: service.calculate_with_cascade(period, mode="REGULATOR", progress=report),
+            self._on_calculation_finished,
+        )
+    
+    def _on_calculation_finished(self, payload: tuple) -> None:
+        """Show a finished calculation (UI THREAD, via worker finished signal).
+        
+        Args:
+            payload: (BalanceResult, list of downstream BalanceResults)
+        """
+        result, downstream = payload
+        
+        # Store result for other tabs
+        self.current_results = result
+        
+        # Populate tabs with real data
+        self._populate_tabs_from_result(result)
+        
+        # Show success message with summary (updated to include data quality warnings)
+        status_icon = "✓" if result.is_balanced else "⚠"
+        summary_msg = (
+            f"{status_icon} Water Balance for {result.period.period_label}\n\n"
+            f"Fresh Inflows:  {result.inflows.total_m3:,.0f} m³\n"
+            f"Total Outflows: {result.outflows.total_m3:,.0f} m³\n"
+            f"Storage Change: {result.storage.delta_m3:,.0f} m³\n"
+            f"Balance Error:  {result.error_pct:.2f}%\n\n"
+            f"Status: {result.status}"
+        )
+        
+        # Add quality warnings if present
+        if result.quality_flags and result.quality_flags.warnings:
+            summary_msg += (
+                f"\n\n⚠ Data Quality Warnings ({len(result.quality_flags.warnings)}):\n"
+                + "\n".join([f"  • {w}" for w in list(result.quality_flags.warnings)[:5]])
+            )
+            if len(result.quality_flags.warnings) > 5:
+                summary_msg += f"\n  ... and {len(result.quality_flags.warnings) - 5} more"
+        
+        if downstream:
+            months = ", ".join(r.period.period_short for r in downstream)
+            summary_msg += f"\n\n↻ Also recalculated {len(downstream)} affected month(s): {months}"
+            logger.info(f"Cascade recalculated {len(downstream)} months: {months}")
+        
+        QMessageBox.information(self, "Calculation Complete", summary_msg)
+        
+        logger.info(f"Balance calculation complete: {result.status} "
+                   f"(error={result.error_pct:.1f}%)")
+    
+    def _start_calc_job(self, task, on_finished) -> None:
+        """Run task on a background QThread and route its result to on_finished.
+        
+        Args:
+            task: Callable taking a progress callback (runs on the worker thread)
+            on_finished: UI-thread handler receiving the task's return value
+        """
+        self._calc_on_finished = on_finished
+        self._calc_worker = CalculationWorker(task)
+        self._calc_thread = QThread(self)
+        self._calc_worker.moveToThread(self._calc_thread)
+        
+        self._calc_thread.started.connect(self._calc_worker.run)
+        self._calc_worker.progress.connect(self._on_calc_progress)
+        self._calc_worker.finished.connect(self._on_calc_job_finished)
+        self._calc_worker.failed.connect(self._on_calc_job_failed)
+        self._calc_worker.cancelled.connect(self._on_calc_job_cancelled)
+        
+        self._set_calculating_state(True)
+        self._calc_thread.start()
+    
+    def _cancel_calculation(self) -> None:
+        """Request cancellation of the running job (takes effect at the next stage)."""
+        if self._calc_worker is None:
+            return
+        logger.info("User cancelled balance calculation")
+        self._calc_worker.cancel()
+        if hasattr(self.ui, 'pushButton'):
+            self.ui.pushButton.setEnabled(False)
+            self.ui.pushButton.setText("Cancelling...")
+    
+    def _on_calc_progress(self, stage: str, percent: int) -> None:
+        """Show worker progress in the control bar (UI THREAD)."""
+        if hasattr(self, 'calc_progress_bar'):
+            self.calc_progress_bar.setValue(percent)
+            self.calc_progress_bar.setFormat(f"{stage}... %p%")
+    
+    def _on_calc_job_finished(self, payload) -> None:
+        """Release the finished job, then hand its result to the job's handler."""
+        handler = self._calc_on_finished
+        self._release_calc_job()
+        self._set_calculating_state(False)
+        try:
+            if handler:
+                handler(payload)
+        except Exception as e:
+            logger.error(f"Balance calculation failed: {e}", exc_info=True)
+            QMessageBox.critical(self, "Calculation Error", 
+                f"Balance calculation failed:\n\n{str(e)}\n\n"
+                f"Check the logs for details.")
+    
+    def _on_calc_job_failed(self, error_message: str) -> None:
+        """Report a failed background job (UI THREAD)."""
+        self._release_calc_job()
+        self._set_calculating_state(False)
+        QMessageBox.critical(self, "Calculation Error", 
+            f"Balance calculation failed:\n\n{error_message}\n\n"
+            f"Check the logs for details.")
+    
+    def _on_calc_job_cancelled(self) -> None:
+        """Reset the page after a cancelled job (UI THREAD)."""
+        self._release_calc_job()
+        self._set_calculating_state(False)
+        logger.info("Balance calculation cancelled; no results saved for the selected month")
+    
+    def _release_calc_job(self) -> None:
+        """Stop the job thread and schedule worker/thread deletion."""
+        thread, worker = self._calc_thread, self._calc_worker
+        self._calc_thread = None
+        self._calc_worker = None
+        self._calc_on_finished = None
+        if thread is not None:
+            thread.quit()
+            thread.wait(5000)
+            thread.deleteLater()
+        if worker is not None:
+            worker.deleteLater()
+    
+    def _set_calculating_state(self, busy: bool) -> None:
+        """Toggle Calculate/Cancel button, date selectors and progress bar."""
+        if hasattr(self.ui, 'pushButton'):
+            self.ui.pushButton.setEnabled(True)
+            self.ui.pushButton.setText("Cancel" if busy else "Calculate Balance")
+        for combo in ('comboBox', 'comboBox_2'):
+            if hasattr(self.ui, combo):
+                getattr(self.ui, combo).setEnabled(not busy)
+        if hasattr(self, 'calc_progress_bar'):
+            self.calc_progress_bar.setValue(0)
+            self.calc_progress_bar.setFormat("%p%")
+            self.calc_progress_bar.setVisible(busy)
+    
+    def stop_background_tasks(self) -> None:
+        """Cancel and stop any running calculation job (SHUTDOWN SAFETY).
+        
+        Called by the main window during app exit so neither the worker
+        thread nor the balance service's stage threads outlive the page.
+        """
+        if self._calc_worker is not None:
+            self._calc_worker.cancel()
+        if self._calc_thread and self._calc_thread.isRunning():
+            logger.info("Stopping calculation worker on exit")
+            self._calc_thread.quit()
+            stopped = self._calc_thread.wait(5000)
+            if not stopped and self._calc_thread.isRunning():
+                logger.warning(
+                    "Calculation worker did not stop in time; leaving graceful shutdown path"
+                )
+        if self._balance_service is not None:
+            self._balance_service.shutdown()
+    
     def _validate_period_against_meter_data(self, year: int, month: int) -> tuple[bool, str]:
         """Ensure selected period is available in Meter Readings."""
         try:
-            import pandas as pd
             from services.excel_manager import get_excel_manager
 
             excel_mgr = get_excel_manager()
@@ -533,9 +759,6 @@ class CalculationPage(QWidget):
             if meter_data is None or meter_data.empty:
                 return False, "Meter Readings file is empty. Load data before calculation."
 
-            if "Date" not in meter_data.columns:
-                return False, "Meter Readings file has no Date column. Cannot validate month."
-
             min_date, max_date = excel_mgr.get_meter_readings_date_range()
             if min_date is None or max_date is None:
                 return False, "Could not determine Meter Readings date range."
@@ -550,9 +773,9 @@ class CalculationPage(QWidget):
                 )
 
             # Ensure at least one row exists for selected month/year.
-            dates = meter_data["Date"]
-            if not hasattr(dates, "dt"):
-                dates = pd.to_datetime(dates, errors="coerce")
+            dates = excel_mgr.get_meter_dates(meter_data)
+            if dates is None:
+                return False, "Meter Readings file has no Date column. Cannot validate month."
             month_mask = (dates.dt.year == year) & (dates.dt.month == month)
             if not month_mask.any():
                 return (
@@ -1875,13 +2098,11 @@ class CalculationPage(QWidget):
 
             tonnes_milled = 0.0
             if excel:
-                series = excel.get_meter_readings_series(
-                    EXCEL_COLUMNS["tonnes_milled"],
-                    start_date=result.period.start_date,
-                    end_date=result.period.end_date
-                )
-                if series and series[0][1] is not None:
-                    tonnes_milled = float(series[0][1])
+                value = excel.get_meter_values(
+                    result.period, [EXCEL_COLUMNS["tonnes_milled"]]
+                )[EXCEL_COLUMNS["tonnes_milled"]]
+                if value is not None:
+                    tonnes_milled = value
 
             dust_rate_l_per_t = float(getattr(constants, "dust_suppression_rate_l_per_t", 1.0))
             dust_m3 = float(result.outflows.components.get("dust_suppression", 0.0))
@@ -3362,60 +3362,27 @@ class FlowDiagramPage(QWidget):
                 )
                 return
             
-            # Load data for each mapped flow
-            updated_count = 0
-            errors = []
+            # Resolve all mapped flows (one lookup per sheet)
+            resolved = excel_mgr.resolve_diagram_volumes(self.diagram_data, year, month)
+            updated_count = len(resolved.volumes)
+            errors = resolved.warnings
             
-            for edge in self.diagram_data.get('edges', []):
-                excel_mapping = edge.get('excel_mapping', {})
-                if not excel_mapping or not excel_mapping.get('sheet') or not excel_mapping.get('column'):
-                    continue  # Skip unmapped flows
-                
-                sheet_name = excel_mapping['sheet']
-                column_name = excel_mapping['column']
-                
-                try:
-                    # Load sheet data
-                    df = excel_mgr.load_flow_sheet(sheet_name)
-                    if df.empty:
-                        continue
-                    
-                    # Filter by year and month
-                    df_filtered = df[(df['Year'] == year) & (df['Month'] == month)]
-                    
-                    if df_filtered.empty:
-                        errors.append(f"No data for {year}/{month} in sheet '{sheet_name}'")
-                        continue
-                    
-                    # Get volume value
-                    if column_name in df_filtered.columns:
-                        volume_value = df_filtered[column_name].iloc[0]
-                        if pd.notna(volume_value):
-                            edge['volume'] = float(volume_value)
-                            updated_count += 1
-                        else:
-                            errors.append(f"Empty value for '{column_name}' in {year}/{month}")
-                    else:
-                        errors.append(f"Column '{column_name}' not found in sheet '{sheet_name}'")
-                
-                except Exception as e:
-                    errors.append(f"Error loading '{column_name}': {str(e)}")
-            
-            # Re-render diagram to show updated volumes
-            if updated_count > 0:
-                self._excel_data_loaded_for_session = True
-                self._refresh_excel_state_badge()
-                # CRITICAL ORDER: First re-render diagram (creates node_items),
-                # THEN load recirculation data into those newly created nodes
-                self._render_diagram()
-                # Now load recirculation data for the selected month/year
-                self._load_and_display_recirculation()
+            edges = self.diagram_data.get('edges', [])
+            for edge_idx, volume in resolved.volumes.items():
+                edges[edge_idx]['volume'] = volume
+            
+            self._excel_data_loaded_for_session = updated_count > 0
+            self._refresh_excel_state_badge()
+            if self.edge_items:
+                # Scene already built: refresh only the affected edge labels
+                for edge_item in self.edge_items:
+                    volume = resolved.volumes.get(edge_item.edge_idx)
+                    if volume is not None:
+                        edge_item.update_volume(volume)
             else:
-                self._excel_data_loaded_for_session = False
-                self._refresh_excel_state_badge()
-                # Even if no flows updated, still refresh diagram and recirculation
                 self._render_diagram()
-                self._load_and_display_recirculation()
+            # Load recirculation data into the existing node items
+            self._load_and_display_recirculation()
             
             # AUTO-UPDATE BALANCE CHECK: Calculate and update footer labels
             # This automatically shows balance metrics without opening the dialog
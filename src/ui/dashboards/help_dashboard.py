@@ -833,14 +833,11 @@ class HelpPage(QWidget):
         try:
             from services.calculation.balance_service import get_balance_service
 
-            service = get_balance_service()
-            cache = getattr(service, "_cache", {}) or {}
-            if not cache:
+            # Use the most recently cached result to avoid recomputation side effects.
+            result = get_balance_service().get_latest_cached_result()
+            if result is None:
                 raise ValueError("No cached balance results available")
 
-            # Use the most recently inserted cached result to avoid recomputation side effects.
-            result = list(cache.values())[-1]
-
             inflows = float(result.inflows.total_m3 or 0.0)
             outflows = float(result.outflows.total_m3 or 0.0)
             delta_s = float(result.storage.delta_m3 or 0.0)
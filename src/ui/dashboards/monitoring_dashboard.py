@@ -17,8 +17,8 @@ Structure:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Dict
-import os
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 from PySide6.QtCore import Qt, QDateTime, QDate, QTimer, QSizeF, QRect, QSize
 from PySide6.QtGui import QStandardItem, QStandardItemModel, QPainter, QPdfWriter, QPageSize, QIcon
 from PySide6.QtWidgets import (
@@ -43,7 +43,10 @@ import pandas as pd
 from services.excel_manager import get_excel_manager
 
 # Import directory loader for background Excel loading (QThread-based, non-blocking UI)
-from services.directory_loader import DirectoryLoaderThread
+from services.directory_loader import (
+    DirectoryLoaderThread, FolderSnapshot, default_parallel_workers, monitoring_parser_version,
+)
+from services.monitoring_cache import get_monitoring_cache
 
 # Import config manager for directory persistence
 from core.config_manager import ConfigManager
@@ -312,17 +315,15 @@ class MonitoringPage(QWidget):
         # Note: Full DataFrame is kept in memory for filters/visualizations.
         self._table_preview_max_rows: int = 5000
         
-        # Cache infrastructure (HYBRID: memory + disk persistence)
-        # Use user data directory for packaged builds
-        user_dir = os.environ.get('WATERBALANCE_USER_DIR')
-        if user_dir:
-            self._cache_dir = Path(user_dir) / 'data' / '.cache' / 'monitoring'
-        else:
-            self._cache_dir = Path(config.get('data_sources.base_path', 'data')) / '.cache' / 'monitoring'
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._memory_cache: Dict[str, Dict] = {}  # {file_path: {mtime, dataframe, rows}}
+        # Cache infrastructure (shared monitoring parse cache: LRU memory + disk)
+        self._cache = get_monitoring_cache()
         self._cache_enabled: bool = True  # Toggle for troubleshooting
         
+        # Last load of each tab's folder (reloads only parse new/changed files)
+        self._folder_snapshots: Dict[str, FolderSnapshot] = {
+            name: FolderSnapshot() for name in ("static_boreholes", "borehole_monitoring", "pcd_monitoring")
+        }
+        
         # Multi-select state tracking for charts
         self._selected_boreholes: list = []  # For static levels (already exists)
         self._selected_monitoring_boreholes: list = []  # For borehole monitoring
@@ -383,6 +384,13 @@ class MonitoringPage(QWidget):
         self._startup_autoload_done = False
         QTimer.singleShot(250, self._load_saved_directories)
 
+        # Periodic rescan of loaded folders (config monitoring.auto_refresh_minutes, 0 = off)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.timeout.connect(self._refresh_changed_folders)
+        refresh_minutes = self._auto_refresh_minutes()
+        if refresh_minutes > 0:
+            self._refresh_timer.start(int(refresh_minutes * 60_000))
+
     def _style_visualization_action_buttons(self) -> None:
         """Align Monitoring visualize action buttons with Analytics theme."""
         generate_buttons = []
@@ -922,95 +930,98 @@ class MonitoringPage(QWidget):
                 info = f"{len(selected)} point(s) selected"
                 QMessageBox.information(self, "Selection Updated", info)
     
+    @staticmethod
+    def _parallel_workers() -> int:
+        """Process count for parsing folders (config monitoring.parallel_workers, 0/1 = off)."""
+        workers = config.get('monitoring.parallel_workers')
+        if workers is None:
+            return default_parallel_workers()
+        try:
+            return int(workers)
+        except (TypeError, ValueError):
+            return 0
+
+    def _auto_refresh_minutes(self) -> float:
+        """Folder rescan interval (config monitoring.auto_refresh_minutes, 0 = off)."""
+        try:
+            return max(0.0, float(config.get('monitoring.auto_refresh_minutes', 0) or 0))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _refresh_changed_folders(self) -> None:
+        """Reload tabs whose folder gained, lost or changed files (PERIODIC RESCAN).
+        
+        Only stats the files; a tab is reloaded (incrementally: new and changed
+        files parsed, removed files dropped) when its folder differs from the
+        last load and no load is already running.
+        """
+        if self._is_closing:
+            return
+        tabs = [
+            ("static_boreholes", self._static_loader_thread, self._load_static_data_async),
+            ("borehole_monitoring", self._monitoring_loader_thread, self._load_monitoring_data_async),
+            ("pcd_monitoring", self._pcd_loader_thread, self._load_pcd_data_async),
+        ]
+        for name, thread, load in tabs:
+            snapshot = self._folder_snapshots[name]
+            if snapshot.folder is None or (thread is not None and thread.isRunning()):
+                continue
+            if snapshot.has_changes():
+                self._logger.info(f"Folder changed, refreshing {name}: {snapshot.folder}")
+                load(str(snapshot.folder))
+
     # ==================== CACHE MANAGEMENT ====================
     
-    def _load_from_cache(self, file_path: str) -> Optional[pd.DataFrame]:
+    def _cache_functions(self, dashboard_name: str) -> Tuple[Callable, Callable]:
+        """Cache loader/saver pair for a loader thread (CACHE INTEGRATION).
+        
+        Binds the dashboard's parser version so entries from one parser are
+        never served to another.
+        
+        Args:
+            dashboard_name: Loader thread dashboard name
+        
+        Returns:
+            (loader, saver) for DirectoryLoaderThread.set_cache_functions()
+        """
+        version = monitoring_parser_version(dashboard_name)
+        return (
+            partial(self._load_from_cache, parser_version=version),
+            partial(self._save_to_cache, parser_version=version),
+        )
+    
+    def _load_from_cache(self, file_path: str, parser_version: str) -> Optional[pd.DataFrame]:
         """Load DataFrame from cache if file unchanged (CACHE LOADER).
         
-        Checks both memory cache and disk cache.
-        Returns cached DataFrame if file mtime matches cached mtime.
+        Looks up the shared monitoring cache (memory first, then disk).
+        Entries are keyed by absolute path and parser version and only
+        served while the file's size and mtime are unchanged.
         
         Args:
             file_path: Full path to Excel file
+            parser_version: Version string of the parser for this file
         
         Returns:
             Cached DataFrame if valid, None if cache miss or file changed
         """
         if not self._cache_enabled:
             return None
-        
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            return None
-        
-        current_mtime = file_path_obj.stat().st_mtime
-        cache_key = file_path_obj.stem  # Use filename without extension
-        
-        # Check memory cache first (fastest)
-        if cache_key in self._memory_cache:
-            cached = self._memory_cache[cache_key]
-            if cached['mtime'] == current_mtime:
-                logger.debug(f"Memory cache HIT: {file_path_obj.name}")
-                return cached['dataframe']
-            else:
-                logger.debug(f"Memory cache STALE: {file_path_obj.name} (file modified)")
-        
-        # Check disk cache (persistent across sessions)
-        disk_cache_file = self._cache_dir / f"{cache_key}.pkl"
-        if disk_cache_file.exists():
-            try:
-                import pickle
-                with open(disk_cache_file, 'rb') as f:
-                    cached = pickle.load(f)
-                
-                if cached['mtime'] == current_mtime:
-                    # Load into memory cache for next access
-                    self._memory_cache[cache_key] = cached
-                    logger.debug(f"Disk cache HIT: {file_path_obj.name}")
-                    return cached['dataframe']
-                else:
-                    logger.debug(f"Disk cache STALE: {file_path_obj.name} (file modified)")
-            except Exception as e:
-                logger.warning(f"Failed to load disk cache for {file_path_obj.name}: {e}")
-        
-        return None  # Cache miss
+        return self._cache.get(file_path, parser_version)
     
-    def _save_to_cache(self, file_path: str, dataframe: pd.DataFrame):
-        """Save DataFrame to both memory and disk cache (CACHE SAVER).
+    def _save_to_cache(self, file_path: str, dataframe: pd.DataFrame, parser_version: str):
+        """Save DataFrame to the shared cache (CACHE SAVER).
+        
+        The memory tier is updated immediately; the disk copy is written on
+        the cache's background writer so the loader thread does not block.
         
         Args:
             file_path: Full path to Excel file
             dataframe: Parsed DataFrame to cache
+            parser_version: Version string of the parser that produced it
         """
         if not self._cache_enabled or dataframe is None or dataframe.empty:
             return
-        
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            return
-        
-        current_mtime = file_path_obj.stat().st_mtime
-        cache_key = file_path_obj.stem
-        
-        cache_entry = {
-            'mtime': current_mtime,
-            'dataframe': dataframe,
-            'rows': len(dataframe),
-            'file_path': str(file_path_obj)
-        }
-        
-        # Save to memory cache
-        self._memory_cache[cache_key] = cache_entry
-        
-        # Save to disk cache (async to avoid blocking)
-        try:
-            import pickle
-            disk_cache_file = self._cache_dir / f"{cache_key}.pkl"
-            with open(disk_cache_file, 'wb') as f:
-                pickle.dump(cache_entry, f, protocol=pickle.HIGHEST_PROTOCOL)
-            logger.debug(f"Cached to disk: {file_path_obj.name} ({len(dataframe)} rows)")
-        except Exception as e:
-            logger.warning(f"Failed to save disk cache for {file_path_obj.name}: {e}")
+        self._cache.put(file_path, parser_version, dataframe)
     
     def clear_cache(self, cache_type: str = 'both'):
         """Clear memory and/or disk cache (CACHE INVALIDATOR).
@@ -1018,20 +1029,21 @@ class MonitoringPage(QWidget):
         Args:
             cache_type: 'memory', 'disk', or 'both' (default)
         """
+        try:
+            count = self._cache.clear(
+                memory=cache_type in ('memory', 'both'),
+                disk=cache_type in ('disk', 'both'),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to clear monitoring cache: {e}")
+            return
+        # Next load of each folder parses every file again
+        for snapshot in self._folder_snapshots.values():
+            snapshot.reset()
         if cache_type in ('memory', 'both'):
-            count = len(self._memory_cache)
-            self._memory_cache.clear()
             logger.info(f"Cleared memory cache ({count} entries)")
-        
         if cache_type in ('disk', 'both'):
-            try:
-                import shutil
-                if self._cache_dir.exists():
-                    shutil.rmtree(self._cache_dir)
-                    self._cache_dir.mkdir(parents=True, exist_ok=True)
-                    logger.info("Cleared disk cache")
-            except Exception as e:
-                logger.warning(f"Failed to clear disk cache: {e}")
+            logger.info("Cleared disk cache")
 
     # ==================== INITIALIZATION HELPERS ====================
 
@@ -1525,14 +1537,15 @@ class MonitoringPage(QWidget):
         
         # Create NEW thread each time (QThreads can't be restarted)
         self._static_loader_thread = DirectoryLoaderThread("static_boreholes")
-        self._static_loader_thread.set_cache_functions(self._load_from_cache, self._save_to_cache)
+        self._static_loader_thread.set_cache_functions(*self._cache_functions("static_boreholes"))
+        self._static_loader_thread.set_parallel_workers(self._parallel_workers())
         self._static_loader_thread.progress.connect(self._on_static_progress)
         self._static_loader_thread.error.connect(self._on_static_error)
         self._static_loader_thread.complete.connect(self._on_static_complete)
         self._static_loader_thread.cache_stats.connect(self._on_cache_stats)
         
         # Load directory in background
-        self._static_loader_thread.load_directory(folder_path)
+        self._static_loader_thread.load_directory(folder_path, self._folder_snapshots["static_boreholes"])
         self._static_loader_thread.start()
         self._logger.info(f"Started background load for static borehole data from {folder_path}")
     
@@ -1774,14 +1787,15 @@ class MonitoringPage(QWidget):
         
         # Create NEW thread each time (QThreads can't be restarted)
         self._monitoring_loader_thread = DirectoryLoaderThread("borehole_monitoring")
-        self._monitoring_loader_thread.set_cache_functions(self._load_from_cache, self._save_to_cache)
+        self._monitoring_loader_thread.set_cache_functions(*self._cache_functions("borehole_monitoring"))
+        self._monitoring_loader_thread.set_parallel_workers(self._parallel_workers())
         self._monitoring_loader_thread.progress.connect(self._on_monitoring_progress)
         self._monitoring_loader_thread.error.connect(self._on_monitoring_error)
         self._monitoring_loader_thread.complete.connect(self._on_monitoring_complete)
         self._monitoring_loader_thread.cache_stats.connect(self._on_cache_stats)
         
         # Load directory in background
-        self._monitoring_loader_thread.load_directory(folder_path)
+        self._monitoring_loader_thread.load_directory(folder_path, self._folder_snapshots["borehole_monitoring"])
         self._monitoring_loader_thread.start()
         self._logger.info(f"Started background load for monitoring borehole data from {folder_path}")
     
@@ -1973,14 +1987,15 @@ class MonitoringPage(QWidget):
         
         # Create NEW thread each time (QThreads can't be restarted)
         self._pcd_loader_thread = DirectoryLoaderThread("pcd_monitoring")
-        self._pcd_loader_thread.set_cache_functions(self._load_from_cache, self._save_to_cache)
+        self._pcd_loader_thread.set_cache_functions(*self._cache_functions("pcd_monitoring"))
+        self._pcd_loader_thread.set_parallel_workers(self._parallel_workers())
         self._pcd_loader_thread.progress.connect(self._on_pcd_progress)
         self._pcd_loader_thread.error.connect(self._on_pcd_error)
         self._pcd_loader_thread.complete.connect(self._on_pcd_complete)
         self._pcd_loader_thread.cache_stats.connect(self._on_cache_stats)
         
         # Load directory in background
-        self._pcd_loader_thread.load_directory(folder_path)
+        self._pcd_loader_thread.load_directory(folder_path, self._folder_snapshots["pcd_monitoring"])
         self._pcd_loader_thread.start()
         self._logger.info(f"Started background load for PCD monitoring data from {folder_path}")
     
@@ -2129,6 +2144,7 @@ class MonitoringPage(QWidget):
         background loaders attempting to update UI widgets after teardown.
         """
         self._is_closing = True
+        self._refresh_timer.stop()
         loaders = [
             ("static_boreholes", self._static_loader_thread),
             ("borehole_monitoring", self._monitoring_loader_thread),
@@ -390,32 +390,28 @@ class ColumnEditorDialog(QDialog):
     def _on_save_changes(self):
         """Persist all column changes to Excel file (PERSISTENCE).
 
-        Executes all add/rename/delete operations in Excel:
-        1. Add new columns via ExcelManager.create_flow_column()
-        2. Rename existing columns via ExcelManager.rename_flow_column()
-        3. Delete columns via ExcelManager.delete_flow_column()
+        Queues all add/rename/delete operations in one ExcelManager edit
+        session (single workbook load/save):
+        1. Add new columns
+        2. Rename existing columns
+        3. Delete columns
 
-        Rollback all changes if any operation fails.
+        Nothing is written if any operation fails.
         """
         sheet_name = self.current_sheet
 
         try:
-            # Create new columns
+            edits = self.excel_manager.begin_flow_column_edits()
             for col_name in self.new_columns:
-                if not self.excel_manager.create_flow_column(sheet_name, col_name):
-                    raise Exception(f"Failed to create column '{col_name}'")
-
-            # Rename columns
+                edits.create_column(sheet_name, col_name)
             for old_name, new_name in self.modified_columns.items():
-                if not self.excel_manager.rename_flow_column(
-                    sheet_name, old_name, new_name
-                ):
-                    raise Exception(f"Failed to rename column '{old_name}' → '{new_name}'")
-
+                edits.rename_column(sheet_name, old_name, new_name)
             # Delete columns (in reverse order to maintain stability)
             for col_name in reversed(self.deleted_columns):
-                if not self.excel_manager.delete_flow_column(sheet_name, col_name):
-                    raise Exception(f"Failed to delete column '{col_name}'")
+                edits.delete_column(sheet_name, col_name)
+
+            if not edits.commit():
+                raise Exception(edits.error)
 
             logger.info(
                 f"✓ Saved changes: +{len(self.new_columns)} -{len(self.deleted_columns)} "
@@ -1007,6 +1007,10 @@ class MainWindow(QMainWindow):
 
         # Flow Diagram page
         self._update_splash("Loading Flow Diagram...", 80)
+        if ConfigManager().get('features.prefetch_flow_sheets', True):
+            # Parse all Flows_* sheets off the UI thread before the page needs them
+            from services.excel_manager import get_excel_manager
+            get_excel_manager().prefetch_flow_sheets()
         flow_diagram_page = FlowDiagramPage()
         flow_diagram_placeholder_index = self.ui.stackedWidget.indexOf(self.ui.flow_diagram)
         if flow_diagram_placeholder_index >= 0:
@@ -1053,9 +1057,32 @@ class MainWindow(QMainWindow):
         self._update_splash("Loading Messages...", 98)
         self._messages_page = MessagesPage()
         self.ui.stackedWidget.addWidget(self._messages_page)
+        self._start_excel_file_watcher()
         self._update_splash("Pages loaded!", 99)
         logger.info("Messages page added to navigation")
 
+    def _start_excel_file_watcher(self) -> None:
+        """Watch Excel sources so caches are invalidated when files change on disk."""
+        if not ConfigManager().get('features.excel_file_watcher', True):
+            return
+        try:
+            from services.excel_file_watcher import get_excel_file_watcher
+            get_excel_file_watcher().excel_changed.connect(self._on_excel_source_changed)
+        except Exception as exc:
+            logger.warning(f"Excel file watcher unavailable: {exc}")
+
+    def _on_excel_source_changed(self, source: str) -> None:
+        """Tell the user and the Flow Diagram page that an Excel source changed."""
+        from services.excel_manager import ExcelManager
+        label = "Meter Readings" if source == ExcelManager.METER_READINGS else "Flow Diagram"
+        self.ui.statusbar.showMessage(f"{label} Excel changed on disk - cached data refreshed", 5000)
+
+        flow_page = getattr(self.ui, "flow_diagram", None)
+        if source == ExcelManager.FLOW_DIAGRAM and hasattr(flow_page, "_refresh_excel_state_badge"):
+            # Volumes on the diagram are stale until the user reloads
+            flow_page._excel_data_loaded_for_session = False
+            flow_page._refresh_excel_state_badge()
+
     @Slot()
     def _toggle_sidebar(self, expanded: bool) -> None:
         """Animate sidebar transitions smoothly.
@@ -1297,6 +1324,13 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             logger.warning(f"Unable to stop notification background sync: {exc}")
 
+        try:
+            from services import excel_file_watcher
+            if excel_file_watcher._watcher_instance is not None:
+                excel_file_watcher._watcher_instance.stop()
+        except Exception as exc:
+            logger.debug(f"Unable to stop Excel file watcher: {exc}")
+
         try:
             from services.update_service import get_update_service
             get_update_service().cancel_download()
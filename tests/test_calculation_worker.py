@@ -0,0 +1,89 @@
+"""Tests for the Calculations page background worker.
+
+Covers:
+- Task result and progress are delivered by signal
+- cancel() stops the task at its next progress report
+- Task errors are reported via failed
+"""
+
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from PySide6.QtWidgets import QApplication
+from ui.dashboards.calculation_dashboard import CalculationWorker
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for all tests (required for PySide6)."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _collect(worker: CalculationWorker) -> dict:
+    events = {"progress": [], "finished": [], "failed": [], "cancelled": 0}
+    worker.progress.connect(lambda stage, pct: events["progress"].append((stage, pct)))
+    worker.finished.connect(lambda result: events["finished"].append(result))
+    worker.failed.connect(lambda msg: events["failed"].append(msg))
+
+    def on_cancelled():
+        events["cancelled"] += 1
+
+    worker.cancelled.connect(on_cancelled)
+    return events
+
+
+def test_worker_emits_progress_and_result(qapp) -> None:
+    """Progress stages and the task's return value arrive via signals."""
+    def task(report):
+        report("Calculating inflows", 0)
+        report("Recording storage history", 85)
+        return ("result", [])
+
+    worker = CalculationWorker(task)
+    events = _collect(worker)
+    worker.run()
+
+    assert events["progress"] == [("Calculating inflows", 0), ("Recording storage history", 85)]
+    assert events["finished"] == [("result", [])]
+    assert events["cancelled"] == 0
+
+
+def test_worker_cancel_stops_at_next_stage(qapp) -> None:
+    """After cancel(), the next progress report aborts the task."""
+    reached = []
+
+    def task(report):
+        report("Calculating inflows", 0)
+        worker.cancel()
+        report("Calculating outflows", 20)
+        reached.append("after cancel")
+        return "unreachable"
+
+    worker = CalculationWorker(task)
+    events = _collect(worker)
+    worker.run()
+
+    assert reached == []
+    assert events["cancelled"] == 1
+    assert events["finished"] == []
+
+
+def test_worker_reports_failure(qapp) -> None:
+    """Exceptions raised by the task are emitted as failed."""
+    def task(report):
+        raise ValueError("boom")
+
+    worker = CalculationWorker(task)
+    events = _collect(worker)
+    worker.run()
+
+    assert events["failed"] == ["boom"]
+    assert events["finished"] == []
@@ -0,0 +1,167 @@
+"""Tests for pooled SQLite connections and row access in DatabaseManager.
+
+Covers:
+- Connections are reused across get_connection()/close() calls
+- Runtime connections carry the schema pragmas
+- Closing without commit rolls back (same as a plain connection)
+- Exhausted pool waits for a release and records wait statistics
+- Cached dict row keys and columnar (NumPy/DataFrame) reads
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import math
+import sqlite3
+import sys
+import threading
+import time
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pytest
+
+from database.connection_pool import ConnectionPool
+from database.db_manager import DatabaseManager
+from database.schema import DatabaseSchema
+
+
+@pytest.fixture
+def db(tmp_path: Path):
+    path = tmp_path / "pool.db"
+    DatabaseSchema(path).create_database()
+    manager = DatabaseManager(path)
+    yield manager
+    DatabaseManager.close_pool(path)
+
+
+def test_connections_are_reused(db: DatabaseManager) -> None:
+    """Sequential checkouts should reuse one pooled connection."""
+    for _ in range(20):
+        with db.connection() as conn:
+            conn.execute("SELECT 1").fetchone()
+        db.execute_query("SELECT COUNT(*) AS n FROM storage_facilities", fetch_one=True)
+
+    stats = db.get_pool_stats()
+    assert stats["checkouts"] == 40
+    assert stats["connections_created"] == 1
+    assert stats["in_use"] == 0
+
+
+def test_pragmas_applied_to_runtime_connections(db: DatabaseManager) -> None:
+    """Pooled connections should use WAL, foreign keys and in-memory temp store."""
+    with db.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()["journal_mode"] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()["foreign_keys"] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()["temp_store"] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()["cache_size"] == -64000
+
+
+def test_close_without_commit_rolls_back(db: DatabaseManager) -> None:
+    """Returning a connection to the pool must discard uncommitted writes."""
+    conn = db.get_connection()
+    conn.execute(
+        "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3) "
+        "VALUES ('TMP1', 'Temp', 'Dam', 100)"
+    )
+    conn.close()
+    conn.close()  # Double close is harmless
+
+    row = db.execute_query("SELECT COUNT(*) AS n FROM storage_facilities", fetch_one=True)
+    assert row["n"] == 0
+
+
+def test_exhausted_pool_waits_for_release(tmp_path: Path) -> None:
+    """A checkout beyond the pool limit should block until a connection frees up."""
+    pool = ConnectionPool(tmp_path / "wait.db", timeout=5.0, pool_size=1, max_overflow=0)
+    held = pool.acquire()
+
+    def release_later() -> None:
+        time.sleep(0.05)
+        held.close()
+
+    threading.Thread(target=release_later).start()
+    conn = pool.acquire()
+    conn.close()
+
+    stats = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["max_wait_ms"] > 0
+    assert stats["connections_created"] == 1
+    pool.close_all()
+
+
+def test_exhausted_pool_times_out(tmp_path: Path) -> None:
+    """Waiting past the timeout should raise instead of hanging."""
+    pool = ConnectionPool(tmp_path / "timeout.db", timeout=0.05, pool_size=1, max_overflow=0)
+    held = pool.acquire()
+    with pytest.raises(sqlite3.OperationalError):
+        pool.acquire()
+    held.close()
+    pool.close_all()
+
+
+def test_backup_includes_uncheckpointed_writes(db: DatabaseManager, tmp_path: Path) -> None:
+    """create_backup() should capture rows still held in the WAL."""
+    db.execute_mutation(
+        "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3) "
+        "VALUES ('BK1', 'Backup', 'Dam', 100)",
+        create_backup=False,
+    )
+    backup = db.create_backup(tmp_path / "copy.db")
+
+    copy = DatabaseManager(backup)
+    row = copy.execute_query("SELECT code FROM storage_facilities", fetch_one=True)
+    assert row["code"] == "BK1"
+    DatabaseManager.close_pool(backup)
+
+
+def test_leaked_connection_slot_is_reclaimed(tmp_path: Path) -> None:
+    """A connection dropped without close() should not exhaust the pool."""
+    pool = ConnectionPool(tmp_path / "leak.db", timeout=0.05, pool_size=1, max_overflow=0)
+    pool.acquire().execute("SELECT 1")  # never closed
+
+    conn = pool.acquire()
+    conn.close()
+
+    assert pool.stats()["leaked"] == 1
+    pool.close_all()
+
+
+def test_dict_rows_keep_column_names_across_queries(db: DatabaseManager) -> None:
+    """Cached row keys must follow each result set's own columns."""
+    db.execute_mutation(
+        "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3) "
+        "VALUES ('K1', 'Keys', 'Dam', 100)",
+        create_backup=False,
+    )
+    first = db.execute_query("SELECT code, name FROM storage_facilities", fetch_one=True)
+    second = db.execute_query("SELECT capacity_m3 AS cap FROM storage_facilities", fetch_one=True)
+
+    assert first == {"code": "K1", "name": "Keys"}
+    assert second == {"cap": 100}
+
+
+def test_execute_query_columnar(db: DatabaseManager) -> None:
+    """Columnar reads return one array per column (NULL numerics as NaN)."""
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3, surface_area_m2) "
+            "VALUES (?, ?, 'Dam', ?, ?)",
+            [("C1", "One", 100, 10.5), ("C2", "Two", 200, None)],
+        )
+
+    cols = db.execute_query_columnar(
+        "SELECT code, capacity_m3, surface_area_m2 FROM storage_facilities ORDER BY code"
+    )
+    assert cols["code"].tolist() == ["C1", "C2"]
+    assert cols["capacity_m3"].sum() == 300
+    assert cols["surface_area_m2"][0] == 10.5
+    assert math.isnan(cols["surface_area_m2"][1])
+
+    frame = db.execute_query_columnar("SELECT code FROM storage_facilities", as_dataframe=True)
+    assert list(frame.columns) == ["code"] and len(frame) == 2
+
+    empty = db.execute_query_columnar("SELECT code FROM storage_facilities WHERE 0")
+    assert list(empty) == ["code"] and len(empty["code"]) == 0
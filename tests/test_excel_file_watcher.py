@@ -0,0 +1,115 @@
+"""Tests for Excel file-watcher cache invalidation.
+
+Covers:
+- Watched sources skip the per-call mtime check in ExcelManager
+- Rewriting the Meter Readings workbook clears its cache and emits signals
+- Changing a watched path re-registers the watcher
+"""
+
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent / 'test_services'))
+
+import pytest
+
+from PySide6.QtWidgets import QApplication
+from services.excel_file_watcher import ExcelFileWatcher
+from services.excel_manager import ExcelManager
+from test_excel_manager_meter_values import _write_meter_excel
+
+
+JAN = date(2025, 1, 1)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for all tests (required for PySide6)."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class _Config:
+    """Minimal config pointing ExcelManager at temp workbooks."""
+
+    def __init__(self, tmp_path: Path) -> None:
+        self._values = {
+            "data_sources.legacy_excel_path": str(tmp_path / "meter.xlsx"),
+            "data_sources.timeseries_excel_path": str(tmp_path / "flows.xlsx"),
+            "data_sources.meter_cache_dir": str(tmp_path / "cache"),
+        }
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def set(self, key, value):
+        self._values[key] = value
+
+
+def _wait_for(qapp, predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_watched_meter_source_skips_stat(qapp, tmp_path: Path, monkeypatch) -> None:
+    _write_meter_excel(tmp_path / "meter.xlsx")
+    manager = ExcelManager(_Config(tmp_path))
+    watcher = ExcelFileWatcher(manager, debounce_ms=20)
+    try:
+        first = manager.load_meter_readings()
+
+        def _no_stat(self, *args, **kwargs):
+            raise AssertionError("watched source should not be stat()ed")
+
+        monkeypatch.setattr(Path, "stat", _no_stat)
+        assert manager.load_meter_readings() is first
+    finally:
+        monkeypatch.undo()
+        watcher.stop()
+
+
+def test_rewritten_workbook_invalidates_cache(qapp, tmp_path: Path) -> None:
+    excel_path = tmp_path / "meter.xlsx"
+    _write_meter_excel(excel_path, tonnes_jan=1000.0)
+    manager = ExcelManager(_Config(tmp_path))
+    watcher = ExcelFileWatcher(manager, debounce_ms=20)
+    changed = []
+    watcher.excel_changed.connect(changed.append)
+    try:
+        assert manager.get_meter_values(JAN, ["Tonnes Milled"]) == {"Tonnes Milled": 1000.0}
+
+        _write_meter_excel(excel_path, tonnes_jan=2500.0)
+        assert _wait_for(qapp, lambda: changed)
+
+        assert changed == [ExcelManager.METER_READINGS]
+        assert manager._meter_df is None
+        assert manager.get_meter_values(JAN, ["Tonnes Milled"]) == {"Tonnes Milled": 2500.0}
+    finally:
+        watcher.stop()
+
+
+def test_path_change_rewatches_new_file(qapp, tmp_path: Path) -> None:
+    _write_meter_excel(tmp_path / "meter.xlsx")
+    other = tmp_path / "other" / "meter2.xlsx"
+    other.parent.mkdir()
+    _write_meter_excel(other)
+
+    manager = ExcelManager(_Config(tmp_path))
+    watcher = ExcelFileWatcher(manager, debounce_ms=20)
+    try:
+        manager.set_meter_readings_path(str(other))
+        assert str(other) in watcher._watcher.files()
+        assert str(tmp_path / "meter.xlsx") not in watcher._watcher.files()
+    finally:
+        watcher.stop()
@@ -0,0 +1,95 @@
+"""Tests for the windowed Flow Diagram Excel preview.
+
+Covers:
+- Opening a large sheet formats only the rows the view requests
+- Saving writes only edited cells (untouched cells keep their values/types)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+import yaml
+from openpyxl import Workbook, load_workbook
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QMessageBox
+from core.config_manager import config
+from services.excel_manager import get_excel_manager
+from ui.components.excel_preview_widget import ExcelPreviewWidget
+
+SHEET = "Flows_UG2 North"
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for all tests (required for PySide6)."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def flow_excel(tmp_path: Path, monkeypatch):
+    """Point the Excel manager at a 1,200-row × 40-column flow sheet."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = SHEET
+    # Title rows: the loader's legacy header row is row 3
+    ws.append(["UG2 North flows"])
+    ws.append([])
+    ws.append(["Year", "Month"] + [f"flow_{i}" for i in range(38)])
+    for row in range(1200):
+        ws.append([1950 + row // 12, row % 12 + 1] + [float(row + i) for i in range(38)])
+    wb.save(excel_path)
+    wb.close()
+
+    cfg_path = tmp_path / "app_config.yaml"
+    cfg_path.write_text(
+        yaml.safe_dump({"data_sources": {"timeseries_excel_path": str(excel_path)}}),
+        encoding="utf-8",
+    )
+    config.load_config(config_path=str(cfg_path))
+    get_excel_manager().clear_flow_cache()
+    monkeypatch.setattr(QMessageBox, "information", lambda *a, **k: None)
+    monkeypatch.setattr(QMessageBox, "warning", lambda *a, **k: None)
+    yield excel_path
+    get_excel_manager().clear_flow_cache()
+
+
+def test_large_sheet_formats_only_requested_rows(qapp, flow_excel: Path) -> None:
+    widget = ExcelPreviewWidget()
+    widget.set_sheet(SHEET)
+    model = widget._table.model()
+
+    assert model.rowCount() == 1200
+    assert model.columnCount() == 40
+    assert len(model.row_cache) <= 200
+
+    # Scrolling further fetches another window on demand
+    assert model.index(1100, 2).data() == "1100"
+    assert len(model.row_cache) <= 300
+
+
+def test_save_writes_only_edited_cells(qapp, flow_excel: Path) -> None:
+    widget = ExcelPreviewWidget()
+    widget.set_sheet(SHEET)
+    widget.set_editable_column("flow_1")
+    model = widget._table.model()
+
+    col = widget._get_header_index("flow_1")
+    assert model.flags(model.index(5, col)) & Qt.ItemIsEditable
+    assert not model.flags(model.index(5, 0)) & Qt.ItemIsEditable
+    assert model.setData(model.index(5, col), "42.5")
+
+    widget._on_save()
+
+    ws = load_workbook(flow_excel)[SHEET]
+    assert ws.cell(row=9, column=col + 1).value == 42.5
+    assert ws.cell(row=10, column=col + 1).value == 7.0
+    assert get_excel_manager().get_flow_volume(SHEET, "flow_1", 1950, 6) == 42.5
@@ -0,0 +1,157 @@
+"""Tests for BalanceService.calculate_range (multi-period batch engine).
+
+Covers:
+- Batch results match sequential calculate() calls month by month
+- Closing volumes chain into next month's opening without DB round-trips
+- storage_history ends up identical to the sequential path
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+import pytest
+
+from database.db_manager import DatabaseManager
+from database.schema import DatabaseSchema
+from services.calculation import balance_service as balance_module
+from services.calculation.balance_service import BalanceService
+from services.calculation.constants import CalculationConstants
+from services.calculation.models import CalculationPeriod
+from services.excel_manager import ExcelManager
+
+
+class _FrameExcelManager(ExcelManager):
+    """ExcelManager backed by an in-memory Meter Readings DataFrame."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._meter_units = {}
+        self._meter_monthly = None
+
+    def load_meter_readings(self) -> pd.DataFrame:
+        return self._df
+
+
+def _meter_frame() -> pd.DataFrame:
+    dates = pd.date_range("2024-11-01", periods=8, freq="MS")
+    return pd.DataFrame({
+        "Month": dates,
+        "Tonnes Milled": [100000 + i * 5000 for i in range(8)],
+        "Plant Borehole Water Use": [20000 + i * 1000 for i in range(8)],
+        "Groot Dwars River": [15000.0] * 8,
+        "Main decline dewatering": [8000 + i * 250 for i in range(8)],
+        "Total Recycled Water": [50000.0] * 8,
+        "Tailings RD": [1.45] * 8,
+        "Date": dates,
+    })
+
+
+def _build_db(path: Path) -> DatabaseManager:
+    DatabaseSchema(path).create_database()
+    db = DatabaseManager(path)
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3, "
+            "surface_area_m2, current_volume_m3, is_lined, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("DAM1", "Dam 1", "Dam", 200000, 20000, 120000, 1, "active"),
+                ("DAM2", "Dam 2", "Dam", 100000, 8000, 40000, 0, "active"),
+                ("TSF1", "TSF 1", "TSF", 500000, 50000, 0, 0, "active"),
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO environmental_data (year, month, rainfall_mm, evaporation_mm) VALUES (?, ?, ?, ?)",
+            [(2025, m, 10.0 * m, 150.0 + m) for m in range(1, 5)],
+        )
+        conn.execute(
+            "INSERT INTO storage_history (facility_code, year, month, opening_volume_m3, "
+            "closing_volume_m3, data_source) VALUES ('DAM1', 2024, 12, 100000, 110000, 'measured')"
+        )
+    return db
+
+
+def _history(db: DatabaseManager) -> list:
+    return [
+        (r["facility_code"], r["year"], r["month"],
+         round(r["opening_volume_m3"], 6), round(r["closing_volume_m3"], 6))
+        for r in db.execute_query(
+            "SELECT * FROM storage_history ORDER BY facility_code, year, month"
+        )
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _default_constants(monkeypatch):
+    monkeypatch.setattr(balance_module, "get_constants", lambda: CalculationConstants())
+
+
+def test_calculate_range_matches_sequential(tmp_path: Path) -> None:
+    """Batch run should reproduce sequential results and history writes."""
+    seq_path = tmp_path / "seq.db"
+    db_seq = _build_db(seq_path)
+    batch_path = tmp_path / "batch.db"
+    db_seq.create_backup(batch_path)
+    db_batch = DatabaseManager(batch_path)
+
+    excel = _FrameExcelManager(_meter_frame())
+    start = CalculationPeriod(month=1, year=2025)
+    end = CalculationPeriod(month=4, year=2025)
+
+    sequential_service = BalanceService(db_seq, excel)
+    sequential = [
+        sequential_service.calculate(CalculationPeriod(month=m, year=2025), force_recalculate=True)
+        for m in range(1, 5)
+    ]
+
+    batch = BalanceService(db_batch, excel).calculate_range(start, end)
+
+    assert [r.period.month for r in batch] == [1, 2, 3, 4]
+    for seq, bat in zip(sequential, batch):
+        assert bat.inflows.total_m3 == pytest.approx(seq.inflows.total_m3)
+        assert bat.outflows.total_m3 == pytest.approx(seq.outflows.total_m3)
+        assert bat.storage.opening_m3 == pytest.approx(seq.storage.opening_m3)
+        assert bat.storage.closing_m3 == pytest.approx(seq.storage.closing_m3)
+        assert bat.recycled.total_m3 == pytest.approx(seq.recycled.total_m3)
+        assert bat.error_pct == pytest.approx(seq.error_pct)
+        assert sorted(bat.quality_flags.missing_values) == sorted(seq.quality_flags.missing_values)
+
+    assert _history(db_batch) == _history(db_seq)
+    volumes = "SELECT code, current_volume_m3 FROM storage_facilities ORDER BY code"
+    assert db_batch.execute_query(volumes) == db_seq.execute_query(volumes)
+
+
+def test_calculate_range_chains_opening_from_previous_closing(tmp_path: Path) -> None:
+    """Month N opening should equal month N-1 closing recorded in the same run."""
+    db = _build_db(tmp_path / "chain.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+
+    results = service.calculate_range(
+        CalculationPeriod(month=1, year=2025),
+        CalculationPeriod(month=3, year=2025),
+    )
+
+    dam1_jan = next(f for f in results[0].storage.facility_breakdown if f.facility_code == "DAM1")
+    assert dam1_jan.opening_m3 == pytest.approx(110000)
+
+    history = {(code, m): closing for code, _, m, _, closing in _history(db)}
+    for result in results[1:]:
+        for fac in result.storage.facility_breakdown:
+            assert fac.opening_m3 == pytest.approx(history[(fac.facility_code, result.period.month - 1)])
+
+
+def test_calculate_range_rejects_reversed_range(tmp_path: Path) -> None:
+    """A start period after the end period is a caller error."""
+    db = _build_db(tmp_path / "reversed.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+
+    with pytest.raises(ValueError):
+        service.calculate_range(
+            CalculationPeriod(month=5, year=2025),
+            CalculationPeriod(month=1, year=2025),
+        )
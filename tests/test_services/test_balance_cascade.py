@@ -0,0 +1,127 @@
+"""Tests for incremental (cascading) balance recalculation.
+
+Covers:
+- An input change that leaves closings unchanged stops the cascade early
+- A corrected closing recalculates its own month and the next one
+- Calculating an unrecorded month recomputes the months that depend on it
+- Stale earlier months are only swept when explicitly requested
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pytest
+
+from services.calculation import balance_service as balance_module
+from services.calculation.balance_service import BalanceService
+from services.calculation.constants import CalculationConstants
+from services.calculation.models import CalculationPeriod
+from test_balance_calculate_range import _FrameExcelManager, _build_db, _meter_frame
+
+
+JAN = CalculationPeriod(month=1, year=2025)
+FEB = CalculationPeriod(month=2, year=2025)
+MAR = CalculationPeriod(month=3, year=2025)
+APR = CalculationPeriod(month=4, year=2025)
+
+
+@pytest.fixture(autouse=True)
+def _default_constants(monkeypatch):
+    monkeypatch.setattr(balance_module, "get_constants", lambda: CalculationConstants())
+
+
+def _service(tmp_path: Path) -> BalanceService:
+    db = _build_db(tmp_path / "cascade.db")
+    return BalanceService(db, _FrameExcelManager(_meter_frame()))
+
+
+def _settle(service: BalanceService) -> None:
+    """Recompute months whose own closing split moved the volumes they read."""
+    service.refresh_stale_periods()
+    assert service.find_stale_periods() == []
+
+
+def test_rainfall_change_stops_after_changed_month(tmp_path: Path) -> None:
+    """March rainfall does not move closings, so April stays cached."""
+    service = _service(tmp_path)
+    service.calculate_range(JAN, APR)
+    _settle(service)
+    cached_april = service.calculate(APR)
+
+    service.db.execute_mutation(
+        "UPDATE environmental_data SET rainfall_mm = 99 WHERE year = 2025 AND month = 3",
+        create_backup=False,
+    )
+    service.clear_cache()
+
+    assert service.find_stale_periods() == [MAR]
+    refreshed = service.refresh_stale_periods()
+
+    assert [r.period for r in refreshed] == [MAR]
+    assert service.calculate(APR).calculated_at == cached_april.calculated_at
+
+
+def test_corrected_closing_cascades_downstream(tmp_path: Path) -> None:
+    """Editing February's closing recalculates February and the month opening from it."""
+    service = _service(tmp_path)
+    service.calculate_range(JAN, APR)
+    _settle(service)
+    before = service.calculate(APR)
+    feb_closing = service.calculate(FEB).storage.closing_m3
+    dam1_closing = service._stored_closings(FEB)["DAM1"]
+
+    service.db.execute_mutation(
+        "UPDATE storage_history SET closing_volume_m3 = 90000 "
+        "WHERE facility_code = 'DAM1' AND year = 2025 AND month = 2",
+        create_backup=False,
+    )
+    service.clear_cache()
+
+    # February reads its recorded closings, March opens from them
+    assert service.find_stale_periods() == [FEB, MAR]
+    refreshed = service.refresh_stale_periods()
+
+    assert [r.period for r in refreshed] == [FEB, MAR]
+    assert refreshed[0].storage.closing_m3 == pytest.approx(feb_closing - dam1_closing + 90000)
+    assert refreshed[1].storage.opening_m3 == pytest.approx(refreshed[0].storage.closing_m3)
+    assert refreshed[-1].calculated_at != before.calculated_at
+    _settle(service)
+
+
+def test_calculate_with_cascade_updates_dependent_months(tmp_path: Path) -> None:
+    """A newly recorded January feeds February's opening and the months after it."""
+    service = _service(tmp_path)
+    service.calculate_range(FEB, APR)
+
+    result, downstream = service.calculate_with_cascade(JAN)
+
+    assert result.period == JAN
+    assert [r.period for r in downstream] == [FEB, MAR, APR]
+    assert "DAM2_opening" not in downstream[0].quality_flags.estimated_values
+    _settle(service)
+
+
+def test_calculate_with_cascade_only_sweeps_stale_months_on_request(tmp_path: Path) -> None:
+    """A stale earlier month is left alone unless refresh_stale is set."""
+    service = _service(tmp_path)
+    service.calculate_range(JAN, APR)
+    _settle(service)
+    service.db.execute_mutation(
+        "UPDATE environmental_data SET rainfall_mm = 99 WHERE year = 2025 AND month = 1",
+        create_backup=False,
+    )
+    service.clear_cache()
+
+    _, downstream = service.calculate_with_cascade(MAR)
+    assert downstream == []
+    assert service.find_stale_periods() == [JAN]
+
+    _, downstream = service.calculate_with_cascade(MAR, refresh_stale=True)
+    assert downstream[0].period == JAN
+    assert service.find_stale_periods() == []
@@ -0,0 +1,94 @@
+"""Tests for the parallel (concurrent sub-service) balance mode.
+
+Covers:
+- Parallel and sequential calculate() give identical results and history
+- Stage flags are merged in workflow order
+- shutdown() stops the stage worker threads
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pytest
+
+from services.calculation import balance_service as balance_module
+from services.calculation.balance_service import BalanceService
+from services.calculation.constants import CalculationConstants
+from services.calculation.models import CalculationPeriod, DataQualityFlags
+from test_balance_calculate_range import _FrameExcelManager, _build_db, _history, _meter_frame
+
+
+@pytest.fixture(autouse=True)
+def _default_constants(monkeypatch):
+    monkeypatch.setattr(balance_module, "get_constants", lambda: CalculationConstants())
+
+
+def _dump(result) -> dict:
+    data = result.model_dump()
+    data.pop("calculated_at")
+    return data
+
+
+def test_parallel_matches_sequential(tmp_path: Path) -> None:
+    """Results, flag ordering and storage history are identical in both modes."""
+    sequential = BalanceService(
+        _build_db(tmp_path / "seq.db"), _FrameExcelManager(_meter_frame()), parallel=False
+    )
+    parallel = BalanceService(
+        _build_db(tmp_path / "par.db"), _FrameExcelManager(_meter_frame()), parallel=True
+    )
+
+    for month in (1, 2, 3):
+        period = CalculationPeriod(month=month, year=2025)
+        assert _dump(parallel.calculate(period)) == _dump(sequential.calculate(period))
+
+    assert _history(parallel.db) == _history(sequential.db)
+    volumes = "SELECT code, current_volume_m3 FROM storage_facilities ORDER BY code"
+    assert parallel.db.execute_query(volumes) == sequential.db.execute_query(volumes)
+
+
+def test_flag_merge_matches_sequential_recording() -> None:
+    """Merging per-stage flags reproduces one sequentially filled instance."""
+    sequential = DataQualityFlags()
+    sequential.add_estimated("a", "first")
+    sequential.add_warning("w1")
+    sequential.add_estimated("a", "second")
+    sequential.add_missing("b", "gone")
+    sequential.add_warning("w1")
+
+    first, second = DataQualityFlags(), DataQualityFlags()
+    first.add_estimated("a", "first")
+    first.add_warning("w1")
+    second.add_estimated("a", "second")
+    second.add_missing("b", "gone")
+    second.add_warning("w1")
+
+    merged = DataQualityFlags()
+    merged.merge(first)
+    merged.merge(second)
+
+    assert merged.model_dump() == sequential.model_dump()
+    assert list(merged.notes) == list(sequential.notes)
+
+
+def test_shutdown_stops_stage_threads(tmp_path: Path) -> None:
+    """shutdown() joins the stage pool; a later parallel run starts a new one."""
+    service = BalanceService(
+        _build_db(tmp_path / "par.db"), _FrameExcelManager(_meter_frame()), parallel=True
+    )
+    service.calculate(CalculationPeriod(month=1, year=2025))
+    threads = list(service._executor._threads)
+
+    service.shutdown()
+    service.shutdown()
+
+    assert service._executor is None
+    assert threads and not any(thread.is_alive() for thread in threads)
+    service.calculate(CalculationPeriod(month=2, year=2025))
+    service.shutdown()
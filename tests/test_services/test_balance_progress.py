@@ -0,0 +1,62 @@
+"""Tests for BalanceService progress reporting and cancellation.
+
+Covers:
+- Every stage is reported in order before the result is cached
+- Cancelling from the progress callback saves neither history nor result
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pytest
+
+from services.calculation import balance_service as balance_module
+from services.calculation.balance_service import BalanceService
+from services.calculation.constants import CalculationConstants
+from services.calculation.interfaces import CalculationCancelled
+from services.calculation.models import CalculationPeriod
+from test_balance_calculate_range import _FrameExcelManager, _build_db, _meter_frame
+
+
+@pytest.fixture(autouse=True)
+def _default_constants(monkeypatch):
+    monkeypatch.setattr(balance_module, "get_constants", lambda: CalculationConstants())
+
+
+def test_calculate_reports_every_stage(tmp_path: Path) -> None:
+    """Stages arrive in workflow order with increasing percentages."""
+    service = BalanceService(_build_db(tmp_path / "progress.db"), _FrameExcelManager(_meter_frame()))
+    seen = []
+
+    service.calculate(CalculationPeriod(month=2, year=2025), progress=lambda s, p: seen.append((s, p)))
+
+    keys = ('inflows', 'outflows', 'storage', 'recycled', 'kpis', 'history')
+    expected = [BalanceService.PROGRESS_STAGES[key] for key in keys] + [("Done", 100)]
+    assert seen == expected
+    assert [p for _, p in seen] == sorted(p for _, p in seen)
+
+
+def test_cancel_before_history_write_saves_nothing(tmp_path: Path) -> None:
+    """Cancelling at the history stage leaves storage_history and the cache untouched."""
+    db = _build_db(tmp_path / "progress.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    period = CalculationPeriod(month=2, year=2025)
+
+    def cancel_at_history(stage: str, percent: int) -> None:
+        if stage == BalanceService.PROGRESS_STAGES['history'][0]:
+            raise CalculationCancelled("cancelled")
+
+    with pytest.raises(CalculationCancelled):
+        service.calculate(period, progress=cancel_at_history)
+
+    rows = db.execute_query("SELECT COUNT(*) AS n FROM storage_history WHERE year = 2025 AND month = 2",
+                            fetch_one=True)
+    assert rows["n"] == 0
+    cached = db.execute_query("SELECT COUNT(*) AS n FROM balance_result_cache", fetch_one=True)
+    assert cached["n"] == 0
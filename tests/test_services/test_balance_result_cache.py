@@ -0,0 +1,197 @@
+"""Tests for the persistent, dependency-tracked BalanceResult cache.
+
+Covers:
+- Results survive a new BalanceService instance (persisted in SQLite)
+- Changing one month's rainfall only invalidates that month
+- Meter Readings month hash is only rechecked when the file mtime changes
+- Cached results equal forced recalculation; live volumes only feed the latest month
+- Facility catchment area (runoff input) is part of the fingerprint
+- The most recently calculated or served result is readable without recalculating
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pytest
+
+from services.calculation import balance_service as balance_module
+from services.calculation.balance_service import BalanceService
+from services.calculation.constants import CalculationConstants
+from services.calculation.models import CalculationPeriod
+from services.calculation.result_cache import BalanceDependencyTracker
+from test_balance_calculate_range import _FrameExcelManager, _build_db, _meter_frame
+
+
+@pytest.fixture(autouse=True)
+def _default_constants(monkeypatch):
+    monkeypatch.setattr(balance_module, "get_constants", lambda: CalculationConstants())
+
+
+def test_cached_result_survives_new_service(tmp_path: Path) -> None:
+    """A second service on the same DB should reuse the persisted result."""
+    db = _build_db(tmp_path / "cache.db")
+    excel = _FrameExcelManager(_meter_frame())
+    period = CalculationPeriod(month=2, year=2025)
+
+    first = BalanceService(db, excel).calculate(period)
+    second = BalanceService(db, excel).calculate(period)
+
+    assert second.calculated_at == first.calculated_at
+    assert second.inflows.total_m3 == first.inflows.total_m3
+
+
+def test_rainfall_change_only_invalidates_that_month(tmp_path: Path) -> None:
+    """Editing March rainfall should recompute March and keep April cached."""
+    db = _build_db(tmp_path / "cache.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    march = CalculationPeriod(month=3, year=2025)
+    april = CalculationPeriod(month=4, year=2025)
+
+    # Historical months first; recalculating them does not move live volumes
+    service.calculate_range(march, april)
+    cached_march = service.calculate(march)
+    cached_april = service.calculate(april)
+
+    db.execute_mutation(
+        "UPDATE environmental_data SET rainfall_mm = 99 WHERE year = 2025 AND month = 3",
+        create_backup=False,
+    )
+    service.clear_cache()
+
+    assert service.calculate(april).calculated_at == cached_april.calculated_at
+    assert service.calculate(march).calculated_at != cached_march.calculated_at
+
+
+def test_meter_hash_rechecked_only_on_mtime_change(tmp_path: Path) -> None:
+    """Same mtime short-circuits; a new mtime with new values is reported as changed."""
+    db = _build_db(tmp_path / "cache.db")
+    excel = _FrameExcelManager(_meter_frame())
+    tracker = BalanceDependencyTracker(db, excel, CalculationConstants)
+    period = CalculationPeriod(month=1, year=2025)
+
+    mtime = {"value": 100.0}
+    tracker.meter_mtime = lambda: mtime["value"]
+    stored = tracker.current(period)
+
+    excel._df.loc[excel._df["Date"] == "2025-01-01", "Tonnes Milled"] = 1.0
+    excel._meter_monthly = None
+    assert tracker.validate(period, stored)[0] == []
+
+    mtime["value"] = 200.0
+    changed, refreshed = tracker.validate(period, stored)
+    assert changed == ["meter_month_hash"]
+    assert refreshed.meter_mtime == 200.0
+
+
+def _same_result(a, b) -> bool:
+    """Compare two results, ignoring when they were calculated."""
+    return a.model_dump(exclude={"calculated_at"}) == b.model_dump(exclude={"calculated_at"})
+
+
+def test_cached_result_matches_forced_recalculation(tmp_path: Path) -> None:
+    """A cached month is always what force_recalculate would return.
+
+    Only the latest recorded month reads live volumes; earlier months read
+    their own recorded closings, so calculating February (which moves the
+    live volumes) leaves January cached and still exact.
+    """
+    db = _build_db(tmp_path / "cache.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    january = CalculationPeriod(month=1, year=2025)
+    february = CalculationPeriod(month=2, year=2025)
+
+    service.calculate_range(january, february)
+    service.refresh_stale_periods()  # months whose own closing split moved volumes
+    assert service.find_stale_periods() == []
+    cached = {p.month: service.calculate(p) for p in (january, february)}
+
+    service.calculate(CalculationPeriod(month=3, year=2025))
+    service.clear_cache()
+
+    assert service.calculate(january).calculated_at == cached[1].calculated_at
+    assert service.calculate(february).calculated_at == cached[2].calculated_at
+    for period in (january, february):
+        assert _same_result(cached[period.month], service.calculate(period, force_recalculate=True))
+
+
+def test_live_volume_edit_only_invalidates_latest_month(tmp_path: Path) -> None:
+    """Editing a live volume recalculates the latest month only."""
+    db = _build_db(tmp_path / "cache.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    january = CalculationPeriod(month=1, year=2025)
+    february = CalculationPeriod(month=2, year=2025)
+    service.calculate_range(january, february)
+    service.refresh_stale_periods()
+
+    db.execute_mutation(
+        "UPDATE storage_facilities SET current_volume_m3 = 55555 WHERE code = 'DAM2'",
+        create_backup=False,
+    )
+    service.clear_cache()
+
+    assert service.find_stale_periods() == [february]
+
+
+def test_fingerprint_records_inputs_before_evaluation(tmp_path: Path) -> None:
+    """The stored opening-volume hash is the one the result was computed from."""
+    db = _build_db(tmp_path / "cache.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    tracker = service._result_cache.tracker
+    january = CalculationPeriod(month=1, year=2025)
+    before = tracker.current(january)
+
+    service.calculate(january, force_recalculate=True)
+
+    row = db.execute_query(
+        "SELECT storage_history_version, volume_version FROM balance_result_cache "
+        "WHERE year = 2025 AND month = 1",
+        fetch_one=True,
+    )
+    assert row["storage_history_version"] == before.storage_history_version
+    assert row["volume_version"] == before.volume_version
+
+
+def test_catchment_area_change_invalidates_result(tmp_path: Path, monkeypatch) -> None:
+    """Runoff reads catchment_area_m2, so editing it recalculates the month."""
+    monkeypatch.setattr(
+        balance_module, "get_constants", lambda: CalculationConstants(runoff_enabled=True)
+    )
+    db = _build_db(tmp_path / "cache.db")
+    db.execute_mutation(
+        "ALTER TABLE storage_facilities ADD COLUMN catchment_area_m2 REAL",
+        create_backup=False,
+    )
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    january = CalculationPeriod(month=1, year=2025)
+    cached = service.calculate(january)
+
+    db.execute_mutation(
+        "UPDATE storage_facilities SET catchment_area_m2 = 250000 WHERE code = 'DAM1'",
+        create_backup=False,
+    )
+    service.clear_cache()
+
+    fresh = service.calculate(january)
+    assert fresh.calculated_at != cached.calculated_at
+    assert fresh.inflows.components["runoff"] > cached.inflows.components["runoff"] == 0
+
+
+def test_latest_cached_result_follows_last_use(tmp_path: Path) -> None:
+    """Read-only views see the last result calculated or served from cache."""
+    db = _build_db(tmp_path / "cache.db")
+    service = BalanceService(db, _FrameExcelManager(_meter_frame()))
+    january = CalculationPeriod(month=1, year=2025)
+    february = CalculationPeriod(month=2, year=2025)
+    assert service.get_latest_cached_result() is None
+
+    service.calculate_range(january, february)
+    assert service.get_latest_cached_result().period == february
+
+    service.calculate(january)
+    assert service.get_latest_cached_result().period == january
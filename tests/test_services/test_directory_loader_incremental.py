@@ -0,0 +1,94 @@
+"""Tests for incremental folder rescans in DirectoryLoadWorker.
+
+Covers:
+- A rescan only loads added/changed files and matches a full load
+- Removed files' rows are dropped; unchanged failures stay reported
+- An unchanged folder loads nothing and keeps the previous result
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from services.directory_loader import DirectoryLoadWorker, FolderSnapshot
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for all tests (required for PySide6)."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _write(folder: Path, name: str, rows: int, label: str = "BH") -> None:
+    path = folder / name
+    pd.DataFrame({"borehole": [f"{label}{i}" for i in range(rows)], "level": range(rows)}).to_excel(
+        path, index=False
+    )
+    # Distinct mtime even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + rows * 1_000_000_000))
+
+
+def _run(folder: Path, snapshot=None) -> dict:
+    worker = DirectoryLoadWorker("static_boreholes")
+    worker.load_directory(str(folder), snapshot)
+    events = {"loaded": [], "complete": []}
+    worker.progress.connect(lambda current, total, name: events["loaded"].append(name))
+    worker.complete.connect(lambda df, summary: events["complete"].append((df, summary)))
+    worker.run()
+    return events
+
+
+def test_rescan_loads_only_changed_files(qapp, tmp_path: Path) -> None:
+    for i in range(4):
+        _write(tmp_path, f"static_{i}.xlsx", i + 1)
+    (tmp_path / "static_9.xlsx").write_bytes(b"not a workbook")
+    snapshot = FolderSnapshot()
+    first = _run(tmp_path, snapshot)
+    assert len(first["loaded"]) == 5
+
+    _write(tmp_path, "static_0b.xlsx", 2, label="NEW")   # added (sorts mid-folder)
+    _write(tmp_path, "static_2.xlsx", 5, label="EDIT")   # changed
+    (tmp_path / "static_3.xlsx").unlink()                # removed
+
+    rescan = _run(tmp_path, snapshot)
+    full = _run(tmp_path)
+
+    assert rescan["loaded"] == ["static_0b.xlsx", "static_2.xlsx"]
+    df, summary = rescan["complete"][0]
+    full_df, full_summary = full["complete"][0]
+    pd.testing.assert_frame_equal(df, full_df)
+    assert "static_3.xlsx" not in set(df["source_file"])
+    assert summary["incremental"] == {"added": 1, "changed": 1, "removed": 1}
+    assert summary["errors"] == full_summary["errors"]
+    assert list(summary["errors"]) == ["static_9.xlsx"]
+    assert summary["loaded_files"] == full_summary["loaded_files"] == 4
+
+
+def test_unchanged_folder_reuses_previous_result(qapp, tmp_path: Path) -> None:
+    for i in range(3):
+        _write(tmp_path, f"static_{i}.xlsx", i + 2)
+    snapshot = FolderSnapshot()
+    first_df = _run(tmp_path, snapshot)["complete"][0][0]
+    assert not snapshot.has_changes()
+
+    first_df.loc[0, "level"] = -1  # Receivers may modify the emitted frame
+    rescan = _run(tmp_path, snapshot)
+
+    assert rescan["loaded"] == []
+    pd.testing.assert_frame_equal(rescan["complete"][0][0], _run(tmp_path)["complete"][0][0])
+
+    (tmp_path / "static_1.xlsx").unlink()
+    assert snapshot.has_changes()
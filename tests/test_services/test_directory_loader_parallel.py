@@ -0,0 +1,103 @@
+"""Tests for DirectoryLoadWorker process-pool parsing.
+
+Covers:
+- Parallel mode emits the same ordered signals and data as sequential mode
+- Cache hits are not re-parsed in parallel mode
+- Cancelling stops the load and emits cancelled
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from services.directory_loader import DirectoryLoadWorker
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for all tests (required for PySide6)."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _write_folder(folder: Path, count: int = 6) -> None:
+    for i in range(count):
+        pd.DataFrame({"borehole": [f"BH{i}"] * (i + 1), "level": range(i + 1)}).to_excel(
+            folder / f"static_{i:02d}.xlsx", index=False
+        )
+    (folder / "static_03b.xlsx").write_bytes(b"not a workbook")
+
+
+def _run(folder: Path, workers: int, cache=None, cancel_after: int = 0) -> dict:
+    worker = DirectoryLoadWorker("static_boreholes")
+    if cache is not None:
+        worker.set_cache_functions(cache.get, cache.__setitem__)
+    worker.set_parallel_workers(workers)
+    worker.load_directory(str(folder))
+
+    events = {"order": [], "complete": [], "cancelled": 0}
+
+    def on_progress(current, total, name):
+        events["order"].append(("progress", name))
+        if cancel_after and current == cancel_after:
+            worker.cancel()
+
+    def on_cancelled():
+        events["cancelled"] += 1
+
+    worker.progress.connect(on_progress)
+    worker.file_loaded.connect(lambda name, rows: events["order"].append(("loaded", name, rows)))
+    worker.error.connect(lambda name, reason: events["order"].append(("error", name)))
+    worker.complete.connect(lambda df, summary: events["complete"].append((df, summary)))
+    worker.cancelled.connect(on_cancelled)
+    worker.run()
+    return events
+
+
+def test_parallel_matches_sequential_order_and_data(qapp, tmp_path: Path) -> None:
+    _write_folder(tmp_path)
+
+    sequential = _run(tmp_path, workers=0)
+    parallel = _run(tmp_path, workers=2)
+
+    assert parallel["order"] == sequential["order"]
+    assert ("error", "static_03b.xlsx") in parallel["order"]
+    seq_df, seq_summary = sequential["complete"][0]
+    par_df, par_summary = parallel["complete"][0]
+    pd.testing.assert_frame_equal(par_df, seq_df)
+    assert par_summary == seq_summary
+    assert par_summary["loaded_files"] == 6
+
+
+def test_parallel_mode_uses_cache_hits(qapp, tmp_path: Path) -> None:
+    _write_folder(tmp_path)
+    cache: dict = {}
+    _run(tmp_path, workers=2, cache=cache)
+    assert len(cache) == 6
+
+    # A cache hit for every readable file: nothing is queued for parsing
+    for key in list(cache):
+        cache[key] = cache[key].assign(level=-1)
+    events = _run(tmp_path, workers=2, cache=cache)
+    df, _ = events["complete"][0]
+    assert (df["level"] == -1).all()
+
+
+def test_cancel_stops_parallel_load(qapp, tmp_path: Path) -> None:
+    _write_folder(tmp_path)
+
+    events = _run(tmp_path, workers=2, cancel_after=2)
+
+    assert events["cancelled"] == 1
+    assert events["complete"] == []
+    assert [e for e in events["order"] if e[0] == "progress"][-1][1] == "static_01.xlsx"
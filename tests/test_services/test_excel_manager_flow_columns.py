@@ -4,10 +4,14 @@ Covers:
 - Auto-mapping flow IDs to existing columns
 - Creating new flow columns without duplication
 - Reading a flow volume for a given month
+- Loading every Flows_* sheet from one workbook open (and prefetch)
+- Indexed multi-column lookups and whole-diagram volume resolution
+- Batched column edits (one save, cached frames patched, all-or-nothing)
 """
 
 from __future__ import annotations
 
+from datetime import date
 from pathlib import Path
 from typing import Tuple
 import sys
@@ -127,3 +131,158 @@ def test_get_flow_volume_for_month(tmp_path: Path) -> None:
     volume = manager.get_flow_volume("Flows_UG2 North", "bh_ndgwa_to_sump_1", 2026, 2)
 
     assert volume == 123.45
+
+
+def _write_multi_area_excel(path: Path) -> None:
+    """Create a Flow Diagram workbook with two areas and a non-flow sheet."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Flows_UG2 North"
+    ws.append(["Year", "Month", "bh_ndgwa_to_sump_1"])
+    ws.append([2026, 2, 123.45])
+    ws = wb.create_sheet("Flows_Old TSF")
+    ws.append(["Old TSF flows"])
+    ws.append([])
+    ws.append(["Date", "tsf_to_rwd", "rwd_to_plant"])
+    ws.append([date(2026, 1, 1), 10.0, 20.0])
+    wb.create_sheet("Notes").append(["not a flow sheet"])
+    wb.save(path)
+    wb.close()
+
+
+def test_load_all_flow_sheets_opens_workbook_once(tmp_path: Path, monkeypatch) -> None:
+    """All Flows_* sheets should be parsed from a single workbook open."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    _write_multi_area_excel(excel_path)
+    manager, _ = _load_test_manager(tmp_path, excel_path)
+
+    import openpyxl
+
+    opens = []
+    real_load = openpyxl.load_workbook
+    monkeypatch.setattr(openpyxl, "load_workbook", lambda *a, **k: opens.append(a) or real_load(*a, **k))
+
+    north = manager.load_flow_sheet("UG2N")
+    old_tsf = manager.load_flow_sheet("OLDTSF")
+
+    assert len(opens) == 1
+    assert north["bh_ndgwa_to_sump_1"].tolist() == [123.45]
+    assert old_tsf[["Year", "Month"]].values.tolist() == [[2026, 1]]
+    assert manager.load_flow_sheet("Notes").empty
+
+
+def test_prefetch_fills_flow_cache(tmp_path: Path) -> None:
+    """Background prefetch should leave every flow sheet cached."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    _write_multi_area_excel(excel_path)
+    manager, _ = _load_test_manager(tmp_path, excel_path)
+
+    thread = manager.prefetch_flow_sheets()
+    thread.join(timeout=10)
+
+    assert set(manager._flow_df_cache) == {"Flows_UG2 North", "Flows_Old TSF"}
+    assert manager.get_flow_volume("Flows_Old TSF", "rwd_to_plant", 2026, 1) == 20.0
+
+
+def test_get_flow_volumes_resolves_columns_in_one_lookup(tmp_path: Path) -> None:
+    """Indexed lookup should match per-column reads and fall back to the latest month."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Flows_UG2 North"
+    ws.append(["UG2 North flows"])
+    ws.append([])
+    ws.append(["Year", "Month", "a_to_b", "b_to_c", "notes"])
+    ws.append([2025, 12, 5.0, None, "x"])
+    ws.append([2026, 1, 7.5, "n/a", "y"])
+    ws.append([2026, 1, 99.0, 99.0, "duplicate month"])
+    ws.append([2025, 11, 1.0, 2.0, "z"])
+    wb.save(excel_path)
+    wb.close()
+    manager, _ = _load_test_manager(tmp_path, excel_path)
+
+    volumes = manager.get_flow_volumes("UG2N", ["a_to_b", "b_to_c", "missing"], 2025, 12)
+    assert volumes == {"a_to_b": 5.0, "b_to_c": None, "missing": None}
+    assert volumes["a_to_b"] == manager.get_flow_volume("UG2N", "a_to_b", 2025, 12)
+
+    # Unknown month: most recent month (first row of Jan 2026) unless disabled
+    assert manager.get_flow_volumes("UG2N", ["a_to_b"], 2030, 1) == {"a_to_b": 7.5}
+    assert manager.get_flow_volumes("UG2N", ["a_to_b"], 2030, 1, fallback_to_latest=False) == {"a_to_b": None}
+    assert manager.has_flow_period("UG2N", 2025, 11)
+    assert not manager.has_flow_period("UG2N", 2025, 10)
+
+    assert manager.get_flow_series("UG2N", "a_to_b", year=2026) == [((2026, 1), 7.5), ((2026, 1), 99.0)]
+    assert manager.get_flow_series("UG2N", "b_to_c") == [((2026, 1), 99.0), ((2025, 11), 2.0)]
+
+
+def test_resolve_diagram_volumes_groups_edges_by_sheet(tmp_path: Path) -> None:
+    """Mapped edges resolve per sheet with warnings for unusable mappings."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    _write_multi_area_excel(excel_path)
+    manager, _ = _load_test_manager(tmp_path, excel_path)
+    diagram = {
+        "edges": [
+            {"excel_mapping": {"sheet": "Flows_UG2 North", "column": "bh_ndgwa_to_sump_1"}},
+            {"excel_mapping": {}},
+            {"excel_mapping": {"sheet": "Flows_Old TSF", "column": "rwd_to_plant"}},
+            {"excel_mapping": {"sheet": "Flows_Old TSF", "column": "no_such_column"}},
+        ]
+    }
+
+    result = manager.resolve_diagram_volumes(diagram, 2026, 1)
+
+    assert result.mapped_count == 3
+    assert result.volumes == {2: 20.0}
+    assert result.warnings == [
+        "No data for 2026/1 in sheet 'Flows_UG2 North'",
+        "Column 'no_such_column' not found in sheet 'Flows_Old TSF'",
+    ]
+
+
+def test_column_edit_session_saves_once_and_patches_cache(tmp_path: Path, monkeypatch) -> None:
+    """Queued edits across sheets apply in one save and match a fresh reload."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    _write_multi_area_excel(excel_path)
+    manager, _ = _load_test_manager(tmp_path, excel_path)
+    manager.load_all_flow_sheets()
+    assert manager.get_flow_volume("UG2N", "bh_ndgwa_to_sump_1", 2026, 2) == 123.45
+
+    import openpyxl
+
+    saves = []
+    real_save = openpyxl.Workbook.save
+    monkeypatch.setattr(openpyxl.Workbook, "save", lambda wb, p: saves.append(p) or real_save(wb, p))
+
+    with manager.begin_flow_column_edits() as edits:
+        edits.create_column("UG2N", "bh_ndgwa_to_plant")
+        edits.rename_column("UG2N", "bh_ndgwa_to_sump_1", "bh_ndgwa_to_sump_2")
+        edits.create_column("OLDTSF", "rwd_to_tsf")
+        edits.delete_column("OLDTSF", "tsf_to_rwd")
+
+    assert edits.committed
+    assert len(saves) == 1
+
+    north = manager.load_flow_sheet("UG2N")
+    assert list(north.columns) == ["Year", "Month", "bh_ndgwa_to_sump_2", "bh_ndgwa_to_plant"]
+    assert manager.get_flow_volume("UG2N", "bh_ndgwa_to_sump_2", 2026, 2) == 123.45
+
+    fresh, _ = _load_test_manager(tmp_path, excel_path)
+    for sheet in ("UG2N", "OLDTSF"):
+        assert list(manager.load_flow_sheet(sheet).columns) == list(fresh.load_flow_sheet(sheet).columns)
+
+
+def test_column_edit_session_failure_leaves_workbook_unchanged(tmp_path: Path) -> None:
+    """One invalid edit aborts the whole batch before anything is saved."""
+    excel_path = tmp_path / "flow_diagram.xlsx"
+    _write_flow_excel(excel_path)
+    manager, _ = _load_test_manager(tmp_path, excel_path)
+    before = excel_path.read_bytes()
+
+    edits = manager.begin_flow_column_edits()
+    edits.create_column("Flows_UG2 North", "new_flow")
+    edits.delete_column("Flows_UG2 North", "missing_flow")
+
+    assert edits.commit() is False
+    assert "missing_flow" in edits.error
+    assert excel_path.read_bytes() == before
+    assert "new_flow" not in manager.list_flow_columns("Flows_UG2 North")
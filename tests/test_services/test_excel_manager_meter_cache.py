@@ -0,0 +1,103 @@
+"""Tests for the Meter Readings disk cache used by ExcelManager.
+
+Covers:
+- A second manager loads the frame and units from disk without openpyxl
+- Touching the workbook (same content, new mtime) still hits the cache
+- Changed content is reparsed and replaces the cache entry
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import os
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pandas as pd
+
+from services import excel_manager as excel_module
+from services.excel_manager import ExcelManager
+from test_excel_manager_meter_values import _write_meter_excel
+
+
+JAN = date(2025, 1, 1)
+
+
+class _Config:
+    """Minimal config pointing ExcelManager at one workbook and cache dir."""
+
+    def __init__(self, excel_path: Path, cache_dir: Path) -> None:
+        self._values = {
+            "data_sources.legacy_excel_path": str(excel_path),
+            "data_sources.meter_cache_dir": str(cache_dir),
+        }
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+
+def _no_openpyxl(monkeypatch) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("workbook should not be parsed")
+
+    monkeypatch.setattr(excel_module.pd, "read_excel", _fail)
+
+
+def test_warm_start_skips_workbook_parse(tmp_path: Path, monkeypatch) -> None:
+    excel_path = tmp_path / "meter.xlsx"
+    _write_meter_excel(excel_path)
+    config = _Config(excel_path, tmp_path / "cache")
+
+    first = ExcelManager(config)
+    parsed = first.load_meter_readings()
+
+    _no_openpyxl(monkeypatch)
+    second = ExcelManager(config)
+    cached = second.load_meter_readings()
+
+    pd.testing.assert_frame_equal(cached, parsed)
+    assert second.get_source_unit("Tonnes Milled") == "t"
+    assert second.get_meter_values(JAN, ["Tonnes Milled"]) == {"Tonnes Milled": 1000.0}
+
+
+def test_touched_workbook_hits_by_content_hash(tmp_path: Path, monkeypatch) -> None:
+    excel_path = tmp_path / "meter.xlsx"
+    _write_meter_excel(excel_path)
+    config = _Config(excel_path, tmp_path / "cache")
+    ExcelManager(config).load_meter_readings()
+
+    stat = excel_path.stat()
+    os.utime(excel_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    _no_openpyxl(monkeypatch)
+    assert len(ExcelManager(config).load_meter_readings()) == 3
+
+
+def test_changed_workbook_is_reparsed(tmp_path: Path) -> None:
+    excel_path = tmp_path / "meter.xlsx"
+    _write_meter_excel(excel_path, tonnes_jan=1000.0)
+    config = _Config(excel_path, tmp_path / "cache")
+    ExcelManager(config).load_meter_readings()
+
+    _write_meter_excel(excel_path, tonnes_jan=2500.0)
+    manager = ExcelManager(config)
+    assert manager.get_meter_values(JAN, ["Tonnes Milled"]) == {"Tonnes Milled": 2500.0}
+
+    # The new content is what the next start reads back
+    again = ExcelManager(config)
+    assert again.get_meter_values(JAN, ["Tonnes Milled"]) == {"Tonnes Milled": 2500.0}
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+
+def test_disk_cache_can_be_disabled(tmp_path: Path) -> None:
+    excel_path = tmp_path / "meter.xlsx"
+    _write_meter_excel(excel_path)
+    config = _Config(excel_path, tmp_path / "cache")
+    config._values["features.meter_readings_disk_cache"] = False
+
+    ExcelManager(config).load_meter_readings()
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,201 @@
+"""Tests for ExcelManager month-indexed Meter Readings lookups.
+
+Covers:
+- get_meter_values matches get_meter_readings_series first-in-month values
+- Missing columns / months / non-numeric cells return None
+- Monthly matrix is rebuilt when the Excel file changes on disk
+- Source catalog metadata is computed once per load
+- Loaded frames are compacted (dropped duplicate/unnamed columns, Date index,
+  float32/categorical, 64-bit meter totals)
+- The calculation page's period check reads dates from compacted frames
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import os
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+import yaml
+from openpyxl import Workbook
+
+from core.config_manager import config
+from services.excel_manager import ExcelManager, MeterReadingsConfig
+
+
+def _write_meter_excel(path: Path, tonnes_jan: float = 1000.0) -> None:
+    """Create a minimal Meter Readings workbook (header row 3, units row 4).
+
+    Args:
+        path: Destination path for the workbook.
+        tonnes_jan: Tonnes Milled value for the first January row.
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Meter Readings"
+    ws.append(["Meter Readings"])
+    ws.append([])
+    ws.append(["Month", "Tonnes Milled", "Tailings RD", "Notes"])
+    ws.append(["", "t", "t/m³", ""])
+    # Loader skips the first dated row (first_data_row offset), keep a filler row
+    ws.append([date(2024, 12, 1), 1.0, 1.0, "filler"])
+    ws.append([date(2025, 1, 1), tonnes_jan, None, "ok"])
+    ws.append([date(2025, 1, 15), 9999.0, 1.4, "late"])
+    ws.append([date(2025, 2, 1), "n/a", 1.5, "bad"])
+    wb.save(path)
+    wb.close()
+
+
+def _load_test_manager(tmp_path: Path, excel_path: Path) -> ExcelManager:
+    """Create a ConfigManager-backed ExcelManager pointing at the workbook."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    cfg_path = config_dir / "app_config.yaml"
+    cfg_path.write_text(
+        yaml.safe_dump({"data_sources": {"legacy_excel_path": str(excel_path)}}),
+        encoding="utf-8",
+    )
+    config.load_config(config_path=str(cfg_path))
+    return ExcelManager(config)
+
+
+def test_get_meter_values_matches_series(tmp_path: Path) -> None:
+    """Matrix lookup should return the same first-in-month values as the series API."""
+    excel_path = tmp_path / "meter_readings.xlsx"
+    _write_meter_excel(excel_path)
+    manager = _load_test_manager(tmp_path, excel_path)
+
+    values = manager.get_meter_values(date(2025, 1, 1), ["Tonnes Milled", "Tailings RD"])
+
+    for column, value in values.items():
+        series = manager.get_meter_readings_series(
+            column, start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
+        )
+        assert value == series[0][1]
+    assert values == {"Tonnes Milled": 1000.0, "Tailings RD": 1.4}
+
+
+def test_get_meter_values_missing_data_returns_none(tmp_path: Path) -> None:
+    """Unknown columns, months without data and text cells resolve to None."""
+    excel_path = tmp_path / "meter_readings.xlsx"
+    _write_meter_excel(excel_path)
+    manager = _load_test_manager(tmp_path, excel_path)
+
+    feb = manager.get_meter_values(date(2025, 2, 1), ["Tonnes Milled", "Tailings RD", "Missing"])
+    assert feb == {"Tonnes Milled": None, "Tailings RD": 1.5, "Missing": None}
+
+    assert manager.get_meter_values(date(2024, 6, 1), ["Tonnes Milled"]) == {"Tonnes Milled": None}
+
+
+def test_monthly_matrix_rebuilt_on_file_change(tmp_path: Path) -> None:
+    """Rewriting the workbook should invalidate the cached monthly matrix."""
+    excel_path = tmp_path / "meter_readings.xlsx"
+    _write_meter_excel(excel_path)
+    manager = _load_test_manager(tmp_path, excel_path)
+
+    first = manager.get_meter_readings_monthly()
+    assert manager.get_meter_readings_monthly() is first
+
+    _write_meter_excel(excel_path, tonnes_jan=2000.0)
+    stat = excel_path.stat()
+    os.utime(excel_path, (stat.st_atime, stat.st_mtime + 10))
+
+    values = manager.get_meter_values(date(2025, 1, 1), ["Tonnes Milled"])
+    assert values == {"Tonnes Milled": 2000.0}
+
+
+def test_single_pass_reader_types_columns(tmp_path: Path) -> None:
+    """Units row and NA text should not force numeric meters to object dtype."""
+    excel_path = tmp_path / "meter_readings.xlsx"
+    _write_meter_excel(excel_path)
+
+    df, units = ExcelManager._read_meter_sheet(MeterReadingsConfig(file_path=excel_path))
+
+    assert list(df.columns) == ["Month", "Tonnes Milled", "Tailings RD", "Notes", "Date"]
+    assert df["Tonnes Milled"].dtype == "float64"
+    assert df["Tailings RD"].dtype == "float64"
+    assert df["Date"].tolist() == [
+        pd.Timestamp(2025, 1, 1), pd.Timestamp(2025, 1, 15), pd.Timestamp(2025, 2, 1)
+    ]
+    assert units["Tailings RD"] == "t/m³"
+    assert units["Notes"] == ""
+
+
+def test_loaded_frame_is_compacted(tmp_path: Path) -> None:
+    """Duplicate date/unnamed columns are dropped and columns retyped losslessly."""
+    excel_path = tmp_path / "meter_readings.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Meter Readings"
+    ws.append(["Meter Readings"])
+    ws.append([])
+    ws.append(["Month", "Tonnes Milled", "Tailings RD", "Status", None, "Notes", "Total Meter"])
+    ws.append(["", "t", "t/m³", "", "", "", "m³"])
+    ws.append([date(2024, 12, 1), 1.0, 1.0, "ok", 5, "filler", 1])
+    for day, status in ((1, "ok"), (10, "ok"), (15, "ok"), (20, "estimated")):
+        ws.append([date(2025, 1, day), 1000.5 + day, 1.0 + day / 10, status, 7, None, 3_000_000 + day])
+    wb.save(excel_path)
+    wb.close()
+    manager = _load_test_manager(tmp_path, excel_path)
+
+    df = manager.load_meter_readings()
+
+    # Empty named columns are kept so required-column checks still find them
+    assert list(df.columns) == ["Tonnes Milled", "Tailings RD", "Status", "Notes", "Total Meter"]
+    assert isinstance(df.index, pd.DatetimeIndex) and df.index.name == "Date"
+    assert df["Tonnes Milled"].dtype == "float32"   # half-units fit exactly
+    assert df["Tailings RD"].dtype == "float64"     # 1.1 is not exact in float32
+    assert df["Status"].dtype == "category"
+    assert df["Total Meter"].dtype.itemsize == 8    # meter totals keep 64 bits
+    assert manager.get_meter_readings_date_range() == (date(2025, 1, 1), date(2025, 1, 20))
+    assert manager.get_meter_values(date(2025, 1, 1), ["Tonnes Milled", "Tailings RD"]) == {
+        "Tonnes Milled": 1001.5, "Tailings RD": 1.1,
+    }
+    assert manager.list_meter_readings_sources() == ["Tonnes Milled", "Tailings RD", "Total Meter"]
+    assert list(manager.get_meter_dates(df).dt.day) == [1, 10, 15, 20]
+
+
+def test_period_check_accepts_compacted_frame(tmp_path: Path, monkeypatch) -> None:
+    """The calculation page validates months against the Date index."""
+    import services.excel_manager as excel_manager_module
+    from ui.dashboards.calculation_dashboard import CalculationPage
+
+    excel_path = tmp_path / "meter_readings.xlsx"
+    _write_meter_excel(excel_path)
+    manager = _load_test_manager(tmp_path, excel_path)
+    monkeypatch.setattr(excel_manager_module, "get_excel_manager", lambda: manager)
+    assert "Date" not in manager.load_meter_readings().columns
+
+    check = CalculationPage._validate_period_against_meter_data
+    assert check(None, 2025, 1) == (True, "")
+    ok, message = check(None, 2024, 11)
+    assert not ok and "No Meter Readings rows found for 2024-11" in message
+    ok, message = check(None, 2025, 3)
+    assert not ok and "beyond Meter Readings data" in message
+
+
+def test_source_catalog_metadata_cached_per_load(tmp_path: Path) -> None:
+    """Catalog reports numeric-ness, counts, date span and units, built once."""
+    excel_path = tmp_path / "meter_readings.xlsx"
+    _write_meter_excel(excel_path)
+    manager = _load_test_manager(tmp_path, excel_path)
+
+    catalog = manager.get_source_catalog()
+
+    assert list(catalog) == ["Tonnes Milled", "Tailings RD", "Notes"]
+    tonnes = catalog["Tonnes Milled"]
+    assert (tonnes.unit, tonnes.non_null_count) == ("t", 2)
+    assert (tonnes.first_date, tonnes.last_date) == (date(2025, 1, 1), date(2025, 1, 15))
+    tailings = catalog["Tailings RD"]
+    assert (tailings.first_date, tailings.last_date) == (date(2025, 1, 15), date(2025, 2, 1))
+    assert catalog["Notes"].is_numeric is False
+    assert manager.list_meter_readings_sources() == ["Tonnes Milled", "Tailings RD"]
+
+    assert manager.get_source_catalog() is catalog
+    manager.clear_meter_cache()
+    assert manager.get_source_catalog() is not catalog
@@ -0,0 +1,48 @@
+"""Tests for the shared Feather/pickle entry files used by the disk caches.
+
+Covers:
+- Frames round-trip through Feather, including a non-default index
+- Frames Feather cannot represent fall back to pickle and replace the old file
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+import pytest
+
+from services import frame_disk_store
+
+pytestmark = pytest.mark.skipif(
+    not frame_disk_store.FEATHER_AVAILABLE, reason="pyarrow not installed"
+)
+
+
+def test_feather_round_trip_keeps_index(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {"Tonnes Milled": [1.5, 2.5, 3.5]},
+        index=pd.DatetimeIndex(pd.date_range("2025-01-01", periods=3, freq="MS"), name="Date"),
+    )
+
+    meta = frame_disk_store.write_frame(tmp_path, "meter", df)
+
+    assert meta["data_format"] == "feather"
+    pd.testing.assert_frame_equal(frame_disk_store.read_frame(tmp_path, meta), df, check_freq=False)
+
+
+def test_mixed_types_fall_back_to_pickle(tmp_path: Path) -> None:
+    frame_disk_store.write_frame(tmp_path, "bh", pd.DataFrame({"Calcium": [1.0, 2.0]}))
+    mixed = pd.DataFrame({"Calcium": [1.0, "n/a"]}, index=[3, 7])
+
+    meta = frame_disk_store.write_frame(tmp_path, "bh", mixed, drop_index=True)
+
+    assert meta["data_format"] == "pickle"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bh.pkl"]
+    pd.testing.assert_frame_equal(
+        frame_disk_store.read_frame(tmp_path, meta), mixed.reset_index(drop=True)
+    )
@@ -0,0 +1,118 @@
+"""Tests for the shared monitoring parse cache.
+
+Covers:
+- Same-named workbooks in different folders get separate entries
+- Entries are invalidated by file changes and parser version bumps
+- LRU memory tier stays under its byte cap (evicted frames served from disk)
+- Disk entries survive a new cache instance (MonitoringDataLoader batches too)
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+
+from models.monitoring_data import ColumnMapping, DataSourceDefinition, DataType, StructureType
+from services.monitoring_cache import MonitoringCache, frame_nbytes
+from services.monitoring_data_loader import MonitoringDataLoader
+
+
+def _frame(label: str, rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame({
+        "borehole": [label] * rows,
+        "date": pd.date_range("2025-01-01", periods=rows),
+        "Calcium": [float(i) for i in range(rows)],
+    })
+
+
+def _touch(path: Path, content: bytes = b"workbook") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_same_name_in_different_folders_does_not_collide(tmp_path: Path) -> None:
+    north = _touch(tmp_path / "north" / "data.xlsx")
+    south = _touch(tmp_path / "south" / "data.xlsx")
+    cache = MonitoringCache(tmp_path / "cache")
+
+    cache.put(north, "v1", _frame("NORTH"))
+    cache.put(south, "v1", _frame("SOUTH"))
+
+    assert cache.get(north, "v1")["borehole"].iloc[0] == "NORTH"
+    assert cache.get(south, "v1")["borehole"].iloc[0] == "SOUTH"
+    assert cache.get(north, "v2") is None  # Parser version bump
+
+    _touch(north, b"edited workbook")
+    assert cache.get(north, "v1") is None  # File changed
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path: Path) -> None:
+    files = [_touch(tmp_path / f"bh{i}.xlsx") for i in range(3)]
+    cap = frame_nbytes(_frame("BH0")) * 2
+    cache = MonitoringCache(tmp_path / "cache", max_memory_bytes=cap)
+
+    cache.put(files[0], "v1", _frame("BH0"))
+    cache.put(files[1], "v1", _frame("BH1"))
+    cache.get(files[0], "v1")                  # BH1 is now least recently used
+    cache.put(files[2], "v1", _frame("BH2"))
+    cache.flush()
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["memory_bytes"] <= cap
+    assert stats["pending_writes"] == 0
+    # Evicted from memory, still served from disk
+    pd.testing.assert_frame_equal(cache.get(files[1], "v1"), _frame("BH1"))
+
+
+def test_disk_entries_survive_new_instance(tmp_path: Path) -> None:
+    source = _touch(tmp_path / "bh.xlsx")
+    first = MonitoringCache(tmp_path / "cache")
+    first.put(source, "v1", _frame("BH"))
+    first.flush()
+
+    second = MonitoringCache(tmp_path / "cache")
+    pd.testing.assert_frame_equal(second.get(source, "v1"), _frame("BH"))
+    assert second.get(source, "v2") is None
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert second.get(source, "v1") is None
+
+    second.clear()
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_loader_batches_reused_from_disk(tmp_path: Path) -> None:
+    pd.DataFrame({
+        "PCD ID": ["PCD1", "PCD2"],
+        "Date": ["2025-01-01", "2025-01-02"],
+        "Water Level (m)": [4.5, 3.25],
+    }).to_excel(tmp_path / "pcd.xlsx", index=False)
+    source = DataSourceDefinition(
+        id="pcd_monitoring_v1",
+        name="PCD Monitoring",
+        directory_pattern=str(tmp_path),
+        structure_type=StructureType.TIMESERIES,
+        columns=[
+            ColumnMapping(id="pcd_id", type=DataType.STRING, required=True, expected_names=["PCD ID"]),
+            ColumnMapping(id="measurement_date", type=DataType.DATE, required=True, expected_names=["Date"]),
+            ColumnMapping(id="water_level_m", type=DataType.FLOAT, required=True, expected_names=["Water Level (m)"]),
+        ],
+    )
+
+    first = MonitoringDataLoader(source, directory=tmp_path, cache=MonitoringCache(tmp_path / "cache"))
+    first.load()
+    first.cache.cache.flush()
+
+    second = MonitoringDataLoader(source, directory=tmp_path, cache=MonitoringCache(tmp_path / "cache"))
+    result = second.load()
+
+    assert result.files_cached == 1 and result.files_parsed == 0
+    pd.testing.assert_frame_equal(second.get_dataframe(), first.get_dataframe())
@@ -0,0 +1,80 @@
+"""Tests for the stacked-block borehole monitoring parser.
+
+Covers:
+- Borehole IDs forward-filled onto their sample rows, sorted output
+- Date formats, Excel dates and (S)/(D) aquifer suffixes
+- NO ACCESS / "<" / blank cells skipped, numeric text converted, text kept
+- Column order follows first appearance (matches the row-dict parser)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+from openpyxl import Workbook
+
+from services.monitoring_excel_parser_v2 import parse_borehole_stacked_blocks
+
+
+def _write_lab_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["TWO RIVERS PLATINUM"])
+    ws.append(["Monitoring Point", "Remarks", "Calcium^", "Static Level"])
+    ws.append(["", "", "mg/l", "m"])
+    ws.append(["TWO RIVERS GROUNDWATER MONITORING"])
+    ws.append(["TRPGWM 02"])
+    ws.append(["2024/03/01 10:15:00 AM", None, " 12.5 ", "NO ACCESS"])
+    ws.append(["05/02/2024 08:00:00", "dry", "<0.01", None])
+    ws.append(["TRPGWM 01"])
+    ws.append([])
+    ws.append(["2024-02-01 (S)", "ok", 7, 15.2])
+    ws.append([datetime(2024, 1, 10, 9, 0), None, 6.5, 14.9])
+    ws.append(["not a date", "skip", 1, 1])
+    ws.append(["2024-03-01 (D)", None, None, 16.0])
+    wb.save(path)
+    wb.close()
+
+
+def test_stacked_blocks_parsed_column_wise(tmp_path: Path) -> None:
+    path = tmp_path / "lab.xlsx"
+    _write_lab_workbook(path)
+
+    df = parse_borehole_stacked_blocks(str(path))
+
+    # First sample row only has Calcium, so it precedes Remarks
+    assert list(df.columns) == [
+        "borehole", "borehole_norm", "date", "aquifer", "Calcium", "Remarks", "Static Level", "source_file",
+    ]
+    assert df["borehole"].tolist() == ["TRPGWM 01"] * 3 + ["TRPGWM 02"] * 2
+    assert df["date"].tolist() == [
+        pd.Timestamp(2024, 1, 10, 9), pd.Timestamp(2024, 2, 1), pd.Timestamp(2024, 3, 1),
+        pd.Timestamp(2024, 2, 5, 8), pd.Timestamp(2024, 3, 1, 10, 15),
+    ]
+    assert df["aquifer"].tolist() == ["", "Shallow Aquifer", "Deep Aquifer", "", ""]
+    assert df["Calcium"].tolist()[:2] == [6.5, 7.0]
+    assert pd.isna(df["Calcium"].iloc[2])
+    assert pd.isna(df["Calcium"].iloc[3])          # "<0.01" below detection limit
+    assert df["Calcium"].iloc[4] == 12.5           # numeric text
+    assert df["Calcium"].dtype == "float64"
+    assert pd.isna(df["Static Level"].iloc[4])     # NO ACCESS
+    assert df["Remarks"].tolist()[1] == "ok"
+    assert df["Remarks"].tolist()[3] == "dry"
+    assert (df["source_file"] == "lab.xlsx").all()
+
+
+def test_workbook_without_borehole_ids_returns_empty(tmp_path: Path) -> None:
+    path = tmp_path / "empty.xlsx"
+    wb = Workbook()
+    wb.active.append(["Static Level"])
+    wb.active.append(["no ids here"])
+    wb.save(path)
+    wb.close()
+
+    assert parse_borehole_stacked_blocks(str(path)).empty
@@ -0,0 +1,108 @@
+"""Tests for the columnar monitoring parse path.
+
+Covers:
+- TimeseriesParser converts columns in bulk into a typed RecordBatch
+- Validation rules skip rows with the same messages as per-record checks
+- Pydantic models are only built when records are iterated
+- MonitoringDataLoader builds its DataFrame (and cache) from batches
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import pandas as pd
+
+from models.monitoring_data import (
+    ColumnMapping, DataSourceDefinition, DataType, PCDMonitoringRecord, StructureType, ValidationRules,
+)
+from services.monitoring_cache import MonitoringCache
+from services.monitoring_data_loader import MonitoringDataLoader
+from services.monitoring_parsers import TimeseriesParser
+
+
+def _pcd_source(directory: Path) -> DataSourceDefinition:
+    return DataSourceDefinition(
+        id="pcd_monitoring_v1",
+        name="PCD Monitoring",
+        directory_pattern=str(directory),
+        structure_type=StructureType.TIMESERIES,
+        columns=[
+            ColumnMapping(id="pcd_id", type=DataType.STRING, required=True, expected_names=["PCD ID"]),
+            ColumnMapping(id="measurement_date", type=DataType.DATE, required=True, expected_names=["Date"]),
+            ColumnMapping(
+                id="water_level_m", type=DataType.FLOAT, required=True, expected_names=["Water Level (m)"],
+                validation=ValidationRules(min=0, max=100),
+            ),
+            ColumnMapping(id="ph", type=DataType.FLOAT, expected_names=["pH"]),
+        ],
+    )
+
+
+def _write_pcd_workbook(path: Path) -> None:
+    pd.DataFrame({
+        "PCD ID": ["PCD1", "PCD2", None, "PCD1", "PCD2", "PCD3"],
+        "Date": [datetime(2025, 1, 1), "2025-01-02", datetime(2025, 1, 3), "bad date", "05/01/2025", "2025-01-06"],
+        "Water Level (m)": [4.5, " 3.25 ", 1.0, 2.0, 150.0, "n/a"],
+        "pH": [7.1, None, 7.0, 6.9, "NO DATA", 7.3],
+    }).to_excel(path, index=False)
+
+
+def test_timeseries_parse_returns_typed_batch(tmp_path: Path) -> None:
+    path = tmp_path / "pcd.xlsx"
+    _write_pcd_workbook(path)
+
+    result = TimeseriesParser(_pcd_source(tmp_path)).parse(str(path))
+
+    assert result.records == []
+    assert result.record_count == result.valid_rows == 2
+    assert result.skipped_rows == 1
+    assert result.errors == ["Row 4: water_level_m above maximum: 150.0 > 100.0"]
+
+    frame = result.batch.frame
+    assert frame["measurement_date"].dtype.kind == "M"
+    assert frame["water_level_m"].dtype == "float64"
+    assert frame["pcd_id"].tolist() == ["PCD1", "PCD2"]
+    assert frame["water_level_m"].tolist() == [4.5, 3.25]
+
+    records = list(result.iter_records())
+    assert all(isinstance(r, PCDMonitoringRecord) for r in records)
+    assert records[1].measurement_date == date(2025, 1, 2)
+    assert records[1].ph is None
+    assert records[0].tss_mg_l is None
+
+
+def test_loader_dataframe_built_from_batches(tmp_path: Path) -> None:
+    _write_pcd_workbook(tmp_path / "pcd.xlsx")
+    loader = MonitoringDataLoader(_pcd_source(tmp_path), directory=tmp_path, enable_cache=False)
+    loader.load()
+
+    df = loader.get_dataframe()
+
+    assert list(df.columns) == [
+        "record_id", "source_id", "source_file", "measurement_date", "created_at", "is_valid",
+        "error_message", "pcd_id", "water_level_m", "ph", "conductivity_us_cm", "tss_mg_l",
+    ]
+    assert df["measurement_date"].tolist() == [date(2025, 1, 1), date(2025, 1, 2)]
+    assert df["is_valid"].tolist() == [True, True]
+    assert df["tss_mg_l"].tolist() == [None, None]
+    assert df["ph"].iloc[0] == 7.1 and pd.isna(df["ph"].iloc[1])
+    assert loader.result.total_records == 2
+
+
+def test_loader_cache_reuses_batch(tmp_path: Path) -> None:
+    _write_pcd_workbook(tmp_path / "pcd.xlsx")
+    cache = MonitoringCache(tmp_path / "cache", async_writes=False)
+    loader = MonitoringDataLoader(_pcd_source(tmp_path), directory=tmp_path, cache=cache)
+
+    loader.load()
+    first = loader.get_dataframe()
+    second_result = loader.load()
+
+    assert second_result.files_cached == 1 and second_result.files_parsed == 0
+    pd.testing.assert_frame_equal(loader.get_dataframe(), first)
@@ -0,0 +1,99 @@
+"""Tests for set-based StorageService reads and batch history writes.
+
+Covers:
+- get_all_facilities_storage matches per-facility get_facility_storage
+- Batch history writes upsert every facility in one call
+- Historical periods do not overwrite current_volume_m3
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path for test imports (pytest runs from repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from database.db_manager import DatabaseManager
+from database.schema import DatabaseSchema
+from services.calculation.balance_service import StorageService
+from services.calculation.models import CalculationPeriod, DataQualityFlags, StorageChange
+
+
+def _build_db(path: Path) -> DatabaseManager:
+    DatabaseSchema(path).create_database()
+    db = DatabaseManager(path)
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO storage_facilities (code, name, facility_type, capacity_m3, "
+            "current_volume_m3, status) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                ("DAM1", "Dam 1", "Dam", 200000, 120000, "active"),
+                ("DAM2", "Dam 2", "Dam", 100000, 40000, "active"),
+                ("OLD1", "Old Dam", "Dam", 50000, 5000, "inactive"),
+            ],
+        )
+        conn.execute(
+            "INSERT INTO storage_history (facility_code, year, month, opening_volume_m3, "
+            "closing_volume_m3, data_source) VALUES ('DAM1', 2025, 2, 90000, 95000, 'measured')"
+        )
+    return db
+
+
+def test_all_facilities_storage_matches_per_facility(tmp_path: Path) -> None:
+    """Joined query should give the same openings/closings and flags as per-facility reads."""
+    service = StorageService(_build_db(tmp_path / "storage.db"))
+    period = CalculationPeriod(month=3, year=2025)
+
+    batch_flags = DataQualityFlags()
+    batch = service.get_all_facilities_storage(period, batch_flags)
+
+    single_flags = DataQualityFlags()
+    single = [service.get_facility_storage(code, period, single_flags) for code in ("DAM1", "DAM2")]
+
+    assert [s.model_dump() for s in batch] == [s.model_dump() for s in single]
+    assert batch_flags.estimated_values == single_flags.estimated_values
+    assert batch[0].opening_m3 == 95000
+    assert batch[1].opening_m3 == 40000
+
+
+def test_batch_history_write_upserts_all_facilities(tmp_path: Path) -> None:
+    """One batch call should write every row and advance current volumes."""
+    db = _build_db(tmp_path / "storage.db")
+    service = StorageService(db)
+    period = CalculationPeriod(month=3, year=2025)
+    storages = [
+        StorageChange(facility_code="DAM1", opening_m3=95000, closing_m3=97000),
+        StorageChange(facility_code="DAM2", opening_m3=40000, closing_m3=41000),
+        StorageChange(facility_code=None, facility_name="System Total", opening_m3=0, closing_m3=0),
+    ]
+
+    assert service.record_storage_history_batch(period, storages, "calculated") == 2
+    storages[0] = StorageChange(facility_code="DAM1", opening_m3=95000, closing_m3=98000)
+    assert service.record_storage_history_batch(period, storages, "calculated") == 2
+
+    rows = db.execute_query(
+        "SELECT facility_code, closing_volume_m3 FROM storage_history "
+        "WHERE year = 2025 AND month = 3 ORDER BY facility_code"
+    )
+    assert [(r["facility_code"], r["closing_volume_m3"]) for r in rows] == [
+        ("DAM1", 98000), ("DAM2", 41000)
+    ]
+    volumes = db.execute_query("SELECT code, current_volume_m3 FROM storage_facilities ORDER BY code")
+    assert [(r["code"], r["current_volume_m3"]) for r in volumes] == [
+        ("DAM1", 98000), ("DAM2", 41000), ("OLD1", 5000)
+    ]
+
+
+def test_batch_history_write_keeps_current_volume_for_past_period(tmp_path: Path) -> None:
+    """Recalculating an older month must not overwrite the live volume snapshot."""
+    db = _build_db(tmp_path / "storage.db")
+    service = StorageService(db)
+    storages = [StorageChange(facility_code="DAM2", opening_m3=30000, closing_m3=31000)]
+
+    assert service.record_storage_history_batch(CalculationPeriod(month=1, year=2025), storages) == 1
+
+    row = db.execute_query(
+        "SELECT current_volume_m3 FROM storage_facilities WHERE code = 'DAM2'", fetch_one=True
+    )
+    assert row["current_volume_m3"] == 40000